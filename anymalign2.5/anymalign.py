@@ -31,15 +31,30 @@ from time import time
 
 import bz2
 import gzip
+import heapq
+import json
 from xml.sax.saxutils import escape
 from tempfile import NamedTemporaryFile
 
 import math
+import cPickle
+import mmap
 import random
+import signal
 from array import array
 from operator import mul
 from bisect import bisect_left
+from itertools import chain, izip
 
+try:
+    import multiprocessing
+except ImportError:     # Python < 2.6
+    multiprocessing = None
+
+try:
+    import numpy
+except ImportError:     # Use pure Python alignment only
+    numpy = None
 
 __version__ = '2.5 (May 4th 2011)'
 __author__ = 'Adrien Lardilleux <Adrien.Lardilleux@limsi.fr>'
@@ -48,6 +63,12 @@ __verbose__ = False
 __tmpDir__ = None
 
 MAX_SUBCORPUS_SIZE = 100000
+JOB_ROUND_TIME = 1.     # Seconds spent by worker processes between merges
+VECTORIZE_MIN_LINES = 24 # Use numpy for subcorpora at least that large
+SORT_LINE_OVERHEAD = 48 # Memory used by a line in a sort buffer, besides text
+MAX_MERGED_RUNS = 64    # Maximum number of files merged at once when sorting
+COOC_CHUNK_PAIRS = 1 << 22  # Word pairs counted at once by CoocMatrix
+LEX_WEIGHT_BLOCK = 4096 # Alignments weighted at once with numpy
 
 ###############################################################################
 # Utility functions
@@ -139,6 +160,57 @@ def message(msg, out=sys.stderr):
     if __verbose__:
         out.write(str(msg))
 
+def external_sort(lines, bufferSize):
+    """Sort lines of text using a bounded amount of memory.
+
+    -- lines: iterable(str)
+        Lines to be sorted, each ending with an end of line.
+    -- bufferSize: int
+        Approximate number of bytes of lines kept in memory.
+
+    Return an iterator over sorted lines. Sorted runs of at most
+    <bufferSize> bytes are written into temporary files, which are then
+    merged (MAX_MERGED_RUNS at once), so that all disk accesses are
+    sequential.
+
+    >>> list(external_sort(["b\\n", "c\\n", "a\\n"], 1))
+    ['a\\n', 'b\\n', 'c\\n']
+    
+    """
+    runs = []
+    try:
+        buf, size = [], 0
+        for line in lines:
+            buf.append(line)
+            size += len(line) + SORT_LINE_OVERHEAD
+            if size >= bufferSize:
+                buf.sort()
+                runs.append(make_temp_file(".run"))
+                runs[-1].writelines(buf)
+                runs[-1].seek(0)
+                buf, size = [], 0
+        buf.sort()
+        if not runs:
+            for line in buf:
+                yield line
+            return
+        runs.append(make_temp_file(".run"))
+        runs[-1].writelines(buf)
+        runs[-1].seek(0)
+        del buf
+        while len(runs) > MAX_MERGED_RUNS:
+            merged = make_temp_file(".run")
+            merged.writelines(heapq.merge(*runs[:MAX_MERGED_RUNS]))
+            merged.seek(0)
+            for f in runs[:MAX_MERGED_RUNS]:
+                f.close()
+            runs = runs[MAX_MERGED_RUNS:] + [merged]
+        for line in heapq.merge(*runs):
+            yield line
+    finally:
+        for f in runs:
+            f.close()
+
 def optimum_array(initialList, maxi=None):
     """Return a memory-efficient copy of a list of integers.
 
@@ -228,6 +300,782 @@ class CoocDB:
                                                   targetWord)]
 
 
+class CoocMatrix:
+    """Word cooccurrence counts as a sparse matrix (requires numpy).
+
+    -- self.indptr: numpy.ndarray
+        Target words of source word i are
+        self.indices[self.indptr[i]:self.indptr[i+1]].
+    -- self.indices: numpy.ndarray
+        Target word ids, sorted for each source word.
+    -- self.data: numpy.ndarray
+        Cooccurrence counts corresponding to self.indices.
+
+    Same as CoocDB (a source word is a word whose language comes before the
+    language of the target word), except that counts are computed at once
+    from a whole corpus and that lookups are batched: get() performs a
+    dichotomy on all the requested pairs at the same time.
+
+    >>> m = CoocMatrix(3, csr_index([[0, 2], [0, 1, 2], [2]]),
+    ...                numpy.array([0, 0, 1]))
+    >>> m.get(numpy.array([0, 1, 0]), numpy.array([2, 2, 1])).tolist()
+    [2, 1, 0]
+    
+    """
+    def __init__(self, nbWords, corpusIndex, wordLanguages):
+        """Initializer.
+
+        -- nbWords: int
+            Number of words: word ids in <corpusIndex> must be lower.
+        -- corpusIndex: tuple(numpy.ndarray, numpy.ndarray)
+            Corpus lines, as returned by csr_index(). A word must not
+            appear twice on the same line.
+        -- wordLanguages: numpy.ndarray
+            Language of each word.
+        """
+        items, bounds = corpusIndex
+        lengths = numpy.diff(bounds)
+        nbPairs = numpy.cumsum(lengths * lengths)
+        # Count pairs a chunk of lines at a time, merging partial counts
+        # when they outnumber those already merged
+        chunkEnds = list(numpy.searchsorted(
+            nbPairs, numpy.arange(COOC_CHUNK_PAIRS, nbPairs[-1] if
+                                  len(nbPairs) else 0, COOC_CHUNK_PAIRS)))
+        chunkEnds.append(len(lengths))
+        keys, freqs = [], []
+        pending, merged = 0, 0
+        start = 0
+        for end in chunkEnds:
+            if end <= start:
+                continue
+            first, second = csr_pairs(bounds[start:end+1])
+            sw = items[first].astype(numpy.int64)
+            tw = items[second]
+            del first, second
+            keep = wordLanguages[sw] < wordLanguages[tw]
+            chunkKeys = sw[keep] * nbWords + tw[keep]
+            del sw, tw, keep
+            start = end
+            if not len(chunkKeys):
+                continue
+            chunkKeys.sort()
+            starts = numpy.flatnonzero(numpy.concatenate(
+                ([True], chunkKeys[1:] != chunkKeys[:-1])))
+            keys.append(chunkKeys[starts])
+            freqs.append(numpy.diff(numpy.append(starts, len(chunkKeys))))
+            pending += len(starts)
+            if pending >= max(merged, COOC_CHUNK_PAIRS):
+                keys, freqs = self._merge_counts(keys, freqs)
+                keys, freqs = [keys], [freqs]
+                pending, merged = 0, len(keys[0])
+        keys, freqs = self._merge_counts(keys, freqs)
+        rows = keys // nbWords
+        self.indptr = numpy.zeros(nbWords + 1, numpy.int64)
+        numpy.cumsum(numpy.bincount(rows, minlength=nbWords),
+                     out=self.indptr[1:])
+        self.indices = (keys - rows * nbWords).astype(numpy.int32)
+        self.data = freqs.astype(numpy.int32)
+
+    @staticmethod
+    def _merge_counts(keys, freqs):
+        """Merge partial counts into a single pair of arrays.
+
+        -- keys: list(numpy.ndarray)
+            Pair keys (source word * number of words + target word).
+            Emptied.
+        -- freqs: list(numpy.ndarray)
+            Corresponding counts. Emptied.
+
+        Return distinct sorted keys and their total counts.
+        
+        """
+        if not keys:
+            return numpy.zeros(0, numpy.int64), numpy.zeros(0, numpy.int64)
+        if len(keys) == 1:
+            return keys.pop(), freqs.pop()
+        allKeys = numpy.concatenate(keys)
+        allFreqs = numpy.concatenate(freqs)
+        del keys[:], freqs[:]
+        if not len(allKeys):
+            return allKeys, allFreqs
+        order = allKeys.argsort(kind='mergesort')
+        allKeys = allKeys[order]
+        allFreqs = allFreqs[order]
+        del order
+        starts = numpy.flatnonzero(numpy.concatenate(
+            ([True], allKeys[1:] != allKeys[:-1])))
+        return allKeys[starts], numpy.add.reduceat(allFreqs, starts)
+
+    def get(self, sourceWords, targetWords):
+        """Retrieve cooccurrence counts between source and target words.
+
+        -- sourceWords: numpy.ndarray
+            Source word ids.
+        -- targetWords: numpy.ndarray
+            Target word ids (same length as <sourceWords>).
+
+        Return an array of counts, 0 for pairs that never cooccur.
+        
+        """
+        low = self.indptr[sourceWords]
+        high = self.indptr[sourceWords + 1]
+        end = high
+        while True:     # Dichotomy on all rows at once
+            todo = low < high
+            if not todo.any():
+                break
+            middle = (low + high) // 2
+            goRight = todo & (self.indices[numpy.minimum(
+                middle, len(self.indices) - 1)] < targetWords)
+            low = numpy.where(goRight, middle + 1, low)
+            high = numpy.where(todo & ~goRight, middle, high)
+        found = low < end
+        found[found] = self.indices[low[found]] == targetWords[found]
+        counts = numpy.zeros(len(sourceWords), numpy.int64)
+        counts[found] = self.data[low[found]]
+        return counts
+
+
+def csr_index(lines):
+    """Return a flat numpy copy of a list of lists of integers.
+
+    -- lines: list(list(int))
+
+    A pair (items, bounds) of numpy arrays is returned: items of line i
+    are items[bounds[i]:bounds[i+1]] (compressed sparse row layout).
+
+    >>> items, bounds = csr_index([[3, 1], [], [2]])
+    >>> items.tolist(), bounds.tolist()
+    ([3, 1, 2], [0, 2, 2, 3])
+    
+    """
+    bounds = numpy.zeros(len(lines) + 1, numpy.int64)
+    numpy.cumsum([len(line) for line in lines], out=bounds[1:])
+    items = numpy.fromiter(chain(*lines), numpy.int32, bounds[-1])
+    return items, bounds
+
+def csr_slice(index, lineIds):
+    """Return the lines of a csr_index() copy, as another csr_index() copy.
+
+    -- index: tuple(numpy.ndarray, numpy.ndarray)
+    -- lineIds: numpy.ndarray
+        The line ids to look up, in the order they should be returned.
+
+    >>> items, bounds = csr_slice(csr_index([[3, 1], [], [2]]),
+    ...                           numpy.array([2, 0]))
+    >>> items.tolist(), bounds.tolist()
+    ([2, 3, 1], [0, 1, 3])
+    
+    """
+    items, bounds = index
+    starts = bounds[lineIds]
+    lengths = bounds[lineIds + 1] - starts
+    newBounds = numpy.zeros(len(lineIds) + 1, numpy.int64)
+    numpy.cumsum(lengths, out=newBounds[1:])
+    positions = numpy.arange(newBounds[-1]) + numpy.repeat(
+        starts - newBounds[:-1], lengths)
+    return items[positions], newBounds
+
+def csr_pairs(bounds):
+    """Return all ordered pairs of items that share a line.
+
+    -- bounds: numpy.ndarray
+        Line bounds, as returned by csr_index(), or a slice of them.
+
+    A pair (first, second) of numpy arrays of item positions is returned,
+    sorted by first item position, then by second item position. Pairs of
+    an item with itself are included.
+
+    >>> first, second = csr_pairs(numpy.array([0, 2, 2, 3]))
+    >>> zip(first.tolist(), second.tolist())
+    [(0, 0), (0, 1), (1, 0), (1, 1), (2, 2)]
+    
+    """
+    lengths = numpy.diff(bounds)
+    itemLengths = numpy.repeat(lengths, lengths)
+    nbPairs = numpy.zeros(len(itemLengths) + 1, numpy.int64)
+    numpy.cumsum(itemLengths, out=nbPairs[1:])
+    first = numpy.repeat(numpy.arange(bounds[0], bounds[-1]), itemLengths)
+    second = numpy.arange(nbPairs[-1]) + numpy.repeat(
+        numpy.repeat(bounds[:-1], lengths) - nbPairs[:-1], itemLengths)
+    return first, second
+
+_rankKeys = None    # Random 64-bit integers, see group_by_lines()
+
+def group_by_lines(index, lineIds):
+    """Group items according to the lines they appear on.
+
+    -- index: tuple(numpy.ndarray, numpy.ndarray)
+        Corpus lines, as returned by csr_index().
+    -- lineIds: iterable(int)
+        The line ids to look up.
+
+    Return a list of pairs (tuple of line ids, list of items). Line ids are
+    in the same order as in <lineIds>, and are the only lines the items
+    appear on. This is equivalent to the pure Python loop in Aligner.align(),
+    but all items are processed at once with numpy.
+
+    >>> sorted(group_by_lines(csr_index([[3, 1], [1, 2], [3, 1]]), [2, 0, 1]))
+    [((1,), [2]), ((2, 0), [3]), ((2, 0, 1), [1])]
+    
+    """
+    global _rankKeys
+    lineIds = numpy.array(lineIds, numpy.int64)
+    nbLines = len(lineIds)
+    # Gather items of all selected lines, along with the rank of their line
+    # in <lineIds>
+    items, bounds = csr_slice(index, lineIds)
+    if not len(items):
+        return []
+    # Sort (item, rank) pairs, remove duplicates
+    pairs = numpy.sort(items.astype(numpy.int64) * nbLines +
+                       numpy.repeat(numpy.arange(nbLines), numpy.diff(bounds)),
+                       kind='mergesort')
+    pairs = pairs[numpy.concatenate(([True], pairs[1:] != pairs[:-1]))]
+    ranks = pairs % nbLines
+    pairs //= nbLines
+    first = numpy.flatnonzero(numpy.concatenate(([True],
+                                                 pairs[1:] != pairs[:-1])))
+    counts = numpy.diff(numpy.append(first, len(pairs)))
+    # Items with the same lines have the same count and rank signature (sum
+    # of random keys, modulo 2**64)
+    if _rankKeys is None or len(_rankKeys) < nbLines:
+        _rankKeys = numpy.random.RandomState(0).randint(
+            -2**63, 2**63 - 1, max(nbLines, 1024), numpy.int64)
+    signatures = numpy.add.reduceat(_rankKeys[ranks], first)
+    order = numpy.lexsort((signatures, counts))
+    sortedCounts = counts[order]
+    sameLines = ((sortedCounts[1:] == sortedCounts[:-1]) &
+                 (signatures[order][1:] == signatures[order][:-1]))
+    # Compare lines of neighbours with the same signature, do not rely on
+    # signatures only
+    candidates = numpy.flatnonzero(sameLines)
+    if len(candidates):
+        c = sortedCounts[candidates]
+        cEnds = numpy.cumsum(c)
+        offsets = numpy.arange(cEnds[-1]) - numpy.repeat(cEnds - c, c)
+        equal = (ranks[numpy.repeat(first[order[candidates]], c) + offsets] ==
+                 ranks[numpy.repeat(first[order[candidates + 1]], c) + offsets])
+        sameLines[candidates] = numpy.logical_and.reduceat(equal, cEnds - c)
+    # Emit groups
+    groupBounds = numpy.flatnonzero(numpy.concatenate(([True], ~sameLines,
+                                                       [True]))).tolist()
+    lines = lineIds[ranks].tolist()
+    first = first[order].tolist()
+    counts = sortedCounts.tolist()
+    members = pairs[first].tolist()
+    groups = []
+    for start, end in zip(groupBounds, groupBounds[1:]):
+        f = first[start]
+        groups.append((tuple(lines[f:f + counts[start]]), members[start:end]))
+    return groups
+
+
+class HashCounter:
+    """Absolute frequencies of alignments, identified by their hash values.
+
+    -- self.buckets: dict(int: dict(int: int))
+        Keys are alignment lengths (number of bytes), values are dictionaries
+        which keys are alignment hashes and values are integer frequencies.
+
+    Two alignments with the same length and hash value are assumed to be
+    equal. This is basically wrong, but we have plenty of possible hashes
+    before a collision occurs.
+
+    >>> c = HashCounter()
+    >>> c.add("a\tb", 2), c.add("a\tb", 1)
+    (True, False)
+    >>> c.get("a\tb")
+    3
+    
+    """
+    def __init__(self):
+        """Initializer."""
+        self.buckets = {}
+
+    def add(self, alString, weight):
+        """Add <weight> to the frequency of an alignment.
+
+        -- alString: str
+        -- weight: int
+
+        Return True if the alignment was not counted yet.
+        """
+        bucket = self.buckets.setdefault(len(alString), {})
+        alHash = hash(alString)
+        alFreq = bucket.get(alHash)
+        if alFreq is None:
+            bucket[alHash] = weight
+            return True
+        bucket[alHash] = alFreq + weight
+        return False
+
+    def get(self, alString):
+        """Return the frequency of an alignment (KeyError if unknown).
+
+        -- alString: str
+        """
+        return self.buckets[len(alString)][hash(alString)]
+
+    def clear(self):
+        """Forget all frequencies (release memory)."""
+        self.buckets.clear()
+
+    def memory(self):
+        """Return an estimate of the memory used, in bytes.
+
+        Hash values are counted as integer objects, frequencies are
+        supposed to be small (shared) integers.
+        """
+        intSize = sys.getsizeof(sys.maxint)
+        return sys.getsizeof(self.buckets) + sum(
+            [sys.getsizeof(c) + len(c) * intSize
+             for c in self.buckets.itervalues()])
+
+    def dump(self, outputFile):
+        """Move frequencies into a file, and clear memory.
+
+        -- outputFile: file
+        """
+        for alLength, c in self.buckets.iteritems():
+            print >> outputFile, hex(alLength)[2:]
+            for alHash_freq in c.iteritems():
+                print >> outputFile, "%x %x" % alHash_freq
+        self.clear()
+
+    def load(self, inputFile):
+        """Recover frequencies previously dumped into a file.
+
+        -- inputFile: file
+        """
+        c = None
+        for line in inputFile:
+            numbers = line.split(" ", 1)
+            if len(numbers) == 1:
+                c = self.buckets.setdefault(int(numbers[0], 16), {})
+            else:
+                c[int(numbers[0], 16)] = int(numbers[1], 16)
+
+
+class ExactCounter:
+    """Absolute frequencies of alignments, without any hash collision.
+
+    -- self.strings: array.array('c')
+        Concatenation of all distinct alignments. Alignment ids are their
+        rank in this concatenation.
+    -- self.ends: array.array('L')
+        For each alignment id, position of the end of the alignment in
+        self.strings (it starts at the end of the previous one).
+    -- self.tags: array.array('B')
+        For each alignment id, 8 bits of the hash value of the alignment,
+        to avoid most useless string comparisons.
+    -- self.freqs: array.array('L')
+        For each alignment id, frequency of the alignment.
+    -- self.table: array.array('i')
+        Open addressing hash table (linear probing) of alignment ids. Empty
+        slots contain -1. Its size is a power of 2.
+
+    Alignments are compared as strings, so counts are exact. Memory usage
+    per alignment is about its length plus 30 to 40 bytes, whereas the
+    dictionaries of HashCounter require about 80 bytes.
+
+    >>> c = ExactCounter()
+    >>> c.add("a\tb", 2), c.add("a\tb", 1)
+    (True, False)
+    >>> c.get("a\tb") == 3
+    True
+    
+    """
+    def __init__(self):
+        """Initializer."""
+        self.clear()
+
+    def _string(self, alId):
+        """Return the alignment which id is <alId>."""
+        if alId:
+            return self.strings[self.ends[alId - 1]:self.ends[alId]].tostring()
+        return self.strings[:self.ends[0]].tostring()
+
+    def _slot(self, alString, alHash):
+        """Return the position of an alignment in self.table.
+
+        -- alString: str
+        -- alHash: int
+
+        If the alignment is not known, the position of the empty slot where
+        it should be inserted is returned.
+        """
+        table, tags = self.table, self.tags
+        tag = alHash >> 24
+        mask = len(table) - 1
+        i = alHash & mask
+        while True:
+            alId = table[i]
+            if alId < 0:
+                return i
+            if tags[alId] == tag and self._string(alId) == alString:
+                return i
+            i = (i + 1) & mask
+
+    def add(self, alString, weight):
+        """Add <weight> to the frequency of an alignment.
+
+        -- alString: str
+        -- weight: int
+
+        Return True if the alignment was not counted yet.
+        """
+        alHash = hash(alString) & 0x7fffffff
+        i = self._slot(alString, alHash)
+        alId = self.table[i]
+        if alId >= 0:
+            self.freqs[alId] += weight
+            return False
+        self.table[i] = len(self.freqs)
+        self.strings.fromstring(alString)
+        self.ends.append(len(self.strings))
+        self.tags.append(alHash >> 24)
+        self.freqs.append(weight)
+        if 3 * len(self.freqs) > 2 * len(self.table):
+            self._rehash(2 * len(self.table))
+        return True
+
+    def get(self, alString):
+        """Return the frequency of an alignment (KeyError if unknown).
+
+        -- alString: str
+        """
+        alId = self.table[self._slot(alString, hash(alString) & 0x7fffffff)]
+        if alId < 0:
+            raise KeyError(alString)
+        return self.freqs[alId]
+
+    def _rehash(self, size):
+        """Rebuild self.table with <size> slots (a power of 2)."""
+        table = array('i', [-1]) * size
+        mask = size - 1
+        for alId in xrange(len(self.freqs)):
+            i = hash(self._string(alId)) & mask
+            while table[i] >= 0:
+                i = (i + 1) & mask
+            table[i] = alId
+        self.table = table
+
+    def clear(self):
+        """Forget all frequencies (release memory)."""
+        self.strings = array('c')
+        self.ends = array('L')
+        self.tags = array('B')
+        self.freqs = array('L')
+        self.table = array('i', [-1]) * 8
+
+    def memory(self):
+        """Return the memory used by arrays, in bytes."""
+        return sum([a.buffer_info()[1] * a.itemsize for a in
+                    (self.strings, self.ends, self.tags, self.freqs,
+                     self.table)])
+
+    def dump(self, outputFile):
+        """Move frequencies into a file, and clear memory.
+
+        -- outputFile: file
+
+        The hash table is not written, it is rebuilt by self.load().
+        """
+        for a in (self.strings, self.ends, self.tags, self.freqs):
+            print >> outputFile, "%x" % len(a)
+            for start in xrange(0, len(a), 1 << 20):
+                outputFile.write(a[start:start + (1 << 20)].tostring())
+        self.clear()
+
+    def load(self, inputFile):
+        """Recover frequencies previously dumped into a file.
+
+        -- inputFile: file
+        """
+        for a in (self.strings, self.ends, self.tags, self.freqs):
+            n = int(inputFile.readline(), 16)
+            a.fromstring(inputFile.read(n * a.itemsize))
+        size = 8
+        while 2 * size < 3 * len(self.freqs):
+            size *= 2
+        self._rehash(size)
+
+
+# Values for the "-c" command line option
+COUNTERS = {'hash': HashCounter, 'exact': ExactCounter}
+
+
+class CorpusCache:
+    """Read-only access to a corpus compiled by CorpusCache.compile().
+
+    -- self.file: file
+        The cache file, open for reading.
+    -- self.map: mmap.mmap
+        The whole cache file, mapped into memory.
+    -- self.fileLanguages: list(int)
+        Number of languages (columns) of each input file.
+    -- self.nbLanguages: int
+        Total number of languages = sum(self.fileLanguages).
+    -- self.nbLines: int
+        Number of lines in the corpus.
+    -- self.nbTokens: int
+        Number of words in the corpus.
+    -- self.wordLanguages: array.array('H')
+        For each word id, the language (0-based) the word is from.
+    -- self.wordOffsets: array.array('L')
+        Word i is self.map[self.wordOffsets[i]:self.wordOffsets[i+1]].
+
+    The cache file is made of a header line, followed by these arrays, in
+    native byte order:
+    - line bounds ('L'): for each line and each input file, the position of
+    the first token of the input file line in the token array;
+    - word offsets ('L'), see self.wordOffsets;
+    - tokens ('i'): word ids of all lines, one input file after another;
+    - word languages ('H'), see self.wordLanguages;
+    - vocabulary: all words, concatenated.
+    Line bounds and tokens are not copied into memory: lines are read
+    directly from the mapped file when needed.
+    
+    """
+    MAGIC = "anymalign-cache-1"
+
+    def __init__(self, filename):
+        """Initializer.
+
+        -- filename: str
+            Name of the cache file.
+        """
+        self.file = open(filename, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self.map.readline().split()
+        if not header or header[0] != self.MAGIC:
+            raise ValueError("%s is not a corpus cache file" % filename)
+        self.fileLanguages = [int(n) for n in header[1].split(',')]
+        self.nbLanguages = sum(self.fileLanguages)
+        self.nbLines, nbWords, self.nbTokens = [int(n) for n in header[2:5]]
+        self.boundsStart = self.map.tell()
+        wordOffsetsStart = self.boundsStart + array('L').itemsize * (
+            self.nbLines * len(self.fileLanguages) + 1)
+        self.tokensStart = wordOffsetsStart + array('L').itemsize * (
+            nbWords + 1)
+        languagesStart = self.tokensStart + array('i').itemsize * self.nbTokens
+        self.wordLanguages = array('H', self.map[
+            languagesStart:languagesStart + array('H').itemsize * nbWords])
+        self.wordOffsets = array('L', self.map[wordOffsetsStart:
+                                               self.tokensStart])
+
+    @staticmethod
+    def compile(inputFiles, filename):
+        """Write a cache file for a corpus.
+
+        -- inputFiles: list(file)
+            Input files, open for reading, with the same number of lines.
+        -- filename: str
+            Name of the cache file to be written.
+        """
+        itemSize = array('L').itemsize
+        fileLanguages = [None] * len(inputFiles)
+        bounds = array('L', [0])
+        allWordIds = {}     # {(int, str): int}
+        wordLanguages = array('H')
+        words = []
+        tokensFile = make_temp_file(".tokens")
+        try:
+            nbTokens = 0
+            lineId = -1
+            for lineId, lines in enumerate(izip(*inputFiles)):
+                for fileId, line in enumerate(lines):
+                    sentences = line.split('\t')
+                    if fileLanguages[fileId] is None:
+                        fileLanguages[fileId] = len(sentences)
+                    else:
+                        assert len(sentences) == fileLanguages[fileId], \
+                               "Found %i columns instead of %i at line %i " \
+                               "in file %s" % (len(sentences),
+                                               fileLanguages[fileId],
+                                               lineId + 1,
+                                               inputFiles[fileId].name)
+                    languageId = sum(fileLanguages[:fileId])
+                    tokens = array('i')
+                    for sentence in sentences:
+                        for word in sentence.split():
+                            wordId = allWordIds.get((languageId, word))
+                            if wordId is None:
+                                wordId = len(words)
+                                allWordIds[languageId, word] = wordId
+                                words.append(word)
+                                wordLanguages.append(languageId)
+                            tokens.append(wordId)
+                        languageId += 1
+                    tokensFile.write(tokens.tostring())
+                    nbTokens += len(tokens)
+                    bounds.append(nbTokens)
+            for f in inputFiles:
+                assert not f.readline(), \
+                       "Input files have different number of lines"
+            del allWordIds
+            nbLines = lineId + 1
+
+            header = "%s %s %i %i %i" % (
+                CorpusCache.MAGIC, ','.join([str(n) for n in fileLanguages]),
+                nbLines, len(words), nbTokens)
+            header += " " * (-(len(header) + 1) % itemSize) + "\n"
+            vocabularyStart = len(header) + itemSize * (len(bounds) +
+                                                        len(words) + 1) + \
+                              array('i').itemsize * nbTokens + \
+                              wordLanguages.itemsize * len(words)
+            wordOffsets = array('L', [vocabularyStart])
+            for word in words:
+                wordOffsets.append(wordOffsets[-1] + len(word))
+
+            outputFile = open(filename, 'wb')
+            try:
+                outputFile.write(header)
+                bounds.tofile(outputFile)
+                wordOffsets.tofile(outputFile)
+                tokensFile.seek(0)
+                while True:
+                    data = tokensFile.read(1 << 20)
+                    if not data:
+                        break
+                    outputFile.write(data)
+                wordLanguages.tofile(outputFile)
+                outputFile.write(''.join(words))
+            finally:
+                outputFile.close()
+        finally:
+            tokensFile.close()
+
+    def line(self, lineId, fileId):
+        """Return the word ids of an input file line.
+
+        -- lineId: int
+        -- fileId: int
+        """
+        i = self.boundsStart + array('L').itemsize * (
+            lineId * len(self.fileLanguages) + fileId)
+        start, end = array('L', self.map[i:i + 2 * array('L').itemsize])
+        tokenSize = array('i').itemsize
+        return array('i', self.map[self.tokensStart + tokenSize * start:
+                                   self.tokensStart + tokenSize * end])
+
+    def arrays(self):
+        """Return numpy views of line bounds and tokens (no copy)."""
+        bounds = numpy.frombuffer(
+            self.map, numpy.dtype('u%i' % array('L').itemsize),
+            self.nbLines * len(self.fileLanguages) + 1, self.boundsStart)
+        tokens = numpy.frombuffer(self.map, numpy.dtype('i%i' %
+                                                        array('i').itemsize),
+                                  self.nbTokens, self.tokensStart)
+        return bounds, tokens
+
+    def word(self, wordId):
+        """Return the string of a word id."""
+        return self.map[self.wordOffsets[wordId]:self.wordOffsets[wordId + 1]]
+
+    def close(self):
+        """Release the cache file."""
+        self.map.close()
+        self.file.close()
+
+
+
+class NgramIndex:
+    """N-grams of a whole corpus, built once and sliced for subcorpora.
+
+    -- self.n: int
+        The "-i" command line option value (maximum n-gram length).
+    -- self.prefixes: list(numpy.ndarray)
+        For n = 2...self.n, self.prefixes[n-2][i] is the id of the (n-1)-gram
+        that starts n-gram i. 1-grams ids are word ids in the CorpusCache.
+    -- self.lasts: list(numpy.ndarray)
+        Same as self.prefixes, with the id of the last word of n-grams.
+    -- self.lineNgrams: list(tuple(numpy.ndarray, numpy.ndarray))
+        For n = 2...self.n, the sorted n-gram ids of every line, as returned
+        by csr_index().
+
+    An n-gram is identified by its (n-1)-gram prefix id and its last word,
+    packed into a single integer: ids of all n-grams are computed at once
+    with numpy, and each n-gram only takes a few bytes. This requires numpy
+    and a CorpusCache, which provides corpus-wide word ids.
+    
+    """
+    def __init__(self, cache, n):
+        """Initializer.
+
+        -- cache: CorpusCache
+        -- n: int
+            = self.n
+        """
+        self.n = n
+        self.prefixes, self.lasts, self.lineNgrams = [], [], []
+        bounds, tokens = cache.arrays()
+        nbWords = len(cache.wordLanguages)
+        nbFiles = len(cache.fileLanguages)
+        # sameSentence[i] tells whether tokens i and i+1 are in the same
+        # sentence (same line, file and language)
+        languages = numpy.frombuffer(cache.wordLanguages, numpy.uint16)
+        sameSentence = languages[tokens[:-1]] == languages[tokens[1:]]
+        sentenceEnds = bounds[1:-1].astype(numpy.int64) - 1
+        sameSentence[sentenceEnds[(sentenceEnds >= 0) &
+                                  (sentenceEnds < len(sameSentence))]] = False
+        tokenLines = numpy.repeat(
+            numpy.arange(cache.nbLines, dtype=numpy.int32),
+            numpy.diff(bounds[::nbFiles].astype(numpy.int64)))
+        ids = tokens.astype(numpy.int64)    # (n-1)-gram ids at each position
+        valid = numpy.ones(len(ids), bool)  # Where (n-1)-gram ids are defined
+        for k in xrange(2, n + 1):
+            # Positions where an k-gram starts
+            valid = valid[:-1] & sameSentence[k-2:]
+            keys = ids[:-1][valid] * nbWords + tokens[k-1:][valid]
+            keys, inverse = numpy.unique(keys, return_inverse=True)
+            self.prefixes.append(keys // nbWords)
+            self.lasts.append((keys % nbWords).astype(numpy.int32))
+            ids = numpy.zeros(len(valid), numpy.int64)
+            ids[valid] = inverse
+            # Sorted distinct k-gram ids of each line
+            nbNgrams = len(keys)
+            pairs = numpy.unique(
+                tokenLines[:len(valid)][valid].astype(numpy.int64) * nbNgrams
+                + inverse)
+            lineBounds = numpy.zeros(cache.nbLines + 1, numpy.int64)
+            numpy.cumsum(numpy.bincount(pairs // nbNgrams,
+                                        minlength=cache.nbLines),
+                         out=lineBounds[1:])
+            self.lineNgrams.append(((pairs % nbNgrams).astype(numpy.int32),
+                                    lineBounds))
+            del keys, inverse, pairs
+
+    def subcorpus(self, lines, wordIds):
+        """Return n-grams of a subcorpus.
+
+        -- lines: list(int)
+            The line ids in the CorpusCache.
+        -- wordIds: numpy.ndarray
+            Maps CorpusCache word ids to subcorpus word ids.
+
+        Return a pair (allNgrams, ngramCorpora), as expected by Aligner.
+        N-gram ids are renumbered from 0 for the subcorpus.
+        """
+        allNgrams, ngramCorpora = [], []
+        lines = numpy.array(lines, numpy.int64)
+        for n in xrange(2, self.n + 1):
+            items, bounds = csr_slice(self.lineNgrams[n-2], lines)
+            ngramIds, items = numpy.unique(items, return_inverse=True)
+            # Retrieve words, from last to first
+            words = numpy.empty((len(ngramIds), n), numpy.int32)
+            for k in xrange(n, 1, -1):
+                words[:, k-1] = self.lasts[k-2][ngramIds]
+                ngramIds = self.prefixes[k-2][ngramIds]
+            words[:, 0] = ngramIds
+            allNgrams.append(array('i', wordIds[words].tostring()))
+            ngramCorpora.append((array('i', items.astype(numpy.int32
+                                                         ).tostring()),
+                                 array('l', bounds.tolist())))
+        return allNgrams, ngramCorpora
+
+
 class Progression:
     """Display progress percentage.
 
@@ -262,6 +1110,127 @@ class Progression:
             message("\r%3i%%" % newWrite)
 
 
+class Metrics:
+    """Throughput statistics of alignment, written as JSON lines.
+
+    -- self.outputFile: file
+        Where statistics are written (one JSON object per line).
+    -- self.interval: float
+        Seconds between two reports during alignment.
+    -- self.sizes: dict(int: int)
+        Histogram of subcorpus sizes: keys are powers of two, values are
+        the numbers of subcorpora which size is between the key (included)
+        and twice the key (excluded).
+    -- self.samples: dict(str: int)
+        Profiler samples (one every SAMPLING_PERIOD seconds of CPU time)
+        per activity, see PHASES.
+
+    The time split between activities is measured by a sampling profiler
+    (SIGPROF), which costs nothing between two samples: the innermost
+    function of PHASES found on the stack identifies the activity.
+
+    >>> m = Metrics(None)
+    >>> for size in (2, 3, 5, 8, 9):
+    ...     m.add_size(size)
+    >>> sorted(m.sizes.items())
+    [(2, 2), (4, 1), (8, 2)]
+    
+    """
+    SAMPLING_PERIOD = .005
+    PHASES = {}     # {code object: activity name}, see set_phases()
+
+    def __init__(self, outputFile, interval=10.):
+        """Initializer.
+
+        -- outputFile: file
+        -- interval: float
+        """
+        self.outputFile = outputFile
+        self.interval = interval
+        self.sizes = {}
+        self.samples = {}
+
+    @classmethod
+    def set_phases(cls, phases):
+        """Register the functions that identify activities.
+
+        -- phases: dict(str: list(function))
+            Activity names, and the functions that belong to them.
+        """
+        for name, functions in phases.iteritems():
+            for function in functions:
+                function = getattr(function, 'im_func', function)
+                cls.PHASES[function.func_code] = name
+
+    def add_size(self, size):
+        """Count a new subcorpus.
+
+        -- size: int
+        """
+        bucket = 1 << (size.bit_length() - 1) if size else 0
+        self.sizes[bucket] = self.sizes.get(bucket, 0) + 1
+
+    def start(self):
+        """Start the profiler (does nothing if SIGPROF is unavailable)."""
+        if hasattr(signal, 'setitimer'):
+            signal.signal(signal.SIGPROF, self._sample)
+            signal.siginterrupt(signal.SIGPROF, False)  # Restart syscalls
+            signal.setitimer(signal.ITIMER_PROF, self.SAMPLING_PERIOD,
+                             self.SAMPLING_PERIOD)
+
+    def stop(self):
+        """Stop the profiler."""
+        if hasattr(signal, 'setitimer'):
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def close(self):
+        """Stop the profiler and close the output file (unless stderr)."""
+        self.stop()
+        if self.outputFile is not None and self.outputFile is not sys.stderr:
+            self.outputFile.close()
+
+    def _sample(self, signum, frame):
+        """Signal handler: count a sample for the current activity."""
+        phase = 'other'
+        phases = self.PHASES
+        while frame is not None:
+            if frame.f_code in phases:
+                phase = phases[frame.f_code]
+                break
+            frame = frame.f_back
+        self.samples[phase] = self.samples.get(phase, 0) + 1
+
+    def reset(self):
+        """Forget subcorpus sizes and samples."""
+        self.sizes = {}
+        self.samples = {}
+
+    def update(self, sizes, samples):
+        """Add statistics of another Metrics instance (worker process).
+
+        -- sizes: dict(int: int)
+        -- samples: dict(str: int)
+        """
+        for mine, other in ((self.sizes, sizes), (self.samples, samples)):
+            for key, value in other.iteritems():
+                mine[key] = mine.get(key, 0) + value
+
+    def write(self, **fields):
+        """Write a report, with subcorpus sizes and time split.
+
+        -- fields: dict
+            Other statistics to be written.
+        """
+        fields['sizes'] = dict([(str(size), nb)
+                                for size, nb in self.sizes.iteritems()])
+        fields['cpu_time'] = dict([(phase, round(nb * self.SAMPLING_PERIOD,
+                                                 3))
+                                   for phase, nb in self.samples.iteritems()])
+        print >> self.outputFile, json.dumps(fields, sort_keys=True)
+        self.outputFile.flush()
+
+
 class Distribution:
     """Generate random integers according to a specific function.
 
@@ -533,18 +1502,31 @@ class TMXWriter:
 # Function shared by Aligner class and merge() function
 ###############################################################################
 
-def set_proba(inputFile, inputDict, writer):
+def set_proba(inputFile, inputDict, writer, sortBuffer=0):
     """Update probabilities in alignment file.
 
     -- inputFile: file
         Contains alignments, tab-separated languages + lexical
         weights in last field.
-    -- inputDict: dict(int: dict(int: int))
-        Absolute frequencies of alignments. Keys are alignment lengths (number
-        of bytes), values are dictionaries which keys are alignment hashes and
-        values are integer frequencies.
+    -- inputDict: {Hash,Exact}Counter
+        Absolute frequencies of alignments.
     -- writer: {Plain,Moses,HTML,TMX}Writer
+    -- sortBuffer: int
+        The "-M" command line option value, in bytes. If not 0,
+        set_proba_external() is used.
     """
+    if sortBuffer:
+        def records():
+            inputFile.seek(0)
+            for alNo, line in enumerate(inputFile):
+                alignment, lexWeights = line[:-1].rsplit('\t', 1)
+                yield "%x\t%x\t%s\t\t%s\n" % (alNo, inputDict.get(alignment),
+                                              lexWeights, alignment)
+            inputDict.clear()   # Release memory
+            inputFile.close()   # Delete temporary input file
+        set_proba_external(records(), writer, sortBuffer)
+        return
+
     nbAlignments = 0
     # Sort: read inputFile once to determine where each line begins
     offsetsByFreq = {}
@@ -553,7 +1535,7 @@ def set_proba(inputFile, inputDict, writer):
     for line in inputFile:
         nbAlignments += 1
         alignment = line.rsplit('\t', 1)[0] # Remove lexical weights
-        freq = inputDict[len(alignment)][hash(alignment)]
+        freq = inputDict.get(alignment)
         offsetsByFreq.setdefault(freq, []).append(offset)
         offset += len(line)
     inputDict.clear()   # Release memory
@@ -626,17 +1608,111 @@ def set_proba(inputFile, inputDict, writer):
         tmpFile.close()
 
 
+def set_proba_external(records, writer, sortBuffer):
+    """Compute probabilities with sequential disk accesses only.
+
+    -- records: iterable(str)
+        One line per distinct alignment: <alignmentNo> <TAB> <frequency> <TAB>
+        <lexicalWeights> <TAB> <TAB> <alignment> <EOL>. Integers are
+        hexadecimal, <alignmentNo> is the rank of the alignment in input
+        (used to sort alignments with the same frequency).
+    -- writer: {Plain,Moses,HTML,TMX}Writer
+    -- sortBuffer: int
+        Sort buffer size, see external_sort().
+
+    Same as set_proba(), but nothing is kept in memory besides sort buffers.
+    The (empty) fourth field of <records> receives translation
+    probabilities: for each language, records are sorted according to their
+    phrase in this language, along with the phrase frequencies. Then,
+    records are sorted by decreasing frequency for output.
+    
+    """
+    def keyed(records, languageId):
+        """Prefix records with their phrase in language <languageId>.
+
+        Phrase frequencies are yielded too, so that they come first once
+        sorted.
+        """
+        for record in records:
+            alignment = record[:-1].split('\t', 4)[4]
+            phrase = alignment.split('\t', languageId + 1)[languageId]
+            yield "%s\t0\t%s\n" % (phrase, record.split('\t', 2)[1])
+            yield "%s\t1\t%s" % (phrase, record)
+
+    records = iter(records)
+    try:
+        record = records.next()
+    except StopIteration:
+        message("\r0 alignments\n")
+        return
+    nbLanguages = record.split('\t', 4)[4].count('\t') + 1
+    records = chain([record], records)
+    tmpFile = None
+    try:
+        for languageId in xrange(nbLanguages):
+            message("\rComputing conditional probabilities (%i/%i)...\n" %
+                    (languageId + 1, nbLanguages))
+            newFile = make_temp_file(".al_lw")
+            nbAlignments = 0
+            total, current = 0, None
+            for line in external_sort(keyed(records, languageId), sortBuffer):
+                phrase, kind, record = line.split('\t', 2)
+                if phrase != current:
+                    total, current = 0, phrase
+                if kind == '0':
+                    total += int(record, 16)
+                    continue
+                alNo, freq, lexWeights, probas, alignment = record.split('\t',
+                                                                         4)
+                probas = ("%s %f" % (probas, 1. * int(freq, 16) / total)
+                          ).lstrip()
+                newFile.write("%s\t%s\t%s\t%s\t%s" % (alNo, freq, lexWeights,
+                                                      probas, alignment))
+                nbAlignments += 1
+            if tmpFile is not None:
+                tmpFile.close()
+            tmpFile = newFile
+            tmpFile.seek(0)
+            records = tmpFile
+        message("\r%i alignments\n" % nbAlignments)
+
+        def byFreq(records):
+            """Prefix records with a key for decreasing frequency order."""
+            for record in records:
+                alNo, freq, rest = record.split('\t', 2)
+                yield "%016x\t%s\t%s\t%s" % ((1 << 63) - int(freq, 16),
+                                             alNo.zfill(16), freq, rest)
+
+        message("Sorting alignments and outputting results...\n")
+        try:
+            for line in external_sort(byFreq(records), sortBuffer):
+                _, _, freq, lexWeights, probas, alignment = line.split('\t', 5)
+                writer.write("%s\t%s\t%s\t%i\n" % (alignment[:-1], lexWeights,
+                                                   probas, int(freq, 16)))
+            writer.terminate()
+        except IOError:
+            pass
+    finally:
+        if tmpFile is not None:
+            tmpFile.close()
+
+
 ###############################################################################
 # Merge alignment files
 ###############################################################################
 
-def merge(inputFilenames, writer):
+def merge(inputFilenames, writer, counterClass=HashCounter, sortBuffer=0):
     """Merge alignments from several input files.
 
     -- inputFilenames: list(str)
         List of file names from which alignments have to be merged.
         Standard input is refered to as "-".
     -- writer: {Plain,Moses,HTML,TMX}Writer
+    -- counterClass: class
+        {Hash,Exact}Counter, according to "-c" command line option.
+    -- sortBuffer: int
+        The "-M" command line option value, in bytes. If not 0,
+        merge_external() is used.
 
     An incoming alignment is assumed to be formatted as <alignment> <tab>
     <lexicalWeights> <tab> <translationProbabilities> <TAB> <integer>
@@ -645,11 +1721,9 @@ def merge(inputFilenames, writer):
     different <lexicalWeights> are input, only lexical weights from the
     first alignment are kept.
 
-    To save memory, <alignment>s are dumped in a sequential file. Only the
-    association between <alignment>s' hash values and their frequencies are
-    kept in memory in a dictionary. Thus we assume that two <alignment>s with
-    the same hash value are equal. This is basically wrong, but we have plenty
-    of possible hashes before a collision occurs.
+    To save memory, <alignment>s are dumped in a sequential file. Only their
+    frequencies are kept in memory in a <counterClass> instance (by default,
+    only hash values of <alignment>s are kept).
 
     The output format is the same as input. <alignment>s are guaranteed to be
     unique and are sent to <outputFile>, sorted according to the <integer>
@@ -657,8 +1731,11 @@ def merge(inputFilenames, writer):
     accordingly (one float per language).
     
     """
+    if sortBuffer:
+        merge_external(inputFilenames, writer, sortBuffer)
+        return
     files = []
-    counts = {} # Absolute frequencies of alignments
+    counts = counterClass() # Absolute frequencies of alignments
     weightedAlignmentFile = make_temp_file('.al_lw')
     try:
         for f in inputFilenames:
@@ -671,14 +1748,8 @@ def merge(inputFilenames, writer):
             for line in inputFile:
                 alignment_lw, _, freq = line.rsplit('\t', 2)
                 alignment = alignment_lw.rsplit('\t', 1)[0]
-                bucket = counts.setdefault(len(alignment), {})
-                alignmentHash = hash(alignment)
-                previousFreq = bucket.get(alignmentHash)
-                if previousFreq is None:
-                    bucket[alignmentHash] = int(freq)
+                if counts.add(alignment, int(freq)):
                     print >> weightedAlignmentFile, alignment_lw
-                else:
-                    bucket[alignmentHash] = previousFreq + int(freq)
         
         weightedAlignmentFile.seek(0)
         set_proba(weightedAlignmentFile, counts, writer)
@@ -686,6 +1757,60 @@ def merge(inputFilenames, writer):
         weightedAlignmentFile.close()
         for f in files:
             f.close()
+
+
+def merge_external(inputFilenames, writer, sortBuffer):
+    """Merge alignments from several input files, with bounded memory.
+
+    -- inputFilenames: list(str)
+    -- writer: {Plain,Moses,HTML,TMX}Writer
+    -- sortBuffer: int
+        Sort buffer size, see external_sort().
+
+    Same as merge(), but input files are read one after another, and all
+    incoming alignments are sorted on disk so that identical alignments
+    follow each other. Their frequencies are then summed up, and
+    set_proba_external() does the rest. Counts are exact.
+    
+    """
+    def lines():
+        """Yield input alignments, with their rank in input."""
+        alNo = 0
+        for f in inputFilenames:
+            if f == "-":
+                inputFile = sys.stdin
+            else:
+                inputFile = open_compressed(f)
+            try:
+                for line in inputFile:
+                    alignment_lw, _, freq = line.rsplit('\t', 2)
+                    alignment, lexWeights = alignment_lw.rsplit('\t', 1)
+                    yield "%s\t%016x\t%s\t%s" % (alignment, alNo, lexWeights,
+                                                 freq)
+                    alNo += 1
+            finally:
+                inputFile.close()
+
+    def records():
+        """Yield distinct alignments, as expected by set_proba_external().
+        
+        Lexical weights of the first occurrence are kept.
+        """
+        current = None
+        for line in external_sort(lines(), sortBuffer):
+            alignment, alNo, lexWeights, freq = line.rsplit('\t', 3)
+            if alignment == current:
+                total += int(freq)
+                continue
+            if current is not None:
+                yield "%s\t%x\t%s\t\t%s\n" % (first, total, firstWeights,
+                                              current)
+            current, first, firstWeights = alignment, alNo, lexWeights
+            total = int(freq)
+        if current is not None:
+            yield "%s\t%x\t%s\t\t%s\n" % (first, total, firstWeights, current)
+
+    set_proba_external(records(), writer, sortBuffer)
     
 
     
@@ -697,10 +1822,12 @@ class Aligner:
     """Generate word alignments from sentence-aligned corpora.
 
     -- self.files: list(file)
-        Input files, open for reading.
+        Input files, open for reading (empty if self.cache is used).
     -- self.offsets: list(array.array(int))
         For each file (corresponding indices in self.files), the list of
         positions of start of lines.
+    -- self.cache: CorpusCache
+        The compiled corpus, according to "-C" command line option, or None.
     -- self.nbLanguages: int
         Number of languages in the corpus.
     -- self.corpus: list(lit(int))
@@ -721,13 +1848,21 @@ class Aligner:
         Languages all words are from: len(self.allWords) =
         len(self.wordLanguages). Languages are 0-based.
         max(self.wordLanguages) = self.nbLanguages - 1
-    -- self.counts: dict(int: dict(int: int))
+    -- self.counts: {Hash,Exact}Counter
         Same as <inputDict> argument of set_proba() function.
+    -- self.counterClass: class
+        Class of self.counts, according to "-c" command line option.
     -- self.nbAlignments: int
-        Total number of alignments = sum(len(c) for c in self.counts).
+        Total number of distinct alignments in self.counts.
     -- self.weightedAlignmentFile: file
         Same as <inputFile> argument of set_proba() function.
         Number of lines in this file equals self.nbAlignments.
+    -- self.nbOccurrences: int
+        Sum of the frequencies added to self.counts (distinct alignments
+        and repeats).
+    -- self.metrics: Metrics
+        Where throughput statistics are reported ("-s" command line
+        option), or None.
     -- self.minLanguages: int
         The "-l" command line option value.
     -- self.minSize: int
@@ -741,9 +1876,41 @@ class Aligner:
     -- self.contiguousFields: list(bool)
         For each language, a bool indicates whether only contiguous words
         should be output or not. len(self.contiguousFields) = self.nbLanguages
+    -- self.allNgrams: list(array.array(int))
+        For n = 2...self.indexN, word ids of all n-grams of the subcorpus:
+        n-gram i is self.allNgrams[n-2][n*i:n*i+n].
+    -- self.ngramCorpora: list(tuple(array.array(int), array.array(int)))
+        For n = 2...self.indexN, the n-gram ids of each line of
+        self.corpus, as returned by csr_index() (but in arrays).
+    -- self.ngramIndex: NgramIndex
+        N-grams of the whole corpus, or None if numpy is not available or
+        self.indexN is 1.
+    -- self.corpusIndex: tuple(numpy.ndarray, numpy.ndarray)
+        Copy of self.corpus returned by csr_index(), or None if numpy is not
+        available.
+    -- self.ngramIndexes: list(tuple(numpy.ndarray, numpy.ndarray))
+        Same as self.corpusIndex, for each of self.ngramCorpora.
     -- self.weightFunc: function
-        {self._dummy_weight|self._lexical_weight}, according to
-        "-w" command line flag.
+        {self._dummy_weight|self._lexical_weight|self._vector_lexical_weight},
+        according to "-w" command line flag (and numpy availability).
+    -- self.nbJobs: int
+        The "-j" command line option value: number of worker processes
+        sampling subcorpora in parallel (1 for no worker process).
+    -- self.sortBuffer: int
+        The "-M" command line option value, in bytes (see set_proba()).
+    -- self.checkpointName: str
+        The "-k" command line option value, or None. Alignment state is
+        periodically saved into this file, alignment files are kept in
+        self.checkpointName + ".al" and self.checkpointName + ".al_lw"
+        instead of temporary files.
+    -- self.checkpointInterval: float
+        The "-K" command line option value: seconds between checkpoints.
+    -- self.progress: dict
+        Where the alignment of the whole corpus stands: line numbers not
+        processed yet ("lines"), those of the current subcorpus
+        ("selection"), the number of subcorpora left ("nbCorpToDo"), and
+        the corpus size and number of subcorpora the run was started with
+        ("nbLines", "nbCorpora").
 
     Main process is as follows:
     1) Read all input files, keep only line start offsets in memory;
@@ -763,7 +1930,10 @@ class Aligner:
 
     def __init__(self, inputFilenames, writer, nbNewAlignments, maxNbLines,
                  timeout, doLexWeight, discontiguousFields, minLanguages,
-                 minSize, maxSize, delimiter, indexN):
+                 minSize, maxSize, delimiter, indexN, nbJobs=1,
+                 counterClass=HashCounter, cacheName=None, sortBuffer=0,
+                 checkpointName=None, checkpointInterval=600., resume=False,
+                 metrics=None):
         """Initializer.
 
         Main process is coded in initializer. That's not very clean, but
@@ -794,7 +1964,40 @@ class Aligner:
             The "-d" command line option value.
         -- indexN: int
             The "-i" command line option value.
+        -- nbJobs: int
+            The "-j" command line option value.
+        -- counterClass: class
+            = self.counterClass
+        -- cacheName: str
+            The "-C" command line option value. If this file exists, the
+            corpus is read from it instead of <inputFilenames>. Otherwise,
+            it is compiled from <inputFilenames> first.
+        -- sortBuffer: int
+            = self.sortBuffer
+        -- checkpointName: str
+            = self.checkpointName
+        -- checkpointInterval: float
+            = self.checkpointInterval
+        -- resume: bool
+            Indicates whether alignment restarts from the state saved into
+            <checkpointName> (the "-r" command line flag). Input files and
+            options should be the same as those of the interrupted run.
+        -- metrics: Metrics
+            = self.metrics
         """
+        self.nbJobs = nbJobs
+        self.metrics = metrics
+        self.sortBuffer = sortBuffer
+        self.checkpointName = checkpointName
+        self.checkpointInterval = checkpointInterval
+        state = None
+        if resume:
+            stateFile = open(checkpointName, 'rb')
+            try:
+                state = cPickle.load(stateFile)
+            finally:
+                stateFile.close()
+        self.counterClass = counterClass
         self.minSize = minSize
         self.maxSize = maxSize
         if delimiter:
@@ -802,26 +2005,62 @@ class Aligner:
         else:
             self.delimiter = None
         self.indexN = max(indexN, 1)
-        if doLexWeight:
+        if doLexWeight and numpy is not None:
+            self.weightFunc = self._vector_lexical_weight
+        elif doLexWeight:
             self.weightFunc = self._lexical_weight
         else:
             self.weightFunc = self._dummy_weight
-        self.counts = {}
-        self.nbAlignments = 0   # = sum(len(c) for c in self.counts)
+        if state is None:
+            self.counts = counterClass()
+            self.nbAlignments = 0
+            self.nbOccurrences = 0
+            self.weightedAlignmentFile = self.make_work_file(".al_lw")
+        else:
+            self.counts = state['counts']
+            self.nbAlignments = state['nbAlignments']
+            self.nbOccurrences = state['nbOccurrences']
+            self.weightedAlignmentFile = self.make_work_file(
+                ".al_lw", state['weightedPosition'])
         self.files = []
-        self.weightedAlignmentFile = make_temp_file(".al_lw")
+        self.cache = None
+        self.ngramIndex = None
+        tmpCacheFile = None
         try:
-            for f in inputFilenames:
-                if f == "-":
-                    inFile = make_temp_file(".stdin")
-                    inFile.writelines(sys.stdin)
-                    inFile.seek(0)
-                    self.files.append(inFile)
-                else:
-                    self.files.append(open_compressed(f))
+            if cacheName is None and self.indexN > 1 and numpy is not None:
+                # NgramIndex requires corpus-wide word ids
+                tmpCacheFile = make_temp_file(".cache")
+                cacheName = tmpCacheFile.name
+            if tmpCacheFile is None and cacheName is not None and \
+               os.path.exists(cacheName):
+                message("Reading corpus cache %s\n" % cacheName)
+            else:
+                for f in inputFilenames:
+                    if f == "-":
+                        inFile = make_temp_file(".stdin")
+                        inFile.writelines(sys.stdin)
+                        inFile.seek(0)
+                        self.files.append(inFile)
+                    else:
+                        self.files.append(open_compressed(f))
+                if cacheName is not None:
+                    if tmpCacheFile is None:
+                        message("Compiling corpus cache %s\n" % cacheName)
+                    CorpusCache.compile(self.files, cacheName)
+                    for f in self.files:
+                        f.close()
+                    self.files = []
+            if cacheName is not None:
+                self.cache = CorpusCache(cacheName)
+                nbLines = self.cache.nbLines
+                self.nbLanguages = self.cache.nbLanguages
+                if self.indexN > 1 and numpy is not None:
+                    message("Indexing n-grams\n")
+                    self.ngramIndex = NgramIndex(self.cache, self.indexN)
             self.offsets = []
-            nbLines = None
-            self.nbLanguages = 0
+            if self.cache is None:
+                nbLines = None
+                self.nbLanguages = 0
             for f in self.files:
                 offset = 0
                 fileOffsets = []
@@ -869,22 +2108,52 @@ class Aligner:
                     timeout /= 1. * nbCorpora
                     message(" (timeout: %.2fs each)" % timeout)
                 message("\n")
-            lines = range(nbLines)
-            random.shuffle(lines)
-            for nbCorpToDo in xrange(nbCorpora, 0, -1):
+            if state is None:
+                lines = range(nbLines)
+                random.shuffle(lines)
+                self.progress = {'lines': lines, 'nbCorpToDo': nbCorpora,
+                                 'nbCorpora': nbCorpora, 'nbLines': nbLines}
+            else:
+                assert (state['progress']['nbLines'], state['progress'][
+                    'nbCorpora']) == (nbLines, nbCorpora), \
+                    "Input corpus or -S option differ from checkpoint"
+                self.progress = state['progress']
+                message("Resuming from checkpoint %s\n" % checkpointName)
+            while self.progress['nbCorpToDo']:
+                nbCorpToDo = self.progress['nbCorpToDo']
                 if nbCorpora > 1:
                     message("\r%i subcorpora remaining\n" % nbCorpToDo)
-                selection = [lines.pop() for _ in
-                             xrange(int(math.ceil(1. * len(lines) /
-                                                  nbCorpToDo)))]
-                selection.sort()    # Speed up disk access
-                self.set_corpus(selection)
-                self.run(timeout, nbNewAlignments)
-            set_proba(self.weightedAlignmentFile, self.counts, writer)
+                runState = None
+                if state is None or state['run'] is None:
+                    lines = self.progress['lines']
+                    selection = [lines.pop() for _ in
+                                 xrange(int(math.ceil(1. * len(lines) /
+                                                      nbCorpToDo)))]
+                    selection.sort()    # Speed up disk access
+                    self.progress['selection'] = selection
+                else:
+                    runState = state['run']
+                self.set_corpus(self.progress['selection'])
+                if state is not None:
+                    random.setstate(state['random'])
+                    state = None
+                self.run(timeout, nbNewAlignments, runState)
+                self.progress['nbCorpToDo'] -= 1
+                if checkpointName is not None:
+                    self.checkpoint()
+            set_proba(self.weightedAlignmentFile, self.counts, writer,
+                      self.sortBuffer)
         finally:
             self.weightedAlignmentFile.close()
             for f in self.files:
                 f.close()
+            if self.cache is not None:
+                self.cache.close()
+            if tmpCacheFile is not None:
+                tmpCacheFile.close()
+        if checkpointName is not None:
+            # The output is complete: the run cannot be resumed any more
+            self.remove_checkpoint()
 
         
 
@@ -892,12 +2161,29 @@ class Aligner:
         """Load subcorpus into memory.
 
         -- lines: list(int)
-            The line numbers. These are indices of arrays in self.offsets.
+            The line numbers. These are indices of arrays in self.offsets
+            (or line ids in self.cache).
         """
         self.corpus = [[] for _ in lines]
         self.allWords, self.wordLanguages = [], []
         allWordIds = [{} for _ in xrange(self.nbLanguages)]
         nbLanguagesDone = 0
+        if self.cache is not None:
+            # Same as below, without any string parsing
+            cache = self.cache
+            cacheWordIds = {}
+            for fileId in xrange(len(cache.fileLanguages)):
+                for lineId, offsetId in enumerate(lines):
+                    line = self.corpus[lineId]
+                    for cacheId in cache.line(offsetId, fileId):
+                        wordId = cacheWordIds.get(cacheId)
+                        if wordId is None:
+                            wordId = len(self.allWords)
+                            cacheWordIds[cacheId] = wordId
+                            self.allWords.append(cache.word(cacheId))
+                            self.wordLanguages.append(
+                                cache.wordLanguages[cacheId])
+                        line.append(wordId)
         # Read files sequentially, rather than in parallel (faster)
         for f, fileOffsets in zip(self.files, self.offsets):
             for lineId, offsetId in enumerate(lines):
@@ -951,6 +2237,32 @@ class Aligner:
         # complete rewriting to handle this properly, as Anymalign was
         # first designed to process only words.
 
+        if self.ngramIndex is not None:
+            # Only slice the index built once for the whole corpus
+            wordIds = numpy.zeros(len(self.cache.wordLanguages), numpy.int32)
+            wordIds[cacheWordIds.keys()] = [newPos[wordId] for wordId
+                                            in cacheWordIds.itervalues()]
+            del cacheWordIds
+            self.allNgrams, self.ngramCorpora = self.ngramIndex.subcorpus(
+                lines, wordIds)
+        else:
+            self.set_ngrams()
+
+        if numpy is not None:
+            self.corpusIndex = csr_index(self.corpus)
+            self.ngramIndexes = [
+                (numpy.frombuffer(items, numpy.int32, len(items)),
+                 numpy.array(bounds, numpy.int64))
+                for items, bounds in self.ngramCorpora]
+        else:
+            self.corpusIndex, self.ngramIndexes = None, None
+
+
+    def set_ngrams(self):
+        """Compute self.allNgrams and self.ngramCorpora from self.corpus.
+
+        This is only used when there is no NgramIndex.
+        """
         ngramRange = range(2, self.indexN + 1)
         languageRange = range(self.nbLanguages)
 
@@ -980,6 +2292,17 @@ class Aligner:
                         ngramSentence.add(ngramId)
             for n in ngramRange:
                 self.ngramCorpora[n-2].append(sorted(ngramSentences[n-2]))
+        del allNgramIds
+
+        # Keep compact copies only
+        for n in ngramRange:
+            self.allNgrams[n-2] = array('i', chain(*self.allNgrams[n-2]))
+            bounds = array('l', [0])
+            for ngramSentence in self.ngramCorpora[n-2]:
+                bounds.append(bounds[-1] + len(ngramSentence))
+            self.ngramCorpora[n-2] = (array('i',
+                                            chain(*self.ngramCorpora[n-2])),
+                                      bounds)
 
 
     def main_distribution(self, k):
@@ -989,7 +2312,7 @@ class Aligner:
         #return 1
 
 
-    def run(self, timeout, nbNewAlignments):
+    def run(self, timeout, nbNewAlignments, runState=None):
         """Extract alignments from subcorpus loaded into memory.
 
         -- timeout: float
@@ -997,7 +2320,12 @@ class Aligner:
             if not all-in-memory).
         -- nbNewAlignments: int
             The "-a" command line argument.
+        -- runState: dict
+            Progress of an interrupted run, as saved by self.checkpoint(), or
+            None to start from scratch. Time already spent counts towards
+            <timeout>.
         """
+        global _jobContext
         nbLines = len(self.corpus)
         if nbLines > 2: # Speed up by not using subcorpora of size 1 or nbLines
             nextRandomSize = Distribution(
@@ -1020,11 +2348,36 @@ class Aligner:
         lastWriteTime = startTime = time()
         speed = sys.maxint
 
+        if runState is not None:
+            nb2 = runState['nb2']
+            nbSubcorporaDone = runState['nbSubcorporaDone']
+            subcorporaDoneSum = runState['subcorporaDoneSum']
+            startTime -= runState['elapsedTime']
+        lastCheckpointTime = lastWriteTime
+        lastReportTime, lastReportNbAl = lastWriteTime, self.nbAlignments
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.reset()
+            metrics.start()
+
         print >> sys.stderr, "\rAligning... (ctrl-c to interrupt)"
         # Do not compress this temp file ! Some alignments are not actually
         # written with KeyboardInterrupt (may be because of psyco)
-        tmpFile = make_temp_file(".al")
+        if runState is None:
+            tmpFile = self.make_work_file(".al")
+        else:
+            tmpFile = self.make_work_file(".al", runState['tmpPosition'])
+        pool = None
+        pendingJobs = None
+        jobFiles = []
         try:
+            if self.nbJobs > 1:
+                # Fork workers now, so that they share the subcorpus loaded
+                # into memory by set_corpus()
+                _jobContext = (self, nextRandomSize)
+                pool = multiprocessing.Pool(self.nbJobs, _init_job)
+                jobFiles = [make_temp_file(".job%i.al" % i)
+                            for i in xrange(self.nbJobs)]
             try:
                 while speed > nbNewAlignments:
                     t = time()
@@ -1045,30 +2398,82 @@ class Aligner:
                         previousWriteLen = len(toWrite)
                         previousNbAl = self.nbAlignments
                         lastWriteTime = t
+                        if self.checkpointName is not None and \
+                           t - lastCheckpointTime >= self.checkpointInterval:
+                            self.checkpoint(tmpFile, {
+                                'nb2': nb2,
+                                'nbSubcorporaDone': nbSubcorporaDone,
+                                'subcorporaDoneSum': subcorporaDoneSum,
+                                'elapsedTime': t - startTime})
+                            lastCheckpointTime = t
+                        if metrics is not None and \
+                           t - lastReportTime >= metrics.interval:
+                            self.report('progress', t - startTime,
+                                        nbSubcorporaDone,
+                                        (self.nbAlignments - lastReportNbAl)
+                                        / (t - lastReportTime))
+                            lastReportTime = t
+                            lastReportNbAl = self.nbAlignments
                     
                     
-                    subcorpusSize = nextRandomSize()
-                    while subcorpusSize > MAX_SUBCORPUS_SIZE:
-                        subcorpusSize = nextRandomSize()
-                    if subcorpusSize == 2:
-                        nb2 += 1
-                    
-                    nbSubcorporaDone += 1
-                    subcorporaDoneSum += subcorpusSize
-                    self.align(random.sample(xrange(nbLines), subcorpusSize),
-                               tmpFile)
+                    if pool is None:
+                        # Counted before aligning, so that an interrupted
+                        # subcorpus counts (its alignments are kept)
+                        subcorpusSize = self.next_size(nextRandomSize)
+                        if subcorpusSize == 2:
+                            nb2 += 1
+                        nbSubcorporaDone += 1
+                        subcorporaDoneSum += subcorpusSize
+                        self.sample(subcorpusSize, tmpFile)
+                    else:
+                        duration = JOB_ROUND_TIME
+                        if timeout is not None:
+                            duration = min(duration, startTime + timeout - t)
+                        pendingJobs = self.start_jobs(pool, jobFiles,
+                                                      duration)
+                        results = _wait_jobs(pendingJobs)
+                        pendingJobs = None
+                        done, doneSum, done2 = self.merge_jobs(results,
+                                                               jobFiles,
+                                                               tmpFile)
+                        nb2 += done2
+                        nbSubcorporaDone += done
+                        subcorporaDoneSum += doneSum
             except KeyboardInterrupt:
+                if pendingJobs is not None:
+                    # Workers ignore ctrl-c and end their round by
+                    # themselves: keep its alignments
+                    message("\rInterrupted, waiting for the current round "
+                            "of jobs to end...")
+                    results = _wait_jobs(pendingJobs)
+                    pendingJobs = None
+                    done, doneSum, done2 = self.merge_jobs(results, jobFiles,
+                                                           tmpFile)
+                    nb2 += done2
+                    nbSubcorporaDone += done
+                    subcorporaDoneSum += doneSum
                 toWrite = "(%i subcorpora, avg=%.2f) Alignment interrupted! " \
                           "Proceeding..." % (nbSubcorporaDone,
                                              1. * subcorporaDoneSum
-                                             / nbSubcorporaDone)
+                                             / max(nbSubcorporaDone, 1))
             else:
                 toWrite = "(%i subcorpora, avg=%.2f) Alignment done, " \
                           "proceeding... " % (nbSubcorporaDone,
                                               1. * subcorporaDoneSum
-                                              / nbSubcorporaDone)
+                                              / max(nbSubcorporaDone, 1))
             print >> sys.stderr, "\r%s%s" % \
                   (toWrite, " " * (previousWriteLen - len(toWrite)))
+            if metrics is not None:
+                metrics.stop()
+                t = time()
+                self.report('done', t - startTime, nbSubcorporaDone,
+                            (self.nbAlignments - lastReportNbAl)
+                            / max(t - lastReportTime, 1e-6))
+            if self.checkpointName is not None:
+                self.checkpoint(tmpFile, {
+                    'nb2': nb2, 'nbSubcorporaDone': nbSubcorporaDone,
+                    'subcorporaDoneSum': subcorporaDoneSum,
+                    'elapsedTime': time() - startTime})
             
             if nbLines > 2:
                 # Add alignments from subcorpora of sizes 1 and nbLines
@@ -1094,12 +2499,187 @@ class Aligner:
                     if w:
                         self.align(xrange(nbLines), tmpFile, w)
             
+            if pool is not None:
+                pool.close()
+                pool.join()
+                pool = None
+            self.corpusIndex, self.ngramIndexes = None, None
             tmpFile.seek(0)
             self.weightFunc(tmpFile)
         finally:
+            if metrics is not None:
+                metrics.stop()
+            if pool is not None:
+                pool.terminate()
+            for f in jobFiles:
+                f.close()
             tmpFile.close()
 
 
+    def report(self, event, elapsedTime, nbSubcorporaDone, speed):
+        """Write throughput statistics of self.run() to self.metrics.
+
+        -- event: str
+            "progress" during alignment, "done" at the end of a subcorpus.
+        -- elapsedTime: float
+            Seconds spent aligning the current subcorpus.
+        -- nbSubcorporaDone: int
+            Number of random subcorpora aligned.
+        -- speed: float
+            New alignments per second since the last report.
+        """
+        self.metrics.write(
+            event=event,
+            corpus=self.progress['nbCorpora'] - self.progress['nbCorpToDo'],
+            elapsed=round(elapsedTime, 3),
+            subcorpora=nbSubcorporaDone,
+            alignments=self.nbAlignments,
+            repeats=self.nbOccurrences - self.nbAlignments,
+            alignments_per_s=round(speed, 1),
+            counts_bytes=self.counts.memory())
+
+    def make_work_file(self, suf, position=None):
+        """Return a new file for alignments.
+
+        -- suf: str
+        -- position: int
+            Size to which an existing file is truncated, or None to create
+            a new file.
+
+        A temporary file is returned, unless checkpoints are requested. In
+        that case, the file name is self.checkpointName + <suf>.
+        
+        """
+        if self.checkpointName is None:
+            return make_temp_file(suf)
+        if position is None:
+            return open(self.checkpointName + suf, 'w+b')
+        workFile = open(self.checkpointName + suf, 'r+b')
+        workFile.truncate(position)
+        workFile.seek(position)
+        return workFile
+
+    def checkpoint(self, tmpFile=None, runState=None):
+        """Save alignment state into self.checkpointName.
+
+        -- tmpFile: file
+            Alignments of the current subcorpus (see self.run()), or None
+            between two subcorpora.
+        -- runState: dict
+            Progress of self.run() (counters and elapsed time), or None
+            between two subcorpora.
+
+        Alignment files are only flushed: their current sizes are saved,
+        anything written after that is discarded when resuming. The state
+        file is replaced atomically.
+        
+        """
+        files = [self.weightedAlignmentFile]
+        if tmpFile is not None:
+            files.append(tmpFile)
+        for f in files:
+            f.flush()
+            os.fsync(f.fileno())
+        if runState is not None:
+            runState['tmpPosition'] = tmpFile.tell()
+        state = {'progress': self.progress, 'run': runState,
+                 'counts': self.counts, 'nbAlignments': self.nbAlignments,
+                 'nbOccurrences': self.nbOccurrences,
+                 'weightedPosition': self.weightedAlignmentFile.tell(),
+                 'random': random.getstate()}
+        stateFile = open(self.checkpointName + ".tmp", 'wb')
+        try:
+            cPickle.dump(state, stateFile, cPickle.HIGHEST_PROTOCOL)
+            stateFile.flush()
+            os.fsync(stateFile.fileno())
+        finally:
+            stateFile.close()
+        os.rename(self.checkpointName + ".tmp", self.checkpointName)
+
+    def remove_checkpoint(self):
+        """Delete self.checkpointName and its alignment files."""
+        for suf in ("", ".al", ".al_lw", ".tmp"):
+            if os.path.exists(self.checkpointName + suf):
+                os.remove(self.checkpointName + suf)
+
+    def next_size(self, nextRandomSize):
+        """Return a random subcorpus size, never greater than
+        MAX_SUBCORPUS_SIZE.
+
+        -- nextRandomSize: function
+            Returns random subcorpus sizes.
+        
+        """
+        subcorpusSize = nextRandomSize()
+        while subcorpusSize > MAX_SUBCORPUS_SIZE:
+            subcorpusSize = nextRandomSize()
+        return subcorpusSize
+
+
+    def sample(self, subcorpusSize, outputFile):
+        """Align a single random subcorpus.
+
+        -- subcorpusSize: int
+            See self.next_size().
+        -- outputFile: file
+        
+        """
+        self.align(random.sample(xrange(len(self.corpus)), subcorpusSize),
+                   outputFile)
+        if self.metrics is not None:
+            self.metrics.add_size(subcorpusSize)
+
+
+    def start_jobs(self, pool, jobFiles, duration):
+        """Let worker processes align random subcorpora.
+
+        -- pool: multiprocessing.Pool
+            Its workers were forked after the subcorpus was loaded.
+        -- jobFiles: list(file)
+            One temporary file per worker process.
+        -- duration: float
+            Time (in seconds) each worker spends sampling.
+
+        Every worker samples with its own random seed and counts alignments
+        independently. Return the multiprocessing.AsyncResult of the
+        workers, to be passed to self.merge_jobs().
+        
+        """
+        jobs = [(random.randrange(sys.maxint), duration, f.name)
+                for f in jobFiles]
+        return pool.map_async(_align_job, jobs, 1)
+
+
+    def merge_jobs(self, results, jobFiles, outputFile):
+        """Merge the results of the workers started by self.start_jobs().
+
+        -- results: list(tuple)
+            What the workers returned (see _align_job()).
+        -- jobFiles: list(file)
+        -- outputFile: file
+
+        The counts of the workers are added to self.counts, new alignments
+        are written to <outputFile>, as align() would do. Return the number
+        of subcorpora processed, the sum of their sizes, and the number of
+        subcorpora of size 2.
+        
+        """
+        if self.metrics is not None:
+            for result in results:
+                self.metrics.update(*result[3])
+        for f in jobFiles:
+            jobFile = open(f.name, 'rb')
+            try:
+                for line in jobFile:
+                    stringToPrint, freq = line[:-1].rsplit('\t', 1)
+                    self.add_alignment(self.to_words(stringToPrint),
+                                       stringToPrint, int(freq, 16),
+                                       outputFile)
+            finally:
+                jobFile.close()
+        return [sum(r) for r in zip(*results)[:3]]
+
+
     def align(self, lineIds, outputFile, weight=1):
         """Get all possible alignments from the specified corpus lines.
 
@@ -1125,16 +2705,28 @@ class Aligner:
         """
         
         corpus = self.corpus
-        languageRange = range(self.nbLanguages)
         ngramRange = range(2, self.indexN + 1)
 
         vec_word = {}   # {tuple(int): set(int)}
         vw_setdefault = vec_word.setdefault
+        vectorize = (self.corpusIndex is not None and
+                     len(lineIds) >= VECTORIZE_MIN_LINES)
         
         for n in xrange(1, self.indexN + 1):
             
             
-            if n == 1:
+            if vectorize and n == 1:
+                for linesAp, words in group_by_lines(self.corpusIndex,
+                                                     lineIds):
+                    vw_setdefault(linesAp, set()).update(words)
+            elif vectorize:
+                ngrams = self.allNgrams[n-2]
+                for linesAp, ngramIds in group_by_lines(
+                    self.ngramIndexes[n-2], lineIds):
+                    wordSet = vw_setdefault(linesAp, set())
+                    for ngram in ngramIds:
+                        wordSet.update(ngrams[n*ngram:n*ngram+n])
+            elif n == 1:
                 word_ap = {}
                 wa_setdefault = word_ap.setdefault
                 for lineId in lineIds:
@@ -1148,90 +2740,127 @@ class Aligner:
             else:
                 ngram_ap = {}
                 na_setdefault = ngram_ap.setdefault
-                ngramCorpus = self.ngramCorpora[n-2]
+                ngramItems, ngramBounds = self.ngramCorpora[n-2]
+                ngrams = self.allNgrams[n-2]
                 for lineId in lineIds:
-                    for ngram in ngramCorpus[lineId]:
+                    for ngram in ngramItems[ngramBounds[lineId]:
+                                            ngramBounds[lineId+1]]:
                         na_setdefault(ngram, []).append(lineId)
                 for ngram, linesAp in ngram_ap.iteritems():
                     vw_setdefault(tuple(linesAp), set()
-                                  ).update(self.allNgrams[n-2][ngram])
+                                  ).update(ngrams[n*ngram:n*ngram+n])
 
             # Above part was changed with new option "-i", rest is identical
             
+            self.extract(vec_word, outputFile, weight)
 
-            minNbWords = self.minLanguages + self.minSize - 1
-            for linesAp, wordSet in vec_word.iteritems():
-                # Check if there are enough words
-                if len(wordSet) < minNbWords:
-                    continue
-                
-                # Check if there are words in at least minLanguages
-                l = set()
-                for word in wordSet:
-                    l.add(self.wordLanguages[word])
-                    if len(l) == self.minLanguages:
-                        break
-                if len(l) < self.minLanguages:
-                    continue
 
-                #wordSet = set(wordSet) # Now it is a a set already
-                
-                for lineId in linesAp:
-                    words = corpus[lineId]
-                    perfect = [[] for _ in languageRange]
-                    context = [[] for _ in languageRange]
-                    for wordPos, word in enumerate(words):
-                        l = self.wordLanguages[word]
-                        if word in wordSet:
-                            perfect[l].append(wordPos)
-                        else:
-                            context[l].append(wordPos)
-                            
-                    for candidate in (perfect, context):
-                        nbLanguages = 0
-                        for languageId, phrase in enumerate(candidate):
-                            # Check for contiguity
-                            if (self.contiguousFields[languageId] and phrase
-                                and phrase[-1] - phrase[0] != len(phrase) - 1):
-                                candidate[languageId] = []
-                            # Check for length
-                            elif not (self.minSize <= len(phrase)
-                                      <= self.maxSize):
-                                candidate[languageId] = []
-                            
-                            if candidate[languageId]:
-                                nbLanguages += 1
+    def extract(self, vec_word, outputFile, weight):
+        """Output the alignments of groups of words (step 2 of align()).
+
+        -- vec_word: dict(tuple(int): set(int))
+            Groups of words, indexed by the lines they all appear on.
+        -- outputFile: file
+        -- weight: int
+        """
+        corpus = self.corpus
+        languageRange = range(self.nbLanguages)
+        minNbWords = self.minLanguages + self.minSize - 1
+        for linesAp, wordSet in vec_word.iteritems():
+            # Check if there are enough words
+            if len(wordSet) < minNbWords:
+                continue
+            
+            # Check if there are words in at least minLanguages
+            l = set()
+            for word in wordSet:
+                l.add(self.wordLanguages[word])
+                if len(l) == self.minLanguages:
+                    break
+            if len(l) < self.minLanguages:
+                continue
+
+            #wordSet = set(wordSet) # Now it is a a set already
+            
+            for lineId in linesAp:
+                words = corpus[lineId]
+                perfect = [[] for _ in languageRange]
+                context = [[] for _ in languageRange]
+                for wordPos, word in enumerate(words):
+                    l = self.wordLanguages[word]
+                    if word in wordSet:
+                        perfect[l].append(wordPos)
+                    else:
+                        context[l].append(wordPos)
                         
-                        if nbLanguages < self.minLanguages:
-                            continue
-
-                        for i, phrase in enumerate(candidate):
-                            prev = None
-                            newPhrase = []
-                            for wordPos in phrase:
-                                if self.delimiter and prev is not None and \
-                                   wordPos != prev + 1:
-                                    newPhrase.append(0)
-                                newPhrase.append(words[wordPos])
-                                prev = wordPos
-                            candidate[i] = newPhrase
-
-                        stringToPrint = '\t'.join([' '.join([hex(w)[2:]
-                                                             for w in phrase])
-                                                   for phrase in candidate])
-                        alString = '\t'.join([' '.join([self.allWords[w]
-                                                            for w in phrase])
-                                                  for phrase in candidate])
-                        bucket = self.counts.setdefault(len(alString), {})
-                        alHash = hash(alString)
-                        alFreq = bucket.get(alHash)
-                        if alFreq is None:
-                            bucket[alHash] = weight
-                            print >> outputFile, stringToPrint
-                            self.nbAlignments += 1
-                        else:
-                            bucket[alHash] = alFreq + weight
+                for candidate in (perfect, context):
+                    nbLanguages = 0
+                    for languageId, phrase in enumerate(candidate):
+                        # Check for contiguity
+                        if (self.contiguousFields[languageId] and phrase
+                            and phrase[-1] - phrase[0] != len(phrase) - 1):
+                            candidate[languageId] = []
+                        # Check for length
+                        elif not (self.minSize <= len(phrase)
+                                  <= self.maxSize):
+                            candidate[languageId] = []
+                        
+                        if candidate[languageId]:
+                            nbLanguages += 1
+                    
+                    if nbLanguages < self.minLanguages:
+                        continue
+
+                    for i, phrase in enumerate(candidate):
+                        prev = None
+                        newPhrase = []
+                        for wordPos in phrase:
+                            if self.delimiter and prev is not None and \
+                               wordPos != prev + 1:
+                                newPhrase.append(0)
+                            newPhrase.append(words[wordPos])
+                            prev = wordPos
+                        candidate[i] = newPhrase
+
+                    stringToPrint = '\t'.join([' '.join([hex(w)[2:]
+                                                         for w in phrase])
+                                               for phrase in candidate])
+                    alString = '\t'.join([' '.join([self.allWords[w]
+                                                        for w in phrase])
+                                              for phrase in candidate])
+                    self.add_alignment(alString, stringToPrint, weight,
+                                       outputFile)
+
+
+    def add_alignment(self, alString, stringToPrint, weight, outputFile):
+        """Count one occurrence of an alignment.
+
+        -- alString: str
+            The alignment, made of actual words.
+        -- stringToPrint: str
+            The same alignment, made of hexadecimal word ids.
+        -- weight: int
+            Frequency to be added.
+        -- outputFile: file
+            <stringToPrint> is written into it if the alignment is new.
+        """
+        self.nbOccurrences += weight
+        if self.counts.add(alString, weight):
+            # One write, so that ctrl-c cannot split the line
+            outputFile.write(stringToPrint + '\n')
+            self.nbAlignments += 1
+
 
+    def to_words(self, stringToPrint):
+        """Replace hexadecimal word ids by original strings.
+
+        -- stringToPrint: str
+            An alignment, as written by align() (without end of line).
+        """
+        return '\t'.join([' '.join([self.allWords[int(word, 16)]
+                                    for word in phrase.split()])
+                          for phrase in stringToPrint.split(
+                              '\t', self.nbLanguages - 1)])
 
     def _dummy_weight(self, inputFile):
         """Simply replace word ids by original strings.
@@ -1274,12 +2903,8 @@ class Aligner:
         dictFile = make_temp_file(".dict.gz")
         zDictFile = gzip.GzipFile(fileobj=dictFile, mode="wb", compresslevel=1)
         try:
-            for alLength, c in self.counts.iteritems():
-                print >> zDictFile, hex(alLength)[2:]
-                for alHash_freq in c.iteritems():
-                    print >> zDictFile, "%x %x" % alHash_freq
+            self.counts.dump(zDictFile)
             zDictFile.close()
-            self.counts.clear()
             
             message("\rComputing word cooccurrences...\n")
             nextPercentage = Progression(nbSourceWords).next
@@ -1376,17 +3001,219 @@ class Aligner:
             # Recover alignment counts from temporary file
             dictFile.seek(0)
             zDictFile = gzip.GzipFile(fileobj=dictFile, mode="rb")
-            c = None
-            for line in zDictFile:
-                numbers = line.split(" ", 1)
-                if len(numbers) == 1:
-                    c = self.counts.setdefault(int(numbers[0], 16), {})
-                else:
-                    c[int(numbers[0], 16)] = int(numbers[1], 16)
+            self.counts.load(zDictFile)
             zDictFile.close()
         finally:
             dictFile.close()
 
+    def _vector_lexical_weight(self, inputFile):
+        """Same as self._lexical_weight(), using numpy.
+
+        -- inputFile: file
+
+        Word cooccurrences are counted into a CoocMatrix, and alignments
+        are weighted LEX_WEIGHT_BLOCK at a time.
+        
+        """
+        FH = len(self.wordFreq) - self.wordFreq.count(1)    # First Hapax
+        wordLanguages = numpy.array(self.wordLanguages, numpy.int32)
+        wordFreq = numpy.array(self.wordFreq, numpy.float64)
+
+        # Dump alignment counts into temporary file to save memory
+        dictFile = make_temp_file(".dict.gz")
+        zDictFile = gzip.GzipFile(fileobj=dictFile, mode="wb", compresslevel=1)
+        try:
+            self.counts.dump(zDictFile)
+            zDictFile.close()
+
+            message("\rComputing word cooccurrences...\n")
+            # Make all words appear at most once on all lines and remove
+            # hapaxes (see self._lexical_weight())
+            for lineId, line in enumerate(self.corpus):
+                self.corpus[lineId] = [word for word in set(line)
+                                       if word < FH]
+            corpusIndex = csr_index(self.corpus)
+            del self.corpus
+            coocMatrix = CoocMatrix(FH, corpusIndex, wordLanguages)
+            del corpusIndex
+
+            message("\rComputing lexical weights...\n")
+            nextPercentage = Progression(self.nbAlignments).next
+            nbSplits = self.nbLanguages - 1
+            block = []
+            for line in chain(inputFile, [None]):
+                if line is not None:
+                    block.append([[int(word, 16) for word in phrase.split()]
+                                  for phrase in line.split('\t', nbSplits)])
+                    if len(block) < LEX_WEIGHT_BLOCK:
+                        continue
+                if not block:
+                    break
+                lexWeights = self._block_lexical_weights(block, FH,
+                                                         coocMatrix,
+                                                         wordFreq).tolist()
+                # Replace word ids by original strings
+                for alignment0, weights in izip(block, lexWeights):
+                    print >> self.weightedAlignmentFile, "%s\t%s" % \
+                          ('\t'.join([' '.join([self.allWords[word]
+                                                for word in phrase])
+                                      for phrase in alignment0]),
+                           ' '.join(["%f" % lw for lw in weights]))
+                nextPercentage(len(block))
+                block = []
+
+            del coocMatrix
+
+            # Recover alignment counts from temporary file
+            dictFile.seek(0)
+            zDictFile = gzip.GzipFile(fileobj=dictFile, mode="rb")
+            self.counts.load(zDictFile)
+            zDictFile.close()
+        finally:
+            dictFile.close()
+
+    def _block_lexical_weights(self, block, FH, coocMatrix, wordFreq):
+        """Compute the lexical weights of a list of alignments.
+
+        -- block: list(list(list(int)))
+            Alignments: one list of word ids per language (0 stands for a
+            discontinuity).
+        -- FH: int
+            First hapax word id.
+        -- coocMatrix: CoocMatrix
+        -- wordFreq: numpy.ndarray
+            Same as self.wordFreq.
+
+        Return a (len(block), self.nbLanguages) numpy array of weights.
+        
+        """
+        nbLanguages = self.nbLanguages
+        words = [word for alignment in block for phrase in alignment
+                 for word in phrase if word]
+        phraseLengths = [len(phrase) - phrase.count(0)
+                         for alignment in block for phrase in alignment]
+        words = numpy.array(words, numpy.int64)
+        phraseLengths = numpy.array(phraseLengths, numpy.int64)
+        wordPhrases = numpy.repeat(numpy.arange(len(phraseLengths)),
+                                   phraseLengths)
+        wordLanguages = wordPhrases % nbLanguages
+        alBounds = numpy.zeros(len(block) + 1, numpy.int64)
+        numpy.cumsum(phraseLengths.reshape(-1, nbLanguages).sum(1),
+                     out=alBounds[1:])
+
+        # Cooccurrence count of each source word with each word of the other
+        # phrases of the same alignment (hapaxes cooccur once)
+        first, second = csr_pairs(alBounds)
+        keep = wordLanguages[first] != wordLanguages[second]
+        first, second = first[keep], second[keep]
+        swap = wordLanguages[first] > wordLanguages[second]
+        sw = numpy.where(swap, words[second], words[first])
+        tw = numpy.where(swap, words[first], words[second])
+        cooc = numpy.ones(len(first), numpy.int64)
+        frequent = (sw < FH) & (tw < FH)
+        cooc[frequent] = coocMatrix.get(sw[frequent], tw[frequent])
+
+        # Highest cooccurrence of each word (pairs are sorted by first word)
+        highestCooc = numpy.zeros(len(words), numpy.int64)
+        if len(first):
+            starts = numpy.flatnonzero(numpy.concatenate(
+                ([True], first[1:] != first[:-1])))
+            highestCooc[first[starts]] = numpy.maximum.reduceat(cooc, starts)
+        ratios = highestCooc / wordFreq[words]
+
+        lexWeights = numpy.ones(len(phraseLengths), numpy.float64)
+        nonEmpty = numpy.flatnonzero(phraseLengths)
+        if len(nonEmpty):
+            lexWeights[nonEmpty] = numpy.multiply.reduceat(
+                ratios, numpy.concatenate(([0], numpy.cumsum(
+                    phraseLengths[nonEmpty])[:-1])))
+        return lexWeights.reshape(-1, nbLanguages)
+
+
+Metrics.set_phases({'align': [Aligner.align],
+                     'filtering': [Aligner.extract],
+                     'hashing': [HashCounter.add, ExactCounter.add],
+                     'writes': [Aligner.add_alignment],
+                     'merging': [Aligner.merge_jobs]})
+
+
+###############################################################################
+# Parallel alignment (worker processes)
+###############################################################################
+
+# (Aligner, nextRandomSize function) inherited by worker processes on fork
+_jobContext = None
+
+def _init_job():
+    """Initialize a worker process: let the parent handle ctrl-c."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _wait_jobs(pendingJobs):
+    """Return the results of a multiprocessing.AsyncResult.
+
+    Waiting with a timeout makes it interruptible (ctrl-c). An interrupted
+    wait can lose the notification of the results, hence the polling.
+    
+    """
+    while not pendingJobs.ready():
+        pendingJobs.wait(0.1)
+    return pendingJobs.get()
+
+def _align_job(job):
+    """Align random subcorpora in a worker process.
+
+    -- job: tuple(int, float, str)
+        Random seed, duration (in seconds) and name of the file where
+        alignments have to be written.
+
+    The Aligner copy inherited from the parent process starts with empty
+    counts. Each alignment found is written to the output file as in align(),
+    followed by a tab and its hexadecimal frequency. Return the same
+    statistics as Aligner.merge_jobs(), plus the subcorpus sizes and profiler
+    samples of the worker (see Metrics.update()) if metrics are reported.
+    
+    """
+    seed, duration, outputName = job
+    aligner, nextRandomSize = _jobContext
+    random.seed(seed)
+    aligner.counts = aligner.counterClass()
+    aligner.nbAlignments = 0
+    nbSubcorporaDone, subcorporaDoneSum, nb2 = 0, 0, 0
+    endTime = time() + duration
+    metrics = aligner.metrics
+    if metrics is not None:
+        metrics.reset()
+        metrics.start()
+    tmpFile = make_temp_file(".al")
+    try:
+        while not nbSubcorporaDone or time() < endTime:
+            subcorpusSize = aligner.next_size(nextRandomSize)
+            aligner.sample(subcorpusSize, tmpFile)
+            if subcorpusSize == 2:
+                nb2 += 1
+            nbSubcorporaDone += 1
+            subcorporaDoneSum += subcorpusSize
+        tmpFile.seek(0)
+        outputFile = open(outputName, 'wb')
+        try:
+            for line in tmpFile:
+                stringToPrint = line[:-1]
+                alString = aligner.to_words(stringToPrint)
+                print >> outputFile, "%s\t%x" % (
+                    stringToPrint,
+                    aligner.counts.get(alString))
+        finally:
+            outputFile.close()
+    finally:
+        tmpFile.close()
+        if metrics is not None:
+            metrics.stop()
+    aligner.counts.clear()
+    if metrics is None:
+        return nbSubcorporaDone, subcorporaDoneSum, nb2, None
+    return (nbSubcorporaDone, subcorporaDoneSum, nb2,
+            (metrics.sizes, metrics.samples))
+
 
 ###############################################################################
 # Main program
@@ -1420,6 +3247,44 @@ ALIGNMENT_FILES is the concatenation of several ALIGNMENT_FILE's.''')
                       help="""Do not align. Input files are
 pre-generated alignment files (plain text format) to be merged into a
 single alignment file.""")
+    parser.add_option('-c', '--count-store', dest='store', default='hash',
+                      help="""(compatible with -m) How alignment
+frequencies are kept in memory: "hash" (fast, identifies alignments by
+their hash values only) or "exact" (no hash collision, requires less
+memory). [default: %default]""")
+    parser.add_option('-C', '--corpus-cache', dest='cache', default=None,
+                      help="""Binary file to read the input corpus
+from. If CACHE does not exist, it is first compiled from input files.
+Later runs on the same corpus (input files may then be omitted) load it
+much faster.""")
+    parser.add_option('-M', '--sort-buffer', dest='sort_mb', type='int',
+                      default=0, help="""(compatible with -m) Compute
+translation probabilities (and merge alignments) with sorts on disk,
+using about SORT_MB megabytes of memory. Specify 0 to keep everything
+in memory (faster on small data). [default: %default]""")
+    parser.add_option('-k', '--checkpoint', dest='checkpoint', default=None,
+                      help="""Periodically save alignment state into
+CHECKPOINT (alignments are also kept in CHECKPOINT.al and
+CHECKPOINT.al_lw), so that an interrupted run can be resumed with
+-r. They are removed once the output of the run is written.""")
+    parser.add_option('-K', '--checkpoint-interval', dest='ckpt_sec',
+                      type='float', default=600., help="""Seconds
+between two checkpoints. [default: %default]""")
+    parser.add_option('-r', '--resume', default=False, action='store_true',
+                      help="""Resume alignment from the state saved
+into CHECKPOINT (requires -k). Give the same input files and options as
+the interrupted run. Time already spent counts towards -t, so a
+larger -t adds sampling time to an interrupted run. Adding sampling time
+to a run which has finished is not supported: its checkpoint is removed
+once its output is written, so start a new run with a larger -t.""")
+    parser.add_option('-s', '--stats', dest='stats', default=None,
+                      help="""Write throughput statistics to STATS
+(one JSON object per line, "-" for standard error): subcorpus size
+histogram, CPU time split between activities, alignments per second,
+distinct alignments and repeats, memory used by counts.""")
+    parser.add_option('--stats-interval', dest='stats_sec', type='float',
+                      default=10., help="""Seconds between two
+statistics reports. [default: %default]""")
     parser.add_option('-T', '--temp-dir', dest='dir', default=None,
                       help="""(compatible with -m) Where to write
 temporary files. Default is OS dependant.""")
@@ -1433,6 +3298,10 @@ temporary files. Default is OS dependant.""")
                       default=-1, help="""Stop alignment when number of
 new alignments per second is lower than NB_AL. Specify -1 to run
 indefinitely. [default: %default]""")
+    alterGroup.add_option('-j', '--jobs', dest='nb_jobs', type='int',
+                      default=1, help="""Number of worker processes
+sampling subcorpora in parallel. Specify 0 to use all available
+processors. [default: %default]""")
     alterGroup.add_option('-i', '--index-ngrams', dest='index_n', type='int',
                       default=1, help="""Consider n-grams up to
 n=INDEX_N as tokens. Increasing this value increases the number of
@@ -1498,8 +3367,8 @@ format. Possible values are "plain", "moses", "html", and "tmx".
             
     if args.count("-") > 1:
         parser.error('Standard input "-" can only be read once')
-    if not args:    # Read standard input
-        args = ["-"]
+    if not args and not (options.cache and os.path.exists(options.cache)):
+        args = ["-"]    # Read standard input
 
     global __verbose__, __tmpDir__
     __verbose__, __tmpDir__ = not options.quiet, options.dir
@@ -1518,8 +3387,16 @@ format. Possible values are "plain", "moses", "html", and "tmx".
     else:
         parser.error("Unknown output format for option -o")
 
+    counterClass = COUNTERS.get(options.store.lower())
+    if counterClass is None:
+        parser.error("Unknown count store for option -c")
+
+    if options.sort_mb < 0:
+        parser.error("-M option must be positive or 0")
+    sortBuffer = options.sort_mb << 20
+
     if options.merge:
-        merge(args, writer)
+        merge(args, writer, counterClass, sortBuffer)
     else:
         try:    # Check whether the -D option value is well formed
             parse_field_numbers(options.fields, 0)
@@ -1534,10 +3411,35 @@ format. Possible values are "plain", "moses", "html", and "tmx".
         if options.index_n > options.max_n:
             parser.error(
                 "-i option value should not be greater than that of -N")
+        if options.nb_jobs != 1 and multiprocessing is None:
+            parser.error("-j option requires Python 2.6 or later")
+        if options.nb_jobs == 0:
+            options.nb_jobs = multiprocessing.cpu_count()
+        elif options.nb_jobs < 0:
+            parser.error("-j option must be positive or 0")
+        if options.resume and options.checkpoint is None:
+            parser.error("-r option requires -k")
+        if options.resume and not os.path.exists(options.checkpoint):
+            parser.error("no checkpoint %s to resume from (a run which "
+                         "has written its output removes it)"
+                         % options.checkpoint)
+        metrics = None
+        if options.stats == "-":
+            metrics = Metrics(sys.stderr, options.stats_sec)
+        elif options.stats:
+            metrics = Metrics(open(options.stats, 'a'), options.stats_sec)
         
-        Aligner(args, writer, options.nb_al, options.nb_sent, options.nb_sec,
-                options.weight, options.fields, options.nb_lang, options.min_n,
-                options.max_n, options.delim, options.index_n)
+        try:
+            Aligner(args, writer, options.nb_al, options.nb_sent,
+                    options.nb_sec, options.weight, options.fields,
+                    options.nb_lang, options.min_n, options.max_n,
+                    options.delim, options.index_n, options.nb_jobs,
+                    counterClass, options.cache, sortBuffer,
+                    options.checkpoint, options.ckpt_sec, options.resume,
+                    metrics)
+        finally:
+            if metrics is not None:
+                metrics.close()
 
 
 if __name__ == '__main__':
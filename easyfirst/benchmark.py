@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+
+## Copyright 2010 Yoav Goldberg
+##
+## This file is part of easyfirst
+##
+##    easyfirst is free software: you can redistribute it and/or modify
+##    it under the terms of the GNU General Public License as published by
+##    the Free Software Foundation, either version 3 of the License, or
+##    (at your option) any later version.
+##
+##    easyfirst is distributed in the hope that it will be useful,
+##    but WITHOUT ANY WARRANTY; without even the implied warranty of
+##    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##    GNU General Public License for more details.
+##
+##    You should have received a copy of the GNU General Public License
+##    along with easyfirst.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+parsing throughput benchmark, over synthetic CoNLL sentences of a
+controlled length distribution.
+
+reports, for each decoding mode: sentences/sec and tokens/sec, latency
+percentiles by sentence length, and the share of the parsing time spent
+in feature extraction, scoring, and the rest (frontier maintenance).
+"""
+
+import os
+import sys
+import time
+import random
+from optparse import OptionParser
+
+from pio import io
+from easyfirst import Parser, Oracle, Model
+
+### synthetic sentences {{{
+# (tag, words) a sentence is drawn from, with a crude tag bigram model: the
+# next tag is drawn from the followers of the current one.
+WORDS = {
+   'DT'  : "the a an this that some no every".split(),
+   'JJ'  : "new other good high old big last long great little own".split(),
+   'NN'  : "year time company market share stock price government week president".split(),
+   'NNS' : "years shares prices companies people sales investors markets rates".split(),
+   'NNP' : "Mr. U.S. Corp. Inc. New York Japan Bush Co. Smith".split(),
+   'PRP' : "it he they we I she".split(),
+   'VBD' : "said was were had rose fell reported made took".split(),
+   'VBZ' : "is has says does makes expects".split(),
+   'VB'  : "be have buy make sell take get pay".split(),
+   'MD'  : "will would could can may should".split(),
+   'RB'  : "also not n't only still just now even".split(),
+   'IN'  : "of in for on that with at by from as".split(),
+   'TO'  : ["to"],
+   'CC'  : "and but or".split(),
+   'CD'  : "1 two 10 million 1988 3.5 100".split(),
+   ','   : [","],
+   '.'   : ["."],
+   }
+FOLLOWERS = {
+   'START': ['DT','NNP','PRP','NN','JJ','IN','CD'],
+   'DT'  : ['NN','NN','NNS','JJ'],
+   'JJ'  : ['NN','NNS','JJ'],
+   'NN'  : ['VBD','VBZ','IN','NN',',','MD','CC'],
+   'NNS' : ['VBD','IN','MD',',','CC'],
+   'NNP' : ['NNP','VBD','VBZ',',','CC'],
+   'PRP' : ['VBD','VBZ','MD'],
+   'VBD' : ['DT','IN','TO','RB','CD','PRP','JJ'],
+   'VBZ' : ['DT','IN','TO','RB','JJ'],
+   'VB'  : ['DT','IN','PRP','NNS','RB'],
+   'MD'  : ['VB','RB'],
+   'RB'  : ['VB','VBD','JJ','IN'],
+   'IN'  : ['DT','NNP','NNS','CD','PRP'],
+   'TO'  : ['VB','DT','CD'],
+   'CC'  : ['DT','NNS','NNP','VBD','JJ'],
+   'CD'  : ['NNS','NN','IN',','],
+   ','   : ['DT','CC','VBD','NNP','PRP'],
+   }
+
+def parse_lengths(spec):
+   """
+   a function returning sentence lengths, from a spec:
+      fixed:N  uniform:A-B  lognormal:MU,SIGMA
+   """
+   kind,_,args = spec.partition(":")
+   try:
+      if kind=="fixed":
+         n = int(args)
+         return lambda: n
+      if kind=="uniform":
+         a,b = map(int,args.split("-"))
+         return lambda: random.randint(a,b)
+      if kind=="lognormal":
+         mu,sigma = map(float,args.split(","))
+         return lambda: max(1,int(random.lognormvariate(mu,sigma)))
+   except ValueError:
+      pass
+   raise ValueError("bad length distribution %s" % spec)
+
+def _projective_tree(lo, hi, parent, heads):
+   # heads[i] = parent id of token i+1, for a random projective tree
+   if lo >= hi: return
+   h = random.randrange(lo, hi)
+   heads[h] = parent
+   a = lo
+   while a < h:
+      b = random.randint(a+1, h)
+      _projective_tree(a, b, h+1, heads)
+      a = b
+   a = h+1
+   while a < hi:
+      b = random.randint(a+1, hi)
+      _projective_tree(a, b, h+1, heads)
+      a = b
+
+def synthetic_sentence(length):
+   """
+   a sentence of the given length, as read by io.conll_to_sents
+   """
+   heads = [0]*length
+   _projective_tree(0, length, 0, heads)
+   tag = 'START'
+   sent = []
+   for i in xrange(length):
+      if i==length-1: tag = '.'
+      else: tag = random.choice(FOLLOWERS.get(tag,FOLLOWERS['START']))
+      form = random.choice(WORDS[tag])
+      sent.append(io.to_tok([str(i+1),form,"_",tag,tag,"_",str(heads[i]),"dep","_","_"]))
+   return sent
+
+def synthetic_corpus(nsents, lengths):
+   return [synthetic_sentence(lengths()) for i in xrange(nsents)]
+#}}}
+
+### timing {{{
+class TimedExtractor:
+   def __init__(self, fext):
+      self.fext = fext
+      self.seconds = 0.0
+
+   def extract(self,parsed,deps,i,sent=None):
+      t = time.time()
+      feats = self.fext.extract(parsed,deps,i,sent)
+      self.seconds += time.time()-t
+      return feats
+
+class TimedScorer:
+   def __init__(self, scorer):
+      self.scorer = scorer
+      self.seconds = 0.0
+
+   def get_scores(self, feats):
+      t = time.time()
+      scores = self.scorer.get_scores(feats)
+      self.seconds += time.time()-t
+      return scores
+
+   def get_scores_batch(self, batch):
+      t = time.time()
+      scores = self.scorer.get_scores_batch(batch)
+      self.seconds += time.time()-t
+      return scores
+
+def percentile(values, p):
+   # nearest rank, values sorted
+   if not values: return 0.0
+   k = int(round(p/100.0*len(values)+0.5))-1
+   return values[min(max(k,0),len(values)-1)]
+
+def length_bucket(n, bounds):
+   lo = 1
+   for b in bounds:
+      if n <= b: return (lo,b)
+      lo = b+1
+   return (lo,None)
+
+def parse_mode(spec):
+   """
+   DECODER[:BEAM], e.g. list, tree, list:4
+   """
+   decoder,_,beam = spec.partition(":")
+   return decoder, int(beam) if beam else 1
+
+def run(scorer, fext, sents, decoder, beam, timed=False):
+   """
+   parse sents, returning (total seconds, per-sentence seconds, seconds in
+   feature extraction, seconds in scoring). extraction and scoring are
+   only timed with timed=True, which slows parsing down.
+   """
+   if timed:
+      fext = TimedExtractor(fext)
+      scorer = TimedScorer(scorer)
+   parser = Parser(scorer, fext, Oracle(), decoder, beam)
+   latencies = []
+   start = time.time()
+   for sent in sents:
+      t = time.time()
+      parser.parse(sent)
+      latencies.append(time.time()-t)
+   total = time.time()-start
+   if timed: return total, latencies, fext.seconds, scorer.seconds
+   return total, latencies, None, None
+#}}}
+
+def main():
+   usage="""usage: %prog [options]"""
+   parser = OptionParser(usage)
+   parser.add_option("-m","--model",dest="model_file",default=os.path.join(os.path.dirname(os.path.abspath(__file__)),"model.model"))
+   parser.add_option("--iter",dest="iter",default="FINAL")
+   parser.add_option("-n","--sents",dest="nsents",action="store",type="int",default=500)
+   parser.add_option("--lengths",dest="lengths",default="lognormal:3.0,0.5",help="fixed:N, uniform:A-B or lognormal:MU,SIGMA [default %default]")
+   parser.add_option("--seed",dest="seed",action="store",type="int",default=1)
+   parser.add_option("--modes",dest="modes",default="list,tree",help="comma separated DECODER[:BEAM] [default %default]")
+   parser.add_option("--repeat",dest="repeat",action="store",type="int",default=1,help="keep the fastest of N runs")
+   parser.add_option("--buckets",dest="buckets",default="10,20,40,80",help="upper bounds of the sentence length buckets")
+   parser.add_option("--write",dest="write",help="also write the synthetic sentences to this CoNLL file")
+   opts, args = parser.parse_args()
+   if args:
+      parser.print_usage()
+      sys.exit(1)
+
+   random.seed(opts.seed)
+   sents = synthetic_corpus(opts.nsents, parse_lengths(opts.lengths))
+   ntoks = sum(map(len,sents))
+   if opts.write:
+      out = file(opts.write,"w")
+      for sent in sents: io.out_conll(sent,out)
+      out.close()
+   modes = map(parse_mode, opts.modes.split(","))
+   bounds = map(int, opts.buckets.split(","))
+
+   model = Model.load(opts.model_file, opts.iter)
+   start = time.time()
+   try:
+      scorer = model.weights(opts.iter)
+   except IOError, e:
+      sys.stderr.write("cannot load the weights of %s: %s\n" % (opts.model_file, e))
+      sys.exit(1)
+   loading = time.time()-start
+   fext = model.featureExtractor()
+   # warm up
+   run(scorer, fext, sents[:10], "list", 1)
+
+   lens = map(len,sents)
+   print "model: %s (weights loaded in %.2fs)" % (opts.model_file, loading)
+   print "corpus: %d sentences, %d tokens, lengths %s (min %d, mean %.1f, max %d)" % (len(sents), ntoks, opts.lengths, min(lens), float(ntoks)/len(sents), max(lens))
+   print
+
+   results = []
+   for decoder,beam in modes:
+      best = None
+      for r in xrange(opts.repeat):
+         res = run(scorer, fext, sents, decoder, beam)
+         if best is None or res[0] < best[0]: best = res
+      profiled = run(scorer, fext, sents, decoder, beam, timed=True)
+      results.append(("%s:%s" % (decoder,beam) if beam>1 else decoder, best, profiled))
+
+   print "%-10s %10s %10s %10s" % ("mode","sents/s","tokens/s","seconds")
+   for name,(total,lat,_,_),profiled in results:
+      print "%-10s %10.1f %10.1f %10.2f" % (name, len(sents)/total, ntoks/total, total)
+   print
+
+   for name,(total,lat,_,_),profiled in results:
+      print "latency (ms) by sentence length, %s:" % name
+      print "%-10s %6s %8s %8s %8s %8s" % ("length","n","p50","p90","p99","max")
+      buckets = {}
+      for n,t in zip(lens,lat):
+         buckets.setdefault(length_bucket(n,bounds),[]).append(t*1000)
+      for (lo,hi) in sorted(buckets):
+         ts = sorted(buckets[(lo,hi)])
+         label = "%d-%d" % (lo,hi) if hi else "%d+" % lo
+         print "%-10s %6d %8.2f %8.2f %8.2f %8.2f" % (label,len(ts),percentile(ts,50),percentile(ts,90),percentile(ts,99),ts[-1])
+      print
+
+   print "time breakdown (separate, instrumented run):"
+   print "%-10s %10s %10s %10s" % ("mode","features","scoring","frontier")
+   for name,best,(total,lat,tfeat,tscore) in results:
+      print "%-10s %9.1f%% %9.1f%% %9.1f%%" % (name, 100*tfeat/total, 100*tscore/total, 100*(total-tfeat-tscore)/total)
+
+if __name__=='__main__':
+   main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+## Copyright 2010 Yoav Goldberg
+##
+## This file is part of easyfirst
+##
+##    easyfirst is free software: you can redistribute it and/or modify
+##    it under the terms of the GNU General Public License as published by
+##    the Free Software Foundation, either version 3 of the License, or
+##    (at your option) any later version.
+##
+##    easyfirst is distributed in the hope that it will be useful,
+##    but WITHOUT ANY WARRANTY; without even the implied warranty of
+##    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##    GNU General Public License for more details.
+##
+##    You should have received a copy of the GNU General Public License
+##    along with easyfirst.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+import os
+from optparse import OptionParser
+
+from ml.ml import convert_model, is_binary_model
+
+usage="""usage: %prog weights_file [weights_file ...]
+
+converts text weights files (e.g. model.weights.FINAL) to the binary,
+memory mapped, format, in place. parse.py recognizes both formats."""
+
+parser = OptionParser(usage)
+opts, args = parser.parse_args()
+
+if not args:
+   parser.print_usage()
+   sys.exit(1)
+
+for fname in args:
+   if is_binary_model(fname):
+      print fname, "is already binary"
+      continue
+   tmp = "%s.tmp" % fname
+   fh = file(tmp,"wb")
+   convert_model(fname, fh)
+   fh.close()
+   os.rename(tmp, fname)
+   print fname, "converted"
@@ -15,6 +15,9 @@
 ##    You should have received a copy of the GNU General Public License
 ##    along with easyfirst.  If not, see <http://www.gnu.org/licenses/>.
 
+import sys
+from array import array
+from bisect import insort
 from collections import defaultdict
 
 class DependenciesCollection: #{{{
@@ -142,3 +145,243 @@ class DependenciesCollection: #{{{
       else: return self.left_border(l)
 #}}}
 
+
+class CompactDependencies(DependenciesCollection): #{{{
+   """
+   a DependenciesCollection over one sentence whose token ids are their
+   positions (sent[0] is ROOT), keeping the tree as typed per-token arrays,
+   indexed by token id:
+
+      parents           parent id, -1 if none
+      lchild, rchild    leftmost / rightmost child, -1 if none
+      lborder, rborder  left_border / right_border
+      version           bumped whenever any of the above changes for the
+                        token, so that per-token values derived from the
+                        tree can be cached
+
+   all are maintained on add, so the queries are O(1) (children and sibling
+   use per-token lists kept sorted by id).
+   """
+   def __init__(self, sent):
+      n = len(sent)
+      self.toks = sent
+      self.deps = set()
+      self.parents = array('i', [-1])*n
+      self.lchild = array('i', [-1])*n
+      self.rchild = array('i', [-1])*n
+      self.lborder = array('i', range(n))
+      self.rborder = array('i', range(n))
+      self.version = array('i', [0])*n
+      self._child_ids = [None]*n
+
+   @classmethod
+   def accepts(cls, sent):
+      for i,tok in enumerate(sent):
+         if tok['id']!=i: return False
+      return True
+
+   def has_parent(self, child):
+      return self.parents[child['id']]!=-1
+
+   def add(self, parent, child):
+      pid = parent['id']
+      cid = child['id']
+      self.deps.add((pid, cid))
+      self.parents[cid] = pid
+      ids = self._child_ids[pid]
+      if ids is None: ids = self._child_ids[pid] = []
+      insort(ids, cid)
+      lc = self.lchild[pid]
+      if lc==-1 or cid < lc: self.lchild[pid] = cid
+      if cid > self.rchild[pid]: self.rchild[pid] = cid
+      self.version[pid] += 1
+      self._update(pid)
+
+   def _update(self, tid):
+      """
+      recompute the borders of tid, then of its ancestors, as long as they
+      change.
+      """
+      lchild = self.lchild
+      rchild = self.rchild
+      lborder = self.lborder
+      rborder = self.rborder
+      while tid!=-1:
+         lc = lchild[tid]
+         rc = rchild[tid]
+         lb = lborder[lc] if lc!=-1 else tid
+         rb = rborder[rc] if rc!=-1 else tid
+         if lb==lborder[tid] and rb==rborder[tid]: return
+         lborder[tid] = lb
+         rborder[tid] = rb
+         self.version[tid] += 1
+         tid = self.parents[tid]
+
+   #{{{ remove
+   def remove(self, parent, child):
+      pid = parent['id']
+      cid = child['id']
+      self.deps.remove((pid,cid))
+      self.parents[cid] = -1
+      ids = self._child_ids[pid]
+      ids.remove(cid)
+      self.lchild[pid] = ids[0] if ids else -1
+      self.rchild[pid] = ids[-1] if ids else -1
+      self.version[pid] += 1
+      self._update(pid)
+   #}}}
+
+   def annotate(self, sent):
+      for tok in sent:
+         p = self.parents[tok['id']]
+         if p==-1:
+            sys.stderr.write("defaulting to root-parent")
+            p = 0
+         tok['pparent'] = p
+      return sent
+
+   def annotate_allow_none(self, sent):
+      for tok in sent:
+         tok['pparent'] = self.parents[tok['id']]
+      return sent
+
+   def left_child(self, tok):
+      if not tok: return None
+      i = tok['id']
+      if i < 0: return None
+      c = self.lchild[i]
+      return self.toks[c] if c!=-1 else None
+
+   def right_child(self, tok):
+      if not tok: return None
+      i = tok['id']
+      if i < 0: return None
+      c = self.rchild[i]
+      return self.toks[c] if c!=-1 else None
+
+   def children(self, tok):
+      if not tok or tok['id'] < 0: return []
+      ids = self._child_ids[tok['id']]
+      if not ids: return []
+      return [self.toks[c] for c in ids]
+
+   def sibling(self, tok, i=1):
+      if tok==None or tok['id'] < 0: return None
+      p = self.parents[tok['id']]
+      if p==-1: return None
+      siblings = self._child_ids[p]
+      index = siblings.index(tok['id'])
+      if 0 < (index+i) < len(siblings):
+         return self.toks[siblings[index+i]]
+      return None
+
+   def span(self, tok):
+      i = tok['id']
+      if i < 0: return 0
+      return self.rborder[i] - self.lborder[i]
+
+   def parent(self, tok):
+      p = self.parents[tok['id']] if tok['id'] >= 0 else -1
+      return self.toks[p] if p!=-1 else None
+
+   def right_border(self,tok):
+      i = tok['id']
+      return self.rborder[i] if i >= 0 else i
+
+   def left_border(self,tok):
+      i = tok['id']
+      return self.lborder[i] if i >= 0 else i
+#}}}
+
+def new_dependencies(sent):
+   """
+   the dependencies collection to parse sent with: CompactDependencies when
+   the token ids are the positions (sent[0] being ROOT), else a
+   DependenciesCollection.
+   """
+   if CompactDependencies.accepts(sent):
+      return CompactDependencies(sent)
+   return DependenciesCollection()
+
+class _TokenInfo(dict):
+   # token id -> (lchild, rchild, lborder, rborder), None for the tokens
+   # without children
+   def __missing__(self, key):
+      return None
+
+class BeamDependencies: #{{{
+   """
+   the dependencies of one state of a beam search, over a sentence whose
+   token ids are their positions (sent[0] is ROOT). states are not copied:
+   all share the sentence, and each keeps the state it extends, the arc it
+   adds, and a small table of the tokens with children (copied on extend).
+
+   supports the queries of the feature extractors (left_child, right_child,
+   span, borders), and annotate. version[id] is the tree information of a
+   token, for the caches of the extractors.
+   """
+   def __init__(self, sent, prev=None, parent=None, child=None):
+      self.toks = sent
+      self.prev = prev
+      if prev is None:
+         self.arc = None
+         self.arcs = frozenset()
+         self.version = _TokenInfo()
+         self.cache_owner = self
+         return
+      pid = parent['id']
+      cid = child['id']
+      self.arc = (pid,cid)
+      self.arcs = prev.arcs | frozenset([self.arc])
+      self.cache_owner = prev.cache_owner
+      info = self.version = _TokenInfo(prev.version)
+      old = info[pid]
+      if old: lc,rc,lb,rb = old
+      else: lc,rc,lb,rb = -1,-1,pid,pid
+      if lc==-1 or cid < lc:
+         lc = cid
+         lb = info[cid][2] if info[cid] else cid
+      if cid > rc:
+         rc = cid
+         rb = info[cid][3] if info[cid] else cid
+      info[pid] = (lc,rc,lb,rb)
+
+   def extend(self, parent, child):
+      """
+      the state with the arc parent->child added. easy-first only attaches
+      tokens without a parent, so only parent's information changes.
+      """
+      return BeamDependencies(self.toks, self, parent, child)
+
+   def left_child(self, tok):
+      if not tok: return None
+      info = self.version[tok['id']]
+      return self.toks[info[0]] if info else None
+
+   def right_child(self, tok):
+      if not tok: return None
+      info = self.version[tok['id']]
+      return self.toks[info[1]] if info else None
+
+   def span(self, tok):
+      info = self.version[tok['id']]
+      return info[3]-info[2] if info else 0
+
+   def right_border(self,tok):
+      info = self.version[tok['id']]
+      return info[3] if info else tok['id']
+
+   def left_border(self,tok):
+      info = self.version[tok['id']]
+      return info[2] if info else tok['id']
+
+   def annotate(self, sent):
+      parents = dict([(c,p) for p,c in self.arcs])
+      for tok in sent:
+         try:
+            tok['pparent'] = parents[tok['id']]
+         except KeyError:
+            sys.stderr.write("defaulting to root-parent")
+            tok['pparent'] = 0
+      return sent
+#}}}
@@ -22,8 +22,10 @@ import os.path
 from collections import defaultdict
 from itertools import izip,islice
 
-from deps import DependenciesCollection
+from deps import new_dependencies, CompactDependencies, BeamDependencies
 from ml.ml import MulticlassModel, MultitronParameters 
+from ml.ml import HashedMultitronParameters, hash_features, load_model
+from ml.ml import is_binary_model
 
 from pio import io
 import isprojective 
@@ -52,17 +54,85 @@ class Oracle: #{{{
       return True
    #}}}
 
+class PairTree: #{{{
+   """
+   segment tree over the positions of a sentence, keeping the best
+   attachment (score, child, parent) of each adjacent pair of the frontier.
+   position p holds the pair starting at token p.
+   """
+   EMPTY = (float('-inf'),)
+   def __init__(self, n):
+      size = 1
+      while size < n: size*=2
+      self.size = size
+      self.tree = [self.EMPTY]*(2*size)
+
+   def set(self, pos, best):
+      tree = self.tree
+      k = pos+self.size
+      tree[k] = best
+      k//=2
+      while k:
+         l = tree[2*k]
+         r = tree[2*k+1]
+         tree[k] = l if l > r else r
+         k//=2
+
+   def clear(self, pos):
+      self.set(pos, self.EMPTY)
+
+   def set_all(self, positions, bests):
+      """
+      set(pos, best) for each pos of positions (ascending) and best of
+      bests, updating their common ancestors once.
+      """
+      tree = self.tree
+      size = self.size
+      ks = []
+      for pos,best in izip(positions,bests):
+         k = pos+size
+         tree[k] = best
+         k//=2
+         if not ks or ks[-1]!=k: ks.append(k)
+      while ks:
+         up = []
+         for k in ks:
+            l = tree[2*k]
+            r = tree[2*k+1]
+            tree[k] = l if l > r else r
+            k//=2
+            if k and (not up or up[-1]!=k): up.append(k)
+         ks = up
+
+   def best(self):
+      return self.tree[1]
+   #}}}
+
 class Parser: #{{{
-   def __init__(self, scorer, featExt, oracle=None):
+   """
+   decoder: how parse() finds the best attachment at each step.
+      "list": rescan all the pairs of the frontier (O(n) per attachment)
+      "tree": keep pair scores in a PairTree, and the frontier in a linked
+              list (O(log n) per attachment, plus rescoring of the pairs
+              which see the parent). same output as "list", faster.
+   beam: if more than 1, parse() keeps the beam best partial parses
+   instead of only the best one (see parse_beam). slower (about beam
+   times), usually more accurate.
+   """
+   def __init__(self, scorer, featExt, oracle=None, decoder="list", beam=1):
       self.scorer=scorer
       self.featExt=featExt
       self.oracle=oracle
+      if decoder not in ("list","tree"):
+         raise ValueError("unknown decoder %s" % decoder)
+      self.decoder=decoder
+      self.beam=beam
 
    def vis_parse(self, sent): #{{{
-      deps = DependenciesCollection()
       parsed = sent[:]
       parsed=[ROOT]+parsed
       sent = [ROOT]+sent
+      deps = new_dependencies(sent)
       connections = 0
       mistake=False
       for tok in parsed: tok['s']=tok['form']
@@ -117,10 +187,13 @@ class Parser: #{{{
       yield (self.oracle,sent, parsed, deps, scores)
    #}}}
    def parse(self, sent): #{{{
-      deps = DependenciesCollection()
+      if self.beam>1 and CompactDependencies.accepts([ROOT]+sent):
+         return self.parse_beam(sent)
+      if self.decoder=="tree": return self.parse_tree(sent)
       parsed = sent[:]
       parsed=[ROOT]+parsed
       sent = [ROOT]+sent
+      deps = new_dependencies(sent)
       scache={}
       fe=self.featExt.extract
       gscore=self.scorer.get_scores
@@ -159,13 +232,175 @@ class Parser: #{{{
          lp-=1
       return deps
 
+   #}}}
+   def parse_tree(self, sent): #{{{
+      """
+      same as parse() with the list decoder, using a linked list of
+      frontier positions and a PairTree of pair scores.
+      """
+      sent = [ROOT]+sent
+      deps = new_dependencies(sent)
+      n = len(sent)
+      nxt = range(1,n+1)
+      nxt[-1] = -1
+      prv = range(-1,n-1)
+      fe=self.featExt.extract
+      gscore=self.scorer.get_scores
+      pairs = PairTree(n)
+      EMPTY = PairTree.EMPTY
+      # token id -> position (the ids are the positions with
+      # CompactDependencies)
+      if isinstance(deps, CompactDependencies):
+         position = range(n)
+      else:
+         position = dict([(tok['id'],i) for i,tok in enumerate(sent)])
+
+      def score(positions):
+         # the extractors look at parsed[i-2:i+4] only, and test i-1>0 and
+         # i-2>0: build once the part of the frontier around positions
+         # (which follow each other on it), keeping ROOT first when it is
+         # reached, and give each pair its slice.
+         seg = []
+         q = prv[positions[0]]
+         while q!=-1 and len(seg)<3:
+            seg.append(q)
+            q = prv[q]
+         seg.reverse()
+         before = len(seg)
+         seg.extend(positions)
+         q = nxt[positions[-1]]
+         while q!=-1 and len(seg)<before+len(positions)+3:
+            seg.append(q)
+            q = nxt[q]
+         toks = [sent[q] for q in seg]
+         bests = []
+         for j in xrange(before,before+len(positions)):
+            if j+1==len(seg):
+               bests.append(EMPTY)
+               continue
+            lo = j-3 if j>3 else 0
+            scr = gscore(fe(toks[lo:j+4],deps,j-lo,sent))
+            tok1 = toks[j]
+            tok2 = toks[j+1]
+            s1 = (scr[0],tok1,tok2)
+            s2 = (scr[1],tok2,tok1)
+            bests.append(s1 if s1 > s2 else s2)
+         pairs.set_all(positions, bests)
+
+      score(range(n))
+      for step in xrange(n-1):
+         best,c,p = pairs.best()
+         cpos = position[c['id']]
+         ppos = position[p['id']]
+         # apply action
+         deps.add(p,c)
+         pairs.clear(cpos)
+         if prv[cpos]!=-1: nxt[prv[cpos]] = nxt[cpos]
+         if nxt[cpos]!=-1: prv[nxt[cpos]] = prv[cpos]
+         # rescore the pairs which now see parent, which changed: 3 before
+         # it, 2 after. the others see the same tokens as before (parse()
+         # rescores one more, with the same result).
+         frm = ppos
+         for k in xrange(3):
+            if prv[frm]==-1: break
+            frm = prv[frm]
+         window = [frm]
+         while window[-1]!=ppos:
+            window.append(nxt[window[-1]])
+         for k in xrange(2):
+            if nxt[window[-1]]==-1: break
+            window.append(nxt[window[-1]])
+         score(window)
+      return deps
+
+   #}}}
+   def parse_beam(self, sent): #{{{
+      """
+      beam search: at each step, every attachment of each of the beam best
+      states is scored by the sum of the scores of its actions, and the
+      beam best distinct resulting states are kept.
+
+      the states share their structure (BeamDependencies), and each keeps
+      the pair scores of its parent state but those of the neighbours of
+      the attachment, as parse() does. the missing pair scores of all
+      the states are computed in one batch, once for all the states in
+      which the pair sees the same tokens and subtrees.
+      """
+      sent = [ROOT]+sent
+      fe=self.featExt.extract
+      gscores=getattr(self.scorer,"get_scores_batch",None)
+      if gscores is None:
+         gscores=lambda batch: map(self.scorer.get_scores,batch)
+      # (score, deps, frontier, pair scores by token id)
+      beam = [(0.0, BeamDependencies(sent), range(len(sent)), {})]
+      shared = {}
+      for step in xrange(len(sent)-1):
+         # score the pairs, in a batch
+         keys = []
+         feats = []
+         for score,deps,frontier,scache in beam:
+            info = deps.version
+            lp = len(frontier)
+            for i in xrange(lp-1):
+               if frontier[i] in scache: continue
+               # the part of the frontier the extractors see, as in
+               # parse_tree
+               lo = i-3 if i>3 else 0
+               window = frontier[lo:i+4]
+               key = (tuple(window), i-lo, tuple([info[t] for t in window]))
+               if key not in shared:
+                  shared[key] = None
+                  keys.append(key)
+                  feats.append(fe([sent[t] for t in window],deps,i-lo,sent))
+         for key,scr in izip(keys,gscores(feats)):
+            shared[key] = scr[0],scr[1]
+         # expand
+         candidates = []
+         for b,(score,deps,frontier,scache) in enumerate(beam):
+            info = deps.version
+            lp = len(frontier)
+            for i in xrange(lp-1):
+               tid = frontier[i]
+               try:
+                  s1,s2 = scache[tid]
+               except KeyError:
+                  lo = i-3 if i>3 else 0
+                  window = frontier[lo:i+4]
+                  s1,s2 = scache[tid] = shared[(tuple(window), i-lo, tuple([info[t] for t in window]))]
+               candidates.append((score+s1,i,i+1,b))
+               candidates.append((score+s2,i+1,i,b))
+         candidates.sort(reverse=True)
+         # keep the beam best distinct states
+         new_beam = []
+         seen = set()
+         for total,ci,pi,b in candidates:
+            score,deps,frontier,scache = beam[b]
+            c = sent[frontier[ci]]
+            p = sent[frontier[pi]]
+            arcs = deps.arcs | frozenset([(p['id'],c['id'])])
+            if arcs in seen: continue
+            seen.add(arcs)
+            # forget the neighbours of parent, as in parse()
+            scache = dict(scache)
+            lp = len(frontier)
+            frm = pi-4
+            to = pi+4
+            if frm<0: frm = 0
+            if to>=lp: to=lp-1
+            for t in frontier[frm:to]:
+               scache.pop(t,None)
+            new_beam.append((total, deps.extend(p,c), frontier[:ci]+frontier[ci+1:], scache))
+            if len(new_beam)==self.beam: break
+         beam = new_beam
+      return beam[0][1]
+
    #}}}
 
    def train(self, sent): #{{{
       updates=0
       sent = [ROOT]+sent
       self.scorer.tick()
-      deps = DependenciesCollection()
+      deps = new_dependencies(sent)
       parsed = sent[:]
       fcache = {}
       scache = {}
@@ -229,28 +464,64 @@ class Parser: #{{{
 #}}}
 
 
+class HashedFeatureExtractor: #{{{
+   """
+   hashes the string features of an extractor which has no hashed mode of
+   its own (no extract_hashed method).
+   """
+   def __init__(self, fext, nbuckets):
+      self.fext = fext
+      self.nbuckets = nbuckets
+
+   def extract(self,parsed,deps,i,sent=None):
+      return hash_features(self.fext.extract(parsed,deps,i,sent),self.nbuckets)
+#}}}
+
 class Model: #{{{
-   def __init__(self, featuresFile, weightFile, iter=None):
+   def __init__(self, featuresFile, weightFile, iter=None, nbuckets=None):
+      """
+      nbuckets: if set, features are hashed into nbuckets integer ids
+      (see ml.hash_features), and the weights are a dense matrix.
+      """
       self._featuresFile = featuresFile
       self._weightFile = weightFile
       self._iter=iter
+      self.nbuckets=nbuckets
 
       featuresModule = load_module(featuresFile)
-      self.fext = featuresModule.FeaturesExtractor()
+      FeaturesExtractor = featuresModule.FeaturesExtractor
+      if not nbuckets:
+         self.fext = FeaturesExtractor()
+      elif hasattr(FeaturesExtractor, "extract_hashed"):
+         self.fext = FeaturesExtractor(nbuckets)
+      else:
+         self.fext = HashedFeatureExtractor(FeaturesExtractor(), nbuckets)
 
 
    def save(self, filename):
       fh = file(filename,"w")
       fh.write("%s\n%s\n" % (self._featuresFile, self._weightFile))
+      if self.nbuckets: fh.write("hashed %s\n" % self.nbuckets)
       fh.close()
 
    @classmethod
-   def load(cls, filename, iter=19):
+   def load(cls, filename, iter=19, nbuckets=None):
+      """
+      nbuckets: hash a string-keyed model when loading it. hashed models
+      are always loaded as such. raises ValueError if the weights of iter
+      are a binary string-keyed model, which cannot be hashed.
+      """
       lines = file(filename,"r").readlines()
       dirname = os.path.dirname(filename)
       featuresFile = os.path.join(dirname,lines[0].strip())
       weightFile   = os.path.join(dirname,lines[1].strip())
-      return cls(featuresFile, weightFile, iter)
+      if len(lines)>2 and lines[2].startswith("hashed"):
+         return cls(featuresFile, weightFile, iter, int(lines[2].split()[1]))
+      model = cls(featuresFile, weightFile, iter, nbuckets)
+      weights = model.weightsFile(iter)
+      if nbuckets and os.path.isfile(weights) and is_binary_model(weights):
+         model.weights(iter) # fail now rather than when parsing
+      return model
 
    def weightsFile(self, iter):
       if iter is None: iter = self._iter
@@ -258,38 +529,110 @@ class Model: #{{{
 
    def featureExtractor(self):
       return self.fext
+
+   def weights(self, iter):
+      return load_model(self.weightsFile(iter), self.nbuckets)
+
+   def trainingParameters(self):
+      if self.nbuckets:
+         return HashedMultitronParameters(2, self.nbuckets)
+      return MultitronParameters(2)
 #}}}
 
-def train(sents, model, dev=None,ITERS=20,save_every=None):
+### parallel training {{{
+# parser and shards shared (copy-on-write) by the worker processes forked
+# at each iteration of train_parallel
+_train_parser = None
+_train_shards = None
+
+def _train_shard(n):
+   """
+   worker side of train_parallel: one iteration over shard n, starting from
+   the mixed weights. returns (ticks, changed weights), see scorer.mix
+   """
+   scorer = _train_parser.scorer
+   since = scorer.now
+   for sent in _train_shards[n]:
+      _train_parser.train(sent)
+   return scorer.now-since, scorer.changes(since)
+
+def _train_iteration(parser, shards):
+   """
+   one iteration of iterative parameter mixing: each shard is trained on
+   in its own process, then the weights are averaged.
+   """
+   import multiprocessing
+   global _train_parser, _train_shards
+   _train_parser = parser
+   _train_shards = shards
+   # one fresh process per shard, so that each starts from the mixed weights
+   pool = multiprocessing.Pool(len(shards),maxtasksperchild=1)
+   try:
+      results = pool.map(_train_shard, range(len(shards)), 1)
+      pool.close()
+   except:
+      pool.terminate()
+      raise
+   finally:
+      pool.join()
+      _train_parser = None
+      _train_shards = None
+   parser.scorer.mix(results)
+#}}}
+
+def train(sents, model, dev=None,ITERS=20,save_every=None,binary=False,jobs=1):
+   """
+   jobs: if more than 1, train with iterative parameter mixing (McDonald et
+   al., 2010): the sentences are split into jobs shards, trained on in
+   parallel, and the weights are averaged after each iteration.
+   """
    fext = model.featureExtractor()
    oracle=Oracle()
-   scorer=MultitronParameters(2)
+   scorer=model.trainingParameters()
    parser=Parser(scorer, fext, oracle)
+   shards = [sents[i::jobs] for i in xrange(jobs)] if jobs>1 else None
    for ITER in xrange(1,ITERS+1):
       print "Iteration",ITER,"[",
-      for i,sent in enumerate(sents):
-         if i%100==0: 
-            print i,
-            sys.stdout.flush()
-         parser.train(sent) 
+      if shards:
+         print "%s shards" % jobs,
+         sys.stdout.flush()
+         _train_iteration(parser, shards)
+      else:
+         for i,sent in enumerate(sents):
+            if i%100==0: 
+               print i,
+               sys.stdout.flush()
+            parser.train(sent) 
       print "]"
       if save_every and (ITER % save_every==0):
          print "saving weights at iter",ITER
-         parser.scorer.dump_fin(file(model.weightsFile(ITER),"w"))
+         dump_weights(parser.scorer,model.weightsFile(ITER),binary)
          if dev:
             print "testing dev"
             print "\nscore: %s" % (test(dev,model,ITER,quiet=True),)
-      parser.scorer.dump_fin(file(model.weightsFile("FINAL"),"w"))
+      dump_weights(parser.scorer,model.weightsFile("FINAL"),binary)
+
+def dump_weights(scorer, filename, binary=False):
+   """
+   binary: write a memory mapped model (see ml.write_binary_model)
+   """
+   if binary:
+      fh = file(filename,"wb")
+      scorer.dump_bin(fh)
+   else:
+      fh = file(filename,"w")
+      scorer.dump_fin(fh)
+   fh.close()
 
-def test(sents,model,iter="FINAL",quiet=False,ignore_punc=False):
+def test(sents,model,iter="FINAL",quiet=False,ignore_punc=False,decoder="list",beam=1):
    fext = model.featureExtractor()
    import time
    good = 0.0
    bad  = 0.0
    complete = 0.0
-   m=MulticlassModel(model.weightsFile(iter))
+   m=model.weights(iter)
    start = time.time()
-   parser=Parser(m,fext,Oracle())
+   parser=Parser(m,fext,Oracle(),decoder,beam)
    scores=[]
    for sent in sents:
       sent_good=0.0
@@ -321,10 +664,10 @@ def test(sents,model,iter="FINAL",quiet=False,ignore_punc=False):
       print "micro:",good/(good+bad)
    return good/(good+bad), complete/len(sents)
 
-def parse(sents,model,iter="FINAL"):
+def parse(sents,model,iter="FINAL",decoder="list",beam=1):
    fext = model.featureExtractor()
-   m=MulticlassModel(model.weightsFile(iter))
-   parser=Parser(m,fext,Oracle())
+   m=model.weights(iter)
+   parser=Parser(m,fext,Oracle(),decoder,beam)
    for sent in sents:
       deps=parser.parse(sent)
       sent = deps.annotate(sent)
@@ -332,13 +675,75 @@ def parse(sents,model,iter="FINAL"):
          print tok['id'], tok['form'], "_",tok['tag'],tok['tag'],"_",tok['pparent'],"_ _ _"
       print 
 
-def make_parser(modelfile,iter):
+### batch parsing {{{
+# parser shared (copy-on-write) by the worker processes forked in parse_batch
+_batch_parser = None
+
+def _parse_chunk(sents):
+   """
+   worker side of parse_batch: returns the parsed sentences as a string,
+   in the same format as parse().
+   """
+   out=[]
+   for sent in sents:
+      deps=_batch_parser.parse(sent)
+      sent = deps.annotate(sent)
+      for tok in sent:
+         out.append("%s %s _ %s %s _ %s _ _ _\n" % (tok['id'], tok['form'], tok['tag'],tok['tag'],tok['pparent']))
+      out.append("\n")
+   return "".join(out)
+
+def _chunks(sents, size):
+   sents=iter(sents)
+   while True:
+      chunk = list(islice(sents,size))
+      if not chunk: return
+      yield chunk
+
+def parse_batch(sents,model,iter="FINAL",out=sys.stdout,jobs=None,chunk_size=200,decoder="list",beam=1):
+   """
+   like parse(), but with several worker processes.
+
+   the weights are loaded once, before forking: workers share them
+   copy-on-write. sents can be a (lazy) iterator, e.g. io.conll_to_sents(fh):
+   sentences are sent to the workers in chunks of chunk_size, and the parses
+   are written to out in the input order.
+   jobs: number of workers (default: number of cpus)
+   """
+   import multiprocessing
+   from collections import deque
+   global _batch_parser
+   if not jobs: jobs = multiprocessing.cpu_count()
+   fext = model.featureExtractor()
+   m=model.weights(iter)
+   _batch_parser=Parser(m,fext,Oracle(),decoder,beam)
+   pool = multiprocessing.Pool(jobs)
+   try:
+      # at most 2 chunks per worker are pending, so that memory stays
+      # bounded on large inputs
+      pending = deque()
+      for chunk in _chunks(sents,chunk_size):
+         pending.append(pool.apply_async(_parse_chunk, (chunk,)))
+         if len(pending) >= 2*jobs:
+            out.write(pending.popleft().get())
+      while pending:
+         out.write(pending.popleft().get())
+      pool.close()
+   except:
+      pool.terminate()
+      raise
+   finally:
+      pool.join()
+      _batch_parser = None
+#}}}
+
+def make_parser(modelfile,iter,decoder="list",beam=1):
    weightsFile = "%s.weights" % (modelfile)
    modelfile = "%s.model" % (modelfile)
    model = Model.load(modelfile,iter)
    fext = model.featureExtractor()
-   m=MulticlassModel(model.weightsFile(iter))
-   parser=Parser(m,fext,Oracle())
+   m=model.weights(iter)
+   parser=Parser(m,fext,Oracle(),decoder,beam)
    return parser
 
 def load_sentences(filename,ONLY_PROJECTIVE=False):
@@ -1,4 +1,5 @@
 from common import PAD,ROOT
+from ml.ml import hash_features
 ## Copyright 2010 Yoav Goldberg
 ##
 ## This file is part of easyfirst
@@ -16,32 +17,96 @@ from common import PAD,ROOT
 ##    You should have received a copy of the GNU General Public License
 ##    along with easyfirst.  If not, see <http://www.gnu.org/licenses/>.
 
+CC = ['CC','CONJ']
+IN = ['IN']
+# "%s_%s..." with n fields, to join a feature tuple of n atoms into a string
+FORMATS = [None] + ["_".join(["%s"]*n) for n in xrange(1,8)]
 
 class BaselineFeatureExtractor: # {{{
    LANG='ENG'
-   def __init__(self):
+   def __init__(self, nbuckets=None):
       self.versions = None
       self.vocab = set()
+      self.nbuckets = nbuckets
+      self._cache_deps = None
+      self._cache_owner = None
+      if nbuckets: self.extract = self.extract_hashed
 
-   def extract(self,parsed,deps,i,sent=None):
+   def _token_atoms(self,tok,deps):
       """
-      i=T4:
-         should I connect T4 and T5 in:
-            t1 t2 t3 T4 T5 t6 t7 t8
-         ?
-         focus: f1=T4 f2=T5
-         previous: p1=t3 p2=t2
-         next:     n1=t6 n2=t7
-      returns (feats1,feats2)
-      where feats1 is a list of features for connecting T4->T5  (T4 is child)
-      and   feats2 is a list of features for connecting T4<-T5  (T5 is child)
+      the per-token part of the features:
+         (form, tag, tag2, lc, rc, rc_form, single, span, id)
+      tag is lexicalized as for f1,f2,p1,n1 and tag2 as for p2,n2. lc/rc
+      are the tags of the left/right children.
       """
-      #LANG = self.LANG
-      CC = ['CC','CONJ']
-      IN = ['IN']
+      form = tok['form']
+      tag = tok['tag']
+
+      lc = deps.left_child(tok)
+      if lc: lc=lc['tag']
+      rc_form=None
+      rc = deps.right_child(tok)
+      if rc:
+         rc_form=rc['form']
+         rc=rc['tag']
+      single = lc==None and rc==None
+
+      if tag in IN: tag = "%s%s" % (tag,form)
+      ## @@@ Hurts performance with small training set. benefit with large!
+      tag2 = tag
+      if tag2 in CC: tag2 = "%s%s" % (tag2,form)
 
+      ## TO-VERB (to keep, to go,...)
+      if tag[0]=='V' and lc=='TO': tag="%s_TO" % tag
+      if tag2[0]=='V' and lc=='TO': tag2="%s_TO" % tag2
+
+      # this should help in cases of A CC B D, telling B not to B->D if CC is not built yet and in matching type
+      # hope this helps (Many money managers and (some traders had already left))
+      if tag in CC: tag = "%s-%s-%s-%s" % (form,tag,lc,rc)
+
+      return (form,intern(tag),intern(tag2),lc,rc,rc_form,single,deps.span(tok),tok['id'])
+
+   def _cached_atoms(self,deps):
+      """
+      the _token_atoms of the tokens of deps' sentence, as a function of
+      the token. the atoms of a token are computed once, and again only
+      after it gains a child (its version in deps changes). the states of
+      a beam search share their cache (deps.cache_owner).
+      """
+      version = getattr(deps,'version',None)
+      if version is None:
+         return lambda tok: self._token_atoms(tok,deps)
+      if self._cache_deps is not deps:
+         owner = getattr(deps,'cache_owner',deps)
+         if self._cache_owner is not owner:
+            self._cache_owner = owner
+            self._cache = {}
+         self._cache_deps = deps
+         self._cache_get = self._get_atoms(deps,version,self._cache)
+      return self._cache_get
+
+   def _get_atoms(self,deps,version,cache):
+      token_atoms = self._token_atoms
+      pad = token_atoms(PAD,deps)
+      def get(tok):
+         i = tok['id']
+         if i < 0:
+            if tok is PAD: return pad
+            return token_atoms(tok,deps)
+         key = (i,version[i])
+         try:
+            return cache[key]
+         except KeyError:
+            atoms = cache[key] = token_atoms(tok,deps)
+            return atoms
+      return get
+
+   def _atoms(self,parsed,deps,i):
+      """
+      the tags, forms, children, distances and spans around the focus
+      pair i,i+1, for the feature templates.
+      """
       j=i+1
-      features=[]
 
       f1=parsed[i]
       f2=parsed[j]
@@ -50,221 +115,184 @@ class BaselineFeatureExtractor: # {{{
       p1=parsed[i-1] if i-1 > 0 else PAD
       p2=parsed[i-2] if i-2 > 0 else PAD
 
-      f1_form = f1['form'] 
-      f2_form = f2['form'] 
-      p1_form = p1['form'] 
-      n1_form = n1['form'] 
-      n2_form = n2['form'] 
-      p2_form = p2['form'] 
-
-      f1_tag = f1['tag'] 
-      f2_tag = f2['tag'] 
-      p1_tag = p1['tag'] 
-      n1_tag = n1['tag'] 
-      n2_tag = n2['tag'] 
-      p2_tag = p2['tag'] 
-      if f1_tag in IN: f1_tag = "%s%s" % (f1_tag,f1_form)
-      if f2_tag in IN: f2_tag = "%s%s" % (f2_tag,f2_form)
-      if p1_tag in IN: p1_tag = "%s%s" % (p1_tag,p1_form)
-      if p2_tag in IN: p2_tag = "%s%s" % (p2_tag,p2_form)
-      if n1_tag in IN: n1_tag = "%s%s" % (n1_tag,n1_form)
-      if n2_tag in IN: n2_tag = "%s%s" % (n2_tag,n2_form)
-
-
-      ## @@@ Hurts performance with small training set. benefit with large!
-      if p2_tag in CC: p2_tag = "%s%s" % (p2_tag,p2_form)
-      if n2_tag in CC: n2_tag = "%s%s" % (n2_tag,n2_form)
-      ####
-
-      left_child=deps.left_child
-      f1lc = left_child(f1)
-      if f1lc: f1lc=f1lc['tag']
-      f2lc = left_child(f2)
-      if f2lc: f2lc=f2lc['tag']
-      n1lc = left_child(n1) 
-      if n1lc: n1lc=n1lc['tag']
-      n2lc = left_child(n2) 
-      if n2lc: n2lc=n2lc['tag']
-      p1lc = left_child(p1) 
-      if p1lc: p1lc=p1lc['tag']
-      p2lc = left_child(p2) 
-      if p2lc: p2lc=p2lc['tag']
-
-      ## TO-VERB (to keep, to go,...)
-      if f1_tag[0]=='V' and f1lc=='TO': f1_tag="%s_TO" % f1_tag
-      if f2_tag[0]=='V' and f2lc=='TO': f2_tag="%s_TO" % f2_tag
-      if p1_tag[0]=='V' and p1lc=='TO': p1_tag="%s_TO" % p1_tag
-      if p2_tag[0]=='V' and p2lc=='TO': p2_tag="%s_TO" % p2_tag
-      if n1_tag[0]=='V' and n1lc=='TO': n1_tag="%s_TO" % n1_tag
-      if n2_tag[0]=='V' and n2lc=='TO': n2_tag="%s_TO" % n2_tag
-
-      f1rc_form=None
-      right_child=deps.right_child
-      f1rc = right_child(f1) 
-      if f1rc: 
-         f1rc_form=f1rc['form']
-         f1rc=f1rc['tag']
-
-      f2rc_form=None
-      f2rc = right_child(f2) 
-      if f2rc: 
-         f2rc_form=f2rc['form']
-         f2rc=f2rc['tag']
-
-      n1rc_form=None
-      n1rc = right_child(n1) 
-      if n1rc: 
-         n1rc_form=n1rc['form']
-         n1rc=n1rc['tag']
-
-      n2rc = right_child(n2) 
-      if n2rc: n2rc=n2rc['tag']
-      p1rc = right_child(p1) 
-      if p1rc: p1rc=p1rc['tag']
-      p2rc = right_child(p2) 
-      if p2rc: p2rc=p2rc['tag']
+      atoms = self._cached_atoms(deps)
+      (f1_form,f1_tag,_,f1lc,f1rc,f1rc_form,sf1,f1span,f1id) = atoms(f1)
+      (f2_form,f2_tag,_,f2lc,f2rc,f2rc_form,sf2,f2span,f2id) = atoms(f2)
+      (n1_form,n1_tag,_,n1lc,n1rc,n1rc_form,sn1,n1span,n1id) = atoms(n1)
+      (p1_form,p1_tag,_,p1lc,p1rc,_,sp1,p1span,p1id) = atoms(p1)
+      (n2_form,_,n2_tag,n2lc,n2rc,_,sn2,n2span,n2id) = atoms(n2)
+      (p2_form,_,p2_tag,p2lc,p2rc,_,sp2,p2span,p2id) = atoms(p2)
+
+      return (f1,f2,n1,p1,
+              f1id,f2id,n1id,n2id,p1id,p2id,
+              f1_form,f2_form,n1_form,n2_form,p1_form,p2_form,
+              f1_tag,f2_tag,n1_tag,n2_tag,p1_tag,p2_tag,
+              f1lc,f2lc,n1lc,n2lc,p1lc,p2lc,
+              f1rc,f2rc,n1rc,n2rc,p1rc,p2rc,
+              f1rc_form,f2rc_form,n1rc_form,
+              sf1,sf2,sn1,sn2,sp1,sp2,
+              f1span,f2span,n1span,n2span,p1span,p2span)
+
+   def _features(self,parsed,deps,i):
+      """
+      the feature templates around the focus pair i,i+1. each feature is
+      a tuple of atoms, the template name first: extract joins it into a
+      string, extract_hashed hashes it (see ml.hash_features).
+      """
+      (f1,f2,n1,p1,
+       f1id,f2id,n1id,n2id,p1id,p2id,
+       f1_form,f2_form,n1_form,n2_form,p1_form,p2_form,
+       f1_tag,f2_tag,n1_tag,n2_tag,p1_tag,p2_tag,
+       f1lc,f2lc,n1lc,n2lc,p1lc,p2lc,
+       f1rc,f2rc,n1rc,n2rc,p1rc,p2rc,
+       f1rc_form,f2rc_form,n1rc_form,
+       sf1,sf2,sn1,sn2,sp1,sp2,
+       f1span,f2span,n1span,n2span,p1span,p2span) = self._atoms(parsed,deps,i)
 
-      # this should help in cases of A CC B D, telling B not to B->D if CC is not built yet and in matching type
-      # hope this helps (Many money managers and (some traders had already left))
-      if f1_tag in CC: f1_tag = "%s-%s-%s-%s" % (f1_form,f1_tag,f1lc,f1rc)
-      if f2_tag in CC: f2_tag = "%s-%s-%s-%s" % (f2_form,f2_tag,f2lc,f2rc)
-      if p1_tag in CC: p1_tag = "%s-%s-%s-%s" % (p1_form,p1_tag,p1lc,p1rc)
-      if n1_tag in CC: n1_tag = "%s-%s-%s-%s" % (n1_form,n1_tag,n1lc,n1rc)
-   
+      features=[]
       append = features.append
 
       # lengths
-      f1id=f1['id']
-      f2id=f2['id']
-      n1id=n1['id']
-      p1id=p1['id']
-      n2id=n2['id']
-      p2id=p2['id']
-      append("lp1f1_%s" % (f1id-p1id))
-      append("lf1f2_%s" % (f2id-f1id))
-      append("lf2n1_%s" % (n1id-f2id))
-      append("lp2p1_%s" % (p1id-p2id))
-      append("ln1n2_%s" % (n2id-n1id))
-
-      append("lp1f1_%s_%s_%s" % (f1id-p1id,f1_tag,p1_tag))
-      append("lf1f2_%s_%s_%s" % (f2id-f1id,f2_tag,f1_tag))
-      append("lf2n1_%s_%s_%s" % (n1id-f2id,n1_tag,f2_tag))
-      append("lp2p1_%s_%s_%s" % (p1id-p2id,p1_tag,p2_tag))
-      append("ln1n2_%s_%s_%s" % (n2id-n1id,n2_tag,n1_tag))
+      append(("lp1f1",f1id-p1id))
+      append(("lf1f2",f2id-f1id))
+      append(("lf2n1",n1id-f2id))
+      append(("lp2p1",p1id-p2id))
+      append(("ln1n2",n2id-n1id))
+
+      append(("lp1f1",f1id-p1id,f1_tag,p1_tag))
+      append(("lf1f2",f2id-f1id,f2_tag,f1_tag))
+      append(("lf2n1",n1id-f2id,n1_tag,f2_tag))
+      append(("lp2p1",p1id-p2id,p1_tag,p2_tag))
+      append(("ln1n2",n2id-n1id,n2_tag,n1_tag))
       
 
       # "am I a word or more?" features
-      sf1 = left_child(f1)==None and right_child(f1)==None
-      sf2 = left_child(f2)==None and right_child(f2)==None
-      sp1 = left_child(p1)==None and right_child(p1)==None
-      sp2 = left_child(p2)==None and right_child(p2)==None
-      sn1 = left_child(n1)==None and right_child(n1)==None
-      sn2 = left_child(n2)==None and right_child(n2)==None
-
-      append("sf1_%s_%s" % (f1_tag,sf1))
-      append("sf2_%s_%s" % (f2_tag,sf2))
-      append("sn1_%s_%s" % (n1_tag,sn1))
-      append("sn2_%s_%s" % (n2_tag,sn2))
-      append("sp1_%s_%s" % (p1_tag,sp1))
-      append("sp2_%s_%s" % (p2_tag,sp2))
+      append(("sf1",f1_tag,sf1))
+      append(("sf2",f2_tag,sf2))
+      append(("sn1",n1_tag,sn1))
+      append(("sn2",n2_tag,sn2))
+      append(("sp1",p1_tag,sp1))
+      append(("sp2",p2_tag,sp2))
 
       # lens
-      span = deps.span
-      append("lenf1_%s_%s" % (f1_tag,span(f1)))
-      append("lenf2_%s_%s" % (f2_tag,span(f2)))
-      append("lenn1_%s_%s" % (n1_tag,span(n1)))
-      append("lenn2_%s_%s" % (n2_tag,span(n2)))
-      append("lenp1_%s_%s" % (p1_tag,span(p1)))
-      append("lenp2_%s_%s" % (p2_tag,span(p2)))
+      append(("lenf1",f1_tag,f1span))
+      append(("lenf2",f2_tag,f2span))
+      append(("lenn1",n1_tag,n1span))
+      append(("lenn2",n2_tag,n2span))
+      append(("lenp1",p1_tag,p1span))
+      append(("lenp2",p2_tag,p2span))
 
       # unigram
-      if f1_form: append("f1w_%s" % (f1_form))
-      if f2_form: append("f2w_%s" % (f2_form))
-      if p1_form: append("p1w_%s" % (p1_form))
-      if p2_form: append("p2w_%s" % (p2_form))
-      if n1_form: append("n1w_%s" % (n1_form))
-      if n2_form: append("n2w_%s" % (n2_form))
-
-      append("f1t_%s" % (f1_tag))
-      append("f2t_%s" % (f2_tag))
-      append("p1t_%s" % (p1_tag))
-      append("p2t_%s" % (p2_tag))
-      append("n1t_%s" % (n1_tag))
-      append("n2t_%s" % (n2_tag))
+      if f1_form: append(("f1w",f1_form))
+      if f2_form: append(("f2w",f2_form))
+      if p1_form: append(("p1w",p1_form))
+      if p2_form: append(("p2w",p2_form))
+      if n1_form: append(("n1w",n1_form))
+      if n2_form: append(("n2w",n2_form))
+
+      append(("f1t",f1_tag))
+      append(("f2t",f2_tag))
+      append(("p1t",p1_tag))
+      append(("p2t",p2_tag))
+      append(("n1t",n1_tag))
+      append(("n2t",n2_tag))
 
       # bigram
-      append("f1tf2t_%s_%s" % (f1_tag,f2_tag))
+      append(("f1tf2t",f1_tag,f2_tag))
 
-      append("p1tf1t_%s_%s" % (p1_tag,f1_tag))
-      append("p1tf2t_%s_%s" % (p1_tag,f2_tag))
+      append(("p1tf1t",p1_tag,f1_tag))
+      append(("p1tf2t",p1_tag,f2_tag))
 
-      append("f2tn1t_%s_%s" % (f2_tag,n1_tag))
-      append("f1tn1t_%s_%s" % (f1_tag,n1_tag))
+      append(("f2tn1t",f2_tag,n1_tag))
+      append(("f1tn1t",f1_tag,n1_tag))
 
       # w bigram
-      if f1_form and f2_form: append("f1tf2t_%s_%s" % (f1_form,f2_form))
-      if p1_form and p2_form: append("p1tf1t_%s_%s" % (p1_form,f1_form))
-      if p1_form and f2_form: append("p1tf2t_%s_%s" % (p1_form,f2_form))
-      if p2_form and n1_form: append("f2tn1t_%s_%s" % (f2_form,n1_form))
-      if f1_form and n1_form: append("f1tn1t_%s_%s" % (f1_form,n1_form))
+      if f1_form and f2_form: append(("f1tf2t",f1_form,f2_form))
+      if p1_form and p2_form: append(("p1tf1t",p1_form,f1_form))
+      if p1_form and f2_form: append(("p1tf2t",p1_form,f2_form))
+      if p2_form and n1_form: append(("f2tn1t",f2_form,n1_form))
+      if f1_form and n1_form: append(("f1tn1t",f1_form,n1_form))
       # w bigram t-w
-      if f2_form: append("f1tf2t_%s_%s" % (f1_tag,f2_form))
-      if f1_form: append("p1tf1t_%s_%s" % (p1_tag,f1_form))
-      if f2_form: append("p1tf2t_%s_%s" % (p1_tag,f2_form))
-      if n1_form: append("f2tn1t_%s_%s" % (f2_tag,n1_form))
-      if n1_form: append("f1tn1t_%s_%s" % (f1_tag,n1_form))
-      if f1_form: append("f1tf2t_%s_%s" % (f1_form,f2_tag))
-      if p1_form: append("p1tf1t_%s_%s" % (p1_form,f1_tag))
-      if p1_form: append("p1tf2t_%s_%s" % (p1_form,f2_tag))
-      if f2_form: append("f2tn1t_%s_%s" % (f2_form,n1_tag))
-      if f1_form: append("f1tn1t_%s_%s" % (f1_form,n1_tag))
+      if f2_form: append(("f1tf2t",f1_tag,f2_form))
+      if f1_form: append(("p1tf1t",p1_tag,f1_form))
+      if f2_form: append(("p1tf2t",p1_tag,f2_form))
+      if n1_form: append(("f2tn1t",f2_tag,n1_form))
+      if n1_form: append(("f1tn1t",f1_tag,n1_form))
+      if f1_form: append(("f1tf2t",f1_form,f2_tag))
+      if p1_form: append(("p1tf1t",p1_form,f1_tag))
+      if p1_form: append(("p1tf2t",p1_form,f2_tag))
+      if f2_form: append(("f2tn1t",f2_form,n1_tag))
+      if f1_form: append(("f1tn1t",f1_form,n1_tag))
 
       # bigram+left/right child
 
-      append("f1tf2t_%s_%s_%s_%s" % (f1_tag,f2_tag,f1lc,f2lc))
-      append("p1tf1t_%s_%s_%s_%s" % (p1_tag,f1_tag,p1lc,f1lc))
-      append("p1tf2t_%s_%s_%s_%s" % (p1_tag,f2_tag,p1lc,f2lc))
-      append("f2tn1t_%s_%s_%s_%s" % (f2_tag,n1_tag,f2lc,n1lc))
-      append("f1tn1t_%s_%s_%s_%s" % (f1_tag,n1_tag,f1lc,n1lc))
+      append(("f1tf2t",f1_tag,f2_tag,f1lc,f2lc))
+      append(("p1tf1t",p1_tag,f1_tag,p1lc,f1lc))
+      append(("p1tf2t",p1_tag,f2_tag,p1lc,f2lc))
+      append(("f2tn1t",f2_tag,n1_tag,f2lc,n1lc))
+      append(("f1tn1t",f1_tag,n1_tag,f1lc,n1lc))
 
-      append("f1tf2t_%s_%s_%s_%s" % (f1_tag,f2_tag,f1lc,f2rc))
-      append("p1tf1t_%s_%s_%s_%s" % (p1_tag,f1_tag,p1lc,f1rc))
-      append("p1tf2t_%s_%s_%s_%s" % (p1_tag,f2_tag,p1lc,f2rc))
-      append("f2tn1t_%s_%s_%s_%s" % (f2_tag,n1_tag,f2lc,n1rc))
-      append("f1tn1t_%s_%s_%s_%s" % (f1_tag,n1_tag,f1lc,n1rc))
+      append(("f1tf2t",f1_tag,f2_tag,f1lc,f2rc))
+      append(("p1tf1t",p1_tag,f1_tag,p1lc,f1rc))
+      append(("p1tf2t",p1_tag,f2_tag,p1lc,f2rc))
+      append(("f2tn1t",f2_tag,n1_tag,f2lc,n1rc))
+      append(("f1tn1t",f1_tag,n1_tag,f1lc,n1rc))
 
-      append("f1tf2t_%s_%s_%s_%s" % (f1_tag,f2_tag,f1rc,f2lc))
-      append("p1tf1t_%s_%s_%s_%s" % (p1_tag,f1_tag,p1rc,f1lc))
-      append("p1tf2t_%s_%s_%s_%s" % (p1_tag,f2_tag,p1rc,f2lc))
-      append("f2tn1t_%s_%s_%s_%s" % (f2_tag,n1_tag,f2rc,n1lc))
-      append("f1tn1t_%s_%s_%s_%s" % (f1_tag,n1_tag,f1rc,n1lc))
+      append(("f1tf2t",f1_tag,f2_tag,f1rc,f2lc))
+      append(("p1tf1t",p1_tag,f1_tag,p1rc,f1lc))
+      append(("p1tf2t",p1_tag,f2_tag,p1rc,f2lc))
+      append(("f2tn1t",f2_tag,n1_tag,f2rc,n1lc))
+      append(("f1tn1t",f1_tag,n1_tag,f1rc,n1lc))
 
-      append("f1tf2t_%s_%s_%s_%s" % (f1_tag,f2_tag,f1rc,f2rc))
-      append("p1tf1t_%s_%s_%s_%s" % (p1_tag,f1_tag,p1rc,f1rc))
-      append("p1tf2t_%s_%s_%s_%s" % (p1_tag,f2_tag,p1rc,f2rc))
-      append("f2tn1t_%s_%s_%s_%s" % (f2_tag,n1_tag,f2rc,n1rc))
-      append("f1tn1t_%s_%s_%s_%s" % (f1_tag,n1_tag,f1rc,n1rc))
+      append(("f1tf2t",f1_tag,f2_tag,f1rc,f2rc))
+      append(("p1tf1t",p1_tag,f1_tag,p1rc,f1rc))
+      append(("p1tf2t",p1_tag,f2_tag,p1rc,f2rc))
+      append(("f2tn1t",f2_tag,n1_tag,f2rc,n1rc))
+      append(("f1tn1t",f1_tag,n1_tag,f1rc,n1rc))
 
 
       if f2['tag']  in  IN:
-         append("PP1_%s_%s_%s" % (f1_form,f2_form,f2rc))
-         append("PP2_%s_%s_%s" % (p1_form,f2_form,f2rc))
+         append(("PP1",f1_form,f2_form,f2rc))
+         append(("PP2",p1_form,f2_form,f2rc))
       if f1['tag']  in  IN:
-         append("PP3_%s_%s_%s" % (p1_form,f1_form,f1rc))
+         append(("PP3",p1_form,f1_form,f1rc))
       if n1['tag']  in  IN:
-         append("PP4_%s_%s_%s" % (f2_form,n1_form,n1rc))
-         append("PP5_%s_%s_%s" % (f1_form,n1_form,n1rc))
+         append(("PP4",f2_form,n1_form,n1rc))
+         append(("PP5",f1_form,n1_form,n1rc))
 
       if f2['tag']  in  IN:
-         append("PP1_%s_%s_%s" % (f1_tag,f2_form,f2rc_form))
-         append("PP2_%s_%s_%s" % (p1_tag,f2_form,f2rc_form))
+         append(("PP1",f1_tag,f2_form,f2rc_form))
+         append(("PP2",p1_tag,f2_form,f2rc_form))
       if f1['tag']  in  IN:
-         append("PP3_%s_%s_%s" % (p1_tag,f1_form,f1rc_form))
+         append(("PP3",p1_tag,f1_form,f1rc_form))
       if n1['tag']  in  IN:
-         append("PP4_%s_%s_%s" % (f2_tag,n1_form,n1rc_form))
-         append("PP5_%s_%s_%s" % (f1_tag,n1_form,n1rc_form))
+         append(("PP4",f2_tag,n1_form,n1rc_form))
+         append(("PP5",f1_tag,n1_form,n1rc_form))
 
       return features
+
+   def extract(self,parsed,deps,i,sent=None):
+      """
+      i=T4:
+         should I connect T4 and T5 in:
+            t1 t2 t3 T4 T5 t6 t7 t8
+         ?
+         focus: f1=T4 f2=T5
+         previous: p1=t3 p2=t2
+         next:     n1=t6 n2=t7
+      returns (feats1,feats2)
+      where feats1 is a list of features for connecting T4->T5  (T4 is child)
+      and   feats2 is a list of features for connecting T4<-T5  (T5 is child)
+      """
+      formats = FORMATS
+      return [formats[len(f)] % f for f in self._features(parsed,deps,i)]
+
+   def extract_hashed(self,parsed,deps,i,sent=None):
+      """
+      same features as extract, hashed straight into [0,nbuckets) without
+      building the strings.
+      """
+      return hash_features(self._features(parsed,deps,i),self.nbuckets)
    #}}}
 
 FeaturesExtractor = BaselineFeatureExtractor
@@ -1,16062 +0,0 @@
-/* Generated by Cython 0.12.1 on Sat May  1 18:30:50 2010 */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#include "structmember.h"
-#ifndef Py_PYTHON_H
-    #error Python headers needed to compile C extensions, please install development version of Python.
-#else
-
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#if PY_VERSION_HEX < 0x02040000
-  #define METH_COEXIST 0
-  #define PyDict_CheckExact(op) (Py_TYPE(op) == &PyDict_Type)
-  #define PyDict_Contains(d,o)   PySequence_Contains(d,o)
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PY_FORMAT_SIZE_T ""
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-  #define PyErr_WarnEx(category, message, stacklevel) PyErr_Warn(category, message)
-#endif
-
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-     void *buf;
-     PyObject *obj;
-     Py_ssize_t len;
-     Py_ssize_t itemsize;
-     int readonly;
-     int ndim;
-     char *format;
-     Py_ssize_t *shape;
-     Py_ssize_t *strides;
-     Py_ssize_t *suboffsets;
-     void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-
-#endif
-
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyString_Type                PyUnicode_Type
-  #define PyString_CheckExact          PyUnicode_CheckExact
-#else
-  #define PyBytes_Type                 PyString_Type
-  #define PyBytes_CheckExact           PyString_CheckExact
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
-
-#endif
-
-#if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
-#endif
-
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-  #ifndef __fastcall
-    #define __fastcall
-  #endif
-#else
-  #define _USE_MATH_DEFINES
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),((char *)(n)))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),((char *)(n)),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),((char *)(n)))
-#else
-  #define __Pyx_GetAttrString(o,n)   PyObject_GetAttrString((o),(n))
-  #define __Pyx_SetAttrString(o,n,a) PyObject_SetAttrString((o),(n),(a))
-  #define __Pyx_DelAttrString(o,n)   PyObject_DelAttrString((o),(n))
-#endif
-
-#if PY_VERSION_HEX < 0x02050000
-  #define __Pyx_NAMESTR(n) ((char *)(n))
-  #define __Pyx_DOCSTR(n)  ((char *)(n))
-#else
-  #define __Pyx_NAMESTR(n) (n)
-  #define __Pyx_DOCSTR(n)  (n)
-#endif
-#ifdef __cplusplus
-#define __PYX_EXTERN_C extern "C"
-#else
-#define __PYX_EXTERN_C extern
-#endif
-#include <math.h>
-#define __PYX_HAVE_API__ml
-#include "stdlib.h"
-
-#ifndef CYTHON_INLINE
-  #if defined(__GNUC__)
-    #define CYTHON_INLINE __inline__
-  #elif defined(_MSC_VER)
-    #define CYTHON_INLINE __inline
-  #else
-    #define CYTHON_INLINE 
-  #endif
-#endif
-
-typedef struct {PyObject **p; char *s; const long n; const char* encoding; const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry; /*proto*/
-
-
-/* Type Conversion Predeclarations */
-
-#if PY_MAJOR_VERSION < 3
-#define __Pyx_PyBytes_FromString          PyString_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyString_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyString_AsString
-#else
-#define __Pyx_PyBytes_FromString          PyBytes_FromString
-#define __Pyx_PyBytes_FromStringAndSize   PyBytes_FromStringAndSize
-#define __Pyx_PyBytes_AsString            PyBytes_AsString
-#endif
-
-#define __Pyx_PyBytes_FromUString(s)      __Pyx_PyBytes_FromString((char*)s)
-#define __Pyx_PyBytes_AsUString(s)        ((unsigned char*) __Pyx_PyBytes_AsString(s))
-
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x);
-
-#if !defined(T_PYSSIZET)
-#if PY_VERSION_HEX < 0x02050000
-#define T_PYSSIZET T_INT
-#elif !defined(T_LONGLONG)
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))  ? T_INT  : \
-        ((sizeof(Py_ssize_t) == sizeof(long)) ? T_LONG : -1))
-#else
-#define T_PYSSIZET \
-        ((sizeof(Py_ssize_t) == sizeof(int))          ? T_INT      : \
-        ((sizeof(Py_ssize_t) == sizeof(long))         ? T_LONG     : \
-        ((sizeof(Py_ssize_t) == sizeof(PY_LONG_LONG)) ? T_LONGLONG : -1)))
-#endif
-#endif
-
-
-#if !defined(T_ULONGLONG)
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : -1))))
-#else
-#define __Pyx_T_UNSIGNED_INT(x) \
-        ((sizeof(x) == sizeof(unsigned char))  ? T_UBYTE : \
-        ((sizeof(x) == sizeof(unsigned short)) ? T_USHORT : \
-        ((sizeof(x) == sizeof(unsigned int))   ? T_UINT : \
-        ((sizeof(x) == sizeof(unsigned long))  ? T_ULONG : \
-        ((sizeof(x) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))))
-#endif
-#if !defined(T_LONGLONG)
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : -1))))
-#else
-#define __Pyx_T_SIGNED_INT(x) \
-        ((sizeof(x) == sizeof(char))  ? T_BYTE : \
-        ((sizeof(x) == sizeof(short)) ? T_SHORT : \
-        ((sizeof(x) == sizeof(int))   ? T_INT : \
-        ((sizeof(x) == sizeof(long))  ? T_LONG : \
-        ((sizeof(x) == sizeof(PY_LONG_LONG))   ? T_LONGLONG : -1)))))
-#endif
-
-#define __Pyx_T_FLOATING(x) \
-        ((sizeof(x) == sizeof(float)) ? T_FLOAT : \
-        ((sizeof(x) == sizeof(double)) ? T_DOUBLE : -1))
-
-#if !defined(T_SIZET)
-#if !defined(T_ULONGLONG)
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))  ? T_UINT  : \
-        ((sizeof(size_t) == sizeof(unsigned long)) ? T_ULONG : -1))
-#else
-#define T_SIZET \
-        ((sizeof(size_t) == sizeof(unsigned int))          ? T_UINT      : \
-        ((sizeof(size_t) == sizeof(unsigned long))         ? T_ULONG     : \
-        ((sizeof(size_t) == sizeof(unsigned PY_LONG_LONG)) ? T_ULONGLONG : -1)))
-#endif
-#endif
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject*);
-
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-
-
-#ifdef __GNUC__
-/* Test for GCC > 2.95 */
-#if __GNUC__ > 2 ||               (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)) 
-#define likely(x)   __builtin_expect(!!(x), 1)
-#define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* __GNUC__ > 2 ... */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static PyObject *__pyx_empty_bytes;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-static const char **__pyx_f;
-
-
-/* Type declarations */
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":309
- *             p.lastUpd[clas]=self.now
- * 
- *    cpdef do_pa_update(self, list feats, int gold_cls, double C=1.0):             # <<<<<<<<<<<<<<
- *       cdef double go_scr
- *       cdef double gu_scr
- */
-
-struct __pyx_opt_args_2ml_19MultitronParameters_do_pa_update {
-  int __pyx_n;
-  double C;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":332
- *       return prediction
- * 
- *    cpdef pa_update(self, object gu_feats, object go_feats, int gu_cls, int go_cls,double C=1.0):             # <<<<<<<<<<<<<<
- *       cdef double go_scr
- *       cdef double gu_scr
- */
-
-struct __pyx_opt_args_2ml_19MultitronParameters_pa_update {
-  int __pyx_n;
-  double C;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":628
- * 
- * 
- * cdef class MultipleVectorsMulticlassModel: #{{{             # <<<<<<<<<<<<<<
- *    def __init__(self):pass
- *    def get_scores(self, features):
- */
-
-struct __pyx_obj_2ml_MultipleVectorsMulticlassModel {
-  PyObject_HEAD
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":684
- *          out.write("\n")
- * 
- * cdef class MulticlassLinearModel(MultipleVectorsMulticlassModel):             # <<<<<<<<<<<<<<
- *    cdef:
- *       list linearmodels  # TODO specific type?
- */
-
-struct __pyx_obj_2ml_MulticlassLinearModel {
-  struct __pyx_obj_2ml_MultipleVectorsMulticlassModel __pyx_base;
-  struct __pyx_vtabstruct_2ml_MulticlassLinearModel *__pyx_vtab;
-  PyObject *linearmodels;
-  int _nclasses;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":38
- *       free(self.vals)
- * 
- * cdef class MulticlassModel:             # <<<<<<<<<<<<<<
- * 
- *    cdef dict W
- */
-
-struct __pyx_obj_2ml_MulticlassModel {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_2ml_MulticlassModel *__pyx_vtab;
-  PyObject *W;
-  struct __pyx_obj_2ml_DoublesArr *biases;
-  int nclas;
-  double *scores;
-  int probs_output;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":576
- *    return mf
- * 
- * cdef class LinearModel:             # <<<<<<<<<<<<<<
- *    cdef:
- *       dict W
- */
-
-struct __pyx_obj_2ml_LinearModel {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_2ml_LinearModel *__pyx_vtab;
-  PyObject *W;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":195
- *       free(self.w)
- * 
- * cdef class MultitronParameters:             # <<<<<<<<<<<<<<
- *    cdef:
- *       int nclasses
- */
-
-struct __pyx_obj_2ml_MultitronParameters {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_2ml_MultitronParameters *__pyx_vtab;
-  int nclasses;
-  int now;
-  PyObject *W;
-  double *scores;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":567
- *          out.write("\n")
- * 
- * cdef class _float:             # <<<<<<<<<<<<<<
- *    cdef:
- *       float val
- */
-
-struct __pyx_obj_2ml__float {
-  PyObject_HEAD
-  float val;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":506
- *       self.lastUpd=0
- * 
- * cdef class PerceptronParameters:             # <<<<<<<<<<<<<<
- *    cdef:
- *       int now
- */
-
-struct __pyx_obj_2ml_PerceptronParameters {
-  PyObject_HEAD
-  struct __pyx_vtabstruct_2ml_PerceptronParameters *__pyx_vtab;
-  int now;
-  PyObject *W;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":175
- * ### Model trainers {{{
- * 
- * cdef class MulticlassParamData:             # <<<<<<<<<<<<<<
- *    cdef:
- *       double *acc
- */
-
-struct __pyx_obj_2ml_MulticlassParamData {
-  PyObject_HEAD
-  double *acc;
-  double *w;
-  int *lastUpd;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":639
- * #}}}
- * 
- * cdef class MultipleVectorsMulticlassParams(MultipleVectorsMulticlassModel):             # <<<<<<<<<<<<<<
- *    cdef:
- *       list params # TODO change to specific type..
- */
-
-struct __pyx_obj_2ml_MultipleVectorsMulticlassParams {
-  struct __pyx_obj_2ml_MultipleVectorsMulticlassModel __pyx_base;
-  struct __pyx_vtabstruct_2ml_MultipleVectorsMulticlassParams *__pyx_vtab;
-  PyObject *params;
-  int nclasses;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":24
- * 
- * 
- * cdef class DoublesArr:             # <<<<<<<<<<<<<<
- *    cdef double* vals
- *    cdef public int n
- */
-
-struct __pyx_obj_2ml_DoublesArr {
-  PyObject_HEAD
-  double *vals;
-  int n;
-};
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":496
- * 
- * ##################
- * cdef class ParamData:             # <<<<<<<<<<<<<<
- *    cdef:
- *       double acc
- */
-
-struct __pyx_obj_2ml_ParamData {
-  PyObject_HEAD
-  double acc;
-  double w;
-  int lastUpd;
-};
-
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":506
- *       self.lastUpd=0
- * 
- * cdef class PerceptronParameters:             # <<<<<<<<<<<<<<
- *    cdef:
- *       int now
- */
-
-struct __pyx_vtabstruct_2ml_PerceptronParameters {
-  PyObject *(*_score)(struct __pyx_obj_2ml_PerceptronParameters *, PyObject *);
-  PyObject *(*updateFeatures)(struct __pyx_obj_2ml_PerceptronParameters *, PyObject *, double, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_2ml_PerceptronParameters *__pyx_vtabptr_2ml_PerceptronParameters;
-
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":576
- *    return mf
- * 
- * cdef class LinearModel:             # <<<<<<<<<<<<<<
- *    cdef:
- *       dict W
- */
-
-struct __pyx_vtabstruct_2ml_LinearModel {
-  PyObject *(*_load)(struct __pyx_obj_2ml_LinearModel *, PyObject *, int __pyx_skip_dispatch);
-  double (*_score)(struct __pyx_obj_2ml_LinearModel *, PyObject *);
-};
-static struct __pyx_vtabstruct_2ml_LinearModel *__pyx_vtabptr_2ml_LinearModel;
-
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":684
- *          out.write("\n")
- * 
- * cdef class MulticlassLinearModel(MultipleVectorsMulticlassModel):             # <<<<<<<<<<<<<<
- *    cdef:
- *       list linearmodels  # TODO specific type?
- */
-
-struct __pyx_vtabstruct_2ml_MulticlassLinearModel {
-  int (*nclasses)(struct __pyx_obj_2ml_MulticlassLinearModel *, int __pyx_skip_dispatch);
-  PyObject *(*get_scores)(struct __pyx_obj_2ml_MulticlassLinearModel *, PyObject *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_2ml_MulticlassLinearModel *__pyx_vtabptr_2ml_MulticlassLinearModel;
-
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":639
- * #}}}
- * 
- * cdef class MultipleVectorsMulticlassParams(MultipleVectorsMulticlassModel):             # <<<<<<<<<<<<<<
- *    cdef:
- *       list params # TODO change to specific type..
- */
-
-struct __pyx_vtabstruct_2ml_MultipleVectorsMulticlassParams {
-  PyObject *(*add)(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *, PyObject *, int, double, int __pyx_skip_dispatch);
-  PyObject *(*tick)(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *, int __pyx_skip_dispatch);
-  PyObject *(*get_scores)(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *, PyObject *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_2ml_MultipleVectorsMulticlassParams *__pyx_vtabptr_2ml_MultipleVectorsMulticlassParams;
-
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":38
- *       free(self.vals)
- * 
- * cdef class MulticlassModel:             # <<<<<<<<<<<<<<
- * 
- *    cdef dict W
- */
-
-struct __pyx_vtabstruct_2ml_MulticlassModel {
-  PyObject *(*load)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *);
-  PyObject *(*predict)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*predict_r)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*get_scores)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*get_scores_r)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch);
-};
-static struct __pyx_vtabstruct_2ml_MulticlassModel *__pyx_vtabptr_2ml_MulticlassModel;
-
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":195
- *       free(self.w)
- * 
- * cdef class MultitronParameters:             # <<<<<<<<<<<<<<
- *    cdef:
- *       int nclasses
- */
-
-struct __pyx_vtabstruct_2ml_MultitronParameters {
-  PyObject *(*getW)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*_tick)(struct __pyx_obj_2ml_MultitronParameters *);
-  PyObject *(*scalar_multiply)(struct __pyx_obj_2ml_MultitronParameters *, double, int __pyx_skip_dispatch);
-  PyObject *(*add)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, double, int __pyx_skip_dispatch);
-  PyObject *(*add_r)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, double, int __pyx_skip_dispatch);
-  PyObject *(*set)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, double, int __pyx_skip_dispatch);
-  PyObject *(*add_params)(struct __pyx_obj_2ml_MultitronParameters *, struct __pyx_obj_2ml_MultitronParameters *, double, int __pyx_skip_dispatch);
-  PyObject *(*do_pa_update)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, int __pyx_skip_dispatch, struct __pyx_opt_args_2ml_19MultitronParameters_do_pa_update *__pyx_optional_args);
-  PyObject *(*pa_update)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, PyObject *, int, int, int __pyx_skip_dispatch, struct __pyx_opt_args_2ml_19MultitronParameters_pa_update *__pyx_optional_args);
-  PyObject *(*get_scores)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*get_scores_r)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*predict_best_class_r)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch);
-  int (*_predict_best_class)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *);
-  PyObject *(*_update)(struct __pyx_obj_2ml_MultitronParameters *, int, int, PyObject *);
-  PyObject *(*_update_r)(struct __pyx_obj_2ml_MultitronParameters *, int, int, PyObject *);
-};
-static struct __pyx_vtabstruct_2ml_MultitronParameters *__pyx_vtabptr_2ml_MultitronParameters;
-
-#ifndef CYTHON_REFNANNY
-  #define CYTHON_REFNANNY 0
-#endif
-
-#if CYTHON_REFNANNY
-  typedef struct {
-    void (*INCREF)(void*, PyObject*, int);
-    void (*DECREF)(void*, PyObject*, int);
-    void (*GOTREF)(void*, PyObject*, int);
-    void (*GIVEREF)(void*, PyObject*, int);
-    void* (*SetupContext)(const char*, int, const char*);
-    void (*FinishContext)(void**);
-  } __Pyx_RefNannyAPIStruct;
-  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
-  static __Pyx_RefNannyAPIStruct * __Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-  end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-  }
-  #define __Pyx_RefNannySetupContext(name)           void *__pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
-  #define __Pyx_RefNannyFinishContext()           __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
-  #define __Pyx_INCREF(r) __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_DECREF(r) __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GOTREF(r) __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
-  #define __Pyx_XDECREF(r) do { if((r) != NULL) {__Pyx_DECREF(r);} } while(0)
-#else
-  #define __Pyx_RefNannySetupContext(name)
-  #define __Pyx_RefNannyFinishContext()
-  #define __Pyx_INCREF(r) Py_INCREF(r)
-  #define __Pyx_DECREF(r) Py_DECREF(r)
-  #define __Pyx_GOTREF(r)
-  #define __Pyx_GIVEREF(r)
-  #define __Pyx_XDECREF(r) Py_XDECREF(r)
-#endif /* CYTHON_REFNANNY */
-#define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);} } while(0)
-#define __Pyx_XGOTREF(r) do { if((r) != NULL) {__Pyx_GOTREF(r);} } while(0)
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name, PyObject* kw_name); /*proto*/
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
-
-static double __Pyx__PyObject_AsDouble(PyObject* obj); /* proto */
-
-#define __Pyx_PyObject_AsDouble(obj) \
-    ((likely(PyFloat_CheckExact(obj))) ? \
-     PyFloat_AS_DOUBLE(obj) : __Pyx__PyObject_AsDouble(obj))
-
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-
-
-#define __Pyx_GetItemInt_List(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_List_Fast(o, i, size <= sizeof(long)) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-            PyObject *r = PyList_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyList_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyList_GET_ITEM(o, PyList_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
-}
-
-#define __Pyx_GetItemInt_Tuple(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Tuple_Fast(o, i, size <= sizeof(long)) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
-    if (likely(o != Py_None)) {
-        if (likely((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, i);
-            Py_INCREF(r);
-            return r;
-        }
-        else if ((-PyTuple_GET_SIZE(o) <= i) & (i < 0)) {
-            PyObject *r = PyTuple_GET_ITEM(o, PyTuple_GET_SIZE(o) + i);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    return __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
-}
-
-
-#define __Pyx_GetItemInt(o, i, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_GetItemInt_Fast(o, i, size <= sizeof(long)) : \
-                                                    __Pyx_GetItemInt_Generic(o, to_py_func(i)))
-
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int fits_long) {
-    PyObject *r;
-    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-        r = PyList_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (PyTuple_CheckExact(o) && ((0 <= i) & (i < PyTuple_GET_SIZE(o)))) {
-        r = PyTuple_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0))) {
-        r = PySequence_GetItem(o, i);
-    }
-    else {
-        r = __Pyx_GetItemInt_Generic(o, fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i));
-    }
-    return r;
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void);
-
-static PyObject *__Pyx_UnpackItem(PyObject *, Py_ssize_t index); /*proto*/
-static int __Pyx_EndUnpack(PyObject *); /*proto*/
-
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Append(PyObject* L, PyObject* x) {
-    if (likely(PyList_CheckExact(L))) {
-        if (PyList_Append(L, x) < 0) return NULL;
-        Py_INCREF(Py_None);
-        return Py_None; /* this is just to have an accurate signature */
-    }
-    else {
-        PyObject *r, *m;
-        m = __Pyx_GetAttrString(L, "append");
-        if (!m) return NULL;
-        r = PyObject_CallFunctionObjArgs(m, x, NULL);
-        Py_DECREF(m);
-        return r;
-    }
-}
-
-#define __Pyx_SetItemInt(o, i, v, size, to_py_func) ((size <= sizeof(Py_ssize_t)) ? \
-                                                    __Pyx_SetItemInt_Fast(o, i, v, size <= sizeof(long)) : \
-                                                    __Pyx_SetItemInt_Generic(o, to_py_func(i), v))
-
-static CYTHON_INLINE int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
-    int r;
-    if (!j) return -1;
-    r = PyObject_SetItem(o, j, v);
-    Py_DECREF(j);
-    return r;
-}
-
-static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int fits_long) {
-    if (PyList_CheckExact(o) && ((0 <= i) & (i < PyList_GET_SIZE(o)))) {
-        Py_INCREF(v);
-        Py_DECREF(PyList_GET_ITEM(o, i));
-        PyList_SET_ITEM(o, i, v);
-        return 1;
-    }
-    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_ass_item && (likely(i >= 0)))
-        return PySequence_SetItem(o, i, v);
-    else {
-        PyObject *j = fits_long ? PyInt_FromLong(i) : PyLong_FromLongLong(i);
-        return __Pyx_SetItemInt_Generic(o, j, v);
-    }
-}
-
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(PyObject *kwdict,
-    const char* function_name, int kw_allowed); /*proto*/
-
-static CYTHON_INLINE PyObject* __Pyx_tp_new(PyObject* type_obj) {
-    return (PyObject*) (((PyTypeObject*)(type_obj))->tp_new(
-        (PyTypeObject*)(type_obj), __pyx_empty_tuple, NULL));
-}
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
-
-#include "descrobject.h"
-static PyObject* __Pyx_Method_ClassMethod(PyObject *method); /*proto*/
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject *);
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject *);
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject *);
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject *);
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject *);
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject *);
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject *);
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject *);
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject *);
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject *);
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject *);
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject *);
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject *);
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject *);
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject *);
-
-static void __Pyx_WriteUnraisable(const char *name); /*proto*/
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable); /*proto*/
-
-static void __Pyx_AddTraceback(const char *funcname); /*proto*/
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-/* Module declarations from stdlib */
-
-/* Module declarations from ml */
-
-static PyTypeObject *__pyx_ptype_2ml_DoublesArr = 0;
-static PyTypeObject *__pyx_ptype_2ml_MulticlassModel = 0;
-static PyTypeObject *__pyx_ptype_2ml_MulticlassParamData = 0;
-static PyTypeObject *__pyx_ptype_2ml_MultitronParameters = 0;
-static PyTypeObject *__pyx_ptype_2ml_ParamData = 0;
-static PyTypeObject *__pyx_ptype_2ml_PerceptronParameters = 0;
-static PyTypeObject *__pyx_ptype_2ml__float = 0;
-static PyTypeObject *__pyx_ptype_2ml_LinearModel = 0;
-static PyTypeObject *__pyx_ptype_2ml_MultipleVectorsMulticlassModel = 0;
-static PyTypeObject *__pyx_ptype_2ml_MultipleVectorsMulticlassParams = 0;
-static PyTypeObject *__pyx_ptype_2ml_MulticlassLinearModel = 0;
-static struct __pyx_obj_2ml__float *__pyx_f_2ml_makef(float); /*proto*/
-#define __Pyx_MODULE_NAME "ml"
-int __pyx_module_is_main_ml = 0;
-
-/* Implementation of ml */
-static PyObject *__pyx_builtin_xrange;
-static PyObject *__pyx_builtin_KeyError;
-static PyObject *__pyx_builtin_range;
-static PyObject *__pyx_builtin_max;
-static char __pyx_k_1[] = "loading model %s";
-static char __pyx_k_2[] = "**BIAS**";
-static char __pyx_k_4[] = " done\n";
-static char __pyx_k_5[] = "incompatible number of classes in add_params";
-static char __pyx_k_6[] = "predict_best_class_r";
-static char __pyx_k_8[] = "%s";
-static char __pyx_k_9[] = " %s";
-static char __pyx_k_10[] = "\n";
-static char __pyx_k_12[] = " %s ";
-static char __pyx_k_15[] = "Not Implemented";
-static char __pyx_k_17[] = "%s\n";
-static char __pyx_k__C[] = "C";
-static char __pyx_k__W[] = "W";
-static char __pyx_k__n[] = "n";
-static char __pyx_k__w[] = "w";
-static char __pyx_k__acc[] = "acc";
-static char __pyx_k__add[] = "add";
-static char __pyx_k__exp[] = "exp";
-static char __pyx_k__max[] = "max";
-static char __pyx_k__now[] = "now";
-static char __pyx_k__out[] = "out";
-static char __pyx_k__set[] = "set";
-static char __pyx_k__sys[] = "sys";
-static char __pyx_k__val[] = "val";
-static char __pyx_k__clas[] = "clas";
-static char __pyx_k__dump[] = "dump";
-static char __pyx_k__getW[] = "getW";
-static char __pyx_k__keys[] = "keys";
-static char __pyx_k__load[] = "load";
-static char __pyx_k__math[] = "math";
-static char __pyx_k__next[] = "next";
-static char __pyx_k__nums[] = "nums";
-static char __pyx_k__tick[] = "tick";
-static char __pyx_k__vals[] = "vals";
-static char __pyx_k___load[] = "_load";
-static char __pyx_k___tick[] = "_tick";
-static char __pyx_k__add_r[] = "add_r";
-static char __pyx_k__feats[] = "feats";
-static char __pyx_k__fname[] = "fname";
-static char __pyx_k__items[] = "items";
-static char __pyx_k__nclas[] = "nclas";
-static char __pyx_k__other[] = "other";
-static char __pyx_k__range[] = "range";
-static char __pyx_k__split[] = "split";
-static char __pyx_k__strip[] = "strip";
-static char __pyx_k__write[] = "write";
-static char __pyx_k___score[] = "_score";
-static char __pyx_k__amount[] = "amount";
-static char __pyx_k__biases[] = "biases";
-static char __pyx_k__factor[] = "factor";
-static char __pyx_k__go_cls[] = "go_cls";
-static char __pyx_k__gu_cls[] = "gu_cls";
-static char __pyx_k__params[] = "params";
-static char __pyx_k__scores[] = "scores";
-static char __pyx_k__stderr[] = "stderr";
-static char __pyx_k__stdout[] = "stdout";
-static char __pyx_k__values[] = "values";
-static char __pyx_k__xrange[] = "xrange";
-static char __pyx_k___update[] = "_update";
-static char __pyx_k__from_fh[] = "from_fh";
-static char __pyx_k__lastUpd[] = "lastUpd";
-static char __pyx_k__predict[] = "predict";
-static char __pyx_k__KeyError[] = "KeyError";
-static char __pyx_k____main__[] = "__main__";
-static char __pyx_k__dump_fin[] = "dump_fin";
-static char __pyx_k__features[] = "features";
-static char __pyx_k__go_feats[] = "go_feats";
-static char __pyx_k__gold_cls[] = "gold_cls";
-static char __pyx_k__gu_feats[] = "gu_feats";
-static char __pyx_k__nclasses[] = "nclasses";
-static char __pyx_k___addmodel[] = "_addmodel";
-static char __pyx_k___nclasses[] = "_nclasses";
-static char __pyx_k___update_r[] = "_update_r";
-static char __pyx_k__from_file[] = "from_file";
-static char __pyx_k__iteritems[] = "iteritems";
-static char __pyx_k__pa_update[] = "pa_update";
-static char __pyx_k__predict_r[] = "predict_r";
-static char __pyx_k__add_params[] = "add_params";
-static char __pyx_k__get_scores[] = "get_scores";
-static char __pyx_k__itervalues[] = "itervalues";
-static char __pyx_k__do_pa_update[] = "do_pa_update";
-static char __pyx_k__get_scores_r[] = "get_scores_r";
-static char __pyx_k__linearmodels[] = "linearmodels";
-static char __pyx_k__probs_output[] = "probs_output";
-static char __pyx_k__correct_class[] = "correct_class";
-static char __pyx_k__updateFeatures[] = "updateFeatures";
-static char __pyx_k__scalar_multiply[] = "scalar_multiply";
-static char __pyx_k___predict_best_class[] = "_predict_best_class";
-static PyObject *__pyx_kp_s_1;
-static PyObject *__pyx_kp_s_10;
-static PyObject *__pyx_kp_s_12;
-static PyObject *__pyx_kp_s_15;
-static PyObject *__pyx_kp_s_17;
-static PyObject *__pyx_kp_s_2;
-static PyObject *__pyx_kp_s_4;
-static PyObject *__pyx_kp_s_5;
-static PyObject *__pyx_n_s_6;
-static PyObject *__pyx_kp_s_8;
-static PyObject *__pyx_kp_s_9;
-static PyObject *__pyx_n_s__C;
-static PyObject *__pyx_n_s__KeyError;
-static PyObject *__pyx_n_s__W;
-static PyObject *__pyx_n_s____main__;
-static PyObject *__pyx_n_s___addmodel;
-static PyObject *__pyx_n_s___load;
-static PyObject *__pyx_n_s___nclasses;
-static PyObject *__pyx_n_s___predict_best_class;
-static PyObject *__pyx_n_s___score;
-static PyObject *__pyx_n_s___tick;
-static PyObject *__pyx_n_s___update;
-static PyObject *__pyx_n_s___update_r;
-static PyObject *__pyx_n_s__acc;
-static PyObject *__pyx_n_s__add;
-static PyObject *__pyx_n_s__add_params;
-static PyObject *__pyx_n_s__add_r;
-static PyObject *__pyx_n_s__amount;
-static PyObject *__pyx_n_s__biases;
-static PyObject *__pyx_n_s__clas;
-static PyObject *__pyx_n_s__correct_class;
-static PyObject *__pyx_n_s__do_pa_update;
-static PyObject *__pyx_n_s__dump;
-static PyObject *__pyx_n_s__dump_fin;
-static PyObject *__pyx_n_s__exp;
-static PyObject *__pyx_n_s__factor;
-static PyObject *__pyx_n_s__feats;
-static PyObject *__pyx_n_s__features;
-static PyObject *__pyx_n_s__fname;
-static PyObject *__pyx_n_s__from_fh;
-static PyObject *__pyx_n_s__from_file;
-static PyObject *__pyx_n_s__getW;
-static PyObject *__pyx_n_s__get_scores;
-static PyObject *__pyx_n_s__get_scores_r;
-static PyObject *__pyx_n_s__go_cls;
-static PyObject *__pyx_n_s__go_feats;
-static PyObject *__pyx_n_s__gold_cls;
-static PyObject *__pyx_n_s__gu_cls;
-static PyObject *__pyx_n_s__gu_feats;
-static PyObject *__pyx_n_s__items;
-static PyObject *__pyx_n_s__iteritems;
-static PyObject *__pyx_n_s__itervalues;
-static PyObject *__pyx_n_s__keys;
-static PyObject *__pyx_n_s__lastUpd;
-static PyObject *__pyx_n_s__linearmodels;
-static PyObject *__pyx_n_s__load;
-static PyObject *__pyx_n_s__math;
-static PyObject *__pyx_n_s__max;
-static PyObject *__pyx_n_s__n;
-static PyObject *__pyx_n_s__nclas;
-static PyObject *__pyx_n_s__nclasses;
-static PyObject *__pyx_n_s__next;
-static PyObject *__pyx_n_s__now;
-static PyObject *__pyx_n_s__nums;
-static PyObject *__pyx_n_s__other;
-static PyObject *__pyx_n_s__out;
-static PyObject *__pyx_n_s__pa_update;
-static PyObject *__pyx_n_s__params;
-static PyObject *__pyx_n_s__predict;
-static PyObject *__pyx_n_s__predict_r;
-static PyObject *__pyx_n_s__probs_output;
-static PyObject *__pyx_n_s__range;
-static PyObject *__pyx_n_s__scalar_multiply;
-static PyObject *__pyx_n_s__scores;
-static PyObject *__pyx_n_s__set;
-static PyObject *__pyx_n_s__split;
-static PyObject *__pyx_n_s__stderr;
-static PyObject *__pyx_n_s__stdout;
-static PyObject *__pyx_n_s__strip;
-static PyObject *__pyx_n_s__sys;
-static PyObject *__pyx_n_s__tick;
-static PyObject *__pyx_n_s__updateFeatures;
-static PyObject *__pyx_n_s__val;
-static PyObject *__pyx_n_s__vals;
-static PyObject *__pyx_n_s__values;
-static PyObject *__pyx_n_s__w;
-static PyObject *__pyx_n_s__write;
-static PyObject *__pyx_n_s__xrange;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_k_3;
-static PyObject *__pyx_k_7;
-static PyObject *__pyx_k_11;
-static PyObject *__pyx_k_13;
-static PyObject *__pyx_k_14;
-static PyObject *__pyx_k_16;
-static PyObject *__pyx_k_18;
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":27
- *    cdef double* vals
- *    cdef public int n
- *    def __cinit__(self, list nums):             # <<<<<<<<<<<<<<
- *       cdef double n
- *       cdef int i
- */
-
-static int __pyx_pf_2ml_10DoublesArr___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_10DoublesArr___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_nums = 0;
-  double __pyx_v_n;
-  int __pyx_v_i;
-  int __pyx_r;
-  Py_ssize_t __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  double __pyx_t_5;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__nums,0};
-  __Pyx_RefNannySetupContext("__cinit__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__nums);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_nums = ((PyObject *)values[0]);
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_nums = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.DoublesArr.__cinit__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_nums);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_nums), &PyList_Type, 1, "nums", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":30
- *       cdef double n
- *       cdef int i
- *       self.n = len(nums)             # <<<<<<<<<<<<<<
- *       self.vals=<double *>malloc(sizeof(double)*self.n)
- *       for i in xrange(self.n):
- */
-  __pyx_t_1 = PyObject_Length(((PyObject *)__pyx_v_nums)); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  ((struct __pyx_obj_2ml_DoublesArr *)__pyx_v_self)->n = __pyx_t_1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":31
- *       cdef int i
- *       self.n = len(nums)
- *       self.vals=<double *>malloc(sizeof(double)*self.n)             # <<<<<<<<<<<<<<
- *       for i in xrange(self.n):
- *          n = float(nums[i])
- */
-  ((struct __pyx_obj_2ml_DoublesArr *)__pyx_v_self)->vals = ((double *)malloc(((sizeof(double)) * ((struct __pyx_obj_2ml_DoublesArr *)__pyx_v_self)->n)));
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":32
- *       self.n = len(nums)
- *       self.vals=<double *>malloc(sizeof(double)*self.n)
- *       for i in xrange(self.n):             # <<<<<<<<<<<<<<
- *          n = float(nums[i])
- *          self.vals[i] = n
- */
-  __pyx_t_2 = ((struct __pyx_obj_2ml_DoublesArr *)__pyx_v_self)->n;
-  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v_i = __pyx_t_3;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":33
- *       self.vals=<double *>malloc(sizeof(double)*self.n)
- *       for i in xrange(self.n):
- *          n = float(nums[i])             # <<<<<<<<<<<<<<
- *          self.vals[i] = n
- *    def __dealloc__(self):
- */
-    __pyx_t_4 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_nums), __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_AsDouble(__pyx_t_4); if (unlikely(__pyx_t_5 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_v_n = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":34
- *       for i in xrange(self.n):
- *          n = float(nums[i])
- *          self.vals[i] = n             # <<<<<<<<<<<<<<
- *    def __dealloc__(self):
- *       free(self.vals)
- */
-    (((struct __pyx_obj_2ml_DoublesArr *)__pyx_v_self)->vals[__pyx_v_i]) = __pyx_v_n;
-  }
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ml.DoublesArr.__cinit__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_nums);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":35
- *          n = float(nums[i])
- *          self.vals[i] = n
- *    def __dealloc__(self):             # <<<<<<<<<<<<<<
- *       free(self.vals)
- * 
- */
-
-static void __pyx_pf_2ml_10DoublesArr___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_2ml_10DoublesArr___dealloc__(PyObject *__pyx_v_self) {
-  __Pyx_RefNannySetupContext("__dealloc__");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":36
- *          self.vals[i] = n
- *    def __dealloc__(self):
- *       free(self.vals)             # <<<<<<<<<<<<<<
- * 
- * cdef class MulticlassModel:
- */
-  free(((struct __pyx_obj_2ml_DoublesArr *)__pyx_v_self)->vals);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":46
- *    cdef int probs_output
- * 
- *    cdef load(self,fname):             # <<<<<<<<<<<<<<
- *       sys.stderr.write("loading model %s" % fname)
- *       for line in file(fname):
- */
-
-static  PyObject *__pyx_f_2ml_15MulticlassModel_load(struct __pyx_obj_2ml_MulticlassModel *__pyx_v_self, PyObject *__pyx_v_fname) {
-  PyObject *__pyx_v_line;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_ws;
-  PyObject *__pyx_v_i;
-  PyObject *__pyx_v_w;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  Py_ssize_t __pyx_t_7;
-  double __pyx_t_8;
-  int __pyx_t_9;
-  __Pyx_RefNannySetupContext("load");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_fname);
-  __pyx_v_line = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_ws = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_w = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":47
- * 
- *    cdef load(self,fname):
- *       sys.stderr.write("loading model %s" % fname)             # <<<<<<<<<<<<<<
- *       for line in file(fname):
- *          f,ws = line.strip().split(None,1)
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__stderr); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_1), __pyx_v_fname); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":48
- *    cdef load(self,fname):
- *       sys.stderr.write("loading model %s" % fname)
- *       for line in file(fname):             # <<<<<<<<<<<<<<
- *          f,ws = line.strip().split(None,1)
- *          self.W[f]=DoublesArr([float(w) for w in ws.split()])
- */
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_fname);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_fname);
-  __Pyx_GIVEREF(__pyx_v_fname);
-  __pyx_t_3 = PyObject_Call(((PyObject *)((PyObject*)&PyFile_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  for (;;) {
-    {
-      __pyx_t_3 = PyIter_Next(__pyx_t_2);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 48; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_v_line);
-    __pyx_v_line = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":49
- *       sys.stderr.write("loading model %s" % fname)
- *       for line in file(fname):
- *          f,ws = line.strip().split(None,1)             # <<<<<<<<<<<<<<
- *          self.W[f]=DoublesArr([float(w) for w in ws.split()])
- *       try:
- */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_line, __pyx_n_s__strip); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__split); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_INCREF(Py_None);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, Py_None);
-    __Pyx_GIVEREF(Py_None);
-    __Pyx_INCREF(__pyx_int_1);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_int_1);
-    __Pyx_GIVEREF(__pyx_int_1);
-    __pyx_t_5 = PyObject_Call(__pyx_t_3, __pyx_t_1, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (PyTuple_CheckExact(__pyx_t_5) && likely(PyTuple_GET_SIZE(__pyx_t_5) == 2)) {
-      PyObject* tuple = __pyx_t_5;
-      __pyx_t_1 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_1;
-      __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_v_ws);
-      __pyx_v_ws = __pyx_t_3;
-      __pyx_t_3 = 0;
-    } else {
-      __pyx_t_6 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_1 = __Pyx_UnpackItem(__pyx_t_6, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_6, 1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      if (__Pyx_EndUnpack(__pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_1;
-      __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_v_ws);
-      __pyx_v_ws = __pyx_t_3;
-      __pyx_t_3 = 0;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":50
- *       for line in file(fname):
- *          f,ws = line.strip().split(None,1)
- *          self.W[f]=DoublesArr([float(w) for w in ws.split()])             # <<<<<<<<<<<<<<
- *       try:
- *          self.biases = self.W['**BIAS**']
- */
-    __pyx_t_5 = PyList_New(0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(((PyObject *)__pyx_t_5));
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_ws, __pyx_n_s__split); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_1 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
-      __pyx_t_7 = 0; __pyx_t_3 = __pyx_t_1; __Pyx_INCREF(__pyx_t_3);
-    } else {
-      __pyx_t_7 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    for (;;) {
-      if (likely(PyList_CheckExact(__pyx_t_3))) {
-        if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_3)) break;
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++;
-      } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
-        if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_7); __Pyx_INCREF(__pyx_t_1); __pyx_t_7++;
-      } else {
-        __pyx_t_1 = PyIter_Next(__pyx_t_3);
-        if (!__pyx_t_1) {
-          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_1);
-      }
-      __Pyx_DECREF(__pyx_v_w);
-      __pyx_v_w = __pyx_t_1;
-      __pyx_t_1 = 0;
-      __pyx_t_8 = __Pyx_PyObject_AsDouble(__pyx_v_w); if (unlikely(__pyx_t_8 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_1 = PyFloat_FromDouble(__pyx_t_8); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_9 = PyList_Append(__pyx_t_5, (PyObject*)__pyx_t_1); if (unlikely(__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_INCREF(((PyObject *)__pyx_t_5));
-    PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_t_5));
-    __Pyx_GIVEREF(((PyObject *)__pyx_t_5));
-    __Pyx_DECREF(((PyObject *)__pyx_t_5)); __pyx_t_5 = 0;
-    __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_DoublesArr)), __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":51
- *          f,ws = line.strip().split(None,1)
- *          self.W[f]=DoublesArr([float(w) for w in ws.split()])
- *       try:             # <<<<<<<<<<<<<<
- *          self.biases = self.W['**BIAS**']
- *       except KeyError:
- */
-  {
-    PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-    __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-    __Pyx_XGOTREF(__pyx_save_exc_type);
-    __Pyx_XGOTREF(__pyx_save_exc_value);
-    __Pyx_XGOTREF(__pyx_save_exc_tb);
-    /*try:*/ {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":52
- *          self.W[f]=DoublesArr([float(w) for w in ws.split()])
- *       try:
- *          self.biases = self.W['**BIAS**']             # <<<<<<<<<<<<<<
- *       except KeyError:
- *          self.biases = self.W.itervalues().next()
- */
-      __pyx_t_2 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_kp_s_2)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_2ml_DoublesArr))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 52; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-      __Pyx_GIVEREF(__pyx_t_2);
-      __Pyx_GOTREF(__pyx_v_self->biases);
-      __Pyx_DECREF(((PyObject *)__pyx_v_self->biases));
-      __pyx_v_self->biases = ((struct __pyx_obj_2ml_DoublesArr *)__pyx_t_2);
-      __pyx_t_2 = 0;
-    }
-    __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-    __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-    __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-    goto __pyx_L14_try_end;
-    __pyx_L7_error:;
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":53
- *       try:
- *          self.biases = self.W['**BIAS**']
- *       except KeyError:             # <<<<<<<<<<<<<<
- *          self.biases = self.W.itervalues().next()
- *          for i in xrange(self.biases.n):
- */
-    __pyx_t_9 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-    if (__pyx_t_9) {
-      __Pyx_AddTraceback("ml.MulticlassModel.load");
-      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_5, &__pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_GOTREF(__pyx_t_3);
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":54
- *          self.biases = self.W['**BIAS**']
- *       except KeyError:
- *          self.biases = self.W.itervalues().next()             # <<<<<<<<<<<<<<
- *          for i in xrange(self.biases.n):
- *             self.biases.vals[i]=0
- */
-      __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self->W), __pyx_n_s__itervalues); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_6 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = PyObject_GetAttr(__pyx_t_6, __pyx_n_s__next); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_6 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_2ml_DoublesArr))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 54; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GIVEREF(__pyx_t_6);
-      __Pyx_GOTREF(__pyx_v_self->biases);
-      __Pyx_DECREF(((PyObject *)__pyx_v_self->biases));
-      __pyx_v_self->biases = ((struct __pyx_obj_2ml_DoublesArr *)__pyx_t_6);
-      __pyx_t_6 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":55
- *       except KeyError:
- *          self.biases = self.W.itervalues().next()
- *          for i in xrange(self.biases.n):             # <<<<<<<<<<<<<<
- *             self.biases.vals[i]=0
- * 
- */
-      __pyx_t_6 = PyInt_FromLong(__pyx_v_self->biases->n); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_6);
-      __Pyx_GIVEREF(__pyx_t_6);
-      __pyx_t_6 = 0;
-      __pyx_t_6 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_1, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      if (PyList_CheckExact(__pyx_t_6) || PyTuple_CheckExact(__pyx_t_6)) {
-        __pyx_t_4 = 0; __pyx_t_1 = __pyx_t_6; __Pyx_INCREF(__pyx_t_1);
-      } else {
-        __pyx_t_4 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-        __Pyx_GOTREF(__pyx_t_1);
-      }
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      for (;;) {
-        if (likely(PyList_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_6 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++;
-        } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-          __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++;
-        } else {
-          __pyx_t_6 = PyIter_Next(__pyx_t_1);
-          if (!__pyx_t_6) {
-            if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-            break;
-          }
-          __Pyx_GOTREF(__pyx_t_6);
-        }
-        __Pyx_DECREF(__pyx_v_i);
-        __pyx_v_i = __pyx_t_6;
-        __pyx_t_6 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":56
- *          self.biases = self.W.itervalues().next()
- *          for i in xrange(self.biases.n):
- *             self.biases.vals[i]=0             # <<<<<<<<<<<<<<
- * 
- *       self.nclas = self.biases.n
- */
-        __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L9_except_error;}
-        (__pyx_v_self->biases->vals[__pyx_t_7]) = 0;
-      }
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      goto __pyx_L8_exception_handled;
-    }
-    __pyx_L9_except_error:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    goto __pyx_L1_error;
-    __pyx_L8_exception_handled:;
-    __Pyx_XGIVEREF(__pyx_save_exc_type);
-    __Pyx_XGIVEREF(__pyx_save_exc_value);
-    __Pyx_XGIVEREF(__pyx_save_exc_tb);
-    __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-    __pyx_L14_try_end:;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":58
- *             self.biases.vals[i]=0
- * 
- *       self.nclas = self.biases.n             # <<<<<<<<<<<<<<
- * 
- *       self.scores=<double *>malloc(sizeof(double)*self.nclas)
- */
-  __pyx_v_self->nclas = __pyx_v_self->biases->n;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":60
- *       self.nclas = self.biases.n
- * 
- *       self.scores=<double *>malloc(sizeof(double)*self.nclas)             # <<<<<<<<<<<<<<
- * 
- *    def __init__(self, fname, probs_output=False):
- */
-  __pyx_v_self->scores = ((double *)malloc(((sizeof(double)) * __pyx_v_self->nclas)));
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("ml.MulticlassModel.load");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_line);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_ws);
-  __Pyx_DECREF(__pyx_v_i);
-  __Pyx_DECREF(__pyx_v_w);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_fname);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":62
- *       self.scores=<double *>malloc(sizeof(double)*self.nclas)
- * 
- *    def __init__(self, fname, probs_output=False):             # <<<<<<<<<<<<<<
- *       self.W = {}
- *       self.probs_output=probs_output
- */
-
-static int __pyx_pf_2ml_15MulticlassModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_15MulticlassModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_fname = 0;
-  PyObject *__pyx_v_probs_output = 0;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__fname,&__pyx_n_s__probs_output,0};
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    values[1] = __pyx_k_3;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__fname);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__probs_output);
-        if (unlikely(value)) { values[1] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_fname = values[0];
-    __pyx_v_probs_output = values[1];
-  } else {
-    __pyx_v_probs_output = __pyx_k_3;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: __pyx_v_probs_output = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: __pyx_v_fname = PyTuple_GET_ITEM(__pyx_args, 0);
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MulticlassModel.__init__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":63
- * 
- *    def __init__(self, fname, probs_output=False):
- *       self.W = {}             # <<<<<<<<<<<<<<
- *       self.probs_output=probs_output
- *       self.load(fname)
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 63; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->W);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->W));
-  ((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->W = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":64
- *    def __init__(self, fname, probs_output=False):
- *       self.W = {}
- *       self.probs_output=probs_output             # <<<<<<<<<<<<<<
- *       self.load(fname)
- *       sys.stderr.write(" done\n")
- */
-  __pyx_t_2 = __Pyx_PyInt_AsInt(__pyx_v_probs_output); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  ((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->probs_output = __pyx_t_2;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":65
- *       self.W = {}
- *       self.probs_output=probs_output
- *       self.load(fname)             # <<<<<<<<<<<<<<
- *       sys.stderr.write(" done\n")
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MulticlassModel *)((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->__pyx_vtab)->load(((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self), __pyx_v_fname); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":66
- *       self.probs_output=probs_output
- *       self.load(fname)
- *       sys.stderr.write(" done\n")             # <<<<<<<<<<<<<<
- * 
- *    def __dealloc__(self):
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__stderr); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ml.MulticlassModel.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":68
- *       sys.stderr.write(" done\n")
- * 
- *    def __dealloc__(self):             # <<<<<<<<<<<<<<
- *       free(self.scores)
- * 
- */
-
-static void __pyx_pf_2ml_15MulticlassModel___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_2ml_15MulticlassModel___dealloc__(PyObject *__pyx_v_self) {
-  __Pyx_RefNannySetupContext("__dealloc__");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":69
- * 
- *    def __dealloc__(self):
- *       free(self.scores)             # <<<<<<<<<<<<<<
- * 
- *    cpdef object predict(self,list features):
- */
-  free(((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->scores);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":71
- *       free(self.scores)
- * 
- *    cpdef object predict(self,list features):             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef double w
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_predict(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_15MulticlassModel_predict(struct __pyx_obj_2ml_MulticlassModel *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  int __pyx_v_i;
-  struct __pyx_obj_2ml_DoublesArr *__pyx_v_ws;
-  PyObject *__pyx_v_f;
-  double __pyx_v_tot;
-  PyObject *__pyx_v_res;
-  int __pyx_v_besti;
-  double __pyx_v_best;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  double __pyx_t_7;
-  int __pyx_t_8;
-  int __pyx_t_9;
-  __Pyx_RefNannySetupContext("predict");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_ws = ((struct __pyx_obj_2ml_DoublesArr *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__predict); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_15MulticlassModel_predict)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":75
- *       cdef double w
- *       cdef DoublesArr ws
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          self.scores[i]=self.biases.vals[i]
- *       for f in features:
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":76
- *       cdef DoublesArr ws
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]             # <<<<<<<<<<<<<<
- *       for f in features:
- *          try:
- */
-    (__pyx_v_self->scores[__pyx_v_i]) = (__pyx_v_self->biases->vals[__pyx_v_i]);
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":77
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             i=0
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_6 = 0; __pyx_t_1 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_1);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_1)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":78
- *          self.scores[i]=self.biases.vals[i]
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             i=0
- *             ws = self.W[f]
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":79
- *       for f in features:
- *          try:
- *             i=0             # <<<<<<<<<<<<<<
- *             ws = self.W[f]
- *             for i in xrange(self.nclas):
- */
-        __pyx_v_i = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":80
- *          try:
- *             i=0
- *             ws = self.W[f]             # <<<<<<<<<<<<<<
- *             for i in xrange(self.nclas):
- *                self.scores[i]+=ws.vals[i]
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_DoublesArr))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 80; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_ws));
-        __pyx_v_ws = ((struct __pyx_obj_2ml_DoublesArr *)__pyx_t_3);
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":81
- *             i=0
- *             ws = self.W[f]
- *             for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *                self.scores[i]+=ws.vals[i]
- *          except KeyError: pass
- */
-        __pyx_t_4 = __pyx_v_self->nclas;
-        for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-          __pyx_v_i = __pyx_t_5;
-
-          /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":82
- *             ws = self.W[f]
- *             for i in xrange(self.nclas):
- *                self.scores[i]+=ws.vals[i]             # <<<<<<<<<<<<<<
- *          except KeyError: pass
- *       cdef double tot = 0
- */
-          (__pyx_v_self->scores[__pyx_v_i]) += (__pyx_v_ws->vals[__pyx_v_i]);
-        }
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L14_try_end;
-      __pyx_L7_error:;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":83
- *             for i in xrange(self.nclas):
- *                self.scores[i]+=ws.vals[i]
- *          except KeyError: pass             # <<<<<<<<<<<<<<
- *       cdef double tot = 0
- *       if self.probs_output:
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L8_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L8_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L14_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":84
- *                self.scores[i]+=ws.vals[i]
- *          except KeyError: pass
- *       cdef double tot = 0             # <<<<<<<<<<<<<<
- *       if self.probs_output:
- *          for i in xrange(self.nclas):
- */
-  __pyx_v_tot = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":85
- *          except KeyError: pass
- *       cdef double tot = 0
- *       if self.probs_output:             # <<<<<<<<<<<<<<
- *          for i in xrange(self.nclas):
- *             self.scores[i]=math.exp(self.scores[i])
- */
-  __pyx_t_4 = __pyx_v_self->probs_output;
-  if (__pyx_t_4) {
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":86
- *       cdef double tot = 0
- *       if self.probs_output:
- *          for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *             self.scores[i]=math.exp(self.scores[i])
- *             tot+=self.scores[i]
- */
-    __pyx_t_4 = __pyx_v_self->nclas;
-    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-      __pyx_v_i = __pyx_t_5;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":87
- *       if self.probs_output:
- *          for i in xrange(self.nclas):
- *             self.scores[i]=math.exp(self.scores[i])             # <<<<<<<<<<<<<<
- *             tot+=self.scores[i]
- *       res=[]
- */
-      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__math); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__exp); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-      __Pyx_GIVEREF(__pyx_t_1);
-      __pyx_t_1 = 0;
-      __pyx_t_1 = PyObject_Call(__pyx_t_3, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      (__pyx_v_self->scores[__pyx_v_i]) = __pyx_t_7;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":88
- *          for i in xrange(self.nclas):
- *             self.scores[i]=math.exp(self.scores[i])
- *             tot+=self.scores[i]             # <<<<<<<<<<<<<<
- *       res=[]
- *       cdef int besti=0
- */
-      __pyx_v_tot += (__pyx_v_self->scores[__pyx_v_i]);
-    }
-    goto __pyx_L17;
-  }
-  __pyx_L17:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":89
- *             self.scores[i]=math.exp(self.scores[i])
- *             tot+=self.scores[i]
- *       res=[]             # <<<<<<<<<<<<<<
- *       cdef int besti=0
- *       cdef double best=0
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":90
- *             tot+=self.scores[i]
- *       res=[]
- *       cdef int besti=0             # <<<<<<<<<<<<<<
- *       cdef double best=0
- *       for i in xrange(self.nclas):
- */
-  __pyx_v_besti = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":91
- *       res=[]
- *       cdef int besti=0
- *       cdef double best=0             # <<<<<<<<<<<<<<
- *       for i in xrange(self.nclas):
- *          if self.scores[i] > best:
- */
-  __pyx_v_best = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":92
- *       cdef int besti=0
- *       cdef double best=0
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          if self.scores[i] > best:
- *             best = self.scores[i]
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":93
- *       cdef double best=0
- *       for i in xrange(self.nclas):
- *          if self.scores[i] > best:             # <<<<<<<<<<<<<<
- *             best = self.scores[i]
- *             besti = i
- */
-    __pyx_t_8 = ((__pyx_v_self->scores[__pyx_v_i]) > __pyx_v_best);
-    if (__pyx_t_8) {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":94
- *       for i in xrange(self.nclas):
- *          if self.scores[i] > best:
- *             best = self.scores[i]             # <<<<<<<<<<<<<<
- *             besti = i
- *          if self.probs_output:
- */
-      __pyx_v_best = (__pyx_v_self->scores[__pyx_v_i]);
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":95
- *          if self.scores[i] > best:
- *             best = self.scores[i]
- *             besti = i             # <<<<<<<<<<<<<<
- *          if self.probs_output:
- *             res.append(self.scores[i]/tot)
- */
-      __pyx_v_besti = __pyx_v_i;
-      goto __pyx_L22;
-    }
-    __pyx_L22:;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":96
- *             best = self.scores[i]
- *             besti = i
- *          if self.probs_output:             # <<<<<<<<<<<<<<
- *             res.append(self.scores[i]/tot)
- *          else:
- */
-    __pyx_t_9 = __pyx_v_self->probs_output;
-    if (__pyx_t_9) {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":97
- *             besti = i
- *          if self.probs_output:
- *             res.append(self.scores[i]/tot)             # <<<<<<<<<<<<<<
- *          else:
- *             res.append(self.scores[i])
- */
-      __pyx_t_7 = (__pyx_v_self->scores[__pyx_v_i]);
-      if (unlikely(__pyx_v_tot == 0)) {
-        PyErr_Format(PyExc_ZeroDivisionError, "float division");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_t_1 = PyFloat_FromDouble((__pyx_t_7 / __pyx_v_tot)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = __Pyx_PyObject_Append(__pyx_v_res, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 97; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      goto __pyx_L23;
-    }
-    /*else*/ {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":99
- *             res.append(self.scores[i]/tot)
- *          else:
- *             res.append(self.scores[i])             # <<<<<<<<<<<<<<
- *       return besti,res
- * 
- */
-      __pyx_t_2 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_1 = __Pyx_PyObject_Append(__pyx_v_res, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    }
-    __pyx_L23:;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":100
- *          else:
- *             res.append(self.scores[i])
- *       return besti,res             # <<<<<<<<<<<<<<
- * 
- *    cpdef object predict_r(self,list features): #@@TODO fix
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_besti); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_res);
-  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_res);
-  __Pyx_GIVEREF(__pyx_v_res);
-  __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.MulticlassModel.predict");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_ws);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":71
- *       free(self.scores)
- * 
- *    cpdef object predict(self,list features):             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef double w
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_predict(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_15MulticlassModel_predict(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("predict");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MulticlassModel *)((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->__pyx_vtab)->predict(((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MulticlassModel.predict");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":102
- *       return besti,res
- * 
- *    cpdef object predict_r(self,list features): #@@TODO fix             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef double w
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_predict_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_15MulticlassModel_predict_r(struct __pyx_obj_2ml_MulticlassModel *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  int __pyx_v_i;
-  double __pyx_v_v;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_ws;
-  double __pyx_v_tot;
-  PyObject *__pyx_v_res;
-  int __pyx_v_besti;
-  double __pyx_v_best;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  double __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  int __pyx_t_10;
-  int __pyx_t_11;
-  __Pyx_RefNannySetupContext("predict_r");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_ws = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__predict_r); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_15MulticlassModel_predict_r)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":106
- *       cdef double w
- *       cdef double v
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          self.scores[i]=self.biases.vals[i]
- *       for f,v in features:
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":107
- *       cdef double v
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]             # <<<<<<<<<<<<<<
- *       for f,v in features:
- *          try:
- */
-    (__pyx_v_self->scores[__pyx_v_i]) = (__pyx_v_self->biases->vals[__pyx_v_i]);
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":108
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]
- *       for f,v in features:             # <<<<<<<<<<<<<<
- *          try:
- *             i=0
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_6 = 0; __pyx_t_1 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_1);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_1)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
-      PyObject* tuple = __pyx_t_3;
-      __pyx_t_2 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_7 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_7);
-      __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __pyx_v_v = __pyx_t_8;
-    } else {
-      __pyx_t_9 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_9, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_7 = __Pyx_UnpackItem(__pyx_t_9, 1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (__Pyx_EndUnpack(__pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 108; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __pyx_v_v = __pyx_t_8;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":109
- *          self.scores[i]=self.biases.vals[i]
- *       for f,v in features:
- *          try:             # <<<<<<<<<<<<<<
- *             i=0
- *             ws = self.W[f]
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":110
- *       for f,v in features:
- *          try:
- *             i=0             # <<<<<<<<<<<<<<
- *             ws = self.W[f]
- *             for i in xrange(self.nclas):
- */
-        __pyx_v_i = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":111
- *          try:
- *             i=0
- *             ws = self.W[f]             # <<<<<<<<<<<<<<
- *             for i in xrange(self.nclas):
- *                self.scores[i]+=ws.vals[i]*v
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_v_ws);
-        __pyx_v_ws = __pyx_t_3;
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":112
- *             i=0
- *             ws = self.W[f]
- *             for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *                self.scores[i]+=ws.vals[i]*v
- *          except KeyError: pass
- */
-        __pyx_t_4 = __pyx_v_self->nclas;
-        for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-          __pyx_v_i = __pyx_t_5;
-
-          /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":113
- *             ws = self.W[f]
- *             for i in xrange(self.nclas):
- *                self.scores[i]+=ws.vals[i]*v             # <<<<<<<<<<<<<<
- *          except KeyError: pass
- *       cdef double tot = 0
- */
-          __pyx_t_3 = PyObject_GetAttr(__pyx_v_ws, __pyx_n_s__vals); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_7);
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __pyx_t_3 = PyFloat_FromDouble(__pyx_v_v); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __pyx_t_2 = PyNumber_Multiply(__pyx_t_7, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          (__pyx_v_self->scores[__pyx_v_i]) += __pyx_t_8;
-        }
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L14_try_end;
-      __pyx_L7_error:;
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":114
- *             for i in xrange(self.nclas):
- *                self.scores[i]+=ws.vals[i]*v
- *          except KeyError: pass             # <<<<<<<<<<<<<<
- *       cdef double tot = 0
- *       if self.probs_output:
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L8_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L8_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L14_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":115
- *                self.scores[i]+=ws.vals[i]*v
- *          except KeyError: pass
- *       cdef double tot = 0             # <<<<<<<<<<<<<<
- *       if self.probs_output:
- *          for i in xrange(self.nclas):
- */
-  __pyx_v_tot = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":116
- *          except KeyError: pass
- *       cdef double tot = 0
- *       if self.probs_output:             # <<<<<<<<<<<<<<
- *          for i in xrange(self.nclas):
- *             self.scores[i]=math.exp(self.scores[i])
- */
-  __pyx_t_4 = __pyx_v_self->probs_output;
-  if (__pyx_t_4) {
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":117
- *       cdef double tot = 0
- *       if self.probs_output:
- *          for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *             self.scores[i]=math.exp(self.scores[i])
- *             tot+=self.scores[i]
- */
-    __pyx_t_4 = __pyx_v_self->nclas;
-    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-      __pyx_v_i = __pyx_t_5;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":118
- *       if self.probs_output:
- *          for i in xrange(self.nclas):
- *             self.scores[i]=math.exp(self.scores[i])             # <<<<<<<<<<<<<<
- *             tot+=self.scores[i]
- *       res=[]
- */
-      __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__math); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__exp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_1 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-      __Pyx_GIVEREF(__pyx_t_1);
-      __pyx_t_1 = 0;
-      __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 118; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      (__pyx_v_self->scores[__pyx_v_i]) = __pyx_t_8;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":119
- *          for i in xrange(self.nclas):
- *             self.scores[i]=math.exp(self.scores[i])
- *             tot+=self.scores[i]             # <<<<<<<<<<<<<<
- *       res=[]
- *       cdef int besti=0
- */
-      __pyx_v_tot += (__pyx_v_self->scores[__pyx_v_i]);
-    }
-    goto __pyx_L17;
-  }
-  __pyx_L17:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":120
- *             self.scores[i]=math.exp(self.scores[i])
- *             tot+=self.scores[i]
- *       res=[]             # <<<<<<<<<<<<<<
- *       cdef int besti=0
- *       cdef double best=0
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":121
- *             tot+=self.scores[i]
- *       res=[]
- *       cdef int besti=0             # <<<<<<<<<<<<<<
- *       cdef double best=0
- *       for i in xrange(self.nclas):
- */
-  __pyx_v_besti = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":122
- *       res=[]
- *       cdef int besti=0
- *       cdef double best=0             # <<<<<<<<<<<<<<
- *       for i in xrange(self.nclas):
- *          if self.scores[i] > best:
- */
-  __pyx_v_best = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":123
- *       cdef int besti=0
- *       cdef double best=0
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          if self.scores[i] > best:
- *             best = self.scores[i]
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":124
- *       cdef double best=0
- *       for i in xrange(self.nclas):
- *          if self.scores[i] > best:             # <<<<<<<<<<<<<<
- *             best = self.scores[i]
- *             besti = i
- */
-    __pyx_t_10 = ((__pyx_v_self->scores[__pyx_v_i]) > __pyx_v_best);
-    if (__pyx_t_10) {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":125
- *       for i in xrange(self.nclas):
- *          if self.scores[i] > best:
- *             best = self.scores[i]             # <<<<<<<<<<<<<<
- *             besti = i
- *          if self.probs_output:
- */
-      __pyx_v_best = (__pyx_v_self->scores[__pyx_v_i]);
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":126
- *          if self.scores[i] > best:
- *             best = self.scores[i]
- *             besti = i             # <<<<<<<<<<<<<<
- *          if self.probs_output:
- *             res.append(self.scores[i]/tot)
- */
-      __pyx_v_besti = __pyx_v_i;
-      goto __pyx_L22;
-    }
-    __pyx_L22:;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":127
- *             best = self.scores[i]
- *             besti = i
- *          if self.probs_output:             # <<<<<<<<<<<<<<
- *             res.append(self.scores[i]/tot)
- *          else:
- */
-    __pyx_t_11 = __pyx_v_self->probs_output;
-    if (__pyx_t_11) {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":128
- *             besti = i
- *          if self.probs_output:
- *             res.append(self.scores[i]/tot)             # <<<<<<<<<<<<<<
- *          else:
- *             res.append(self.scores[i])
- */
-      __pyx_t_8 = (__pyx_v_self->scores[__pyx_v_i]);
-      if (unlikely(__pyx_v_tot == 0)) {
-        PyErr_Format(PyExc_ZeroDivisionError, "float division");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_t_1 = PyFloat_FromDouble((__pyx_t_8 / __pyx_v_tot)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_PyObject_Append(__pyx_v_res, __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 128; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      goto __pyx_L23;
-    }
-    /*else*/ {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":130
- *             res.append(self.scores[i]/tot)
- *          else:
- *             res.append(self.scores[i])             # <<<<<<<<<<<<<<
- *       return besti,res
- * 
- */
-      __pyx_t_3 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_1 = __Pyx_PyObject_Append(__pyx_v_res, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    }
-    __pyx_L23:;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":131
- *          else:
- *             res.append(self.scores[i])
- *       return besti,res             # <<<<<<<<<<<<<<
- * 
- *    cpdef object get_scores(self,list features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_besti); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_res);
-  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_res);
-  __Pyx_GIVEREF(__pyx_v_res);
-  __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("ml.MulticlassModel.predict_r");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_ws);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":102
- *       return besti,res
- * 
- *    cpdef object predict_r(self,list features): #@@TODO fix             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef double w
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_predict_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_15MulticlassModel_predict_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("predict_r");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MulticlassModel *)((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->__pyx_vtab)->predict_r(((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 102; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MulticlassModel.predict_r");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":133
- *       return besti,res
- * 
- *    cpdef object get_scores(self,list features):             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef DoublesArr ws
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_15MulticlassModel_get_scores(struct __pyx_obj_2ml_MulticlassModel *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  int __pyx_v_i;
-  struct __pyx_obj_2ml_DoublesArr *__pyx_v_ws;
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  int __pyx_t_7;
-  __Pyx_RefNannySetupContext("get_scores");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_ws = ((struct __pyx_obj_2ml_DoublesArr *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_res = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__get_scores); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_15MulticlassModel_get_scores)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":137
- *       cdef DoublesArr ws
- *       cdef list res
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          self.scores[i]=self.biases.vals[i]
- *       for f in features:
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":138
- *       cdef list res
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]             # <<<<<<<<<<<<<<
- *       for f in features:
- *          try:
- */
-    (__pyx_v_self->scores[__pyx_v_i]) = (__pyx_v_self->biases->vals[__pyx_v_i]);
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":139
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             ws = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_6 = 0; __pyx_t_1 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_1);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_1)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":140
- *          self.scores[i]=self.biases.vals[i]
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             ws = self.W[f]
- *             for i in xrange(ws.n):
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":141
- *       for f in features:
- *          try:
- *             ws = self.W[f]             # <<<<<<<<<<<<<<
- *             for i in xrange(ws.n):
- *                self.scores[i]+=ws.vals[i]
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_DoublesArr))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 141; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_ws));
-        __pyx_v_ws = ((struct __pyx_obj_2ml_DoublesArr *)__pyx_t_3);
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":142
- *          try:
- *             ws = self.W[f]
- *             for i in xrange(ws.n):             # <<<<<<<<<<<<<<
- *                self.scores[i]+=ws.vals[i]
- *          except KeyError: pass
- */
-        __pyx_t_4 = __pyx_v_ws->n;
-        for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-          __pyx_v_i = __pyx_t_5;
-
-          /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":143
- *             ws = self.W[f]
- *             for i in xrange(ws.n):
- *                self.scores[i]+=ws.vals[i]             # <<<<<<<<<<<<<<
- *          except KeyError: pass
- *       res=[]
- */
-          (__pyx_v_self->scores[__pyx_v_i]) += (__pyx_v_ws->vals[__pyx_v_i]);
-        }
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L14_try_end;
-      __pyx_L7_error:;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":144
- *             for i in xrange(ws.n):
- *                self.scores[i]+=ws.vals[i]
- *          except KeyError: pass             # <<<<<<<<<<<<<<
- *       res=[]
- *       for i in xrange(self.nclas):
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L8_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L8_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L14_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":145
- *                self.scores[i]+=ws.vals[i]
- *          except KeyError: pass
- *       res=[]             # <<<<<<<<<<<<<<
- *       for i in xrange(self.nclas):
- *          res.append(self.scores[i])
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(((PyObject *)__pyx_v_res));
-  __pyx_v_res = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":146
- *          except KeyError: pass
- *       res=[]
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          res.append(self.scores[i])
- *       return res
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":147
- *       res=[]
- *       for i in xrange(self.nclas):
- *          res.append(self.scores[i])             # <<<<<<<<<<<<<<
- *       return res
- * 
- */
-    if (unlikely(__pyx_v_res == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
-    }
-    __pyx_t_1 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = PyList_Append(((PyObject *)__pyx_v_res), __pyx_t_1); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":148
- *       for i in xrange(self.nclas):
- *          res.append(self.scores[i])
- *       return res             # <<<<<<<<<<<<<<
- * 
- *    cpdef list get_scores_r(self,list features): #@@TODO FIX
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_res));
-  __pyx_r = ((PyObject *)__pyx_v_res);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.MulticlassModel.get_scores");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_ws);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":133
- *       return besti,res
- * 
- *    cpdef object get_scores(self,list features):             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef DoublesArr ws
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_15MulticlassModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_scores");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MulticlassModel *)((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->__pyx_vtab)->get_scores(((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MulticlassModel.get_scores");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":150
- *       return res
- * 
- *    cpdef list get_scores_r(self,list features): #@@TODO FIX             # <<<<<<<<<<<<<<
- *       """
- *       like get_scores but with real values features
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_get_scores_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_15MulticlassModel_get_scores_r(struct __pyx_obj_2ml_MulticlassModel *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  int __pyx_v_i;
-  double __pyx_v_v;
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_ws;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  double __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  long __pyx_t_10;
-  int __pyx_t_11;
-  __Pyx_RefNannySetupContext("get_scores_r");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_res = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_ws = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__get_scores_r); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_15MulticlassModel_get_scores_r)) {
-      __Pyx_XDECREF(((PyObject *)__pyx_r));
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      if (!(likely(PyList_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = ((PyObject *)__pyx_t_3);
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":159
- *       cdef double v
- *       cdef list res
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          self.scores[i]=self.biases.vals[i]
- *       for f,v in features:
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":160
- *       cdef list res
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]             # <<<<<<<<<<<<<<
- *       for f,v in features:
- *          try:
- */
-    (__pyx_v_self->scores[__pyx_v_i]) = (__pyx_v_self->biases->vals[__pyx_v_i]);
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":161
- *       for i in xrange(self.nclas):
- *          self.scores[i]=self.biases.vals[i]
- *       for f,v in features:             # <<<<<<<<<<<<<<
- *          try:
- *             ws = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_6 = 0; __pyx_t_1 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_1);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_1)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
-      PyObject* tuple = __pyx_t_3;
-      __pyx_t_2 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_7 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_7);
-      __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __pyx_v_v = __pyx_t_8;
-    } else {
-      __pyx_t_9 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_9, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_7 = __Pyx_UnpackItem(__pyx_t_9, 1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (__Pyx_EndUnpack(__pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __pyx_v_v = __pyx_t_8;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":162
- *          self.scores[i]=self.biases.vals[i]
- *       for f,v in features:
- *          try:             # <<<<<<<<<<<<<<
- *             ws = self.W[f]
- *             for i in xrange(ws.n):
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":163
- *       for f,v in features:
- *          try:
- *             ws = self.W[f]             # <<<<<<<<<<<<<<
- *             for i in xrange(ws.n):
- *                self.scores[i]+=ws.vals[i]*v
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 163; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_v_ws);
-        __pyx_v_ws = __pyx_t_3;
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":164
- *          try:
- *             ws = self.W[f]
- *             for i in xrange(ws.n):             # <<<<<<<<<<<<<<
- *                self.scores[i]+=ws.vals[i]*v
- *          except KeyError: pass
- */
-        __pyx_t_3 = PyObject_GetAttr(__pyx_v_ws, __pyx_n_s__n); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_10 = __Pyx_PyInt_AsLong(__pyx_t_3); if (unlikely((__pyx_t_10 == (long)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_10; __pyx_t_4+=1) {
-          __pyx_v_i = __pyx_t_4;
-
-          /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":165
- *             ws = self.W[f]
- *             for i in xrange(ws.n):
- *                self.scores[i]+=ws.vals[i]*v             # <<<<<<<<<<<<<<
- *          except KeyError: pass
- *       res=[]
- */
-          __pyx_t_3 = PyObject_GetAttr(__pyx_v_ws, __pyx_n_s__vals); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __pyx_t_7 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_7) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_7);
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __pyx_t_3 = PyFloat_FromDouble(__pyx_v_v); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_3);
-          __pyx_t_2 = PyNumber_Multiply(__pyx_t_7, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          (__pyx_v_self->scores[__pyx_v_i]) += __pyx_t_8;
-        }
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L14_try_end;
-      __pyx_L7_error:;
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":166
- *             for i in xrange(ws.n):
- *                self.scores[i]+=ws.vals[i]*v
- *          except KeyError: pass             # <<<<<<<<<<<<<<
- *       res=[]
- *       for i in xrange(self.nclas):
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L8_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L8_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L14_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":167
- *                self.scores[i]+=ws.vals[i]*v
- *          except KeyError: pass
- *       res=[]             # <<<<<<<<<<<<<<
- *       for i in xrange(self.nclas):
- *          res.append(self.scores[i])
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(((PyObject *)__pyx_v_res));
-  __pyx_v_res = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":168
- *          except KeyError: pass
- *       res=[]
- *       for i in xrange(self.nclas):             # <<<<<<<<<<<<<<
- *          res.append(self.scores[i])
- *       return res
- */
-  __pyx_t_4 = __pyx_v_self->nclas;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":169
- *       res=[]
- *       for i in xrange(self.nclas):
- *          res.append(self.scores[i])             # <<<<<<<<<<<<<<
- *       return res
- *    #}}}
- */
-    if (unlikely(__pyx_v_res == Py_None)) {
-      PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
-    }
-    __pyx_t_1 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_11 = PyList_Append(((PyObject *)__pyx_v_res), __pyx_t_1); if (unlikely(__pyx_t_11 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 169; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":170
- *       for i in xrange(self.nclas):
- *          res.append(self.scores[i])
- *       return res             # <<<<<<<<<<<<<<
- *    #}}}
- * 
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_res));
-  __pyx_r = __pyx_v_res;
-  goto __pyx_L0;
-
-  __pyx_r = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("ml.MulticlassModel.get_scores_r");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_ws);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":150
- *       return res
- * 
- *    cpdef list get_scores_r(self,list features): #@@TODO FIX             # <<<<<<<<<<<<<<
- *       """
- *       like get_scores but with real values features
- */
-
-static PyObject *__pyx_pf_2ml_15MulticlassModel_get_scores_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static char __pyx_doc_2ml_15MulticlassModel_get_scores_r[] = "\n      like get_scores but with real values features\n         each feature is a pair (f,v), where v is the value.\n      ";
-static PyObject *__pyx_pf_2ml_15MulticlassModel_get_scores_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_scores_r");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_vtabstruct_2ml_MulticlassModel *)((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self)->__pyx_vtab)->get_scores_r(((struct __pyx_obj_2ml_MulticlassModel *)__pyx_v_self), __pyx_v_features, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MulticlassModel.get_scores_r");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":180
- *       double *w
- *       int *lastUpd
- *    def __cinit__(self, int nclasses):             # <<<<<<<<<<<<<<
- *       cdef int i
- *       self.lastUpd = <int *>malloc(nclasses*sizeof(int))
- */
-
-static int __pyx_pf_2ml_19MulticlassParamData___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_19MulticlassParamData___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_v_nclasses;
-  int __pyx_v_i;
-  int __pyx_r;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__nclasses,0};
-  __Pyx_RefNannySetupContext("__cinit__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__nclasses);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_nclasses = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_nclasses == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_nclasses = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_nclasses == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MulticlassParamData.__cinit__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":182
- *    def __cinit__(self, int nclasses):
- *       cdef int i
- *       self.lastUpd = <int *>malloc(nclasses*sizeof(int))             # <<<<<<<<<<<<<<
- *       self.acc     = <double *>malloc(nclasses*sizeof(double))
- *       self.w       = <double *>malloc(nclasses*sizeof(double))
- */
-  ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->lastUpd = ((int *)malloc((__pyx_v_nclasses * (sizeof(int)))));
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":183
- *       cdef int i
- *       self.lastUpd = <int *>malloc(nclasses*sizeof(int))
- *       self.acc     = <double *>malloc(nclasses*sizeof(double))             # <<<<<<<<<<<<<<
- *       self.w       = <double *>malloc(nclasses*sizeof(double))
- *       for i in range(nclasses):
- */
-  ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->acc = ((double *)malloc((__pyx_v_nclasses * (sizeof(double)))));
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":184
- *       self.lastUpd = <int *>malloc(nclasses*sizeof(int))
- *       self.acc     = <double *>malloc(nclasses*sizeof(double))
- *       self.w       = <double *>malloc(nclasses*sizeof(double))             # <<<<<<<<<<<<<<
- *       for i in range(nclasses):
- *          self.lastUpd[i]=0
- */
-  ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->w = ((double *)malloc((__pyx_v_nclasses * (sizeof(double)))));
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":185
- *       self.acc     = <double *>malloc(nclasses*sizeof(double))
- *       self.w       = <double *>malloc(nclasses*sizeof(double))
- *       for i in range(nclasses):             # <<<<<<<<<<<<<<
- *          self.lastUpd[i]=0
- *          self.acc[i]=0
- */
-  __pyx_t_1 = __pyx_v_nclasses;
-  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
-    __pyx_v_i = __pyx_t_2;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":186
- *       self.w       = <double *>malloc(nclasses*sizeof(double))
- *       for i in range(nclasses):
- *          self.lastUpd[i]=0             # <<<<<<<<<<<<<<
- *          self.acc[i]=0
- *          self.w[i]=0
- */
-    (((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->lastUpd[__pyx_v_i]) = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":187
- *       for i in range(nclasses):
- *          self.lastUpd[i]=0
- *          self.acc[i]=0             # <<<<<<<<<<<<<<
- *          self.w[i]=0
- * 
- */
-    (((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->acc[__pyx_v_i]) = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":188
- *          self.lastUpd[i]=0
- *          self.acc[i]=0
- *          self.w[i]=0             # <<<<<<<<<<<<<<
- * 
- *    def __dealloc__(self):
- */
-    (((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->w[__pyx_v_i]) = 0;
-  }
-
-  __pyx_r = 0;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":190
- *          self.w[i]=0
- * 
- *    def __dealloc__(self):             # <<<<<<<<<<<<<<
- *       free(self.lastUpd)
- *       free(self.acc)
- */
-
-static void __pyx_pf_2ml_19MulticlassParamData___dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pf_2ml_19MulticlassParamData___dealloc__(PyObject *__pyx_v_self) {
-  __Pyx_RefNannySetupContext("__dealloc__");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":191
- * 
- *    def __dealloc__(self):
- *       free(self.lastUpd)             # <<<<<<<<<<<<<<
- *       free(self.acc)
- *       free(self.w)
- */
-  free(((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->lastUpd);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":192
- *    def __dealloc__(self):
- *       free(self.lastUpd)
- *       free(self.acc)             # <<<<<<<<<<<<<<
- *       free(self.w)
- * 
- */
-  free(((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->acc);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":193
- *       free(self.lastUpd)
- *       free(self.acc)
- *       free(self.w)             # <<<<<<<<<<<<<<
- * 
- * cdef class MultitronParameters:
- */
-  free(((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_v_self)->w);
-
-  __Pyx_RefNannyFinishContext();
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":203
- *       double* scores # (re)used in calculating prediction
- * 
- *    def __cinit__(self, nclasses):             # <<<<<<<<<<<<<<
- *       self.scores = <double *>malloc(nclasses*sizeof(double))
- * 
- */
-
-static int __pyx_pf_2ml_19MultitronParameters___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_19MultitronParameters___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_nclasses = 0;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  size_t __pyx_t_3;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__nclasses,0};
-  __Pyx_RefNannySetupContext("__cinit__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__nclasses);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_nclasses = values[0];
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_nclasses = PyTuple_GET_ITEM(__pyx_args, 0);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.__cinit__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":204
- * 
- *    def __cinit__(self, nclasses):
- *       self.scores = <double *>malloc(nclasses*sizeof(double))             # <<<<<<<<<<<<<<
- * 
- *    cpdef getW(self, clas):
- */
-  __pyx_t_1 = __Pyx_PyInt_FromSize_t((sizeof(double))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyNumber_Multiply(__pyx_v_nclasses, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyInt_AsSize_t(__pyx_t_2); if (unlikely((__pyx_t_3 == (size_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 204; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  ((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->scores = ((double *)malloc(__pyx_t_3));
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("ml.MultitronParameters.__cinit__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":206
- *       self.scores = <double *>malloc(nclasses*sizeof(double))
- * 
- *    cpdef getW(self, clas):             # <<<<<<<<<<<<<<
- *       d={}
- *       cdef MulticlassParamData p
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_getW(PyObject *__pyx_v_self, PyObject *__pyx_v_clas); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_getW(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_clas, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_d;
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  void *__pyx_t_5;
-  void *__pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  __Pyx_RefNannySetupContext("getW");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_clas);
-  __pyx_v_d = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__getW); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_getW)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(__pyx_v_clas);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_clas);
-      __Pyx_GIVEREF(__pyx_v_clas);
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":207
- * 
- *    cpdef getW(self, clas):
- *       d={}             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       for f,p in self.W.iteritems():
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_d);
-  __pyx_v_d = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":209
- *       d={}
- *       cdef MulticlassParamData p
- *       for f,p in self.W.iteritems():             # <<<<<<<<<<<<<<
- *          d[f] = p.w[clas]
- *       return d
- */
-  __Pyx_INCREF(((PyObject *)__pyx_v_self->W));
-  __Pyx_XDECREF(__pyx_t_1);
-  __pyx_t_1 = ((PyObject *)__pyx_v_self->W);
-  __pyx_t_4 = 0;
-  while (1) {
-    if (!PyDict_Next(__pyx_t_1, (&__pyx_t_4), ((PyObject **)(&__pyx_t_5)), ((PyObject **)(&__pyx_t_6)))) break;
-    __Pyx_INCREF(((PyObject *)__pyx_t_5));
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = ((PyObject *)__pyx_t_5);
-    if (!(likely(__Pyx_TypeTest(((PyObject *)__pyx_t_6), __pyx_ptype_2ml_MulticlassParamData)))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_INCREF(((PyObject *)((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_6)));
-    __Pyx_DECREF(((PyObject *)__pyx_v_p));
-    __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_6);
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":210
- *       cdef MulticlassParamData p
- *       for f,p in self.W.iteritems():
- *          d[f] = p.w[clas]             # <<<<<<<<<<<<<<
- *       return d
- * 
- */
-    __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_clas); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = PyFloat_FromDouble((__pyx_v_p->w[__pyx_t_7])); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    if (PyObject_SetItem(__pyx_v_d, __pyx_v_f, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 210; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":211
- *       for f,p in self.W.iteritems():
- *          d[f] = p.w[clas]
- *       return d             # <<<<<<<<<<<<<<
- * 
- *    def __init__(self, nclasses):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_d);
-  __pyx_r = __pyx_v_d;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.MultitronParameters.getW");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_d);
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_clas);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":206
- *       self.scores = <double *>malloc(nclasses*sizeof(double))
- * 
- *    cpdef getW(self, clas):             # <<<<<<<<<<<<<<
- *       d={}
- *       cdef MulticlassParamData p
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_getW(PyObject *__pyx_v_self, PyObject *__pyx_v_clas); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_getW(PyObject *__pyx_v_self, PyObject *__pyx_v_clas) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("getW");
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->getW(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_clas, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.getW");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":213
- *       return d
- * 
- *    def __init__(self, nclasses):             # <<<<<<<<<<<<<<
- *       self.nclasses = nclasses
- *       self.now = 0
- */
-
-static int __pyx_pf_2ml_19MultitronParameters___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_19MultitronParameters___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_nclasses = 0;
-  int __pyx_r;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__nclasses,0};
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__nclasses);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_nclasses = values[0];
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_nclasses = PyTuple_GET_ITEM(__pyx_args, 0);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.__init__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":214
- * 
- *    def __init__(self, nclasses):
- *       self.nclasses = nclasses             # <<<<<<<<<<<<<<
- *       self.now = 0
- *       self.W = {}
- */
-  __pyx_t_1 = __Pyx_PyInt_AsInt(__pyx_v_nclasses); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  ((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->nclasses = __pyx_t_1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":215
- *    def __init__(self, nclasses):
- *       self.nclasses = nclasses
- *       self.now = 0             # <<<<<<<<<<<<<<
- *       self.W = {}
- * 
- */
-  ((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->now = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":216
- *       self.nclasses = nclasses
- *       self.now = 0
- *       self.W = {}             # <<<<<<<<<<<<<<
- * 
- *    cdef _tick(self):
- */
-  __pyx_t_2 = PyDict_New(); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 216; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W));
-  ((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("ml.MultitronParameters.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":218
- *       self.W = {}
- * 
- *    cdef _tick(self):             # <<<<<<<<<<<<<<
- *       self.now=self.now+1
- * 
- */
-
-static  PyObject *__pyx_f_2ml_19MultitronParameters__tick(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("_tick");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":219
- * 
- *    cdef _tick(self):
- *       self.now=self.now+1             # <<<<<<<<<<<<<<
- * 
- *    def tick(self): self._tick()
- */
-  __pyx_v_self->now = (__pyx_v_self->now + 1);
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":221
- *       self.now=self.now+1
- * 
- *    def tick(self): self._tick()             # <<<<<<<<<<<<<<
- * 
- *    cpdef scalar_multiply(self, double scalar):
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_tick(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_tick(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("tick");
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->_tick(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.tick");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":223
- *    def tick(self): self._tick()
- * 
- *    cpdef scalar_multiply(self, double scalar):             # <<<<<<<<<<<<<<
- *       """
- *       note: DOES NOT support averaging
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_scalar_multiply(PyObject *__pyx_v_self, PyObject *__pyx_arg_scalar); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_scalar_multiply(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, double __pyx_v_scalar, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  int __pyx_v_c;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  __Pyx_RefNannySetupContext("scalar_multiply");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__scalar_multiply); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_scalar_multiply)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyFloat_FromDouble(__pyx_v_scalar); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":229
- *       cdef MulticlassParamData p
- *       cdef int c
- *       for p in self.W.values():             # <<<<<<<<<<<<<<
- *          for c in xrange(self.nclasses):
- *             p.w[c]*=scalar
- */
-  __pyx_t_1 = PyDict_Values(((PyObject *)__pyx_v_self->W)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
-    __pyx_t_4 = 0; __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2);
-  } else {
-    __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++;
-    } else {
-      __pyx_t_1 = PyIter_Next(__pyx_t_2);
-      if (!__pyx_t_1) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_1);
-    }
-    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_p));
-    __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":230
- *       cdef int c
- *       for p in self.W.values():
- *          for c in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *             p.w[c]*=scalar
- * 
- */
-    __pyx_t_5 = __pyx_v_self->nclasses;
-    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
-      __pyx_v_c = __pyx_t_6;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":231
- *       for p in self.W.values():
- *          for c in xrange(self.nclasses):
- *             p.w[c]*=scalar             # <<<<<<<<<<<<<<
- * 
- *    cpdef add(self, list features, int clas, double amount):
- */
-      (__pyx_v_p->w[__pyx_v_c]) *= __pyx_v_scalar;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.MultitronParameters.scalar_multiply");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":223
- *    def tick(self): self._tick()
- * 
- *    cpdef scalar_multiply(self, double scalar):             # <<<<<<<<<<<<<<
- *       """
- *       note: DOES NOT support averaging
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_scalar_multiply(PyObject *__pyx_v_self, PyObject *__pyx_arg_scalar); /*proto*/
-static char __pyx_doc_2ml_19MultitronParameters_scalar_multiply[] = "\n      note: DOES NOT support averaging\n      ";
-static PyObject *__pyx_pf_2ml_19MultitronParameters_scalar_multiply(PyObject *__pyx_v_self, PyObject *__pyx_arg_scalar) {
-  double __pyx_v_scalar;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("scalar_multiply");
-  assert(__pyx_arg_scalar); {
-    __pyx_v_scalar = __pyx_PyFloat_AsDouble(__pyx_arg_scalar); if (unlikely((__pyx_v_scalar == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.scalar_multiply");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->scalar_multiply(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_scalar, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 223; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.scalar_multiply");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":233
- *             p.w[c]*=scalar
- * 
- *    cpdef add(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       for f in features:
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_add(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_v_clas, double __pyx_v_amount, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  __Pyx_RefNannySetupContext("add");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__add); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_add)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_clas); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":235
- *    cpdef add(self, list features, int clas, double amount):
- *       cdef MulticlassParamData p
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_5 = 0; __pyx_t_1 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_1);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_1)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++;
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":236
- *       cdef MulticlassParamData p
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *          except KeyError:
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":237
- *       for f in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":238
- *          try:
- *             p = self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p
- */
-      __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_6) {
-        __Pyx_AddTraceback("ml.MultitronParameters.add");
-        if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_4, &__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GOTREF(__pyx_t_2);
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":239
- *             p = self.W[f]
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)             # <<<<<<<<<<<<<<
- *             self.W[f] = p
- * 
- */
-        __pyx_t_7 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_8);
-        PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
-        __Pyx_GIVEREF(__pyx_t_7);
-        __pyx_t_7 = 0;
-        __pyx_t_7 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_MulticlassParamData)), __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 239; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_7);
-        __pyx_t_7 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":240
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p             # <<<<<<<<<<<<<<
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- */
-        if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f, ((PyObject *)__pyx_v_p)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 240; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        goto __pyx_L6_exception_handled;
-      }
-      __pyx_L7_except_error:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":242
- *             self.W[f] = p
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]             # <<<<<<<<<<<<<<
- *          p.w[clas]+=amount
- *          p.lastUpd[clas]=self.now
- */
-    (__pyx_v_p->acc[__pyx_v_clas]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_clas])) * (__pyx_v_p->w[__pyx_v_clas]));
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":243
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *          p.w[clas]+=amount             # <<<<<<<<<<<<<<
- *          p.lastUpd[clas]=self.now
- * 
- */
-    (__pyx_v_p->w[__pyx_v_clas]) += __pyx_v_amount;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":244
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *          p.w[clas]+=amount
- *          p.lastUpd[clas]=self.now             # <<<<<<<<<<<<<<
- * 
- *    cpdef add_r(self, list features, int clas, double amount):
- */
-    (__pyx_v_p->lastUpd[__pyx_v_clas]) = __pyx_v_self->now;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("ml.MultitronParameters.add");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":233
- *             p.w[c]*=scalar
- * 
- *    cpdef add(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       for f in features:
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_features = 0;
-  int __pyx_v_clas;
-  double __pyx_v_amount;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__features,&__pyx_n_s__clas,&__pyx_n_s__amount,0};
-  __Pyx_RefNannySetupContext("add");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[3] = {0,0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__features);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__clas);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("add", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__amount);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("add", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "add") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_features = ((PyObject *)values[0]);
-    __pyx_v_clas = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_features = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_clas = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("add", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.add");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->add(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_features, __pyx_v_clas, __pyx_v_amount, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.add");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":246
- *          p.lastUpd[clas]=self.now
- * 
- *    cpdef add_r(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       """
- *       like "add", but with real values features:
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add_r(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_add_r(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_v_clas, double __pyx_v_amount, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  double __pyx_v_v;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  double __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  __Pyx_RefNannySetupContext("add_r");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__add_r); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_add_r)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_clas); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":254
- *       cdef double v
- *       cdef str f
- *       for f,v in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_5 = 0; __pyx_t_1 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_1);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_1)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++;
-    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
-      PyObject* tuple = __pyx_t_3;
-      __pyx_t_4 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_4);
-      if (!(likely(PyString_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_4)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_2 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_v_f));
-      __pyx_v_f = ((PyObject *)__pyx_t_4);
-      __pyx_t_4 = 0;
-      __pyx_v_v = __pyx_t_6;
-    } else {
-      __pyx_t_7 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_7, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (!(likely(PyString_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_4)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_7, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      if (__Pyx_EndUnpack(__pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 254; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_v_f));
-      __pyx_v_f = ((PyObject *)__pyx_t_4);
-      __pyx_t_4 = 0;
-      __pyx_v_v = __pyx_t_6;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":255
- *       cdef str f
- *       for f,v in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *          except KeyError:
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":256
- *       for f,v in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f)); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 256; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":257
- *          try:
- *             p = self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p
- */
-      __pyx_t_8 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_8) {
-        __Pyx_AddTraceback("ml.MultitronParameters.add_r");
-        if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_2, &__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 257; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_GOTREF(__pyx_t_4);
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":258
- *             p = self.W[f]
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)             # <<<<<<<<<<<<<<
- *             self.W[f] = p
- * 
- */
-        __pyx_t_7 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_9);
-        PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7);
-        __Pyx_GIVEREF(__pyx_t_7);
-        __pyx_t_7 = 0;
-        __pyx_t_7 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_MulticlassParamData)), __pyx_t_9, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 258; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_7);
-        __pyx_t_7 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":259
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p             # <<<<<<<<<<<<<<
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- */
-        if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f), ((PyObject *)__pyx_v_p)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        goto __pyx_L6_exception_handled;
-      }
-      __pyx_L7_except_error:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":261
- *             self.W[f] = p
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]             # <<<<<<<<<<<<<<
- *          p.w[clas]+=amount*v
- *          p.lastUpd[clas]=self.now
- */
-    (__pyx_v_p->acc[__pyx_v_clas]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_clas])) * (__pyx_v_p->w[__pyx_v_clas]));
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":262
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *          p.w[clas]+=amount*v             # <<<<<<<<<<<<<<
- *          p.lastUpd[clas]=self.now
- * 
- */
-    (__pyx_v_p->w[__pyx_v_clas]) += (__pyx_v_amount * __pyx_v_v);
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":263
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *          p.w[clas]+=amount*v
- *          p.lastUpd[clas]=self.now             # <<<<<<<<<<<<<<
- * 
- *    cpdef set(self, list features, int clas, double amount):
- */
-    (__pyx_v_p->lastUpd[__pyx_v_clas]) = __pyx_v_self->now;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("ml.MultitronParameters.add_r");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":246
- *          p.lastUpd[clas]=self.now
- * 
- *    cpdef add_r(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       """
- *       like "add", but with real values features:
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add_r(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_2ml_19MultitronParameters_add_r[] = "\n      like \"add\", but with real values features: \n         each feature is a pair (f,v), where v is the value.\n      ";
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add_r(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_features = 0;
-  int __pyx_v_clas;
-  double __pyx_v_amount;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__features,&__pyx_n_s__clas,&__pyx_n_s__amount,0};
-  __Pyx_RefNannySetupContext("add_r");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[3] = {0,0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__features);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__clas);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("add_r", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__amount);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("add_r", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "add_r") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_features = ((PyObject *)values[0]);
-    __pyx_v_clas = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_features = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_clas = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("add_r", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.add_r");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->add_r(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_features, __pyx_v_clas, __pyx_v_amount, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 246; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.add_r");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":265
- *          p.lastUpd[clas]=self.now
- * 
- *    cpdef set(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       """
- *       like "add", but replaces instead of adding
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_set(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_set(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_v_clas, double __pyx_v_amount, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  __Pyx_RefNannySetupContext("set");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__set); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_set)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_clas); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":272
- *       cdef double v
- *       cdef str f
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_5 = 0; __pyx_t_1 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_1);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_1)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_5); __Pyx_INCREF(__pyx_t_3); __pyx_t_5++;
-    if (!(likely(PyString_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_f));
-    __pyx_v_f = ((PyObject *)__pyx_t_3);
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":273
- *       cdef str f
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *          except KeyError:
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":274
- *       for f in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f)); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":275
- *          try:
- *             p = self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p
- */
-      __pyx_t_6 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_6) {
-        __Pyx_AddTraceback("ml.MultitronParameters.set");
-        if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_4, &__pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GOTREF(__pyx_t_2);
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":276
- *             p = self.W[f]
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)             # <<<<<<<<<<<<<<
- *             self.W[f] = p
- * 
- */
-        __pyx_t_7 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_8);
-        PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
-        __Pyx_GIVEREF(__pyx_t_7);
-        __pyx_t_7 = 0;
-        __pyx_t_7 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_MulticlassParamData)), __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_7);
-        __pyx_t_7 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":277
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p             # <<<<<<<<<<<<<<
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- */
-        if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f), ((PyObject *)__pyx_v_p)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        goto __pyx_L6_exception_handled;
-      }
-      __pyx_L7_except_error:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":279
- *             self.W[f] = p
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]             # <<<<<<<<<<<<<<
- *          p.w[clas]+=amount
- *          p.lastUpd[clas]=self.now
- */
-    (__pyx_v_p->acc[__pyx_v_clas]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_clas])) * (__pyx_v_p->w[__pyx_v_clas]));
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":280
- * 
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *          p.w[clas]+=amount             # <<<<<<<<<<<<<<
- *          p.lastUpd[clas]=self.now
- * 
- */
-    (__pyx_v_p->w[__pyx_v_clas]) += __pyx_v_amount;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":281
- *          p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *          p.w[clas]+=amount
- *          p.lastUpd[clas]=self.now             # <<<<<<<<<<<<<<
- * 
- *    cpdef add_params(self, MultitronParameters other, double factor):
- */
-    (__pyx_v_p->lastUpd[__pyx_v_clas]) = __pyx_v_self->now;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("ml.MultitronParameters.set");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":265
- *          p.lastUpd[clas]=self.now
- * 
- *    cpdef set(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       """
- *       like "add", but replaces instead of adding
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_set(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_2ml_19MultitronParameters_set[] = "\n      like \"add\", but replaces instead of adding\n      ";
-static PyObject *__pyx_pf_2ml_19MultitronParameters_set(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_features = 0;
-  int __pyx_v_clas;
-  double __pyx_v_amount;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__features,&__pyx_n_s__clas,&__pyx_n_s__amount,0};
-  __Pyx_RefNannySetupContext("set");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[3] = {0,0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__features);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__clas);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("set", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__amount);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("set", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "set") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_features = ((PyObject *)values[0]);
-    __pyx_v_clas = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_features = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_clas = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("set", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.set");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->set(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_features, __pyx_v_clas, __pyx_v_amount, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.set");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":283
- *          p.lastUpd[clas]=self.now
- * 
- *    cpdef add_params(self, MultitronParameters other, double factor):             # <<<<<<<<<<<<<<
- *       """
- *       like "add", but with data from another MultitronParameters object.
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add_params(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_add_params(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, struct __pyx_obj_2ml_MultitronParameters *__pyx_v_other, double __pyx_v_factor, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_op;
-  PyObject *__pyx_v_f;
-  int __pyx_v_clas;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  int __pyx_t_9;
-  int __pyx_t_10;
-  __Pyx_RefNannySetupContext("add_params");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF((PyObject *)__pyx_v_other);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_op = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__add_params); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_add_params)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyFloat_FromDouble(__pyx_v_factor); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(((PyObject *)__pyx_v_other));
-      PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_v_other));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_other));
-      PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":294
- *       cdef str f
- *       cdef int clas
- *       assert(self.nclasses==other.nclasses),"incompatible number of classes in add_params"             # <<<<<<<<<<<<<<
- *       for f,op in other.W.items():
- *          try:
- */
-  #ifndef PYREX_WITHOUT_ASSERTIONS
-  if (unlikely(!(__pyx_v_self->nclasses == __pyx_v_other->nclasses))) {
-    PyErr_SetObject(PyExc_AssertionError, ((PyObject *)__pyx_kp_s_5));
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  #endif
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":295
- *       cdef int clas
- *       assert(self.nclasses==other.nclasses),"incompatible number of classes in add_params"
- *       for f,op in other.W.items():             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  __pyx_t_1 = PyDict_Items(((PyObject *)__pyx_v_other->W)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyList_CheckExact(__pyx_t_1) || PyTuple_CheckExact(__pyx_t_1)) {
-    __pyx_t_4 = 0; __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2);
-  } else {
-    __pyx_t_4 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_4); __Pyx_INCREF(__pyx_t_1); __pyx_t_4++;
-    } else {
-      __pyx_t_1 = PyIter_Next(__pyx_t_2);
-      if (!__pyx_t_1) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_1);
-    }
-    if (PyTuple_CheckExact(__pyx_t_1) && likely(PyTuple_GET_SIZE(__pyx_t_1) == 2)) {
-      PyObject* tuple = __pyx_t_1;
-      __pyx_t_3 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_3);
-      if (!(likely(PyString_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_5 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_5);
-      if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_v_f));
-      __pyx_v_f = ((PyObject *)__pyx_t_3);
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_v_op));
-      __pyx_v_op = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_5);
-      __pyx_t_5 = 0;
-    } else {
-      __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_3 = __Pyx_UnpackItem(__pyx_t_6, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      if (!(likely(PyString_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_6, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      if (__Pyx_EndUnpack(__pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 295; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_v_f));
-      __pyx_v_f = ((PyObject *)__pyx_t_3);
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(((PyObject *)__pyx_v_op));
-      __pyx_v_op = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_5);
-      __pyx_t_5 = 0;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":296
- *       assert(self.nclasses==other.nclasses),"incompatible number of classes in add_params"
- *       for f,op in other.W.items():
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *          except KeyError:
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":297
- *       for f,op in other.W.items():
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- */
-        __pyx_t_1 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f)); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_1);
-        if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 297; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_1);
-        __pyx_t_1 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":298
- *          try:
- *             p = self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p
- */
-      __pyx_t_7 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_7) {
-        __Pyx_AddTraceback("ml.MultitronParameters.add_params");
-        if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_5, &__pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 298; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GOTREF(__pyx_t_3);
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":299
- *             p = self.W[f]
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)             # <<<<<<<<<<<<<<
- *             self.W[f] = p
- * 
- */
-        __pyx_t_6 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_8);
-        PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_6);
-        __pyx_t_6 = 0;
-        __pyx_t_6 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_MulticlassParamData)), __pyx_t_8, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_6);
-        __pyx_t_6 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":300
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p             # <<<<<<<<<<<<<<
- * 
- *          for clas in xrange(self.nclasses):
- */
-        if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f), ((PyObject *)__pyx_v_p)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 300; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        goto __pyx_L6_exception_handled;
-      }
-      __pyx_L7_except_error:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":302
- *             self.W[f] = p
- * 
- *          for clas in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *             if op.w[clas]<0.0000001: continue
- *             p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- */
-    __pyx_t_7 = __pyx_v_self->nclasses;
-    for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_7; __pyx_t_9+=1) {
-      __pyx_v_clas = __pyx_t_9;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":303
- * 
- *          for clas in xrange(self.nclasses):
- *             if op.w[clas]<0.0000001: continue             # <<<<<<<<<<<<<<
- *             p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *             #print p.w[clas], op.w[clas]
- */
-      __pyx_t_10 = ((__pyx_v_op->w[__pyx_v_clas]) < 9.9999999999999995e-08);
-      if (__pyx_t_10) {
-        goto __pyx_L15_continue;
-        goto __pyx_L17;
-      }
-      __pyx_L17:;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":304
- *          for clas in xrange(self.nclasses):
- *             if op.w[clas]<0.0000001: continue
- *             p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]             # <<<<<<<<<<<<<<
- *             #print p.w[clas], op.w[clas]
- *             p.w[clas]+=(op.w[clas]*factor)
- */
-      (__pyx_v_p->acc[__pyx_v_clas]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_clas])) * (__pyx_v_p->w[__pyx_v_clas]));
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":306
- *             p.acc[clas]+=(self.now-p.lastUpd[clas])*p.w[clas]
- *             #print p.w[clas], op.w[clas]
- *             p.w[clas]+=(op.w[clas]*factor)             # <<<<<<<<<<<<<<
- *             p.lastUpd[clas]=self.now
- * 
- */
-      (__pyx_v_p->w[__pyx_v_clas]) += ((__pyx_v_op->w[__pyx_v_clas]) * __pyx_v_factor);
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":307
- *             #print p.w[clas], op.w[clas]
- *             p.w[clas]+=(op.w[clas]*factor)
- *             p.lastUpd[clas]=self.now             # <<<<<<<<<<<<<<
- * 
- *    cpdef do_pa_update(self, list feats, int gold_cls, double C=1.0):
- */
-      (__pyx_v_p->lastUpd[__pyx_v_clas]) = __pyx_v_self->now;
-      __pyx_L15_continue:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("ml.MultitronParameters.add_params");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF((PyObject *)__pyx_v_op);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF((PyObject *)__pyx_v_other);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":283
- *          p.lastUpd[clas]=self.now
- * 
- *    cpdef add_params(self, MultitronParameters other, double factor):             # <<<<<<<<<<<<<<
- *       """
- *       like "add", but with data from another MultitronParameters object.
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add_params(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_2ml_19MultitronParameters_add_params[] = "\n      like \"add\", but with data from another MultitronParameters object.\n      they must both share the number of classes\n      add each value * factor\n      ";
-static PyObject *__pyx_pf_2ml_19MultitronParameters_add_params(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_2ml_MultitronParameters *__pyx_v_other = 0;
-  double __pyx_v_factor;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__other,&__pyx_n_s__factor,0};
-  __Pyx_RefNannySetupContext("add_params");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__other);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__factor);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("add_params", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "add_params") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_other = ((struct __pyx_obj_2ml_MultitronParameters *)values[0]);
-    __pyx_v_factor = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_factor == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_other = ((struct __pyx_obj_2ml_MultitronParameters *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_factor = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_factor == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("add_params", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.add_params");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_other), __pyx_ptype_2ml_MultitronParameters, 1, "other", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->add_params(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_other, __pyx_v_factor, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.add_params");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":309
- *             p.lastUpd[clas]=self.now
- * 
- *    cpdef do_pa_update(self, list feats, int gold_cls, double C=1.0):             # <<<<<<<<<<<<<<
- *       cdef double go_scr
- *       cdef double gu_scr
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_do_pa_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_do_pa_update(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_feats, int __pyx_v_gold_cls, int __pyx_skip_dispatch, struct __pyx_opt_args_2ml_19MultitronParameters_do_pa_update *__pyx_optional_args) {
-  double __pyx_v_C = ((double)1.0);
-  double __pyx_v_go_scr;
-  double __pyx_v_gu_scr;
-  double __pyx_v_loss;
-  double __pyx_v_norm;
-  double __pyx_v_tau;
-  int __pyx_v_prediction;
-  PyObject *__pyx_v_scores;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  double __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  __Pyx_RefNannySetupContext("do_pa_update");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_C = __pyx_optional_args->C;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_feats);
-  __pyx_v_scores = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__do_pa_update); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_do_pa_update)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_gold_cls); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_C); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_v_feats));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_feats));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_feats));
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":317
- *       cdef int prediction
- *       cdef dict scores
- *       self._tick()             # <<<<<<<<<<<<<<
- *       prediction = self._predict_best_class(feats)
- *       if prediction==gold_cls: return prediction
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->_tick(__pyx_v_self); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":318
- *       cdef dict scores
- *       self._tick()
- *       prediction = self._predict_best_class(feats)             # <<<<<<<<<<<<<<
- *       if prediction==gold_cls: return prediction
- *       scores = self.get_scores(feats)
- */
-  __pyx_v_prediction = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->_predict_best_class(__pyx_v_self, __pyx_v_feats);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":319
- *       self._tick()
- *       prediction = self._predict_best_class(feats)
- *       if prediction==gold_cls: return prediction             # <<<<<<<<<<<<<<
- *       scores = self.get_scores(feats)
- *       go_scr = scores[gold_cls]
- */
-  __pyx_t_5 = (__pyx_v_prediction == __pyx_v_gold_cls);
-  if (__pyx_t_5) {
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = PyInt_FromLong(__pyx_v_prediction); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":320
- *       prediction = self._predict_best_class(feats)
- *       if prediction==gold_cls: return prediction
- *       scores = self.get_scores(feats)             # <<<<<<<<<<<<<<
- *       go_scr = scores[gold_cls]
- *       gu_scr = scores[prediction]
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->get_scores(__pyx_v_self, ((PyObject *)__pyx_v_feats), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected dict, got %.200s", Py_TYPE(__pyx_t_1)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_v_scores));
-  __pyx_v_scores = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":321
- *       if prediction==gold_cls: return prediction
- *       scores = self.get_scores(feats)
- *       go_scr = scores[gold_cls]             # <<<<<<<<<<<<<<
- *       gu_scr = scores[prediction]
- * 
- */
-  __pyx_t_1 = __Pyx_GetItemInt(((PyObject *)__pyx_v_scores), __pyx_v_gold_cls, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 321; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_go_scr = __pyx_t_6;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":322
- *       scores = self.get_scores(feats)
- *       go_scr = scores[gold_cls]
- *       gu_scr = scores[prediction]             # <<<<<<<<<<<<<<
- * 
- *       loss = gu_scr - go_scr + 1
- */
-  __pyx_t_1 = __Pyx_GetItemInt(((PyObject *)__pyx_v_scores), __pyx_v_prediction, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_gu_scr = __pyx_t_6;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":324
- *       gu_scr = scores[prediction]
- * 
- *       loss = gu_scr - go_scr + 1             # <<<<<<<<<<<<<<
- *       norm = len(feats)+len(feats)
- *       tau = loss / norm
- */
-  __pyx_v_loss = ((__pyx_v_gu_scr - __pyx_v_go_scr) + 1);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":325
- * 
- *       loss = gu_scr - go_scr + 1
- *       norm = len(feats)+len(feats)             # <<<<<<<<<<<<<<
- *       tau = loss / norm
- *       if tau>C: tau=C
- */
-  __pyx_t_7 = PyObject_Length(((PyObject *)__pyx_v_feats)); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_8 = PyObject_Length(((PyObject *)__pyx_v_feats)); if (unlikely(__pyx_t_8 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_norm = (__pyx_t_7 + __pyx_t_8);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":326
- *       loss = gu_scr - go_scr + 1
- *       norm = len(feats)+len(feats)
- *       tau = loss / norm             # <<<<<<<<<<<<<<
- *       if tau>C: tau=C
- *       self.add(feats,prediction,-tau)
- */
-  if (unlikely(__pyx_v_norm == 0)) {
-    PyErr_Format(PyExc_ZeroDivisionError, "float division");
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_tau = (__pyx_v_loss / __pyx_v_norm);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":327
- *       norm = len(feats)+len(feats)
- *       tau = loss / norm
- *       if tau>C: tau=C             # <<<<<<<<<<<<<<
- *       self.add(feats,prediction,-tau)
- *       self.add(feats,gold_cls,+tau)
- */
-  __pyx_t_5 = (__pyx_v_tau > __pyx_v_C);
-  if (__pyx_t_5) {
-    __pyx_v_tau = __pyx_v_C;
-    goto __pyx_L4;
-  }
-  __pyx_L4:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":328
- *       tau = loss / norm
- *       if tau>C: tau=C
- *       self.add(feats,prediction,-tau)             # <<<<<<<<<<<<<<
- *       self.add(feats,gold_cls,+tau)
- *       return prediction
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->add(__pyx_v_self, __pyx_v_feats, __pyx_v_prediction, (-__pyx_v_tau), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":329
- *       if tau>C: tau=C
- *       self.add(feats,prediction,-tau)
- *       self.add(feats,gold_cls,+tau)             # <<<<<<<<<<<<<<
- *       return prediction
- * 
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->add(__pyx_v_self, __pyx_v_feats, __pyx_v_gold_cls, __pyx_v_tau, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":330
- *       self.add(feats,prediction,-tau)
- *       self.add(feats,gold_cls,+tau)
- *       return prediction             # <<<<<<<<<<<<<<
- * 
- *    cpdef pa_update(self, object gu_feats, object go_feats, int gu_cls, int go_cls,double C=1.0):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(__pyx_v_prediction); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 330; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ml.MultitronParameters.do_pa_update");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_scores);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_feats);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":309
- *             p.lastUpd[clas]=self.now
- * 
- *    cpdef do_pa_update(self, list feats, int gold_cls, double C=1.0):             # <<<<<<<<<<<<<<
- *       cdef double go_scr
- *       cdef double gu_scr
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_do_pa_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_do_pa_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_feats = 0;
-  int __pyx_v_gold_cls;
-  double __pyx_v_C;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_2ml_19MultitronParameters_do_pa_update __pyx_t_2;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__feats,&__pyx_n_s__gold_cls,&__pyx_n_s__C,0};
-  __Pyx_RefNannySetupContext("do_pa_update");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[3] = {0,0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__feats);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__gold_cls);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("do_pa_update", 0, 2, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__C);
-        if (unlikely(value)) { values[2] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "do_pa_update") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_feats = ((PyObject *)values[0]);
-    __pyx_v_gold_cls = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_gold_cls == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    if (values[2]) {
-      __pyx_v_C = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_C == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_C = ((double)1.0);
-    }
-  } else {
-    __pyx_v_C = ((double)1.0);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3:
-      __pyx_v_C = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_C == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  2:
-      __pyx_v_gold_cls = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_gold_cls == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_feats = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("do_pa_update", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.do_pa_update");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_feats), &PyList_Type, 1, "feats", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2.__pyx_n = 1;
-  __pyx_t_2.C = __pyx_v_C;
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->do_pa_update(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_feats, __pyx_v_gold_cls, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 309; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.do_pa_update");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":332
- *       return prediction
- * 
- *    cpdef pa_update(self, object gu_feats, object go_feats, int gu_cls, int go_cls,double C=1.0):             # <<<<<<<<<<<<<<
- *       cdef double go_scr
- *       cdef double gu_scr
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_pa_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_pa_update(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_gu_feats, PyObject *__pyx_v_go_feats, int __pyx_v_gu_cls, int __pyx_v_go_cls, int __pyx_skip_dispatch, struct __pyx_opt_args_2ml_19MultitronParameters_pa_update *__pyx_optional_args) {
-  double __pyx_v_C = ((double)1.0);
-  double __pyx_v_go_scr;
-  double __pyx_v_gu_scr;
-  double __pyx_v_loss;
-  double __pyx_v_norm;
-  double __pyx_v_tau;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  double __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  int __pyx_t_9;
-  __Pyx_RefNannySetupContext("pa_update");
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_C = __pyx_optional_args->C;
-    }
-  }
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_gu_feats);
-  __Pyx_INCREF(__pyx_v_go_feats);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__pa_update); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_pa_update)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_gu_cls); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyInt_FromLong(__pyx_v_go_cls); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_C); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyTuple_New(5); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_INCREF(__pyx_v_gu_feats);
-      PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_gu_feats);
-      __Pyx_GIVEREF(__pyx_v_gu_feats);
-      __Pyx_INCREF(__pyx_v_go_feats);
-      PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_v_go_feats);
-      __Pyx_GIVEREF(__pyx_v_go_feats);
-      PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_5, 3, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_5, 4, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_4);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_4 = PyObject_Call(__pyx_t_1, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_r = __pyx_t_4;
-      __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":338
- *       cdef double norm
- *       cdef double tau
- *       go_scr = self.get_scores(go_feats)[go_cls]             # <<<<<<<<<<<<<<
- *       gu_scr = self.get_scores(gu_feats)[gu_cls]
- *       loss = gu_scr - go_scr + 1
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->get_scores(__pyx_v_self, __pyx_v_go_feats, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_1, __pyx_v_go_cls, sizeof(int), PyInt_FromLong); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_4); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_go_scr = __pyx_t_6;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":339
- *       cdef double tau
- *       go_scr = self.get_scores(go_feats)[go_cls]
- *       gu_scr = self.get_scores(gu_feats)[gu_cls]             # <<<<<<<<<<<<<<
- *       loss = gu_scr - go_scr + 1
- *       norm = len(go_feats)+len(gu_feats)
- */
-  __pyx_t_4 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->get_scores(__pyx_v_self, __pyx_v_gu_feats, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_4, __pyx_v_gu_cls, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 339; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_gu_scr = __pyx_t_6;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":340
- *       go_scr = self.get_scores(go_feats)[go_cls]
- *       gu_scr = self.get_scores(gu_feats)[gu_cls]
- *       loss = gu_scr - go_scr + 1             # <<<<<<<<<<<<<<
- *       norm = len(go_feats)+len(gu_feats)
- *       tau = loss / norm
- */
-  __pyx_v_loss = ((__pyx_v_gu_scr - __pyx_v_go_scr) + 1);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":341
- *       gu_scr = self.get_scores(gu_feats)[gu_cls]
- *       loss = gu_scr - go_scr + 1
- *       norm = len(go_feats)+len(gu_feats)             # <<<<<<<<<<<<<<
- *       tau = loss / norm
- *       if tau>C: tau=C
- */
-  __pyx_t_7 = PyObject_Length(__pyx_v_go_feats); if (unlikely(__pyx_t_7 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_8 = PyObject_Length(__pyx_v_gu_feats); if (unlikely(__pyx_t_8 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_norm = (__pyx_t_7 + __pyx_t_8);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":342
- *       loss = gu_scr - go_scr + 1
- *       norm = len(go_feats)+len(gu_feats)
- *       tau = loss / norm             # <<<<<<<<<<<<<<
- *       if tau>C: tau=C
- *       self.add(gu_feats,gu_cls,-tau)
- */
-  if (unlikely(__pyx_v_norm == 0)) {
-    PyErr_Format(PyExc_ZeroDivisionError, "float division");
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 342; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_tau = (__pyx_v_loss / __pyx_v_norm);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":343
- *       norm = len(go_feats)+len(gu_feats)
- *       tau = loss / norm
- *       if tau>C: tau=C             # <<<<<<<<<<<<<<
- *       self.add(gu_feats,gu_cls,-tau)
- *       self.add(go_feats,go_cls,+tau)
- */
-  __pyx_t_9 = (__pyx_v_tau > __pyx_v_C);
-  if (__pyx_t_9) {
-    __pyx_v_tau = __pyx_v_C;
-    goto __pyx_L3;
-  }
-  __pyx_L3:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":344
- *       tau = loss / norm
- *       if tau>C: tau=C
- *       self.add(gu_feats,gu_cls,-tau)             # <<<<<<<<<<<<<<
- *       self.add(go_feats,go_cls,+tau)
- * 
- */
-  if (!(likely(PyList_CheckExact(__pyx_v_gu_feats))||((__pyx_v_gu_feats) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_v_gu_feats)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->add(__pyx_v_self, ((PyObject *)__pyx_v_gu_feats), __pyx_v_gu_cls, (-__pyx_v_tau), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":345
- *       if tau>C: tau=C
- *       self.add(gu_feats,gu_cls,-tau)
- *       self.add(go_feats,go_cls,+tau)             # <<<<<<<<<<<<<<
- * 
- *    cpdef get_scores(self, features):
- */
-  if (!(likely(PyList_CheckExact(__pyx_v_go_feats))||((__pyx_v_go_feats) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_v_go_feats)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->add(__pyx_v_self, ((PyObject *)__pyx_v_go_feats), __pyx_v_go_cls, __pyx_v_tau, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 345; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("ml.MultitronParameters.pa_update");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_gu_feats);
-  __Pyx_DECREF(__pyx_v_go_feats);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":332
- *       return prediction
- * 
- *    cpdef pa_update(self, object gu_feats, object go_feats, int gu_cls, int go_cls,double C=1.0):             # <<<<<<<<<<<<<<
- *       cdef double go_scr
- *       cdef double gu_scr
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_pa_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_pa_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_gu_feats = 0;
-  PyObject *__pyx_v_go_feats = 0;
-  int __pyx_v_gu_cls;
-  int __pyx_v_go_cls;
-  double __pyx_v_C;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_2ml_19MultitronParameters_pa_update __pyx_t_2;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__gu_feats,&__pyx_n_s__go_feats,&__pyx_n_s__gu_cls,&__pyx_n_s__go_cls,&__pyx_n_s__C,0};
-  __Pyx_RefNannySetupContext("pa_update");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[5] = {0,0,0,0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__gu_feats);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__go_feats);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pa_update", 0, 4, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__gu_cls);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pa_update", 0, 4, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  3:
-      values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__go_cls);
-      if (likely(values[3])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pa_update", 0, 4, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  4:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__C);
-        if (unlikely(value)) { values[4] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pa_update") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_gu_feats = values[0];
-    __pyx_v_go_feats = values[1];
-    __pyx_v_gu_cls = __Pyx_PyInt_AsInt(values[2]); if (unlikely((__pyx_v_gu_cls == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_go_cls = __Pyx_PyInt_AsInt(values[3]); if (unlikely((__pyx_v_go_cls == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    if (values[4]) {
-      __pyx_v_C = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_C == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    } else {
-      __pyx_v_C = ((double)1.0);
-    }
-  } else {
-    __pyx_v_C = ((double)1.0);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  5:
-      __pyx_v_C = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_C == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  4:
-      __pyx_v_go_cls = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_go_cls == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_gu_cls = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_gu_cls == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_go_feats = PyTuple_GET_ITEM(__pyx_args, 1);
-      __pyx_v_gu_feats = PyTuple_GET_ITEM(__pyx_args, 0);
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pa_update", 0, 4, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.pa_update");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2.__pyx_n = 1;
-  __pyx_t_2.C = __pyx_v_C;
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->pa_update(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_gu_feats, __pyx_v_go_feats, __pyx_v_gu_cls, __pyx_v_go_cls, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.pa_update");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":347
- *       self.add(go_feats,go_cls,+tau)
- * 
- *    cpdef get_scores(self, features):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       cdef int i
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_get_scores(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  int __pyx_v_i;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_c;
-  double __pyx_v_tot;
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  __Pyx_RefNannySetupContext("get_scores");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__get_scores); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_get_scores)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(__pyx_v_features);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_features);
-      __Pyx_GIVEREF(__pyx_v_features);
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":351
- *       cdef int i
- *       cdef double w
- *       for i in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *          self.scores[i]=0
- *       for f in features:
- */
-  __pyx_t_4 = __pyx_v_self->nclasses;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":352
- *       cdef double w
- *       for i in xrange(self.nclasses):
- *          self.scores[i]=0             # <<<<<<<<<<<<<<
- *       for f in features:
- *          try:
- */
-    (__pyx_v_self->scores[__pyx_v_i]) = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":353
- *       for i in xrange(self.nclasses):
- *          self.scores[i]=0
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (PyList_CheckExact(__pyx_v_features) || PyTuple_CheckExact(__pyx_v_features)) {
-    __pyx_t_6 = 0; __pyx_t_1 = __pyx_v_features; __Pyx_INCREF(__pyx_t_1);
-  } else {
-    __pyx_t_6 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_features); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    } else {
-      __pyx_t_3 = PyIter_Next(__pyx_t_1);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 353; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":354
- *          self.scores[i]=0
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":355
- *       for f in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 355; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":356
- *          try:
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *                self.scores[c] += p.w[c]
- *          except KeyError: pass
- */
-        __pyx_t_3 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 356; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 356; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
-        __Pyx_GIVEREF(__pyx_t_3);
-        __pyx_t_3 = 0;
-        __pyx_t_3 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 356; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
-          __pyx_t_7 = 0; __pyx_t_2 = __pyx_t_3; __Pyx_INCREF(__pyx_t_2);
-        } else {
-          __pyx_t_7 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 356; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_2);
-        }
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        for (;;) {
-          if (likely(PyList_CheckExact(__pyx_t_2))) {
-            if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_2)) break;
-            __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_3); __pyx_t_7++;
-          } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
-            if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-            __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_7); __Pyx_INCREF(__pyx_t_3); __pyx_t_7++;
-          } else {
-            __pyx_t_3 = PyIter_Next(__pyx_t_2);
-            if (!__pyx_t_3) {
-              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 356; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              break;
-            }
-            __Pyx_GOTREF(__pyx_t_3);
-          }
-          __Pyx_DECREF(__pyx_v_c);
-          __pyx_v_c = __pyx_t_3;
-          __pyx_t_3 = 0;
-
-          /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":357
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]             # <<<<<<<<<<<<<<
- *          except KeyError: pass
- *       cdef double tot = 0
- */
-          __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __pyx_t_9 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_9 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          (__pyx_v_self->scores[__pyx_t_9]) += (__pyx_v_p->w[__pyx_t_8]);
-        }
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L14_try_end;
-      __pyx_L7_error:;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":358
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]
- *          except KeyError: pass             # <<<<<<<<<<<<<<
- *       cdef double tot = 0
- *       res={}
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L8_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L8_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L14_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":359
- *                self.scores[c] += p.w[c]
- *          except KeyError: pass
- *       cdef double tot = 0             # <<<<<<<<<<<<<<
- *       res={}
- *       for i in xrange(self.nclasses):
- */
-  __pyx_v_tot = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":360
- *          except KeyError: pass
- *       cdef double tot = 0
- *       res={}             # <<<<<<<<<<<<<<
- *       for i in xrange(self.nclasses):
- *          res[i] = self.scores[i]
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":361
- *       cdef double tot = 0
- *       res={}
- *       for i in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *          res[i] = self.scores[i]
- *       return res
- */
-  __pyx_t_4 = __pyx_v_self->nclasses;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":362
- *       res={}
- *       for i in xrange(self.nclasses):
- *          res[i] = self.scores[i]             # <<<<<<<<<<<<<<
- *       return res
- * 
- */
-    __pyx_t_1 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (__Pyx_SetItemInt(__pyx_v_res, __pyx_v_i, __pyx_t_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 362; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":363
- *       for i in xrange(self.nclasses):
- *          res[i] = self.scores[i]
- *       return res             # <<<<<<<<<<<<<<
- * 
- *    cpdef get_scores_r(self, features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_res);
-  __pyx_r = __pyx_v_res;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.MultitronParameters.get_scores");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":347
- *       self.add(go_feats,go_cls,+tau)
- * 
- *    cpdef get_scores(self, features):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       cdef int i
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_scores");
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->get_scores(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 347; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.get_scores");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":365
- *       return res
- * 
- *    cpdef get_scores_r(self, features):             # <<<<<<<<<<<<<<
- *       """
- *       like get_scores but with real values features
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_get_scores_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_get_scores_r(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  int __pyx_v_i;
-  double __pyx_v_v;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_c;
-  double __pyx_v_tot;
-  PyObject *__pyx_v_res;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  Py_ssize_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  double __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  Py_ssize_t __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  __Pyx_RefNannySetupContext("get_scores_r");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_res = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__get_scores_r); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_get_scores_r)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(__pyx_v_features);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_features);
-      __Pyx_GIVEREF(__pyx_v_features);
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":374
- *       cdef double w
- *       cdef double v
- *       for i in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *          self.scores[i]=0
- *       for f,v in features:
- */
-  __pyx_t_4 = __pyx_v_self->nclasses;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":375
- *       cdef double v
- *       for i in xrange(self.nclasses):
- *          self.scores[i]=0             # <<<<<<<<<<<<<<
- *       for f,v in features:
- *          try:
- */
-    (__pyx_v_self->scores[__pyx_v_i]) = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":376
- *       for i in xrange(self.nclasses):
- *          self.scores[i]=0
- *       for f,v in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (PyList_CheckExact(__pyx_v_features) || PyTuple_CheckExact(__pyx_v_features)) {
-    __pyx_t_6 = 0; __pyx_t_1 = __pyx_v_features; __Pyx_INCREF(__pyx_t_1);
-  } else {
-    __pyx_t_6 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_features); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_3); __pyx_t_6++;
-    } else {
-      __pyx_t_3 = PyIter_Next(__pyx_t_1);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
-      PyObject* tuple = __pyx_t_3;
-      __pyx_t_2 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_7 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_7);
-      __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __pyx_v_v = __pyx_t_8;
-    } else {
-      __pyx_t_9 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_9, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_7 = __Pyx_UnpackItem(__pyx_t_9, 1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (__Pyx_EndUnpack(__pyx_t_9) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 376; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __pyx_v_v = __pyx_t_8;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":377
- *          self.scores[i]=0
- *       for f,v in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":378
- *       for f,v in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]*v
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 378; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":379
- *          try:
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *                self.scores[c] += p.w[c]*v
- *          except KeyError: pass
- */
-        __pyx_t_3 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_3);
-        __Pyx_GIVEREF(__pyx_t_3);
-        __pyx_t_3 = 0;
-        __pyx_t_3 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_7, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
-          __pyx_t_10 = 0; __pyx_t_7 = __pyx_t_3; __Pyx_INCREF(__pyx_t_7);
-        } else {
-          __pyx_t_10 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_7);
-        }
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        for (;;) {
-          if (likely(PyList_CheckExact(__pyx_t_7))) {
-            if (__pyx_t_10 >= PyList_GET_SIZE(__pyx_t_7)) break;
-            __pyx_t_3 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_10); __Pyx_INCREF(__pyx_t_3); __pyx_t_10++;
-          } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-            if (__pyx_t_10 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-            __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_10); __Pyx_INCREF(__pyx_t_3); __pyx_t_10++;
-          } else {
-            __pyx_t_3 = PyIter_Next(__pyx_t_7);
-            if (!__pyx_t_3) {
-              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              break;
-            }
-            __Pyx_GOTREF(__pyx_t_3);
-          }
-          __Pyx_DECREF(__pyx_v_c);
-          __pyx_v_c = __pyx_t_3;
-          __pyx_t_3 = 0;
-
-          /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":380
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]*v             # <<<<<<<<<<<<<<
- *          except KeyError: pass
- *       cdef double tot = 0
- */
-          __pyx_t_11 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_11 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 380; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __pyx_t_12 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_12 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 380; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          (__pyx_v_self->scores[__pyx_t_12]) += ((__pyx_v_p->w[__pyx_t_11]) * __pyx_v_v);
-        }
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L14_try_end;
-      __pyx_L7_error:;
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":381
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]*v
- *          except KeyError: pass             # <<<<<<<<<<<<<<
- *       cdef double tot = 0
- *       res={}
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L8_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L8_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L14_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":382
- *                self.scores[c] += p.w[c]*v
- *          except KeyError: pass
- *       cdef double tot = 0             # <<<<<<<<<<<<<<
- *       res={}
- *       for i in xrange(self.nclasses):
- */
-  __pyx_v_tot = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":383
- *          except KeyError: pass
- *       cdef double tot = 0
- *       res={}             # <<<<<<<<<<<<<<
- *       for i in xrange(self.nclasses):
- *          res[i] = self.scores[i]
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 383; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_res);
-  __pyx_v_res = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":384
- *       cdef double tot = 0
- *       res={}
- *       for i in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *          res[i] = self.scores[i]
- *       return res
- */
-  __pyx_t_4 = __pyx_v_self->nclasses;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":385
- *       res={}
- *       for i in xrange(self.nclasses):
- *          res[i] = self.scores[i]             # <<<<<<<<<<<<<<
- *       return res
- * 
- */
-    __pyx_t_1 = PyFloat_FromDouble((__pyx_v_self->scores[__pyx_v_i])); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 385; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (__Pyx_SetItemInt(__pyx_v_res, __pyx_v_i, __pyx_t_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 385; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":386
- *       for i in xrange(self.nclasses):
- *          res[i] = self.scores[i]
- *       return res             # <<<<<<<<<<<<<<
- * 
- *    def update(self, correct_class, features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_res);
-  __pyx_r = __pyx_v_res;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_AddTraceback("ml.MultitronParameters.get_scores_r");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_DECREF(__pyx_v_res);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":365
- *       return res
- * 
- *    cpdef get_scores_r(self, features):             # <<<<<<<<<<<<<<
- *       """
- *       like get_scores but with real values features
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_get_scores_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static char __pyx_doc_2ml_19MultitronParameters_get_scores_r[] = "\n      like get_scores but with real values features\n         each feature is a pair (f,v), where v is the value.\n      ";
-static PyObject *__pyx_pf_2ml_19MultitronParameters_get_scores_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_scores_r");
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->get_scores_r(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 365; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.get_scores_r");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":388
- *       return res
- * 
- *    def update(self, correct_class, features):             # <<<<<<<<<<<<<<
- *       """
- *       does a prediction, and a parameter update.
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_2ml_19MultitronParameters_update[] = "\n      does a prediction, and a parameter update.\n      return: the predicted class before the update.\n      ";
-static PyObject *__pyx_pf_2ml_19MultitronParameters_update(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_correct_class = 0;
-  PyObject *__pyx_v_features = 0;
-  PyObject *__pyx_v_prediction;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__correct_class,&__pyx_n_s__features,0};
-  __Pyx_RefNannySetupContext("update");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__correct_class);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__features);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("update", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "update") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_correct_class = values[0];
-    __pyx_v_features = values[1];
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_correct_class = PyTuple_GET_ITEM(__pyx_args, 0);
-    __pyx_v_features = PyTuple_GET_ITEM(__pyx_args, 1);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("update", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 388; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.update");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_correct_class);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_prediction = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":393
- *       return: the predicted class before the update.
- *       """
- *       self._tick()             # <<<<<<<<<<<<<<
- *       prediction = self._predict_best_class(features)
- *       if prediction != correct_class:
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->_tick(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 393; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":394
- *       """
- *       self._tick()
- *       prediction = self._predict_best_class(features)             # <<<<<<<<<<<<<<
- *       if prediction != correct_class:
- *          self._update(correct_class, prediction, features)
- */
-  if (!(likely(PyList_CheckExact(__pyx_v_features))||((__pyx_v_features) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_v_features)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->_predict_best_class(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), ((PyObject *)__pyx_v_features))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 394; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_prediction);
-  __pyx_v_prediction = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":395
- *       self._tick()
- *       prediction = self._predict_best_class(features)
- *       if prediction != correct_class:             # <<<<<<<<<<<<<<
- *          self._update(correct_class, prediction, features)
- *       return prediction
- */
-  __pyx_t_1 = PyObject_RichCompare(__pyx_v_prediction, __pyx_v_correct_class, Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 395; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":396
- *       prediction = self._predict_best_class(features)
- *       if prediction != correct_class:
- *          self._update(correct_class, prediction, features)             # <<<<<<<<<<<<<<
- *       return prediction
- * 
- */
-    __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_v_correct_class); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_4 = __Pyx_PyInt_AsInt(__pyx_v_prediction); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (!(likely(PyList_CheckExact(__pyx_v_features))||((__pyx_v_features) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_v_features)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->_update(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_t_3, __pyx_t_4, ((PyObject *)__pyx_v_features)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 396; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":397
- *       if prediction != correct_class:
- *          self._update(correct_class, prediction, features)
- *       return prediction             # <<<<<<<<<<<<<<
- * 
- *    cpdef predict_best_class_r(self, list features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_prediction);
-  __pyx_r = __pyx_v_prediction;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.update");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_prediction);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_correct_class);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":399
- *       return prediction
- * 
- *    cpdef predict_best_class_r(self, list features):             # <<<<<<<<<<<<<<
- *       scores = self.get_scores_r(features)
- *       scores = [(s,c) for c,s in scores.iteritems()]
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_predict_best_class_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_19MultitronParameters_predict_best_class_r(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_scores;
-  PyObject *__pyx_v_s;
-  PyObject *__pyx_v_c;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  __Pyx_RefNannySetupContext("predict_best_class_r");
-  __pyx_v_scores = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_s = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_19MultitronParameters_predict_best_class_r)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":400
- * 
- *    cpdef predict_best_class_r(self, list features):
- *       scores = self.get_scores_r(features)             # <<<<<<<<<<<<<<
- *       scores = [(s,c) for c,s in scores.iteritems()]
- *       s = max(scores)[1]
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)__pyx_v_self->__pyx_vtab)->get_scores_r(__pyx_v_self, ((PyObject *)__pyx_v_features), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 400; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_scores);
-  __pyx_v_scores = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":401
- *    cpdef predict_best_class_r(self, list features):
- *       scores = self.get_scores_r(features)
- *       scores = [(s,c) for c,s in scores.iteritems()]             # <<<<<<<<<<<<<<
- *       s = max(scores)[1]
- *       return max(scores)[1]
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PyObject_GetAttr(__pyx_v_scores, __pyx_n_s__iteritems); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_4 = 0; __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
-  } else {
-    __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-    } else {
-      __pyx_t_2 = PyIter_Next(__pyx_t_3);
-      if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    if (PyTuple_CheckExact(__pyx_t_2) && likely(PyTuple_GET_SIZE(__pyx_t_2) == 2)) {
-      PyObject* tuple = __pyx_t_2;
-      __pyx_t_5 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_5);
-      __pyx_t_6 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_v_c);
-      __pyx_v_c = __pyx_t_5;
-      __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_v_s);
-      __pyx_v_s = __pyx_t_6;
-      __pyx_t_6 = 0;
-    } else {
-      __pyx_t_7 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_7, 0); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_6 = __Pyx_UnpackItem(__pyx_t_7, 1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      if (__Pyx_EndUnpack(__pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_v_c);
-      __pyx_v_c = __pyx_t_5;
-      __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_v_s);
-      __pyx_v_s = __pyx_t_6;
-      __pyx_t_6 = 0;
-    }
-    __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx_v_s);
-    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_s);
-    __Pyx_GIVEREF(__pyx_v_s);
-    __Pyx_INCREF(__pyx_v_c);
-    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_c);
-    __Pyx_GIVEREF(__pyx_v_c);
-    __pyx_t_8 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_2); if (unlikely(__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 401; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_INCREF(((PyObject *)__pyx_t_1));
-  __Pyx_DECREF(__pyx_v_scores);
-  __pyx_v_scores = ((PyObject *)__pyx_t_1);
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":402
- *       scores = self.get_scores_r(features)
- *       scores = [(s,c) for c,s in scores.iteritems()]
- *       s = max(scores)[1]             # <<<<<<<<<<<<<<
- *       return max(scores)[1]
- * 
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_scores);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_scores);
-  __Pyx_GIVEREF(__pyx_v_scores);
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_max, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_v_s);
-  __pyx_v_s = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":403
- *       scores = [(s,c) for c,s in scores.iteritems()]
- *       s = max(scores)[1]
- *       return max(scores)[1]             # <<<<<<<<<<<<<<
- * 
- *    def update_r(self, correct_class, features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 403; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_scores);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_scores);
-  __Pyx_GIVEREF(__pyx_v_scores);
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_max, __pyx_t_1, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 403; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_3, 1, sizeof(long), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 403; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("ml.MultitronParameters.predict_best_class_r");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_scores);
-  __Pyx_DECREF(__pyx_v_s);
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":399
- *       return prediction
- * 
- *    cpdef predict_best_class_r(self, list features):             # <<<<<<<<<<<<<<
- *       scores = self.get_scores_r(features)
- *       scores = [(s,c) for c,s in scores.iteritems()]
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_predict_best_class_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_predict_best_class_r(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("predict_best_class_r");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->predict_best_class_r(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.predict_best_class_r");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":405
- *       return max(scores)[1]
- * 
- *    def update_r(self, correct_class, features):             # <<<<<<<<<<<<<<
- *       self._tick()
- *       prediction = self.predict_best_class_r(features)
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_update_r(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_update_r(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_correct_class = 0;
-  PyObject *__pyx_v_features = 0;
-  PyObject *__pyx_v_prediction;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__correct_class,&__pyx_n_s__features,0};
-  __Pyx_RefNannySetupContext("update_r");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__correct_class);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__features);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("update_r", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "update_r") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_correct_class = values[0];
-    __pyx_v_features = values[1];
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_correct_class = PyTuple_GET_ITEM(__pyx_args, 0);
-    __pyx_v_features = PyTuple_GET_ITEM(__pyx_args, 1);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("update_r", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.update_r");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_correct_class);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_prediction = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":406
- * 
- *    def update_r(self, correct_class, features):
- *       self._tick()             # <<<<<<<<<<<<<<
- *       prediction = self.predict_best_class_r(features)
- *       if prediction != correct_class:
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->_tick(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":407
- *    def update_r(self, correct_class, features):
- *       self._tick()
- *       prediction = self.predict_best_class_r(features)             # <<<<<<<<<<<<<<
- *       if prediction != correct_class:
- *          self._update_r(correct_class, prediction, features)
- */
-  if (!(likely(PyList_CheckExact(__pyx_v_features))||((__pyx_v_features) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_v_features)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->predict_best_class_r(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), ((PyObject *)__pyx_v_features), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_prediction);
-  __pyx_v_prediction = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":408
- *       self._tick()
- *       prediction = self.predict_best_class_r(features)
- *       if prediction != correct_class:             # <<<<<<<<<<<<<<
- *          self._update_r(correct_class, prediction, features)
- *       return prediction
- */
-  __pyx_t_1 = PyObject_RichCompare(__pyx_v_prediction, __pyx_v_correct_class, Py_NE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_2) {
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":409
- *       prediction = self.predict_best_class_r(features)
- *       if prediction != correct_class:
- *          self._update_r(correct_class, prediction, features)             # <<<<<<<<<<<<<<
- *       return prediction
- * 
- */
-    __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_v_correct_class); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_4 = __Pyx_PyInt_AsInt(__pyx_v_prediction); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (!(likely(PyList_CheckExact(__pyx_v_features))||((__pyx_v_features) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_v_features)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultitronParameters *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->__pyx_vtab)->_update_r(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self), __pyx_t_3, __pyx_t_4, ((PyObject *)__pyx_v_features)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":410
- *       if prediction != correct_class:
- *          self._update_r(correct_class, prediction, features)
- *       return prediction             # <<<<<<<<<<<<<<
- * 
- *    cdef int _predict_best_class(self, list features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_prediction);
-  __pyx_r = __pyx_v_prediction;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultitronParameters.update_r");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_prediction);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_correct_class);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":412
- *       return prediction
- * 
- *    cdef int _predict_best_class(self, list features):             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef MulticlassParamData p
- */
-
-static  int __pyx_f_2ml_19MultitronParameters__predict_best_class(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, PyObject *__pyx_v_features) {
-  int __pyx_v_i;
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_c;
-  int __pyx_v_best_i;
-  double __pyx_v_best;
-  int __pyx_r;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  int __pyx_t_10;
-  __Pyx_RefNannySetupContext("_predict_best_class");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":415
- *       cdef int i
- *       cdef MulticlassParamData p
- *       for i in range(self.nclasses):             # <<<<<<<<<<<<<<
- *          self.scores[i]=0
- *       for f in features:
- */
-  __pyx_t_1 = __pyx_v_self->nclasses;
-  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
-    __pyx_v_i = __pyx_t_2;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":416
- *       cdef MulticlassParamData p
- *       for i in range(self.nclasses):
- *          self.scores[i]=0             # <<<<<<<<<<<<<<
- *       for f in features:
- *          #print "lookup", f
- */
-    (__pyx_v_self->scores[__pyx_v_i]) = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":417
- *       for i in range(self.nclasses):
- *          self.scores[i]=0
- *       for f in features:             # <<<<<<<<<<<<<<
- *          #print "lookup", f
- *          try:
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_3 = 0; __pyx_t_4 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_4);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_4)) break;
-    __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++;
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_5;
-    __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":419
- *       for f in features:
- *          #print "lookup", f
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":420
- *          #print "lookup", f
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]
- */
-        __pyx_t_5 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_5) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 420; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_5);
-        __pyx_t_5 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":421
- *          try:
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *                self.scores[c] += p.w[c]
- *          except KeyError:
- */
-        __pyx_t_5 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_5);
-        __pyx_t_5 = 0;
-        __pyx_t_5 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_7, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (PyList_CheckExact(__pyx_t_5) || PyTuple_CheckExact(__pyx_t_5)) {
-          __pyx_t_6 = 0; __pyx_t_7 = __pyx_t_5; __Pyx_INCREF(__pyx_t_7);
-        } else {
-          __pyx_t_6 = -1; __pyx_t_7 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __Pyx_GOTREF(__pyx_t_7);
-        }
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        for (;;) {
-          if (likely(PyList_CheckExact(__pyx_t_7))) {
-            if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_7)) break;
-            __pyx_t_5 = PyList_GET_ITEM(__pyx_t_7, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++;
-          } else if (likely(PyTuple_CheckExact(__pyx_t_7))) {
-            if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_7)) break;
-            __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_7, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++;
-          } else {
-            __pyx_t_5 = PyIter_Next(__pyx_t_7);
-            if (!__pyx_t_5) {
-              if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 421; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-              break;
-            }
-            __Pyx_GOTREF(__pyx_t_5);
-          }
-          __Pyx_DECREF(__pyx_v_c);
-          __pyx_v_c = __pyx_t_5;
-          __pyx_t_5 = 0;
-
-          /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":422
- *             p = self.W[f]
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             #print "feature",f,"not found"
- */
-          __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 422; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          __pyx_t_9 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_9 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 422; __pyx_clineno = __LINE__; goto __pyx_L7_error;}
-          (__pyx_v_self->scores[__pyx_t_9]) += (__pyx_v_p->w[__pyx_t_8]);
-        }
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L14_try_end;
-      __pyx_L7_error:;
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":423
- *             for c in xrange(self.nclasses):
- *                self.scores[c] += p.w[c]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             #print "feature",f,"not found"
- *             pass
- */
-      __pyx_t_1 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_1) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L8_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L8_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L14_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":427
- *             pass
- *       # return best_i
- *       cdef int best_i = 0             # <<<<<<<<<<<<<<
- *       cdef double best = self.scores[0]
- *       for i in xrange(1,self.nclasses):
- */
-  __pyx_v_best_i = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":428
- *       # return best_i
- *       cdef int best_i = 0
- *       cdef double best = self.scores[0]             # <<<<<<<<<<<<<<
- *       for i in xrange(1,self.nclasses):
- *          if best < self.scores[i]:
- */
-  __pyx_v_best = (__pyx_v_self->scores[0]);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":429
- *       cdef int best_i = 0
- *       cdef double best = self.scores[0]
- *       for i in xrange(1,self.nclasses):             # <<<<<<<<<<<<<<
- *          if best < self.scores[i]:
- *             best_i = i
- */
-  __pyx_t_1 = __pyx_v_self->nclasses;
-  for (__pyx_t_2 = 1; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
-    __pyx_v_i = __pyx_t_2;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":430
- *       cdef double best = self.scores[0]
- *       for i in xrange(1,self.nclasses):
- *          if best < self.scores[i]:             # <<<<<<<<<<<<<<
- *             best_i = i
- *             best = self.scores[i]
- */
-    __pyx_t_10 = (__pyx_v_best < (__pyx_v_self->scores[__pyx_v_i]));
-    if (__pyx_t_10) {
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":431
- *       for i in xrange(1,self.nclasses):
- *          if best < self.scores[i]:
- *             best_i = i             # <<<<<<<<<<<<<<
- *             best = self.scores[i]
- *       return best_i
- */
-      __pyx_v_best_i = __pyx_v_i;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":432
- *          if best < self.scores[i]:
- *             best_i = i
- *             best = self.scores[i]             # <<<<<<<<<<<<<<
- *       return best_i
- * 
- */
-      __pyx_v_best = (__pyx_v_self->scores[__pyx_v_i]);
-      goto __pyx_L19;
-    }
-    __pyx_L19:;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":433
- *             best_i = i
- *             best = self.scores[i]
- *       return best_i             # <<<<<<<<<<<<<<
- * 
- *    cdef _update(self, int goodClass, int badClass, list features):
- */
-  __pyx_r = __pyx_v_best_i;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_WriteUnraisable("ml.MultitronParameters._predict_best_class");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":435
- *       return best_i
- * 
- *    cdef _update(self, int goodClass, int badClass, list features):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       for f in features:
- */
-
-static  PyObject *__pyx_f_2ml_19MultitronParameters__update(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, int __pyx_v_goodClass, int __pyx_v_badClass, PyObject *__pyx_v_features) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  __Pyx_RefNannySetupContext("_update");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":437
- *    cdef _update(self, int goodClass, int badClass, list features):
- *       cdef MulticlassParamData p
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_1 = 0; __pyx_t_2 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_2);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 437; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_2)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":438
- *       cdef MulticlassParamData p
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *          except KeyError:
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":439
- *       for f in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 439; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":440
- *          try:
- *             p = self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        __Pyx_AddTraceback("ml.MultitronParameters._update");
-        if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_5, &__pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 440; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GOTREF(__pyx_t_6);
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":441
- *             p = self.W[f]
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)             # <<<<<<<<<<<<<<
- *             self.W[f] = p
- * 
- */
-        __pyx_t_7 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_8);
-        PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_7);
-        __Pyx_GIVEREF(__pyx_t_7);
-        __pyx_t_7 = 0;
-        __pyx_t_7 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_MulticlassParamData)), __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 441; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_7);
-        __pyx_t_7 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":442
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p             # <<<<<<<<<<<<<<
- * 
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]
- */
-        if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f, ((PyObject *)__pyx_v_p)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 442; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        goto __pyx_L6_exception_handled;
-      }
-      __pyx_L7_except_error:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":444
- *             self.W[f] = p
- * 
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]             # <<<<<<<<<<<<<<
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]
- *          p.w[badClass]-=1.0
- */
-    (__pyx_v_p->acc[__pyx_v_badClass]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_badClass])) * (__pyx_v_p->w[__pyx_v_badClass]));
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":445
- * 
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]             # <<<<<<<<<<<<<<
- *          p.w[badClass]-=1.0
- *          p.w[goodClass]+=1.0
- */
-    (__pyx_v_p->acc[__pyx_v_goodClass]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_goodClass])) * (__pyx_v_p->w[__pyx_v_goodClass]));
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":446
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]
- *          p.w[badClass]-=1.0             # <<<<<<<<<<<<<<
- *          p.w[goodClass]+=1.0
- *          p.lastUpd[badClass]=self.now
- */
-    (__pyx_v_p->w[__pyx_v_badClass]) -= 1.0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":447
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]
- *          p.w[badClass]-=1.0
- *          p.w[goodClass]+=1.0             # <<<<<<<<<<<<<<
- *          p.lastUpd[badClass]=self.now
- *          p.lastUpd[goodClass]=self.now
- */
-    (__pyx_v_p->w[__pyx_v_goodClass]) += 1.0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":448
- *          p.w[badClass]-=1.0
- *          p.w[goodClass]+=1.0
- *          p.lastUpd[badClass]=self.now             # <<<<<<<<<<<<<<
- *          p.lastUpd[goodClass]=self.now
- * 
- */
-    (__pyx_v_p->lastUpd[__pyx_v_badClass]) = __pyx_v_self->now;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":449
- *          p.w[goodClass]+=1.0
- *          p.lastUpd[badClass]=self.now
- *          p.lastUpd[goodClass]=self.now             # <<<<<<<<<<<<<<
- * 
- *    cdef _update_r(self, int goodClass, int badClass, list features):
- */
-    (__pyx_v_p->lastUpd[__pyx_v_goodClass]) = __pyx_v_self->now;
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("ml.MultitronParameters._update");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":451
- *          p.lastUpd[goodClass]=self.now
- * 
- *    cdef _update_r(self, int goodClass, int badClass, list features):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       for f,v in features:
- */
-
-static  PyObject *__pyx_f_2ml_19MultitronParameters__update_r(struct __pyx_obj_2ml_MultitronParameters *__pyx_v_self, int __pyx_v_goodClass, int __pyx_v_badClass, PyObject *__pyx_v_features) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_v;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  double __pyx_t_9;
-  __Pyx_RefNannySetupContext("_update_r");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_v = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":453
- *    cdef _update_r(self, int goodClass, int badClass, list features):
- *       cdef MulticlassParamData p
- *       for f,v in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_1 = 0; __pyx_t_2 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_2);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_2)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
-    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
-      PyObject* tuple = __pyx_t_3;
-      __pyx_t_4 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_4);
-      __pyx_t_5 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_4;
-      __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_v_v);
-      __pyx_v_v = __pyx_t_5;
-      __pyx_t_5 = 0;
-    } else {
-      __pyx_t_6 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_4 = __Pyx_UnpackItem(__pyx_t_6, 0); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = __Pyx_UnpackItem(__pyx_t_6, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      if (__Pyx_EndUnpack(__pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 453; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_4;
-      __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_v_v);
-      __pyx_v_v = __pyx_t_5;
-      __pyx_t_5 = 0;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":454
- *       cdef MulticlassParamData p
- *       for f,v in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *          except KeyError:
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":455
- *       for f,v in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 455; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":456
- *          try:
- *             p = self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p
- */
-      __pyx_t_7 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_7) {
-        __Pyx_AddTraceback("ml.MultitronParameters._update_r");
-        if (__Pyx_GetException(&__pyx_t_3, &__pyx_t_5, &__pyx_t_4) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 456; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GOTREF(__pyx_t_4);
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":457
- *             p = self.W[f]
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)             # <<<<<<<<<<<<<<
- *             self.W[f] = p
- * 
- */
-        __pyx_t_6 = PyInt_FromLong(__pyx_v_self->nclasses); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_8);
-        PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_6);
-        __pyx_t_6 = 0;
-        __pyx_t_6 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_MulticlassParamData)), __pyx_t_8, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 457; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_6);
-        __pyx_t_6 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":458
- *          except KeyError:
- *             p = MulticlassParamData(self.nclasses)
- *             self.W[f] = p             # <<<<<<<<<<<<<<
- * 
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]
- */
-        if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f, ((PyObject *)__pyx_v_p)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 458; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        goto __pyx_L6_exception_handled;
-      }
-      __pyx_L7_except_error:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":460
- *             self.W[f] = p
- * 
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]             # <<<<<<<<<<<<<<
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]
- *          p.w[badClass]-=v
- */
-    (__pyx_v_p->acc[__pyx_v_badClass]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_badClass])) * (__pyx_v_p->w[__pyx_v_badClass]));
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":461
- * 
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]             # <<<<<<<<<<<<<<
- *          p.w[badClass]-=v
- *          p.w[goodClass]+=v
- */
-    (__pyx_v_p->acc[__pyx_v_goodClass]) += ((__pyx_v_self->now - (__pyx_v_p->lastUpd[__pyx_v_goodClass])) * (__pyx_v_p->w[__pyx_v_goodClass]));
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":462
- *          p.acc[badClass]+=(self.now-p.lastUpd[badClass])*p.w[badClass]
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]
- *          p.w[badClass]-=v             # <<<<<<<<<<<<<<
- *          p.w[goodClass]+=v
- *          p.lastUpd[badClass]=self.now
- */
-    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_v_v); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 462; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    (__pyx_v_p->w[__pyx_v_badClass]) -= __pyx_t_9;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":463
- *          p.acc[goodClass]+=(self.now-p.lastUpd[goodClass])*p.w[goodClass]
- *          p.w[badClass]-=v
- *          p.w[goodClass]+=v             # <<<<<<<<<<<<<<
- *          p.lastUpd[badClass]=self.now
- *          p.lastUpd[goodClass]=self.now
- */
-    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_v_v); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 463; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    (__pyx_v_p->w[__pyx_v_goodClass]) += __pyx_t_9;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":464
- *          p.w[badClass]-=v
- *          p.w[goodClass]+=v
- *          p.lastUpd[badClass]=self.now             # <<<<<<<<<<<<<<
- *          p.lastUpd[goodClass]=self.now
- * 
- */
-    (__pyx_v_p->lastUpd[__pyx_v_badClass]) = __pyx_v_self->now;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":465
- *          p.w[goodClass]+=v
- *          p.lastUpd[badClass]=self.now
- *          p.lastUpd[goodClass]=self.now             # <<<<<<<<<<<<<<
- * 
- *    def finalize(self):
- */
-    (__pyx_v_p->lastUpd[__pyx_v_goodClass]) = __pyx_v_self->now;
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("ml.MultitronParameters._update_r");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_v);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":467
- *          p.lastUpd[goodClass]=self.now
- * 
- *    def finalize(self):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       # average
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_finalize(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_finalize(PyObject *__pyx_v_self, PyObject *unused) {
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_c;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  double __pyx_t_9;
-  __Pyx_RefNannySetupContext("finalize");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":470
- *       cdef MulticlassParamData p
- *       # average
- *       for f in self.W.keys():             # <<<<<<<<<<<<<<
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]
- */
-  __pyx_t_2 = PyDict_Keys(((PyObject *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_1 = 0; __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
-  } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else {
-      __pyx_t_2 = PyIter_Next(__pyx_t_3);
-      if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 470; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_2;
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":471
- *       # average
- *       for f in self.W.keys():
- *          for c in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *             p.acc[c]+=(self.now-p.lastUpd[c])*p.w[c]
- */
-    __pyx_t_2 = PyInt_FromLong(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->nclasses); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_2);
-    __Pyx_GIVEREF(__pyx_t_2);
-    __pyx_t_2 = 0;
-    __pyx_t_2 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-      __pyx_t_4 = 0; __pyx_t_5 = __pyx_t_2; __Pyx_INCREF(__pyx_t_5);
-    } else {
-      __pyx_t_4 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    for (;;) {
-      if (likely(PyList_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_5)) break;
-        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-      } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
-        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-      } else {
-        __pyx_t_2 = PyIter_Next(__pyx_t_5);
-        if (!__pyx_t_2) {
-          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 471; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_2);
-      }
-      __Pyx_DECREF(__pyx_v_c);
-      __pyx_v_c = __pyx_t_2;
-      __pyx_t_2 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":472
- *       for f in self.W.keys():
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *             p.acc[c]+=(self.now-p.lastUpd[c])*p.w[c]
- *             p.w[c] = p.acc[c] / self.now
- */
-      __pyx_t_2 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W), __pyx_v_f); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 472; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(((PyObject *)__pyx_v_p));
-      __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_2);
-      __pyx_t_2 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":473
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]
- *             p.acc[c]+=(self.now-p.lastUpd[c])*p.w[c]             # <<<<<<<<<<<<<<
- *             p.w[c] = p.acc[c] / self.now
- * 
- */
-      __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 473; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      (__pyx_v_p->acc[__pyx_t_8]) += ((((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->now - (__pyx_v_p->lastUpd[__pyx_t_6])) * (__pyx_v_p->w[__pyx_t_7]));
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":474
- *             p = self.W[f]
- *             p.acc[c]+=(self.now-p.lastUpd[c])*p.w[c]
- *             p.w[c] = p.acc[c] / self.now             # <<<<<<<<<<<<<<
- * 
- *    def dump(self, out=sys.stdout):
- */
-      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_9 = (__pyx_v_p->acc[__pyx_t_7]);
-      if (unlikely(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->now == 0)) {
-        PyErr_Format(PyExc_ZeroDivisionError, "float division");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 474; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      (__pyx_v_p->w[__pyx_t_7]) = (__pyx_t_9 / ((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->now);
-    }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("ml.MultitronParameters.finalize");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":476
- *             p.w[c] = p.acc[c] / self.now
- * 
- *    def dump(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       for f in self.W.keys():
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_dump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_dump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_out = 0;
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_c;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__out,0};
-  __Pyx_RefNannySetupContext("dump");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    values[0] = __pyx_k_7;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__out);
-        if (unlikely(value)) { values[0] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "dump") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_out = values[0];
-  } else {
-    __pyx_v_out = __pyx_k_7;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_out = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("dump", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.dump");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_out);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":478
- *    def dump(self, out=sys.stdout):
- *       cdef MulticlassParamData p
- *       for f in self.W.keys():             # <<<<<<<<<<<<<<
- *          out.write("%s" % f)
- *          for c in xrange(self.nclasses):
- */
-  __pyx_t_2 = PyDict_Keys(((PyObject *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_1 = 0; __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
-  } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else {
-      __pyx_t_2 = PyIter_Next(__pyx_t_3);
-      if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 478; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_2;
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":479
- *       cdef MulticlassParamData p
- *       for f in self.W.keys():
- *          out.write("%s" % f)             # <<<<<<<<<<<<<<
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]
- */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_8), __pyx_v_f); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 479; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":480
- *       for f in self.W.keys():
- *          out.write("%s" % f)
- *          for c in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *             out.write(" %s" % p.w[c])
- */
-    __pyx_t_4 = PyInt_FromLong(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->nclasses); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (PyList_CheckExact(__pyx_t_4) || PyTuple_CheckExact(__pyx_t_4)) {
-      __pyx_t_6 = 0; __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5);
-    } else {
-      __pyx_t_6 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    for (;;) {
-      if (likely(PyList_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_5)) break;
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
-      } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
-      } else {
-        __pyx_t_4 = PyIter_Next(__pyx_t_5);
-        if (!__pyx_t_4) {
-          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 480; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_4);
-      }
-      __Pyx_DECREF(__pyx_v_c);
-      __pyx_v_c = __pyx_t_4;
-      __pyx_t_4 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":481
- *          out.write("%s" % f)
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *             out.write(" %s" % p.w[c])
- *          out.write("\n")
- */
-      __pyx_t_4 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W), __pyx_v_f); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 481; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 481; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(((PyObject *)__pyx_v_p));
-      __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_4);
-      __pyx_t_4 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":482
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]
- *             out.write(" %s" % p.w[c])             # <<<<<<<<<<<<<<
- *          out.write("\n")
- * 
- */
-      __pyx_t_4 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_2 = PyFloat_FromDouble((__pyx_v_p->w[__pyx_t_7])); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_8 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_t_2); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_8);
-      __Pyx_GIVEREF(__pyx_t_8);
-      __pyx_t_8 = 0;
-      __pyx_t_8 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 482; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":483
- *             p = self.W[f]
- *             out.write(" %s" % p.w[c])
- *          out.write("\n")             # <<<<<<<<<<<<<<
- * 
- *    def dump_fin(self,out=sys.stdout):
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 483; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_8 = PyTuple_New(1); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 483; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_8);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_10));
-    PyTuple_SET_ITEM(__pyx_t_8, 0, ((PyObject *)__pyx_kp_s_10));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
-    __pyx_t_2 = PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 483; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("ml.MultitronParameters.dump");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_out);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":485
- *          out.write("\n")
- * 
- *    def dump_fin(self,out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       # write the average
- */
-
-static PyObject *__pyx_pf_2ml_19MultitronParameters_dump_fin(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_19MultitronParameters_dump_fin(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_out = 0;
-  struct __pyx_obj_2ml_MulticlassParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_c;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  Py_ssize_t __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  double __pyx_t_10;
-  PyObject *__pyx_t_11 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__out,0};
-  __Pyx_RefNannySetupContext("dump_fin");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    values[0] = __pyx_k_11;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__out);
-        if (unlikely(value)) { values[0] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "dump_fin") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 485; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_out = values[0];
-  } else {
-    __pyx_v_out = __pyx_k_11;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_out = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("dump_fin", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 485; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultitronParameters.dump_fin");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_out);
-  __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_c = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":488
- *       cdef MulticlassParamData p
- *       # write the average
- *       for f in self.W.keys():             # <<<<<<<<<<<<<<
- *          out.write("%s" % f)
- *          for c in xrange(self.nclasses):
- */
-  __pyx_t_2 = PyDict_Keys(((PyObject *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_1 = 0; __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
-  } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else {
-      __pyx_t_2 = PyIter_Next(__pyx_t_3);
-      if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 488; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_2;
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":489
- *       # write the average
- *       for f in self.W.keys():
- *          out.write("%s" % f)             # <<<<<<<<<<<<<<
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]
- */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_8), __pyx_v_f); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 489; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":490
- *       for f in self.W.keys():
- *          out.write("%s" % f)
- *          for c in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *             out.write(" %s " % ((p.acc[c]+((self.now-p.lastUpd[c])*p.w[c])) / self.now))
- */
-    __pyx_t_4 = PyInt_FromLong(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->nclasses); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyTuple_New(1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
-    __Pyx_GIVEREF(__pyx_t_4);
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (PyList_CheckExact(__pyx_t_4) || PyTuple_CheckExact(__pyx_t_4)) {
-      __pyx_t_6 = 0; __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5);
-    } else {
-      __pyx_t_6 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    for (;;) {
-      if (likely(PyList_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_5)) break;
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
-      } else if (likely(PyTuple_CheckExact(__pyx_t_5))) {
-        if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++;
-      } else {
-        __pyx_t_4 = PyIter_Next(__pyx_t_5);
-        if (!__pyx_t_4) {
-          if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 490; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_4);
-      }
-      __Pyx_DECREF(__pyx_v_c);
-      __pyx_v_c = __pyx_t_4;
-      __pyx_t_4 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":491
- *          out.write("%s" % f)
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *             out.write(" %s " % ((p.acc[c]+((self.now-p.lastUpd[c])*p.w[c])) / self.now))
- *          out.write("\n")
- */
-      __pyx_t_4 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->W), __pyx_v_f); if (!__pyx_t_4) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_2ml_MulticlassParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 491; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(((PyObject *)__pyx_v_p));
-      __pyx_v_p = ((struct __pyx_obj_2ml_MulticlassParamData *)__pyx_t_4);
-      __pyx_t_4 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":492
- *          for c in xrange(self.nclasses):
- *             p = self.W[f]
- *             out.write(" %s " % ((p.acc[c]+((self.now-p.lastUpd[c])*p.w[c])) / self.now))             # <<<<<<<<<<<<<<
- *          out.write("\n")
- * 
- */
-      __pyx_t_4 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_9 = __Pyx_PyIndex_AsSsize_t(__pyx_v_c); if (unlikely((__pyx_t_9 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_10 = ((__pyx_v_p->acc[__pyx_t_7]) + ((((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->now - (__pyx_v_p->lastUpd[__pyx_t_8])) * (__pyx_v_p->w[__pyx_t_9])));
-      if (unlikely(((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->now == 0)) {
-        PyErr_Format(PyExc_ZeroDivisionError, "float division");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      __pyx_t_2 = PyFloat_FromDouble((__pyx_t_10 / ((struct __pyx_obj_2ml_MultitronParameters *)__pyx_v_self)->now)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_11 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_12), __pyx_t_2); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_11);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_11);
-      __Pyx_GIVEREF(__pyx_t_11);
-      __pyx_t_11 = 0;
-      __pyx_t_11 = PyObject_Call(__pyx_t_4, __pyx_t_2, NULL); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 492; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_11);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":493
- *             p = self.W[f]
- *             out.write(" %s " % ((p.acc[c]+((self.now-p.lastUpd[c])*p.w[c])) / self.now))
- *          out.write("\n")             # <<<<<<<<<<<<<<
- * 
- * ##################
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_11 = PyTuple_New(1); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_11);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_10));
-    PyTuple_SET_ITEM(__pyx_t_11, 0, ((PyObject *)__pyx_kp_s_10));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
-    __pyx_t_2 = PyObject_Call(__pyx_t_5, __pyx_t_11, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 493; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_AddTraceback("ml.MultitronParameters.dump_fin");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_c);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_out);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":501
- *       double w
- *       int lastUpd
- *    def __init__(self):             # <<<<<<<<<<<<<<
- *       self.acc=0
- *       self.w=0
- */
-
-static int __pyx_pf_2ml_9ParamData___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_9ParamData___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":502
- *       int lastUpd
- *    def __init__(self):
- *       self.acc=0             # <<<<<<<<<<<<<<
- *       self.w=0
- *       self.lastUpd=0
- */
-  ((struct __pyx_obj_2ml_ParamData *)__pyx_v_self)->acc = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":503
- *    def __init__(self):
- *       self.acc=0
- *       self.w=0             # <<<<<<<<<<<<<<
- *       self.lastUpd=0
- * 
- */
-  ((struct __pyx_obj_2ml_ParamData *)__pyx_v_self)->w = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":504
- *       self.acc=0
- *       self.w=0
- *       self.lastUpd=0             # <<<<<<<<<<<<<<
- * 
- * cdef class PerceptronParameters:
- */
-  ((struct __pyx_obj_2ml_ParamData *)__pyx_v_self)->lastUpd = 0;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":511
- *       dict W
- * 
- *    def __init__(self):             # <<<<<<<<<<<<<<
- *       self.now = 0
- *       self.W = {}
- */
-
-static int __pyx_pf_2ml_20PerceptronParameters___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_20PerceptronParameters___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":512
- * 
- *    def __init__(self):
- *       self.now = 0             # <<<<<<<<<<<<<<
- *       self.W = {}
- * 
- */
-  ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":513
- *    def __init__(self):
- *       self.now = 0
- *       self.W = {}             # <<<<<<<<<<<<<<
- * 
- *    def tick(self):
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 513; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W));
-  ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.PerceptronParameters.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":515
- *       self.W = {}
- * 
- *    def tick(self):             # <<<<<<<<<<<<<<
- *       self.now+=1
- * 
- */
-
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_tick(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_tick(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("tick");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":516
- * 
- *    def tick(self):
- *       self.now+=1             # <<<<<<<<<<<<<<
- * 
- *    def score(self,features):
- */
-  ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now += 1;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":518
- *       self.now+=1
- * 
- *    def score(self,features):             # <<<<<<<<<<<<<<
- *       return self._score(features)
- * 
- */
-
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_score(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_score(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("score");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":519
- * 
- *    def score(self,features):
- *       return self._score(features)             # <<<<<<<<<<<<<<
- * 
- *    cdef _score(self, features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_PerceptronParameters *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->__pyx_vtab)->_score(((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self), __pyx_v_features); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 519; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.PerceptronParameters.score");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":521
- *       return self._score(features)
- * 
- *    cdef _score(self, features):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       cdef double score=0
- */
-
-static  PyObject *__pyx_f_2ml_20PerceptronParameters__score(struct __pyx_obj_2ml_PerceptronParameters *__pyx_v_self, PyObject *__pyx_v_features) {
-  struct __pyx_obj_2ml_ParamData *__pyx_v_p;
-  double __pyx_v_score;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  __Pyx_RefNannySetupContext("_score");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":523
- *    cdef _score(self, features):
- *       cdef ParamData p
- *       cdef double score=0             # <<<<<<<<<<<<<<
- *       for f in features:
- *          try:
- */
-  __pyx_v_score = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":524
- *       cdef ParamData p
- *       cdef double score=0
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (PyList_CheckExact(__pyx_v_features) || PyTuple_CheckExact(__pyx_v_features)) {
-    __pyx_t_1 = 0; __pyx_t_2 = __pyx_v_features; __Pyx_INCREF(__pyx_t_2);
-  } else {
-    __pyx_t_1 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_v_features); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 524; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-  }
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_2))) {
-      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
-      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
-    } else {
-      __pyx_t_3 = PyIter_Next(__pyx_t_2);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 524; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":525
- *       cdef double score=0
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *             score += p.w
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":526
- *       for f in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *             score += p.w
- *          except KeyError:
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml_ParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 526; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)__pyx_t_3);
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":527
- *          try:
- *             p = self.W[f]
- *             score += p.w             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             pass
- */
-        __pyx_v_score += __pyx_v_p->w;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":528
- *             p = self.W[f]
- *             score += p.w
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             pass
- *       return score
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L6_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":530
- *          except KeyError:
- *             pass
- *       return score             # <<<<<<<<<<<<<<
- * 
- *    cpdef updateFeatures(self, features, double amount):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_score); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 530; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.PerceptronParameters._score");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":532
- *       return score
- * 
- *    cpdef updateFeatures(self, features, double amount):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       cdef str f
- */
-
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_updateFeatures(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_20PerceptronParameters_updateFeatures(struct __pyx_obj_2ml_PerceptronParameters *__pyx_v_self, PyObject *__pyx_v_features, double __pyx_v_amount, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_ParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  int __pyx_t_5;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  __Pyx_RefNannySetupContext("updateFeatures");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__updateFeatures); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_20PerceptronParameters_updateFeatures)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_v_features);
-      PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_features);
-      __Pyx_GIVEREF(__pyx_v_features);
-      PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      __pyx_t_2 = 0;
-      __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":535
- *       cdef ParamData p
- *       cdef str f
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             p = self.W[f]
- */
-  if (PyList_CheckExact(__pyx_v_features) || PyTuple_CheckExact(__pyx_v_features)) {
-    __pyx_t_4 = 0; __pyx_t_1 = __pyx_v_features; __Pyx_INCREF(__pyx_t_1);
-  } else {
-    __pyx_t_4 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_features); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-    } else {
-      __pyx_t_2 = PyIter_Next(__pyx_t_1);
-      if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    if (!(likely(PyString_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_2)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_f));
-    __pyx_v_f = ((PyObject *)__pyx_t_2);
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":536
- *       cdef str f
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             p = self.W[f]
- *          except KeyError:
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":537
- *       for f in features:
- *          try:
- *             p = self.W[f]             # <<<<<<<<<<<<<<
- *          except KeyError:
- *             p = ParamData()
- */
-        __pyx_t_2 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f)); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_2ml_ParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 537; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)__pyx_t_2);
-        __pyx_t_2 = 0;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":538
- *          try:
- *             p = self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             p = ParamData()
- *             self.W[f] = p
- */
-      __pyx_t_5 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_5) {
-        __Pyx_AddTraceback("ml.PerceptronParameters.updateFeatures");
-        if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_3, &__pyx_t_6) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 538; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_GOTREF(__pyx_t_6);
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":539
- *             p = self.W[f]
- *          except KeyError:
- *             p = ParamData()             # <<<<<<<<<<<<<<
- *             self.W[f] = p
- *          p.acc+=(self.now-p.lastUpd)*p.w
- */
-        __pyx_t_7 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_ParamData)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 539; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_GOTREF(__pyx_t_7);
-        __Pyx_DECREF(((PyObject *)__pyx_v_p));
-        __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)__pyx_t_7);
-        __pyx_t_7 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":540
- *          except KeyError:
- *             p = ParamData()
- *             self.W[f] = p             # <<<<<<<<<<<<<<
- *          p.acc+=(self.now-p.lastUpd)*p.w
- *          p.w+=amount
- */
-        if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f), ((PyObject *)__pyx_v_p)) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 540; __pyx_clineno = __LINE__; goto __pyx_L7_except_error;}
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        goto __pyx_L6_exception_handled;
-      }
-      __pyx_L7_except_error:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":541
- *             p = ParamData()
- *             self.W[f] = p
- *          p.acc+=(self.now-p.lastUpd)*p.w             # <<<<<<<<<<<<<<
- *          p.w+=amount
- *          p.lastUpd=self.now
- */
-    __pyx_v_p->acc += ((__pyx_v_self->now - __pyx_v_p->lastUpd) * __pyx_v_p->w);
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":542
- *             self.W[f] = p
- *          p.acc+=(self.now-p.lastUpd)*p.w
- *          p.w+=amount             # <<<<<<<<<<<<<<
- *          p.lastUpd=self.now
- * 
- */
-    __pyx_v_p->w += __pyx_v_amount;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":543
- *          p.acc+=(self.now-p.lastUpd)*p.w
- *          p.w+=amount
- *          p.lastUpd=self.now             # <<<<<<<<<<<<<<
- * 
- *    def finalize(self):
- */
-    __pyx_v_p->lastUpd = __pyx_v_self->now;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("ml.PerceptronParameters.updateFeatures");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":532
- *       return score
- * 
- *    cpdef updateFeatures(self, features, double amount):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       cdef str f
- */
-
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_updateFeatures(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_updateFeatures(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_features = 0;
-  double __pyx_v_amount;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__features,&__pyx_n_s__amount,0};
-  __Pyx_RefNannySetupContext("updateFeatures");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[2] = {0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__features);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__amount);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("updateFeatures", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "updateFeatures") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_features = values[0];
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_features = PyTuple_GET_ITEM(__pyx_args, 0);
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("updateFeatures", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.PerceptronParameters.updateFeatures");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_PerceptronParameters *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->__pyx_vtab)->updateFeatures(((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self), __pyx_v_features, __pyx_v_amount, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 532; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.PerceptronParameters.updateFeatures");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":545
- *          p.lastUpd=self.now
- * 
- *    def finalize(self):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       # average
- */
-
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_finalize(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_finalize(PyObject *__pyx_v_self, PyObject *unused) {
-  struct __pyx_obj_2ml_ParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("finalize");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":548
- *       cdef ParamData p
- *       # average
- *       for f in self.W.keys():             # <<<<<<<<<<<<<<
- *          p = self.W[f]
- *          p.acc+=(self.now-p.lastUpd)*p.w
- */
-  __pyx_t_2 = PyDict_Keys(((PyObject *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W)); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_1 = 0; __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
-  } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_3))) {
-      if (__pyx_t_1 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++;
-    } else {
-      __pyx_t_2 = PyIter_Next(__pyx_t_3);
-      if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 548; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = __pyx_t_2;
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":549
- *       # average
- *       for f in self.W.keys():
- *          p = self.W[f]             # <<<<<<<<<<<<<<
- *          p.acc+=(self.now-p.lastUpd)*p.w
- *          p.w = p.acc / self.now
- */
-    __pyx_t_2 = PyObject_GetItem(((PyObject *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W), __pyx_v_f); if (!__pyx_t_2) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_2ml_ParamData))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 549; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_p));
-    __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)__pyx_t_2);
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":550
- *       for f in self.W.keys():
- *          p = self.W[f]
- *          p.acc+=(self.now-p.lastUpd)*p.w             # <<<<<<<<<<<<<<
- *          p.w = p.acc / self.now
- * 
- */
-    __pyx_v_p->acc += ((((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now - __pyx_v_p->lastUpd) * __pyx_v_p->w);
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":551
- *          p = self.W[f]
- *          p.acc+=(self.now-p.lastUpd)*p.w
- *          p.w = p.acc / self.now             # <<<<<<<<<<<<<<
- * 
- *    def dump(self, out=sys.stdout):
- */
-    if (unlikely(((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now == 0)) {
-      PyErr_Format(PyExc_ZeroDivisionError, "float division");
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 551; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_v_p->w = (__pyx_v_p->acc / ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now);
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.PerceptronParameters.finalize");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":553
- *          p.w = p.acc / self.now
- * 
- *    def dump(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():
- */
-
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_dump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_dump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_out = 0;
-  struct __pyx_obj_2ml_ParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  void *__pyx_t_3;
-  void *__pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__out,0};
-  __Pyx_RefNannySetupContext("dump");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    values[0] = __pyx_k_13;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__out);
-        if (unlikely(value)) { values[0] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "dump") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_out = values[0];
-  } else {
-    __pyx_v_out = __pyx_k_13;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_out = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("dump", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.PerceptronParameters.dump");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_out);
-  __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":555
- *    def dump(self, out=sys.stdout):
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():             # <<<<<<<<<<<<<<
- *          out.write("%s" % f)
- *          out.write(" %s" % p.w)
- */
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W));
-  __Pyx_XDECREF(__pyx_t_1);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W);
-  __pyx_t_2 = 0;
-  while (1) {
-    if (!PyDict_Next(__pyx_t_1, (&__pyx_t_2), ((PyObject **)(&__pyx_t_3)), ((PyObject **)(&__pyx_t_4)))) break;
-    __Pyx_INCREF(((PyObject *)__pyx_t_3));
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = ((PyObject *)__pyx_t_3);
-    if (!(likely(__Pyx_TypeTest(((PyObject *)__pyx_t_4), __pyx_ptype_2ml_ParamData)))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 555; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_INCREF(((PyObject *)((struct __pyx_obj_2ml_ParamData *)__pyx_t_4)));
-    __Pyx_DECREF(((PyObject *)__pyx_v_p));
-    __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)__pyx_t_4);
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":556
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():
- *          out.write("%s" % f)             # <<<<<<<<<<<<<<
- *          out.write(" %s" % p.w)
- *          out.write("\n")
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_8), __pyx_v_f); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_6);
-    __pyx_t_6 = 0;
-    __pyx_t_6 = PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":557
- *       for f,p in self.W.iteritems():
- *          out.write("%s" % f)
- *          out.write(" %s" % p.w)             # <<<<<<<<<<<<<<
- *          out.write("\n")
- * 
- */
-    __pyx_t_6 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyFloat_FromDouble(__pyx_v_p->w); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_9), __pyx_t_7); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_5);
-    __pyx_t_5 = 0;
-    __pyx_t_5 = PyObject_Call(__pyx_t_6, __pyx_t_7, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":558
- *          out.write("%s" % f)
- *          out.write(" %s" % p.w)
- *          out.write("\n")             # <<<<<<<<<<<<<<
- * 
- *    def dump_fin(self, out=sys.stdout):
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_10));
-    PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_kp_s_10));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
-    __pyx_t_6 = PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 558; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("ml.PerceptronParameters.dump");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_out);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":560
- *          out.write("\n")
- * 
- *    def dump_fin(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():
- */
-
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_dump_fin(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_20PerceptronParameters_dump_fin(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_out = 0;
-  struct __pyx_obj_2ml_ParamData *__pyx_v_p;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  void *__pyx_t_3;
-  void *__pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  double __pyx_t_8;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__out,0};
-  __Pyx_RefNannySetupContext("dump_fin");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    values[0] = __pyx_k_14;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__out);
-        if (unlikely(value)) { values[0] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "dump_fin") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_out = values[0];
-  } else {
-    __pyx_v_out = __pyx_k_14;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_out = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("dump_fin", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.PerceptronParameters.dump_fin");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_out);
-  __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":562
- *    def dump_fin(self, out=sys.stdout):
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():             # <<<<<<<<<<<<<<
- *          out.write("%s" % f)
- *          out.write(" %s " % ((p.acc+((self.now-p.lastUpd)*p.w)) / self.now))
- */
-  __Pyx_INCREF(((PyObject *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W));
-  __Pyx_XDECREF(__pyx_t_1);
-  __pyx_t_1 = ((PyObject *)((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->W);
-  __pyx_t_2 = 0;
-  while (1) {
-    if (!PyDict_Next(__pyx_t_1, (&__pyx_t_2), ((PyObject **)(&__pyx_t_3)), ((PyObject **)(&__pyx_t_4)))) break;
-    __Pyx_INCREF(((PyObject *)__pyx_t_3));
-    __Pyx_DECREF(__pyx_v_f);
-    __pyx_v_f = ((PyObject *)__pyx_t_3);
-    if (!(likely(__Pyx_TypeTest(((PyObject *)__pyx_t_4), __pyx_ptype_2ml_ParamData)))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 562; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_INCREF(((PyObject *)((struct __pyx_obj_2ml_ParamData *)__pyx_t_4)));
-    __Pyx_DECREF(((PyObject *)__pyx_v_p));
-    __pyx_v_p = ((struct __pyx_obj_2ml_ParamData *)__pyx_t_4);
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":563
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():
- *          out.write("%s" % f)             # <<<<<<<<<<<<<<
- *          out.write(" %s " % ((p.acc+((self.now-p.lastUpd)*p.w)) / self.now))
- *          out.write("\n")
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_8), __pyx_v_f); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_6);
-    __Pyx_GIVEREF(__pyx_t_6);
-    __pyx_t_6 = 0;
-    __pyx_t_6 = PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 563; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":564
- *       for f,p in self.W.iteritems():
- *          out.write("%s" % f)
- *          out.write(" %s " % ((p.acc+((self.now-p.lastUpd)*p.w)) / self.now))             # <<<<<<<<<<<<<<
- *          out.write("\n")
- * 
- */
-    __pyx_t_6 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_8 = (__pyx_v_p->acc + ((((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now - __pyx_v_p->lastUpd) * __pyx_v_p->w));
-    if (unlikely(((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now == 0)) {
-      PyErr_Format(PyExc_ZeroDivisionError, "float division");
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_7 = PyFloat_FromDouble((__pyx_t_8 / ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_v_self)->now)); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_5 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_12), __pyx_t_7); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5);
-    __Pyx_GIVEREF(__pyx_t_5);
-    __pyx_t_5 = 0;
-    __pyx_t_5 = PyObject_Call(__pyx_t_6, __pyx_t_7, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 564; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":565
- *          out.write("%s" % f)
- *          out.write(" %s " % ((p.acc+((self.now-p.lastUpd)*p.w)) / self.now))
- *          out.write("\n")             # <<<<<<<<<<<<<<
- * 
- * cdef class _float:
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_7);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_10));
-    PyTuple_SET_ITEM(__pyx_t_7, 0, ((PyObject *)__pyx_kp_s_10));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
-    __pyx_t_6 = PyObject_Call(__pyx_t_5, __pyx_t_7, NULL); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 565; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("ml.PerceptronParameters.dump_fin");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_out);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":571
- *       float val
- * 
- * cdef _float makef(float f):             # <<<<<<<<<<<<<<
- *    cdef _float mf = _float.__new__(_float)
- *    mf.val = f
- */
-
-static  struct __pyx_obj_2ml__float *__pyx_f_2ml_makef(float __pyx_v_f) {
-  struct __pyx_obj_2ml__float *__pyx_v_mf = 0;
-  struct __pyx_obj_2ml__float *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("makef");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":572
- * 
- * cdef _float makef(float f):
- *    cdef _float mf = _float.__new__(_float)             # <<<<<<<<<<<<<<
- *    mf.val = f
- *    return mf
- */
-  __pyx_t_1 = __Pyx_tp_new(((PyObject*)__pyx_ptype_2ml__float)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_2ml__float))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 572; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_mf = ((struct __pyx_obj_2ml__float *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":573
- * cdef _float makef(float f):
- *    cdef _float mf = _float.__new__(_float)
- *    mf.val = f             # <<<<<<<<<<<<<<
- *    return mf
- * 
- */
-  __pyx_v_mf->val = __pyx_v_f;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":574
- *    cdef _float mf = _float.__new__(_float)
- *    mf.val = f
- *    return mf             # <<<<<<<<<<<<<<
- * 
- * cdef class LinearModel:
- */
-  __Pyx_XDECREF(((PyObject *)__pyx_r));
-  __Pyx_INCREF(((PyObject *)__pyx_v_mf));
-  __pyx_r = __pyx_v_mf;
-  goto __pyx_L0;
-
-  __pyx_r = ((struct __pyx_obj_2ml__float *)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.makef");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_mf);
-  __Pyx_XGIVEREF((PyObject *)__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":580
- *       dict W
- * 
- *    def __init__(self):             # <<<<<<<<<<<<<<
- *       self.W = {}
- * 
- */
-
-static int __pyx_pf_2ml_11LinearModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_11LinearModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":581
- * 
- *    def __init__(self):
- *       self.W = {}             # <<<<<<<<<<<<<<
- * 
- *    def __cinit__(self):
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->W);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->W));
-  ((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->W = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.LinearModel.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":583
- *       self.W = {}
- * 
- *    def __cinit__(self):             # <<<<<<<<<<<<<<
- *       self.W = {}
- * 
- */
-
-static int __pyx_pf_2ml_11LinearModel___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_11LinearModel___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__cinit__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":584
- * 
- *    def __cinit__(self):
- *       self.W = {}             # <<<<<<<<<<<<<<
- * 
- *    cpdef _load(self, fh):
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 584; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->W);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->W));
-  ((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->W = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.LinearModel.__cinit__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":586
- *       self.W = {}
- * 
- *    cpdef _load(self, fh):             # <<<<<<<<<<<<<<
- *       for line in fh:
- *          if not line.strip(): break
- */
-
-static PyObject *__pyx_pf_2ml_11LinearModel__load(PyObject *__pyx_v_self, PyObject *__pyx_v_fh); /*proto*/
-static  PyObject *__pyx_f_2ml_11LinearModel__load(struct __pyx_obj_2ml_LinearModel *__pyx_v_self, PyObject *__pyx_v_fh, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_line;
-  PyObject *__pyx_v_f;
-  PyObject *__pyx_v_w;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  double __pyx_t_9;
-  __Pyx_RefNannySetupContext("_load");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_fh);
-  __pyx_v_line = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_f = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_w = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s___load); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_11LinearModel__load)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(__pyx_v_fh);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_fh);
-      __Pyx_GIVEREF(__pyx_v_fh);
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":587
- * 
- *    cpdef _load(self, fh):
- *       for line in fh:             # <<<<<<<<<<<<<<
- *          if not line.strip(): break
- *          f,w = line.strip().split()
- */
-  if (PyList_CheckExact(__pyx_v_fh) || PyTuple_CheckExact(__pyx_v_fh)) {
-    __pyx_t_4 = 0; __pyx_t_1 = __pyx_v_fh; __Pyx_INCREF(__pyx_t_1);
-  } else {
-    __pyx_t_4 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_fh); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_4 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_4); __Pyx_INCREF(__pyx_t_3); __pyx_t_4++;
-    } else {
-      __pyx_t_3 = PyIter_Next(__pyx_t_1);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 587; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_v_line);
-    __pyx_v_line = __pyx_t_3;
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":588
- *    cpdef _load(self, fh):
- *       for line in fh:
- *          if not line.strip(): break             # <<<<<<<<<<<<<<
- *          f,w = line.strip().split()
- *          #self.W[f]=float(w)
- */
-    __pyx_t_3 = PyObject_GetAttr(__pyx_v_line, __pyx_n_s__strip); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PyObject_Call(__pyx_t_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely(__pyx_t_5 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 588; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_6 = (!__pyx_t_5);
-    if (__pyx_t_6) {
-      goto __pyx_L4_break;
-      goto __pyx_L5;
-    }
-    __pyx_L5:;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":589
- *       for line in fh:
- *          if not line.strip(): break
- *          f,w = line.strip().split()             # <<<<<<<<<<<<<<
- *          #self.W[f]=float(w)
- *          self.W[f]=makef(float(w))
- */
-    __pyx_t_2 = PyObject_GetAttr(__pyx_v_line, __pyx_n_s__strip); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__split); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (PyTuple_CheckExact(__pyx_t_3) && likely(PyTuple_GET_SIZE(__pyx_t_3) == 2)) {
-      PyObject* tuple = __pyx_t_3;
-      __pyx_t_2 = PyTuple_GET_ITEM(tuple, 0); __Pyx_INCREF(__pyx_t_2);
-      __pyx_t_7 = PyTuple_GET_ITEM(tuple, 1); __Pyx_INCREF(__pyx_t_7);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_v_w);
-      __pyx_v_w = __pyx_t_7;
-      __pyx_t_7 = 0;
-    } else {
-      __pyx_t_8 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_2 = __Pyx_UnpackItem(__pyx_t_8, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_7 = __Pyx_UnpackItem(__pyx_t_8, 1); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_7);
-      if (__Pyx_EndUnpack(__pyx_t_8) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 589; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __Pyx_DECREF(__pyx_v_f);
-      __pyx_v_f = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_v_w);
-      __pyx_v_w = __pyx_t_7;
-      __pyx_t_7 = 0;
-    }
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":591
- *          f,w = line.strip().split()
- *          #self.W[f]=float(w)
- *          self.W[f]=makef(float(w))             # <<<<<<<<<<<<<<
- *       return self
- * 
- */
-    __pyx_t_9 = __Pyx_PyObject_AsDouble(__pyx_v_w); if (unlikely(__pyx_t_9 == ((double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = ((PyObject *)__pyx_f_2ml_makef(__pyx_t_9)); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    if (PyDict_SetItem(((PyObject *)__pyx_v_self->W), __pyx_v_f, __pyx_t_3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 591; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __pyx_L4_break:;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":592
- *          #self.W[f]=float(w)
- *          self.W[f]=makef(float(w))
- *       return self             # <<<<<<<<<<<<<<
- * 
- *    @classmethod
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_self));
-  __pyx_r = ((PyObject *)__pyx_v_self);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("ml.LinearModel._load");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_line);
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF(__pyx_v_w);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_fh);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":586
- *       self.W = {}
- * 
- *    cpdef _load(self, fh):             # <<<<<<<<<<<<<<
- *       for line in fh:
- *          if not line.strip(): break
- */
-
-static PyObject *__pyx_pf_2ml_11LinearModel__load(PyObject *__pyx_v_self, PyObject *__pyx_v_fh); /*proto*/
-static PyObject *__pyx_pf_2ml_11LinearModel__load(PyObject *__pyx_v_self, PyObject *__pyx_v_fh) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("_load");
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_LinearModel *)((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->__pyx_vtab)->_load(((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self), __pyx_v_fh, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 586; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.LinearModel._load");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":595
- * 
- *    @classmethod
- *    def from_file(cls, fname):             # <<<<<<<<<<<<<<
- *       sys.stderr.write("loading model %s" % fname)
- *       o=cls()
- */
-
-static PyObject *__pyx_pf_2ml_11LinearModel_from_file(PyObject *__pyx_v_cls, PyObject *__pyx_v_fname); /*proto*/
-static PyObject *__pyx_pf_2ml_11LinearModel_from_file(PyObject *__pyx_v_cls, PyObject *__pyx_v_fname) {
-  PyObject *__pyx_v_o;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("from_file");
-  __pyx_v_o = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":596
- *    @classmethod
- *    def from_file(cls, fname):
- *       sys.stderr.write("loading model %s" % fname)             # <<<<<<<<<<<<<<
- *       o=cls()
- *       o._load(file(fname))
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__stderr); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_1), __pyx_v_fname); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 596; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":597
- *    def from_file(cls, fname):
- *       sys.stderr.write("loading model %s" % fname)
- *       o=cls()             # <<<<<<<<<<<<<<
- *       o._load(file(fname))
- *       sys.stderr.write(" done\n")
- */
-  __pyx_t_2 = PyObject_Call(__pyx_v_cls, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 597; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_v_o);
-  __pyx_v_o = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":598
- *       sys.stderr.write("loading model %s" % fname)
- *       o=cls()
- *       o._load(file(fname))             # <<<<<<<<<<<<<<
- *       sys.stderr.write(" done\n")
- *       return o
- */
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_o, __pyx_n_s___load); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_v_fname);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_fname);
-  __Pyx_GIVEREF(__pyx_v_fname);
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)&PyFile_Type)), __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 598; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":599
- *       o=cls()
- *       o._load(file(fname))
- *       sys.stderr.write(" done\n")             # <<<<<<<<<<<<<<
- *       return o
- * 
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__stderr); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_3, __pyx_n_s__write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(((PyObject *)__pyx_kp_s_4));
-  PyTuple_SET_ITEM(__pyx_t_3, 0, ((PyObject *)__pyx_kp_s_4));
-  __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_4));
-  __pyx_t_2 = PyObject_Call(__pyx_t_1, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 599; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":600
- *       o._load(file(fname))
- *       sys.stderr.write(" done\n")
- *       return o             # <<<<<<<<<<<<<<
- * 
- *    @classmethod
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_o);
-  __pyx_r = __pyx_v_o;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.LinearModel.from_file");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_o);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":603
- * 
- *    @classmethod
- *    def from_fh(cls, fh):             # <<<<<<<<<<<<<<
- *       o=cls()
- *       o._load(fh)
- */
-
-static PyObject *__pyx_pf_2ml_11LinearModel_from_fh(PyObject *__pyx_v_cls, PyObject *__pyx_v_fh); /*proto*/
-static PyObject *__pyx_pf_2ml_11LinearModel_from_fh(PyObject *__pyx_v_cls, PyObject *__pyx_v_fh) {
-  PyObject *__pyx_v_o;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("from_fh");
-  __pyx_v_o = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":604
- *    @classmethod
- *    def from_fh(cls, fh):
- *       o=cls()             # <<<<<<<<<<<<<<
- *       o._load(fh)
- *       return o
- */
-  __pyx_t_1 = PyObject_Call(__pyx_v_cls, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 604; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_o);
-  __pyx_v_o = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":605
- *    def from_fh(cls, fh):
- *       o=cls()
- *       o._load(fh)             # <<<<<<<<<<<<<<
- *       return o
- * 
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_o, __pyx_n_s___load); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 605; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 605; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_v_fh);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_fh);
-  __Pyx_GIVEREF(__pyx_v_fh);
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 605; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":606
- *       o=cls()
- *       o._load(fh)
- *       return o             # <<<<<<<<<<<<<<
- * 
- * 
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_o);
-  __pyx_r = __pyx_v_o;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.LinearModel.from_fh");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_o);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":609
- * 
- * 
- *    def score(self,features):             # <<<<<<<<<<<<<<
- *       return self._score(features)
- * 
- */
-
-static PyObject *__pyx_pf_2ml_11LinearModel_score(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_11LinearModel_score(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("score");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":610
- * 
- *    def score(self,features):
- *       return self._score(features)             # <<<<<<<<<<<<<<
- * 
- *    cdef double _score(self, list features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  if (!(likely(PyList_CheckExact(__pyx_v_features))||((__pyx_v_features) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_v_features)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_vtabstruct_2ml_LinearModel *)((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self)->__pyx_vtab)->_score(((struct __pyx_obj_2ml_LinearModel *)__pyx_v_self), ((PyObject *)__pyx_v_features))); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 610; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.LinearModel.score");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":612
- *       return self._score(features)
- * 
- *    cdef double _score(self, list features):             # <<<<<<<<<<<<<<
- *       cdef double score=0
- *       cdef str f
- */
-
-static  double __pyx_f_2ml_11LinearModel__score(struct __pyx_obj_2ml_LinearModel *__pyx_v_self, PyObject *__pyx_v_features) {
-  double __pyx_v_score;
-  PyObject *__pyx_v_f;
-  struct __pyx_obj_2ml__float *__pyx_v_v;
-  double __pyx_r;
-  Py_ssize_t __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  __Pyx_RefNannySetupContext("_score");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_f = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_v = ((struct __pyx_obj_2ml__float *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":613
- * 
- *    cdef double _score(self, list features):
- *       cdef double score=0             # <<<<<<<<<<<<<<
- *       cdef str f
- *       cdef _float v
- */
-  __pyx_v_score = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":616
- *       cdef str f
- *       cdef _float v
- *       for f in features:             # <<<<<<<<<<<<<<
- *          try:
- *             v = self.W[f]
- */
-  if (likely(((PyObject *)__pyx_v_features) != Py_None)) {
-    __pyx_t_1 = 0; __pyx_t_2 = ((PyObject *)__pyx_v_features); __Pyx_INCREF(__pyx_t_2);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_1 >= PyList_GET_SIZE(__pyx_t_2)) break;
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++;
-    if (!(likely(PyString_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected str, got %.200s", Py_TYPE(__pyx_t_3)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 616; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_f));
-    __pyx_v_f = ((PyObject *)__pyx_t_3);
-    __pyx_t_3 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":617
- *       cdef _float v
- *       for f in features:
- *          try:             # <<<<<<<<<<<<<<
- *             v = self.W[f]
- *             score += v.val
- */
-    {
-      PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-      __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-      __Pyx_XGOTREF(__pyx_save_exc_type);
-      __Pyx_XGOTREF(__pyx_save_exc_value);
-      __Pyx_XGOTREF(__pyx_save_exc_tb);
-      /*try:*/ {
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":618
- *       for f in features:
- *          try:
- *             v = self.W[f]             # <<<<<<<<<<<<<<
- *             score += v.val
- *             #score += self.W[f]
- */
-        __pyx_t_3 = PyObject_GetItem(((PyObject *)__pyx_v_self->W), ((PyObject *)__pyx_v_f)); if (!__pyx_t_3) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 618; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_GOTREF(__pyx_t_3);
-        if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_2ml__float))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 618; __pyx_clineno = __LINE__; goto __pyx_L5_error;}
-        __Pyx_DECREF(((PyObject *)__pyx_v_v));
-        __pyx_v_v = ((struct __pyx_obj_2ml__float *)__pyx_t_3);
-        __pyx_t_3 = 0;
-
-        /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":619
- *          try:
- *             v = self.W[f]
- *             score += v.val             # <<<<<<<<<<<<<<
- *             #score += self.W[f]
- *          except KeyError:
- */
-        __pyx_v_score += __pyx_v_v->val;
-      }
-      __Pyx_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-      __Pyx_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-      __Pyx_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-      goto __pyx_L12_try_end;
-      __pyx_L5_error:;
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-      /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":621
- *             score += v.val
- *             #score += self.W[f]
- *          except KeyError:             # <<<<<<<<<<<<<<
- *             pass
- *       return score
- */
-      __pyx_t_4 = PyErr_ExceptionMatches(__pyx_builtin_KeyError);
-      if (__pyx_t_4) {
-        PyErr_Restore(0,0,0);
-        goto __pyx_L6_exception_handled;
-      }
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      goto __pyx_L1_error;
-      __pyx_L6_exception_handled:;
-      __Pyx_XGIVEREF(__pyx_save_exc_type);
-      __Pyx_XGIVEREF(__pyx_save_exc_value);
-      __Pyx_XGIVEREF(__pyx_save_exc_tb);
-      __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-      __pyx_L12_try_end:;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":623
- *          except KeyError:
- *             pass
- *       return score             # <<<<<<<<<<<<<<
- * 
- * #}}}
- */
-  __pyx_r = __pyx_v_score;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_WriteUnraisable("ml.LinearModel._score");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_f);
-  __Pyx_DECREF((PyObject *)__pyx_v_v);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":629
- * 
- * cdef class MultipleVectorsMulticlassModel: #{{{
- *    def __init__(self):pass             # <<<<<<<<<<<<<<
- *    def get_scores(self, features):
- *       """
- */
-
-static int __pyx_pf_2ml_30MultipleVectorsMulticlassModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_30MultipleVectorsMulticlassModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  __pyx_r = 0;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":630
- * cdef class MultipleVectorsMulticlassModel: #{{{
- *    def __init__(self):pass
- *    def get_scores(self, features):             # <<<<<<<<<<<<<<
- *       """
- *       just an "interface"
- */
-
-static PyObject *__pyx_pf_2ml_30MultipleVectorsMulticlassModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static char __pyx_doc_2ml_30MultipleVectorsMulticlassModel_get_scores[] = "\n      just an \"interface\" \n\n      features: a list of feature vectors, one per class\n      ";
-static PyObject *__pyx_pf_2ml_30MultipleVectorsMulticlassModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannySetupContext("get_scores");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":636
- *       features: a list of feature vectors, one per class
- *       """
- *       raise "Not Implemented"             # <<<<<<<<<<<<<<
- * #}}}
- * 
- */
-  __Pyx_Raise(((PyObject *)__pyx_kp_s_15), 0, 0);
-  {__pyx_filename = __pyx_f[0]; __pyx_lineno = 636; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassModel.get_scores");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":644
- *       int    nclasses
- * 
- *    def __init__(self, nclasses):             # <<<<<<<<<<<<<<
- *       self.nclasses=nclasses
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]
- */
-
-static int __pyx_pf_2ml_31MultipleVectorsMulticlassParams___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_31MultipleVectorsMulticlassParams___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_nclasses = 0;
-  PyObject *__pyx_v_x;
-  int __pyx_r;
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__nclasses,0};
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__nclasses);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_nclasses = values[0];
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_nclasses = PyTuple_GET_ITEM(__pyx_args, 0);
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 644; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.__init__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":645
- * 
- *    def __init__(self, nclasses):
- *       self.nclasses=nclasses             # <<<<<<<<<<<<<<
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]
- * 
- */
-  __pyx_t_1 = __Pyx_PyInt_AsInt(__pyx_v_nclasses); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 645; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  ((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->nclasses = __pyx_t_1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":646
- *    def __init__(self, nclasses):
- *       self.nclasses=nclasses
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]             # <<<<<<<<<<<<<<
- * 
- *    def __cinit__(self, int nclasses):
- */
-  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_2));
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_INCREF(__pyx_v_nclasses);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_nclasses);
-  __Pyx_GIVEREF(__pyx_v_nclasses);
-  __pyx_t_5 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyList_CheckExact(__pyx_t_5) || PyTuple_CheckExact(__pyx_t_5)) {
-    __pyx_t_3 = 0; __pyx_t_4 = __pyx_t_5; __Pyx_INCREF(__pyx_t_4);
-  } else {
-    __pyx_t_3 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-  }
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_5 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_5); __pyx_t_3++;
-    } else {
-      __pyx_t_5 = PyIter_Next(__pyx_t_4);
-      if (!__pyx_t_5) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __Pyx_DECREF(__pyx_v_x);
-    __pyx_v_x = __pyx_t_5;
-    __pyx_t_5 = 0;
-    __pyx_t_5 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_PerceptronParameters)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = PyList_Append(__pyx_t_2, (PyObject*)__pyx_t_5); if (unlikely(__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 646; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_INCREF(((PyObject *)__pyx_t_2));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_2));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params));
-  ((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params = __pyx_t_2;
-  __Pyx_DECREF(((PyObject *)__pyx_t_2)); __pyx_t_2 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_x);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":648
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]
- * 
- *    def __cinit__(self, int nclasses):             # <<<<<<<<<<<<<<
- *       self.nclasses=nclasses
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]
- */
-
-static int __pyx_pf_2ml_31MultipleVectorsMulticlassParams___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_31MultipleVectorsMulticlassParams___cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_v_nclasses;
-  PyObject *__pyx_v_x;
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__nclasses,0};
-  __Pyx_RefNannySetupContext("__cinit__");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__nclasses);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "__cinit__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_nclasses = __Pyx_PyInt_AsInt(values[0]); if (unlikely((__pyx_v_nclasses == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_nclasses = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely((__pyx_v_nclasses == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 648; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.__cinit__");
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_v_x = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":649
- * 
- *    def __cinit__(self, int nclasses):
- *       self.nclasses=nclasses             # <<<<<<<<<<<<<<
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]
- * 
- */
-  ((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->nclasses = __pyx_v_nclasses;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":650
- *    def __cinit__(self, int nclasses):
- *       self.nclasses=nclasses
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]             # <<<<<<<<<<<<<<
- * 
- *    cpdef add(self, list features, int clas, double amount):
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_t_3 = PyInt_FromLong(__pyx_v_nclasses); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_4);
-  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyList_CheckExact(__pyx_t_3) || PyTuple_CheckExact(__pyx_t_3)) {
-    __pyx_t_2 = 0; __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
-  } else {
-    __pyx_t_2 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_4))) {
-      if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
-      __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++;
-    } else {
-      __pyx_t_3 = PyIter_Next(__pyx_t_4);
-      if (!__pyx_t_3) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __Pyx_DECREF(__pyx_v_x);
-    __pyx_v_x = __pyx_t_3;
-    __pyx_t_3 = 0;
-    __pyx_t_3 = PyObject_Call(((PyObject *)((PyObject*)__pyx_ptype_2ml_PerceptronParameters)), ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_3); if (unlikely(__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 650; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __Pyx_INCREF(((PyObject *)__pyx_t_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params));
-  ((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params = __pyx_t_1;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.__cinit__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_x);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":652
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]
- * 
- *    cpdef add(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       cdef PerceptronParameters params
- *       params=self.params[clas]
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static  PyObject *__pyx_f_2ml_31MultipleVectorsMulticlassParams_add(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_v_clas, double __pyx_v_amount, int __pyx_skip_dispatch) {
-  struct __pyx_obj_2ml_PerceptronParameters *__pyx_v_params;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("add");
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_params = ((struct __pyx_obj_2ml_PerceptronParameters *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__add); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_31MultipleVectorsMulticlassParams_add)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyInt_FromLong(__pyx_v_clas); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyTuple_New(3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_2);
-      PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_2 = 0;
-      __pyx_t_3 = 0;
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_4, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":654
- *    cpdef add(self, list features, int clas, double amount):
- *       cdef PerceptronParameters params
- *       params=self.params[clas]             # <<<<<<<<<<<<<<
- *       features=features[clas]
- *       params.updateFeatures(features, amount)
- */
-  __pyx_t_1 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_self->params), __pyx_v_clas, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 654; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_2ml_PerceptronParameters))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 654; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_v_params));
-  __pyx_v_params = ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":655
- *       cdef PerceptronParameters params
- *       params=self.params[clas]
- *       features=features[clas]             # <<<<<<<<<<<<<<
- *       params.updateFeatures(features, amount)
- * 
- */
-  __pyx_t_1 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_features), __pyx_v_clas, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 655; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (!(likely(PyList_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_t_1)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 655; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(((PyObject *)__pyx_v_features));
-  __pyx_v_features = ((PyObject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":656
- *       params=self.params[clas]
- *       features=features[clas]
- *       params.updateFeatures(features, amount)             # <<<<<<<<<<<<<<
- * 
- *    cpdef tick(self):
- */
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_PerceptronParameters *)__pyx_v_params->__pyx_vtab)->updateFeatures(__pyx_v_params, ((PyObject *)__pyx_v_features), __pyx_v_amount, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 656; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.add");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_params);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":652
- *       self.params=[PerceptronParameters() for x in xrange(nclasses)]
- * 
- *    cpdef add(self, list features, int clas, double amount):             # <<<<<<<<<<<<<<
- *       cdef PerceptronParameters params
- *       params=self.params[clas]
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_add(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_features = 0;
-  int __pyx_v_clas;
-  double __pyx_v_amount;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__features,&__pyx_n_s__clas,&__pyx_n_s__amount,0};
-  __Pyx_RefNannySetupContext("add");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[3] = {0,0,0};
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__features);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__clas);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("add", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s__amount);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("add", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "add") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_features = ((PyObject *)values[0]);
-    __pyx_v_clas = __Pyx_PyInt_AsInt(values[1]); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_features = ((PyObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_clas = __Pyx_PyInt_AsInt(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_clas == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_amount = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("add", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.add");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultipleVectorsMulticlassParams *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->__pyx_vtab)->add(((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self), __pyx_v_features, __pyx_v_clas, __pyx_v_amount, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 652; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.add");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":658
- *       params.updateFeatures(features, amount)
- * 
- *    cpdef tick(self):             # <<<<<<<<<<<<<<
- *       [p.tick() for p in self.params]
- * 
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_tick(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static  PyObject *__pyx_f_2ml_31MultipleVectorsMulticlassParams_tick(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *__pyx_v_self, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_p;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  __Pyx_RefNannySetupContext("tick");
-  __pyx_v_p = Py_None; __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__tick); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_31MultipleVectorsMulticlassParams_tick)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":659
- * 
- *    cpdef tick(self):
- *       [p.tick() for p in self.params]             # <<<<<<<<<<<<<<
- * 
- *    cpdef get_scores(self, list features):
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 659; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  if (likely(((PyObject *)__pyx_v_self->params) != Py_None)) {
-    __pyx_t_3 = 0; __pyx_t_2 = ((PyObject *)__pyx_v_self->params); __Pyx_INCREF(__pyx_t_2);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 659; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
-    __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++;
-    __Pyx_DECREF(__pyx_v_p);
-    __pyx_v_p = __pyx_t_4;
-    __pyx_t_4 = 0;
-    __pyx_t_4 = PyObject_GetAttr(__pyx_v_p, __pyx_n_s__tick); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 659; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PyObject_Call(__pyx_t_4, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 659; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_6 = PyList_Append(__pyx_t_1, (PyObject*)__pyx_t_5); if (unlikely(__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 659; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_1;
-  __Pyx_DECREF(((PyObject *)__pyx_t_1)); __pyx_t_1 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.tick");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_p);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":658
- *       params.updateFeatures(features, amount)
- * 
- *    cpdef tick(self):             # <<<<<<<<<<<<<<
- *       [p.tick() for p in self.params]
- * 
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_tick(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_tick(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("tick");
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultipleVectorsMulticlassParams *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->__pyx_vtab)->tick(((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self), 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 658; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.tick");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":661
- *       [p.tick() for p in self.params]
- * 
- *    cpdef get_scores(self, list features):             # <<<<<<<<<<<<<<
- *       cdef dict scores={}
- *       cdef int i
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_31MultipleVectorsMulticlassParams_get_scores(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_scores = 0;
-  int __pyx_v_i;
-  struct __pyx_obj_2ml_PerceptronParameters *__pyx_v_pars;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  __Pyx_RefNannySetupContext("get_scores");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_pars = ((struct __pyx_obj_2ml_PerceptronParameters *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__get_scores); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_31MultipleVectorsMulticlassParams_get_scores)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":662
- * 
- *    cpdef get_scores(self, list features):
- *       cdef dict scores={}             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef PerceptronParameters pars
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 662; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_v_scores = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":665
- *       cdef int i
- *       cdef PerceptronParameters pars
- *       for i in xrange(self.nclasses):             # <<<<<<<<<<<<<<
- *          pars = self.params[i]
- *          scores[i]=pars._score(features[i])
- */
-  __pyx_t_4 = __pyx_v_self->nclasses;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":666
- *       cdef PerceptronParameters pars
- *       for i in xrange(self.nclasses):
- *          pars = self.params[i]             # <<<<<<<<<<<<<<
- *          scores[i]=pars._score(features[i])
- *       return scores
- */
-    __pyx_t_1 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_self->params), __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_2ml_PerceptronParameters))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 666; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_pars));
-    __pyx_v_pars = ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":667
- *       for i in xrange(self.nclasses):
- *          pars = self.params[i]
- *          scores[i]=pars._score(features[i])             # <<<<<<<<<<<<<<
- *       return scores
- * 
- */
-    __pyx_t_1 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_features), __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = ((struct __pyx_vtabstruct_2ml_PerceptronParameters *)__pyx_v_pars->__pyx_vtab)->_score(__pyx_v_pars, __pyx_t_1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (__Pyx_SetItemInt(((PyObject *)__pyx_v_scores), __pyx_v_i, __pyx_t_3, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 667; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":668
- *          pars = self.params[i]
- *          scores[i]=pars._score(features[i])
- *       return scores             # <<<<<<<<<<<<<<
- * 
- *    def dump(self, out=sys.stdout):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_scores));
-  __pyx_r = ((PyObject *)__pyx_v_scores);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.get_scores");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_scores);
-  __Pyx_DECREF((PyObject *)__pyx_v_pars);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":661
- *       [p.tick() for p in self.params]
- * 
- *    cpdef get_scores(self, list features):             # <<<<<<<<<<<<<<
- *       cdef dict scores={}
- *       cdef int i
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_scores");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MultipleVectorsMulticlassParams *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->__pyx_vtab)->get_scores(((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 661; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.get_scores");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":670
- *       return scores
- * 
- *    def dump(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       out.write("%s\n" % self.nclasses)
- *       cdef PerceptronParameters p
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_dump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_dump(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_out = 0;
-  struct __pyx_obj_2ml_PerceptronParameters *__pyx_v_p;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__out,0};
-  __Pyx_RefNannySetupContext("dump");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    values[0] = __pyx_k_16;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__out);
-        if (unlikely(value)) { values[0] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "dump") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 670; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_out = values[0];
-  } else {
-    __pyx_v_out = __pyx_k_16;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_out = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("dump", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 670; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.dump");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_out);
-  __pyx_v_p = ((struct __pyx_obj_2ml_PerceptronParameters *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":671
- * 
- *    def dump(self, out=sys.stdout):
- *       out.write("%s\n" % self.nclasses)             # <<<<<<<<<<<<<<
- *       cdef PerceptronParameters p
- *       for p in self.params:
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 671; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyInt_FromLong(((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->nclasses); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 671; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 671; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 671; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 671; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":673
- *       out.write("%s\n" % self.nclasses)
- *       cdef PerceptronParameters p
- *       for p in self.params:             # <<<<<<<<<<<<<<
- *          p.dump(out)
- *          out.write("\n")
- */
-  if (likely(((PyObject *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params) != Py_None)) {
-    __pyx_t_4 = 0; __pyx_t_3 = ((PyObject *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params); __Pyx_INCREF(__pyx_t_3);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_3)) break;
-    __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_2ml_PerceptronParameters))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 673; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_p));
-    __pyx_v_p = ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_t_2);
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":674
- *       cdef PerceptronParameters p
- *       for p in self.params:
- *          p.dump(out)             # <<<<<<<<<<<<<<
- *          out.write("\n")
- * 
- */
-    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_p), __pyx_n_s__dump); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 674; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 674; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_INCREF(__pyx_v_out);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_out);
-    __Pyx_GIVEREF(__pyx_v_out);
-    __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 674; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":675
- *       for p in self.params:
- *          p.dump(out)
- *          out.write("\n")             # <<<<<<<<<<<<<<
- * 
- *    def dump_fin(self, out=sys.stdout):
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 675; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 675; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_10));
-    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_10));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
-    __pyx_t_2 = PyObject_Call(__pyx_t_5, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 675; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.dump");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_out);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":677
- *          out.write("\n")
- * 
- *    def dump_fin(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       out.write("%s\n" % self.nclasses)
- *       cdef PerceptronParameters p
- */
-
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_dump_fin(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_2ml_31MultipleVectorsMulticlassParams_dump_fin(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_out = 0;
-  struct __pyx_obj_2ml_PerceptronParameters *__pyx_v_p;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *__pyx_t_5 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_n_s__out,0};
-  __Pyx_RefNannySetupContext("dump_fin");
-  if (unlikely(__pyx_kwds)) {
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    PyObject* values[1] = {0};
-    values[0] = __pyx_k_18;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      if (kw_args > 1) {
-        PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s__out);
-        if (unlikely(value)) { values[0] = value; kw_args--; }
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "dump_fin") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 677; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_out = values[0];
-  } else {
-    __pyx_v_out = __pyx_k_18;
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  1: __pyx_v_out = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("dump_fin", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 677; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.dump_fin");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_out);
-  __pyx_v_p = ((struct __pyx_obj_2ml_PerceptronParameters *)Py_None); __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":678
- * 
- *    def dump_fin(self, out=sys.stdout):
- *       out.write("%s\n" % self.nclasses)             # <<<<<<<<<<<<<<
- *       cdef PerceptronParameters p
- *       for p in self.params:
- */
-  __pyx_t_1 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyInt_FromLong(((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->nclasses); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyNumber_Remainder(((PyObject *)__pyx_kp_s_17), __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
-  __Pyx_GIVEREF(__pyx_t_3);
-  __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 678; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":680
- *       out.write("%s\n" % self.nclasses)
- *       cdef PerceptronParameters p
- *       for p in self.params:             # <<<<<<<<<<<<<<
- *          p.dump_fin(out)
- *          out.write("\n")
- */
-  if (likely(((PyObject *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params) != Py_None)) {
-    __pyx_t_4 = 0; __pyx_t_3 = ((PyObject *)((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)__pyx_v_self)->params); __Pyx_INCREF(__pyx_t_3);
-  } else {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 680; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  for (;;) {
-    if (__pyx_t_4 >= PyList_GET_SIZE(__pyx_t_3)) break;
-    __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_2); __pyx_t_4++;
-    if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_2ml_PerceptronParameters))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 680; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_p));
-    __pyx_v_p = ((struct __pyx_obj_2ml_PerceptronParameters *)__pyx_t_2);
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":681
- *       cdef PerceptronParameters p
- *       for p in self.params:
- *          p.dump_fin(out)             # <<<<<<<<<<<<<<
- *          out.write("\n")
- * 
- */
-    __pyx_t_2 = PyObject_GetAttr(((PyObject *)__pyx_v_p), __pyx_n_s__dump_fin); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_INCREF(__pyx_v_out);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_out);
-    __Pyx_GIVEREF(__pyx_v_out);
-    __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_1, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 681; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":682
- *       for p in self.params:
- *          p.dump_fin(out)
- *          out.write("\n")             # <<<<<<<<<<<<<<
- * 
- * cdef class MulticlassLinearModel(MultipleVectorsMulticlassModel):
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_out, __pyx_n_s__write); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 682; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 682; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_INCREF(((PyObject *)__pyx_kp_s_10));
-    PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_kp_s_10));
-    __Pyx_GIVEREF(((PyObject *)__pyx_kp_s_10));
-    __pyx_t_2 = PyObject_Call(__pyx_t_5, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 682; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("ml.MultipleVectorsMulticlassParams.dump_fin");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF((PyObject *)__pyx_v_p);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_out);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":689
- *       int _nclasses
- * 
- *    def __init__(self):             # <<<<<<<<<<<<<<
- *       self.linearmodels=[]
- * 
- */
-
-static int __pyx_pf_2ml_21MulticlassLinearModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pf_2ml_21MulticlassLinearModel___init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__init__");
-  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__init__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
-  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__init__", 0))) return -1;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":690
- * 
- *    def __init__(self):
- *       self.linearmodels=[]             # <<<<<<<<<<<<<<
- * 
- *    def _addmodel(self, m):
- */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 690; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __Pyx_GIVEREF(((PyObject *)__pyx_t_1));
-  __Pyx_GOTREF(((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->linearmodels);
-  __Pyx_DECREF(((PyObject *)((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->linearmodels));
-  ((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->linearmodels = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MulticlassLinearModel.__init__");
-  __pyx_r = -1;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":692
- *       self.linearmodels=[]
- * 
- *    def _addmodel(self, m):             # <<<<<<<<<<<<<<
- *       self.linearmodels.append(m)
- *       self._nclasses = len(self.linearmodels)
- */
-
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel__addmodel(PyObject *__pyx_v_self, PyObject *__pyx_v_m); /*proto*/
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel__addmodel(PyObject *__pyx_v_self, PyObject *__pyx_v_m) {
-  PyObject *__pyx_r = NULL;
-  int __pyx_t_1;
-  Py_ssize_t __pyx_t_2;
-  __Pyx_RefNannySetupContext("_addmodel");
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":693
- * 
- *    def _addmodel(self, m):
- *       self.linearmodels.append(m)             # <<<<<<<<<<<<<<
- *       self._nclasses = len(self.linearmodels)
- * 
- */
-  if (unlikely(((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->linearmodels == Py_None)) {
-    PyErr_SetString(PyExc_AttributeError, "'NoneType' object has no attribute 'append'"); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;} 
-  }
-  __pyx_t_1 = PyList_Append(((PyObject *)((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->linearmodels), __pyx_v_m); if (unlikely(__pyx_t_1 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 693; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":694
- *    def _addmodel(self, m):
- *       self.linearmodels.append(m)
- *       self._nclasses = len(self.linearmodels)             # <<<<<<<<<<<<<<
- * 
- *    cpdef int nclasses(self):
- */
-  __pyx_t_2 = PyObject_Length(((PyObject *)((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->linearmodels)); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 694; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  ((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->_nclasses = __pyx_t_2;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("ml.MulticlassLinearModel._addmodel");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":696
- *       self._nclasses = len(self.linearmodels)
- * 
- *    cpdef int nclasses(self):             # <<<<<<<<<<<<<<
- *       return self._nclasses
- * 
- */
-
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_nclasses(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static  int __pyx_f_2ml_21MulticlassLinearModel_nclasses(struct __pyx_obj_2ml_MulticlassLinearModel *__pyx_v_self, int __pyx_skip_dispatch) {
-  int __pyx_r;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("nclasses");
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__nclasses); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_21MulticlassLinearModel_nclasses)) {
-      __pyx_t_2 = PyObject_Call(__pyx_t_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = __Pyx_PyInt_AsInt(__pyx_t_2); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":697
- * 
- *    cpdef int nclasses(self):
- *       return self._nclasses             # <<<<<<<<<<<<<<
- * 
- *    @classmethod
- */
-  __pyx_r = __pyx_v_self->_nclasses;
-  goto __pyx_L0;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_WriteUnraisable("ml.MulticlassLinearModel.nclasses");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":696
- *       self._nclasses = len(self.linearmodels)
- * 
- *    cpdef int nclasses(self):             # <<<<<<<<<<<<<<
- *       return self._nclasses
- * 
- */
-
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_nclasses(PyObject *__pyx_v_self, PyObject *unused); /*proto*/
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_nclasses(PyObject *__pyx_v_self, PyObject *unused) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("nclasses");
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyInt_FromLong(((struct __pyx_vtabstruct_2ml_MulticlassLinearModel *)((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->__pyx_vtab)->nclasses(((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self), 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 696; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MulticlassLinearModel.nclasses");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":700
- * 
- *    @classmethod
- *    def from_file(cls, fname):             # <<<<<<<<<<<<<<
- *       o=cls()
- *       fh=file(fname)
- */
-
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_from_file(PyObject *__pyx_v_cls, PyObject *__pyx_v_fname); /*proto*/
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_from_file(PyObject *__pyx_v_cls, PyObject *__pyx_v_fname) {
-  PyObject *__pyx_v_o;
-  PyObject *__pyx_v_fh;
-  PyObject *__pyx_v_nclasses;
-  PyObject *__pyx_v_i;
-  PyObject *__pyx_v_model;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  __Pyx_RefNannySetupContext("from_file");
-  __Pyx_INCREF(__pyx_v_cls);
-  __Pyx_INCREF(__pyx_v_fname);
-  __pyx_v_o = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_fh = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_nclasses = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_i = Py_None; __Pyx_INCREF(Py_None);
-  __pyx_v_model = Py_None; __Pyx_INCREF(Py_None);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":701
- *    @classmethod
- *    def from_file(cls, fname):
- *       o=cls()             # <<<<<<<<<<<<<<
- *       fh=file(fname)
- *       nclasses=int(fh.next())
- */
-  __pyx_t_1 = PyObject_Call(__pyx_v_cls, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 701; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_v_o);
-  __pyx_v_o = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":702
- *    def from_file(cls, fname):
- *       o=cls()
- *       fh=file(fname)             # <<<<<<<<<<<<<<
- *       nclasses=int(fh.next())
- *       for i in xrange(nclasses):
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_fname);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_fname);
-  __Pyx_GIVEREF(__pyx_v_fname);
-  __pyx_t_2 = PyObject_Call(((PyObject *)((PyObject*)&PyFile_Type)), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 702; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_v_fh);
-  __pyx_v_fh = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":703
- *       o=cls()
- *       fh=file(fname)
- *       nclasses=int(fh.next())             # <<<<<<<<<<<<<<
- *       for i in xrange(nclasses):
- *          model=LinearModel.from_fh(fh)
- */
-  __pyx_t_2 = PyObject_GetAttr(__pyx_v_fh, __pyx_n_s__next); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_Call(__pyx_t_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyObject_Call(((PyObject *)((PyObject*)&PyInt_Type)), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 703; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_v_nclasses);
-  __pyx_v_nclasses = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":704
- *       fh=file(fname)
- *       nclasses=int(fh.next())
- *       for i in xrange(nclasses):             # <<<<<<<<<<<<<<
- *          model=LinearModel.from_fh(fh)
- *          o._addmodel(model)
- */
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_nclasses);
-  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_nclasses);
-  __Pyx_GIVEREF(__pyx_v_nclasses);
-  __pyx_t_2 = PyObject_Call(__pyx_builtin_xrange, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyList_CheckExact(__pyx_t_2) || PyTuple_CheckExact(__pyx_t_2)) {
-    __pyx_t_3 = 0; __pyx_t_1 = __pyx_t_2; __Pyx_INCREF(__pyx_t_1);
-  } else {
-    __pyx_t_3 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  for (;;) {
-    if (likely(PyList_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++;
-    } else if (likely(PyTuple_CheckExact(__pyx_t_1))) {
-      if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
-      __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++;
-    } else {
-      __pyx_t_2 = PyIter_Next(__pyx_t_1);
-      if (!__pyx_t_2) {
-        if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 704; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_2);
-    }
-    __Pyx_DECREF(__pyx_v_i);
-    __pyx_v_i = __pyx_t_2;
-    __pyx_t_2 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":705
- *       nclasses=int(fh.next())
- *       for i in xrange(nclasses):
- *          model=LinearModel.from_fh(fh)             # <<<<<<<<<<<<<<
- *          o._addmodel(model)
- *       return o
- */
-    __pyx_t_2 = PyObject_GetAttr(((PyObject *)((PyObject*)__pyx_ptype_2ml_LinearModel)), __pyx_n_s__from_fh); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(__pyx_v_fh);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_fh);
-    __Pyx_GIVEREF(__pyx_v_fh);
-    __pyx_t_5 = PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 705; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_v_model);
-    __pyx_v_model = __pyx_t_5;
-    __pyx_t_5 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":706
- *       for i in xrange(nclasses):
- *          model=LinearModel.from_fh(fh)
- *          o._addmodel(model)             # <<<<<<<<<<<<<<
- *       return o
- * 
- */
-    __pyx_t_5 = PyObject_GetAttr(__pyx_v_o, __pyx_n_s___addmodel); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_INCREF(__pyx_v_model);
-    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_model);
-    __Pyx_GIVEREF(__pyx_v_model);
-    __pyx_t_2 = PyObject_Call(__pyx_t_5, __pyx_t_4, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 706; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":707
- *          model=LinearModel.from_fh(fh)
- *          o._addmodel(model)
- *       return o             # <<<<<<<<<<<<<<
- * 
- *    cpdef get_scores(self, list features):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_o);
-  __pyx_r = __pyx_v_o;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("ml.MulticlassLinearModel.from_file");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_DECREF(__pyx_v_o);
-  __Pyx_DECREF(__pyx_v_fh);
-  __Pyx_DECREF(__pyx_v_nclasses);
-  __Pyx_DECREF(__pyx_v_i);
-  __Pyx_DECREF(__pyx_v_model);
-  __Pyx_DECREF(__pyx_v_cls);
-  __Pyx_DECREF(__pyx_v_fname);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":709
- *       return o
- * 
- *    cpdef get_scores(self, list features):             # <<<<<<<<<<<<<<
- *       cdef dict scores={}
- *       cdef int i
- */
-
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static  PyObject *__pyx_f_2ml_21MulticlassLinearModel_get_scores(struct __pyx_obj_2ml_MulticlassLinearModel *__pyx_v_self, PyObject *__pyx_v_features, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_scores = 0;
-  int __pyx_v_i;
-  struct __pyx_obj_2ml_LinearModel *__pyx_v_lm;
-  PyObject *__pyx_v_feats;
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  __Pyx_RefNannySetupContext("get_scores");
-  __Pyx_INCREF((PyObject *)__pyx_v_self);
-  __Pyx_INCREF(__pyx_v_features);
-  __pyx_v_lm = ((struct __pyx_obj_2ml_LinearModel *)Py_None); __Pyx_INCREF(Py_None);
-  __pyx_v_feats = ((PyObject *)Py_None); __Pyx_INCREF(Py_None);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overriden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = PyObject_GetAttr(((PyObject *)__pyx_v_self), __pyx_n_s__get_scores); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (void *)&__pyx_pf_2ml_21MulticlassLinearModel_get_scores)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_INCREF(((PyObject *)__pyx_v_features));
-      PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_features));
-      __Pyx_GIVEREF(((PyObject *)__pyx_v_features));
-      __pyx_t_3 = PyObject_Call(__pyx_t_1, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":710
- * 
- *    cpdef get_scores(self, list features):
- *       cdef dict scores={}             # <<<<<<<<<<<<<<
- *       cdef int i
- *       cdef LinearModel lm
- */
-  __pyx_t_1 = PyDict_New(); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 710; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(((PyObject *)__pyx_t_1));
-  __pyx_v_scores = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":714
- *       cdef LinearModel lm
- *       cdef list feats
- *       for i in xrange(self._nclasses):             # <<<<<<<<<<<<<<
- *          lm = self.linearmodels[i]
- *          feats = features[i]
- */
-  __pyx_t_4 = __pyx_v_self->_nclasses;
-  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":715
- *       cdef list feats
- *       for i in xrange(self._nclasses):
- *          lm = self.linearmodels[i]             # <<<<<<<<<<<<<<
- *          feats = features[i]
- *          scores[i]=lm._score(feats)
- */
-    __pyx_t_1 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_self->linearmodels), __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 715; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_2ml_LinearModel))))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 715; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_lm));
-    __pyx_v_lm = ((struct __pyx_obj_2ml_LinearModel *)__pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":716
- *       for i in xrange(self._nclasses):
- *          lm = self.linearmodels[i]
- *          feats = features[i]             # <<<<<<<<<<<<<<
- *          scores[i]=lm._score(feats)
- *       return scores
- */
-    __pyx_t_1 = __Pyx_GetItemInt_List(((PyObject *)__pyx_v_features), __pyx_v_i, sizeof(int), PyInt_FromLong); if (!__pyx_t_1) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 716; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!(likely(PyList_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected list, got %.200s", Py_TYPE(__pyx_t_1)->tp_name), 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 716; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(((PyObject *)__pyx_v_feats));
-    __pyx_v_feats = ((PyObject *)__pyx_t_1);
-    __pyx_t_1 = 0;
-
-    /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":717
- *          lm = self.linearmodels[i]
- *          feats = features[i]
- *          scores[i]=lm._score(feats)             # <<<<<<<<<<<<<<
- *       return scores
- */
-    __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_vtabstruct_2ml_LinearModel *)__pyx_v_lm->__pyx_vtab)->_score(__pyx_v_lm, __pyx_v_feats)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 717; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (__Pyx_SetItemInt(((PyObject *)__pyx_v_scores), __pyx_v_i, __pyx_t_1, sizeof(int), PyInt_FromLong) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 717; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":718
- *          feats = features[i]
- *          scores[i]=lm._score(feats)
- *       return scores             # <<<<<<<<<<<<<<
- */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(((PyObject *)__pyx_v_scores));
-  __pyx_r = ((PyObject *)__pyx_v_scores);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("ml.MulticlassLinearModel.get_scores");
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_scores);
-  __Pyx_DECREF((PyObject *)__pyx_v_lm);
-  __Pyx_DECREF(__pyx_v_feats);
-  __Pyx_DECREF((PyObject *)__pyx_v_self);
-  __Pyx_DECREF(__pyx_v_features);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":709
- *       return o
- * 
- *    cpdef get_scores(self, list features):             # <<<<<<<<<<<<<<
- *       cdef dict scores={}
- *       cdef int i
- */
-
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features); /*proto*/
-static PyObject *__pyx_pf_2ml_21MulticlassLinearModel_get_scores(PyObject *__pyx_v_self, PyObject *__pyx_v_features) {
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("get_scores");
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_features), &PyList_Type, 1, "features", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_2ml_MulticlassLinearModel *)((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self)->__pyx_vtab)->get_scores(((struct __pyx_obj_2ml_MulticlassLinearModel *)__pyx_v_self), __pyx_v_features, 1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 709; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("ml.MulticlassLinearModel.get_scores");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_tp_new_2ml_DoublesArr(PyTypeObject *t, PyObject *a, PyObject *k) {
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  if (__pyx_pf_2ml_10DoublesArr___cinit__(o, a, k) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_DoublesArr(PyObject *o) {
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_2ml_10DoublesArr___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_2ml_DoublesArr[] = {
-  {0, 0, 0, 0}
-};
-
-static struct PyMemberDef __pyx_members_2ml_DoublesArr[] = {
-  {(char *)"n", T_INT, offsetof(struct __pyx_obj_2ml_DoublesArr, n), 0, 0},
-  {0, 0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_DoublesArr = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_DoublesArr = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_DoublesArr = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_DoublesArr = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_DoublesArr = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.DoublesArr"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_DoublesArr), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_DoublesArr, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_DoublesArr, /*tp_as_number*/
-  &__pyx_tp_as_sequence_DoublesArr, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_DoublesArr, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_DoublesArr, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_DoublesArr, /*tp_methods*/
-  __pyx_members_2ml_DoublesArr, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_DoublesArr, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_2ml_MulticlassModel __pyx_vtable_2ml_MulticlassModel;
-
-static PyObject *__pyx_tp_new_2ml_MulticlassModel(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_2ml_MulticlassModel *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_2ml_MulticlassModel *)o);
-  p->__pyx_vtab = __pyx_vtabptr_2ml_MulticlassModel;
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  p->biases = ((struct __pyx_obj_2ml_DoublesArr *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_MulticlassModel(PyObject *o) {
-  struct __pyx_obj_2ml_MulticlassModel *p = (struct __pyx_obj_2ml_MulticlassModel *)o;
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_2ml_15MulticlassModel___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_XDECREF(((PyObject *)p->W));
-  Py_XDECREF(((PyObject *)p->biases));
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_2ml_MulticlassModel(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_2ml_MulticlassModel *p = (struct __pyx_obj_2ml_MulticlassModel *)o;
-  if (p->W) {
-    e = (*v)(p->W, a); if (e) return e;
-  }
-  if (p->biases) {
-    e = (*v)(((PyObject*)p->biases), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_2ml_MulticlassModel(PyObject *o) {
-  struct __pyx_obj_2ml_MulticlassModel *p = (struct __pyx_obj_2ml_MulticlassModel *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->W);
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->biases);
-  p->biases = ((struct __pyx_obj_2ml_DoublesArr *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_2ml_MulticlassModel[] = {
-  {__Pyx_NAMESTR("predict"), (PyCFunction)__pyx_pf_2ml_15MulticlassModel_predict, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("predict_r"), (PyCFunction)__pyx_pf_2ml_15MulticlassModel_predict_r, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_scores"), (PyCFunction)__pyx_pf_2ml_15MulticlassModel_get_scores, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_scores_r"), (PyCFunction)__pyx_pf_2ml_15MulticlassModel_get_scores_r, METH_O, __Pyx_DOCSTR(__pyx_doc_2ml_15MulticlassModel_get_scores_r)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_MulticlassModel = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_MulticlassModel = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_MulticlassModel = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_MulticlassModel = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_MulticlassModel = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.MulticlassModel"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_MulticlassModel), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_MulticlassModel, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_MulticlassModel, /*tp_as_number*/
-  &__pyx_tp_as_sequence_MulticlassModel, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_MulticlassModel, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_MulticlassModel, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_2ml_MulticlassModel, /*tp_traverse*/
-  __pyx_tp_clear_2ml_MulticlassModel, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_MulticlassModel, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_15MulticlassModel___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_MulticlassModel, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static PyObject *__pyx_tp_new_2ml_MulticlassParamData(PyTypeObject *t, PyObject *a, PyObject *k) {
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  if (__pyx_pf_2ml_19MulticlassParamData___cinit__(o, a, k) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_MulticlassParamData(PyObject *o) {
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
-    __pyx_pf_2ml_19MulticlassParamData___dealloc__(o);
-    if (PyErr_Occurred()) PyErr_WriteUnraisable(o);
-    --Py_REFCNT(o);
-    PyErr_Restore(etype, eval, etb);
-  }
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_2ml_MulticlassParamData[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_MulticlassParamData = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_MulticlassParamData = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_MulticlassParamData = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_MulticlassParamData = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_MulticlassParamData = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.MulticlassParamData"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_MulticlassParamData), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_MulticlassParamData, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_MulticlassParamData, /*tp_as_number*/
-  &__pyx_tp_as_sequence_MulticlassParamData, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_MulticlassParamData, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_MulticlassParamData, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_MulticlassParamData, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_MulticlassParamData, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_2ml_MultitronParameters __pyx_vtable_2ml_MultitronParameters;
-
-static PyObject *__pyx_tp_new_2ml_MultitronParameters(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_2ml_MultitronParameters *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_2ml_MultitronParameters *)o);
-  p->__pyx_vtab = __pyx_vtabptr_2ml_MultitronParameters;
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  if (__pyx_pf_2ml_19MultitronParameters___cinit__(o, a, k) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_MultitronParameters(PyObject *o) {
-  struct __pyx_obj_2ml_MultitronParameters *p = (struct __pyx_obj_2ml_MultitronParameters *)o;
-  Py_XDECREF(((PyObject *)p->W));
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_2ml_MultitronParameters(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_2ml_MultitronParameters *p = (struct __pyx_obj_2ml_MultitronParameters *)o;
-  if (p->W) {
-    e = (*v)(p->W, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_2ml_MultitronParameters(PyObject *o) {
-  struct __pyx_obj_2ml_MultitronParameters *p = (struct __pyx_obj_2ml_MultitronParameters *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->W);
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_2ml_MultitronParameters[] = {
-  {__Pyx_NAMESTR("getW"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_getW, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("tick"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_tick, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("scalar_multiply"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_scalar_multiply, METH_O, __Pyx_DOCSTR(__pyx_doc_2ml_19MultitronParameters_scalar_multiply)},
-  {__Pyx_NAMESTR("add"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_add, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("add_r"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_add_r, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_2ml_19MultitronParameters_add_r)},
-  {__Pyx_NAMESTR("set"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_set, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_2ml_19MultitronParameters_set)},
-  {__Pyx_NAMESTR("add_params"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_add_params, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_2ml_19MultitronParameters_add_params)},
-  {__Pyx_NAMESTR("do_pa_update"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_do_pa_update, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("pa_update"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_pa_update, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_scores"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_get_scores, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_scores_r"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_get_scores_r, METH_O, __Pyx_DOCSTR(__pyx_doc_2ml_19MultitronParameters_get_scores_r)},
-  {__Pyx_NAMESTR("update"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_update, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(__pyx_doc_2ml_19MultitronParameters_update)},
-  {__Pyx_NAMESTR("predict_best_class_r"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_predict_best_class_r, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("update_r"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_update_r, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("finalize"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_finalize, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("dump"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_dump, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("dump_fin"), (PyCFunction)__pyx_pf_2ml_19MultitronParameters_dump_fin, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_MultitronParameters = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_MultitronParameters = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_MultitronParameters = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_MultitronParameters = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_MultitronParameters = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.MultitronParameters"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_MultitronParameters), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_MultitronParameters, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_MultitronParameters, /*tp_as_number*/
-  &__pyx_tp_as_sequence_MultitronParameters, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_MultitronParameters, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_MultitronParameters, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_2ml_MultitronParameters, /*tp_traverse*/
-  __pyx_tp_clear_2ml_MultitronParameters, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_MultitronParameters, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_19MultitronParameters___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_MultitronParameters, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static PyObject *__pyx_tp_new_2ml_ParamData(PyTypeObject *t, PyObject *a, PyObject *k) {
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_ParamData(PyObject *o) {
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_2ml_ParamData[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_ParamData = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_ParamData = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_ParamData = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_ParamData = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_ParamData = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.ParamData"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_ParamData), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_ParamData, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_ParamData, /*tp_as_number*/
-  &__pyx_tp_as_sequence_ParamData, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_ParamData, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_ParamData, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_ParamData, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_9ParamData___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_ParamData, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_2ml_PerceptronParameters __pyx_vtable_2ml_PerceptronParameters;
-
-static PyObject *__pyx_tp_new_2ml_PerceptronParameters(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_2ml_PerceptronParameters *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_2ml_PerceptronParameters *)o);
-  p->__pyx_vtab = __pyx_vtabptr_2ml_PerceptronParameters;
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_PerceptronParameters(PyObject *o) {
-  struct __pyx_obj_2ml_PerceptronParameters *p = (struct __pyx_obj_2ml_PerceptronParameters *)o;
-  Py_XDECREF(((PyObject *)p->W));
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_2ml_PerceptronParameters(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_2ml_PerceptronParameters *p = (struct __pyx_obj_2ml_PerceptronParameters *)o;
-  if (p->W) {
-    e = (*v)(p->W, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_2ml_PerceptronParameters(PyObject *o) {
-  struct __pyx_obj_2ml_PerceptronParameters *p = (struct __pyx_obj_2ml_PerceptronParameters *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->W);
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_2ml_PerceptronParameters[] = {
-  {__Pyx_NAMESTR("tick"), (PyCFunction)__pyx_pf_2ml_20PerceptronParameters_tick, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("score"), (PyCFunction)__pyx_pf_2ml_20PerceptronParameters_score, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("updateFeatures"), (PyCFunction)__pyx_pf_2ml_20PerceptronParameters_updateFeatures, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("finalize"), (PyCFunction)__pyx_pf_2ml_20PerceptronParameters_finalize, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("dump"), (PyCFunction)__pyx_pf_2ml_20PerceptronParameters_dump, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("dump_fin"), (PyCFunction)__pyx_pf_2ml_20PerceptronParameters_dump_fin, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_PerceptronParameters = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_PerceptronParameters = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_PerceptronParameters = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_PerceptronParameters = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_PerceptronParameters = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.PerceptronParameters"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_PerceptronParameters), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_PerceptronParameters, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_PerceptronParameters, /*tp_as_number*/
-  &__pyx_tp_as_sequence_PerceptronParameters, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_PerceptronParameters, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_PerceptronParameters, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_2ml_PerceptronParameters, /*tp_traverse*/
-  __pyx_tp_clear_2ml_PerceptronParameters, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_PerceptronParameters, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_20PerceptronParameters___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_PerceptronParameters, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static PyObject *__pyx_tp_new_2ml__float(PyTypeObject *t, PyObject *a, PyObject *k) {
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml__float(PyObject *o) {
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_2ml__float[] = {
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number__float = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence__float = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping__float = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer__float = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml__float = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml._float"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml__float), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml__float, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number__float, /*tp_as_number*/
-  &__pyx_tp_as_sequence__float, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping__float, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer__float, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml__float, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  0, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml__float, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_2ml_LinearModel __pyx_vtable_2ml_LinearModel;
-
-static PyObject *__pyx_tp_new_2ml_LinearModel(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_2ml_LinearModel *p;
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_2ml_LinearModel *)o);
-  p->__pyx_vtab = __pyx_vtabptr_2ml_LinearModel;
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  if (__pyx_pf_2ml_11LinearModel___cinit__(o, __pyx_empty_tuple, NULL) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_LinearModel(PyObject *o) {
-  struct __pyx_obj_2ml_LinearModel *p = (struct __pyx_obj_2ml_LinearModel *)o;
-  Py_XDECREF(((PyObject *)p->W));
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static int __pyx_tp_traverse_2ml_LinearModel(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_2ml_LinearModel *p = (struct __pyx_obj_2ml_LinearModel *)o;
-  if (p->W) {
-    e = (*v)(p->W, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_2ml_LinearModel(PyObject *o) {
-  struct __pyx_obj_2ml_LinearModel *p = (struct __pyx_obj_2ml_LinearModel *)o;
-  PyObject* tmp;
-  tmp = ((PyObject*)p->W);
-  p->W = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_2ml_LinearModel[] = {
-  {__Pyx_NAMESTR("_load"), (PyCFunction)__pyx_pf_2ml_11LinearModel__load, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("from_file"), (PyCFunction)__pyx_pf_2ml_11LinearModel_from_file, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("from_fh"), (PyCFunction)__pyx_pf_2ml_11LinearModel_from_fh, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("score"), (PyCFunction)__pyx_pf_2ml_11LinearModel_score, METH_O, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_LinearModel = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_LinearModel = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_LinearModel = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_LinearModel = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_LinearModel = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.LinearModel"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_LinearModel), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_LinearModel, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_LinearModel, /*tp_as_number*/
-  &__pyx_tp_as_sequence_LinearModel, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_LinearModel, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_LinearModel, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_2ml_LinearModel, /*tp_traverse*/
-  __pyx_tp_clear_2ml_LinearModel, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_LinearModel, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_11LinearModel___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_LinearModel, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static PyObject *__pyx_tp_new_2ml_MultipleVectorsMulticlassModel(PyTypeObject *t, PyObject *a, PyObject *k) {
-  PyObject *o = (*t->tp_alloc)(t, 0);
-  if (!o) return 0;
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_MultipleVectorsMulticlassModel(PyObject *o) {
-  (*Py_TYPE(o)->tp_free)(o);
-}
-
-static struct PyMethodDef __pyx_methods_2ml_MultipleVectorsMulticlassModel[] = {
-  {__Pyx_NAMESTR("get_scores"), (PyCFunction)__pyx_pf_2ml_30MultipleVectorsMulticlassModel_get_scores, METH_O, __Pyx_DOCSTR(__pyx_doc_2ml_30MultipleVectorsMulticlassModel_get_scores)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_MultipleVectorsMulticlassModel = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_MultipleVectorsMulticlassModel = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_MultipleVectorsMulticlassModel = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_MultipleVectorsMulticlassModel = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_MultipleVectorsMulticlassModel = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.MultipleVectorsMulticlassModel"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_MultipleVectorsMulticlassModel), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_MultipleVectorsMulticlassModel, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_MultipleVectorsMulticlassModel, /*tp_as_number*/
-  &__pyx_tp_as_sequence_MultipleVectorsMulticlassModel, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_MultipleVectorsMulticlassModel, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_MultipleVectorsMulticlassModel, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_MultipleVectorsMulticlassModel, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_30MultipleVectorsMulticlassModel___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_MultipleVectorsMulticlassModel, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_2ml_MultipleVectorsMulticlassParams __pyx_vtable_2ml_MultipleVectorsMulticlassParams;
-
-static PyObject *__pyx_tp_new_2ml_MultipleVectorsMulticlassParams(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *p;
-  PyObject *o = __pyx_tp_new_2ml_MultipleVectorsMulticlassModel(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)o);
-  p->__pyx_vtab = __pyx_vtabptr_2ml_MultipleVectorsMulticlassParams;
-  p->params = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  if (__pyx_pf_2ml_31MultipleVectorsMulticlassParams___cinit__(o, a, k) < 0) {
-    Py_DECREF(o); o = 0;
-  }
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_MultipleVectorsMulticlassParams(PyObject *o) {
-  struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *p = (struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)o;
-  Py_XDECREF(((PyObject *)p->params));
-  __pyx_tp_dealloc_2ml_MultipleVectorsMulticlassModel(o);
-}
-
-static int __pyx_tp_traverse_2ml_MultipleVectorsMulticlassParams(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *p = (struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)o;
-  if (__pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_traverse) {
-    e = __pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_traverse(o, v, a); if (e) return e;
-  }
-  if (p->params) {
-    e = (*v)(p->params, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_2ml_MultipleVectorsMulticlassParams(PyObject *o) {
-  struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *p = (struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *)o;
-  PyObject* tmp;
-  if (__pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_clear) {
-    __pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_clear(o);
-  }
-  tmp = ((PyObject*)p->params);
-  p->params = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_2ml_MultipleVectorsMulticlassParams[] = {
-  {__Pyx_NAMESTR("add"), (PyCFunction)__pyx_pf_2ml_31MultipleVectorsMulticlassParams_add, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("tick"), (PyCFunction)__pyx_pf_2ml_31MultipleVectorsMulticlassParams_tick, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_scores"), (PyCFunction)__pyx_pf_2ml_31MultipleVectorsMulticlassParams_get_scores, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("dump"), (PyCFunction)__pyx_pf_2ml_31MultipleVectorsMulticlassParams_dump, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("dump_fin"), (PyCFunction)__pyx_pf_2ml_31MultipleVectorsMulticlassParams_dump_fin, METH_VARARGS|METH_KEYWORDS, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_MultipleVectorsMulticlassParams = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_MultipleVectorsMulticlassParams = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_MultipleVectorsMulticlassParams = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_MultipleVectorsMulticlassParams = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_MultipleVectorsMulticlassParams = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.MultipleVectorsMulticlassParams"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_MultipleVectorsMulticlassParams, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_MultipleVectorsMulticlassParams, /*tp_as_number*/
-  &__pyx_tp_as_sequence_MultipleVectorsMulticlassParams, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_MultipleVectorsMulticlassParams, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_MultipleVectorsMulticlassParams, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_2ml_MultipleVectorsMulticlassParams, /*tp_traverse*/
-  __pyx_tp_clear_2ml_MultipleVectorsMulticlassParams, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_MultipleVectorsMulticlassParams, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_31MultipleVectorsMulticlassParams___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_MultipleVectorsMulticlassParams, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-static struct __pyx_vtabstruct_2ml_MulticlassLinearModel __pyx_vtable_2ml_MulticlassLinearModel;
-
-static PyObject *__pyx_tp_new_2ml_MulticlassLinearModel(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_2ml_MulticlassLinearModel *p;
-  PyObject *o = __pyx_tp_new_2ml_MultipleVectorsMulticlassModel(t, a, k);
-  if (!o) return 0;
-  p = ((struct __pyx_obj_2ml_MulticlassLinearModel *)o);
-  p->__pyx_vtab = __pyx_vtabptr_2ml_MulticlassLinearModel;
-  p->linearmodels = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
-
-static void __pyx_tp_dealloc_2ml_MulticlassLinearModel(PyObject *o) {
-  struct __pyx_obj_2ml_MulticlassLinearModel *p = (struct __pyx_obj_2ml_MulticlassLinearModel *)o;
-  Py_XDECREF(((PyObject *)p->linearmodels));
-  __pyx_tp_dealloc_2ml_MultipleVectorsMulticlassModel(o);
-}
-
-static int __pyx_tp_traverse_2ml_MulticlassLinearModel(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_2ml_MulticlassLinearModel *p = (struct __pyx_obj_2ml_MulticlassLinearModel *)o;
-  if (__pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_traverse) {
-    e = __pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_traverse(o, v, a); if (e) return e;
-  }
-  if (p->linearmodels) {
-    e = (*v)(p->linearmodels, a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_2ml_MulticlassLinearModel(PyObject *o) {
-  struct __pyx_obj_2ml_MulticlassLinearModel *p = (struct __pyx_obj_2ml_MulticlassLinearModel *)o;
-  PyObject* tmp;
-  if (__pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_clear) {
-    __pyx_ptype_2ml_MultipleVectorsMulticlassModel->tp_clear(o);
-  }
-  tmp = ((PyObject*)p->linearmodels);
-  p->linearmodels = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static struct PyMethodDef __pyx_methods_2ml_MulticlassLinearModel[] = {
-  {__Pyx_NAMESTR("_addmodel"), (PyCFunction)__pyx_pf_2ml_21MulticlassLinearModel__addmodel, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("nclasses"), (PyCFunction)__pyx_pf_2ml_21MulticlassLinearModel_nclasses, METH_NOARGS, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("from_file"), (PyCFunction)__pyx_pf_2ml_21MulticlassLinearModel_from_file, METH_O, __Pyx_DOCSTR(0)},
-  {__Pyx_NAMESTR("get_scores"), (PyCFunction)__pyx_pf_2ml_21MulticlassLinearModel_get_scores, METH_O, __Pyx_DOCSTR(0)},
-  {0, 0, 0, 0}
-};
-
-static PyNumberMethods __pyx_tp_as_number_MulticlassLinearModel = {
-  0, /*nb_add*/
-  0, /*nb_subtract*/
-  0, /*nb_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_divide*/
-  #endif
-  0, /*nb_remainder*/
-  0, /*nb_divmod*/
-  0, /*nb_power*/
-  0, /*nb_negative*/
-  0, /*nb_positive*/
-  0, /*nb_absolute*/
-  0, /*nb_nonzero*/
-  0, /*nb_invert*/
-  0, /*nb_lshift*/
-  0, /*nb_rshift*/
-  0, /*nb_and*/
-  0, /*nb_xor*/
-  0, /*nb_or*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_coerce*/
-  #endif
-  0, /*nb_int*/
-  #if PY_MAJOR_VERSION >= 3
-  0, /*reserved*/
-  #else
-  0, /*nb_long*/
-  #endif
-  0, /*nb_float*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_oct*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_hex*/
-  #endif
-  0, /*nb_inplace_add*/
-  0, /*nb_inplace_subtract*/
-  0, /*nb_inplace_multiply*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*nb_inplace_divide*/
-  #endif
-  0, /*nb_inplace_remainder*/
-  0, /*nb_inplace_power*/
-  0, /*nb_inplace_lshift*/
-  0, /*nb_inplace_rshift*/
-  0, /*nb_inplace_and*/
-  0, /*nb_inplace_xor*/
-  0, /*nb_inplace_or*/
-  0, /*nb_floor_divide*/
-  0, /*nb_true_divide*/
-  0, /*nb_inplace_floor_divide*/
-  0, /*nb_inplace_true_divide*/
-  #if (PY_MAJOR_VERSION >= 3) || (Py_TPFLAGS_DEFAULT & Py_TPFLAGS_HAVE_INDEX)
-  0, /*nb_index*/
-  #endif
-};
-
-static PySequenceMethods __pyx_tp_as_sequence_MulticlassLinearModel = {
-  0, /*sq_length*/
-  0, /*sq_concat*/
-  0, /*sq_repeat*/
-  0, /*sq_item*/
-  0, /*sq_slice*/
-  0, /*sq_ass_item*/
-  0, /*sq_ass_slice*/
-  0, /*sq_contains*/
-  0, /*sq_inplace_concat*/
-  0, /*sq_inplace_repeat*/
-};
-
-static PyMappingMethods __pyx_tp_as_mapping_MulticlassLinearModel = {
-  0, /*mp_length*/
-  0, /*mp_subscript*/
-  0, /*mp_ass_subscript*/
-};
-
-static PyBufferProcs __pyx_tp_as_buffer_MulticlassLinearModel = {
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getreadbuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getwritebuffer*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getsegcount*/
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  0, /*bf_getcharbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_getbuffer*/
-  #endif
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*bf_releasebuffer*/
-  #endif
-};
-
-PyTypeObject __pyx_type_2ml_MulticlassLinearModel = {
-  PyVarObject_HEAD_INIT(0, 0)
-  __Pyx_NAMESTR("ml.MulticlassLinearModel"), /*tp_name*/
-  sizeof(struct __pyx_obj_2ml_MulticlassLinearModel), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_2ml_MulticlassLinearModel, /*tp_dealloc*/
-  0, /*tp_print*/
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  0, /*tp_compare*/
-  0, /*tp_repr*/
-  &__pyx_tp_as_number_MulticlassLinearModel, /*tp_as_number*/
-  &__pyx_tp_as_sequence_MulticlassLinearModel, /*tp_as_sequence*/
-  &__pyx_tp_as_mapping_MulticlassLinearModel, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  &__pyx_tp_as_buffer_MulticlassLinearModel, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_2ml_MulticlassLinearModel, /*tp_traverse*/
-  __pyx_tp_clear_2ml_MulticlassLinearModel, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_2ml_MulticlassLinearModel, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  0, /*tp_dictoffset*/
-  __pyx_pf_2ml_21MulticlassLinearModel___init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_2ml_MulticlassLinearModel, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  #if PY_VERSION_HEX >= 0x02060000
-  0, /*tp_version_tag*/
-  #endif
-};
-
-static struct PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-
-static void __pyx_init_filenames(void); /*proto*/
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    __Pyx_NAMESTR("ml"),
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_s_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 1, 0},
-  {&__pyx_kp_s_10, __pyx_k_10, sizeof(__pyx_k_10), 0, 0, 1, 0},
-  {&__pyx_kp_s_12, __pyx_k_12, sizeof(__pyx_k_12), 0, 0, 1, 0},
-  {&__pyx_kp_s_15, __pyx_k_15, sizeof(__pyx_k_15), 0, 0, 1, 0},
-  {&__pyx_kp_s_17, __pyx_k_17, sizeof(__pyx_k_17), 0, 0, 1, 0},
-  {&__pyx_kp_s_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 1, 0},
-  {&__pyx_kp_s_4, __pyx_k_4, sizeof(__pyx_k_4), 0, 0, 1, 0},
-  {&__pyx_kp_s_5, __pyx_k_5, sizeof(__pyx_k_5), 0, 0, 1, 0},
-  {&__pyx_n_s_6, __pyx_k_6, sizeof(__pyx_k_6), 0, 0, 1, 1},
-  {&__pyx_kp_s_8, __pyx_k_8, sizeof(__pyx_k_8), 0, 0, 1, 0},
-  {&__pyx_kp_s_9, __pyx_k_9, sizeof(__pyx_k_9), 0, 0, 1, 0},
-  {&__pyx_n_s__C, __pyx_k__C, sizeof(__pyx_k__C), 0, 0, 1, 1},
-  {&__pyx_n_s__KeyError, __pyx_k__KeyError, sizeof(__pyx_k__KeyError), 0, 0, 1, 1},
-  {&__pyx_n_s__W, __pyx_k__W, sizeof(__pyx_k__W), 0, 0, 1, 1},
-  {&__pyx_n_s____main__, __pyx_k____main__, sizeof(__pyx_k____main__), 0, 0, 1, 1},
-  {&__pyx_n_s___addmodel, __pyx_k___addmodel, sizeof(__pyx_k___addmodel), 0, 0, 1, 1},
-  {&__pyx_n_s___load, __pyx_k___load, sizeof(__pyx_k___load), 0, 0, 1, 1},
-  {&__pyx_n_s___nclasses, __pyx_k___nclasses, sizeof(__pyx_k___nclasses), 0, 0, 1, 1},
-  {&__pyx_n_s___predict_best_class, __pyx_k___predict_best_class, sizeof(__pyx_k___predict_best_class), 0, 0, 1, 1},
-  {&__pyx_n_s___score, __pyx_k___score, sizeof(__pyx_k___score), 0, 0, 1, 1},
-  {&__pyx_n_s___tick, __pyx_k___tick, sizeof(__pyx_k___tick), 0, 0, 1, 1},
-  {&__pyx_n_s___update, __pyx_k___update, sizeof(__pyx_k___update), 0, 0, 1, 1},
-  {&__pyx_n_s___update_r, __pyx_k___update_r, sizeof(__pyx_k___update_r), 0, 0, 1, 1},
-  {&__pyx_n_s__acc, __pyx_k__acc, sizeof(__pyx_k__acc), 0, 0, 1, 1},
-  {&__pyx_n_s__add, __pyx_k__add, sizeof(__pyx_k__add), 0, 0, 1, 1},
-  {&__pyx_n_s__add_params, __pyx_k__add_params, sizeof(__pyx_k__add_params), 0, 0, 1, 1},
-  {&__pyx_n_s__add_r, __pyx_k__add_r, sizeof(__pyx_k__add_r), 0, 0, 1, 1},
-  {&__pyx_n_s__amount, __pyx_k__amount, sizeof(__pyx_k__amount), 0, 0, 1, 1},
-  {&__pyx_n_s__biases, __pyx_k__biases, sizeof(__pyx_k__biases), 0, 0, 1, 1},
-  {&__pyx_n_s__clas, __pyx_k__clas, sizeof(__pyx_k__clas), 0, 0, 1, 1},
-  {&__pyx_n_s__correct_class, __pyx_k__correct_class, sizeof(__pyx_k__correct_class), 0, 0, 1, 1},
-  {&__pyx_n_s__do_pa_update, __pyx_k__do_pa_update, sizeof(__pyx_k__do_pa_update), 0, 0, 1, 1},
-  {&__pyx_n_s__dump, __pyx_k__dump, sizeof(__pyx_k__dump), 0, 0, 1, 1},
-  {&__pyx_n_s__dump_fin, __pyx_k__dump_fin, sizeof(__pyx_k__dump_fin), 0, 0, 1, 1},
-  {&__pyx_n_s__exp, __pyx_k__exp, sizeof(__pyx_k__exp), 0, 0, 1, 1},
-  {&__pyx_n_s__factor, __pyx_k__factor, sizeof(__pyx_k__factor), 0, 0, 1, 1},
-  {&__pyx_n_s__feats, __pyx_k__feats, sizeof(__pyx_k__feats), 0, 0, 1, 1},
-  {&__pyx_n_s__features, __pyx_k__features, sizeof(__pyx_k__features), 0, 0, 1, 1},
-  {&__pyx_n_s__fname, __pyx_k__fname, sizeof(__pyx_k__fname), 0, 0, 1, 1},
-  {&__pyx_n_s__from_fh, __pyx_k__from_fh, sizeof(__pyx_k__from_fh), 0, 0, 1, 1},
-  {&__pyx_n_s__from_file, __pyx_k__from_file, sizeof(__pyx_k__from_file), 0, 0, 1, 1},
-  {&__pyx_n_s__getW, __pyx_k__getW, sizeof(__pyx_k__getW), 0, 0, 1, 1},
-  {&__pyx_n_s__get_scores, __pyx_k__get_scores, sizeof(__pyx_k__get_scores), 0, 0, 1, 1},
-  {&__pyx_n_s__get_scores_r, __pyx_k__get_scores_r, sizeof(__pyx_k__get_scores_r), 0, 0, 1, 1},
-  {&__pyx_n_s__go_cls, __pyx_k__go_cls, sizeof(__pyx_k__go_cls), 0, 0, 1, 1},
-  {&__pyx_n_s__go_feats, __pyx_k__go_feats, sizeof(__pyx_k__go_feats), 0, 0, 1, 1},
-  {&__pyx_n_s__gold_cls, __pyx_k__gold_cls, sizeof(__pyx_k__gold_cls), 0, 0, 1, 1},
-  {&__pyx_n_s__gu_cls, __pyx_k__gu_cls, sizeof(__pyx_k__gu_cls), 0, 0, 1, 1},
-  {&__pyx_n_s__gu_feats, __pyx_k__gu_feats, sizeof(__pyx_k__gu_feats), 0, 0, 1, 1},
-  {&__pyx_n_s__items, __pyx_k__items, sizeof(__pyx_k__items), 0, 0, 1, 1},
-  {&__pyx_n_s__iteritems, __pyx_k__iteritems, sizeof(__pyx_k__iteritems), 0, 0, 1, 1},
-  {&__pyx_n_s__itervalues, __pyx_k__itervalues, sizeof(__pyx_k__itervalues), 0, 0, 1, 1},
-  {&__pyx_n_s__keys, __pyx_k__keys, sizeof(__pyx_k__keys), 0, 0, 1, 1},
-  {&__pyx_n_s__lastUpd, __pyx_k__lastUpd, sizeof(__pyx_k__lastUpd), 0, 0, 1, 1},
-  {&__pyx_n_s__linearmodels, __pyx_k__linearmodels, sizeof(__pyx_k__linearmodels), 0, 0, 1, 1},
-  {&__pyx_n_s__load, __pyx_k__load, sizeof(__pyx_k__load), 0, 0, 1, 1},
-  {&__pyx_n_s__math, __pyx_k__math, sizeof(__pyx_k__math), 0, 0, 1, 1},
-  {&__pyx_n_s__max, __pyx_k__max, sizeof(__pyx_k__max), 0, 0, 1, 1},
-  {&__pyx_n_s__n, __pyx_k__n, sizeof(__pyx_k__n), 0, 0, 1, 1},
-  {&__pyx_n_s__nclas, __pyx_k__nclas, sizeof(__pyx_k__nclas), 0, 0, 1, 1},
-  {&__pyx_n_s__nclasses, __pyx_k__nclasses, sizeof(__pyx_k__nclasses), 0, 0, 1, 1},
-  {&__pyx_n_s__next, __pyx_k__next, sizeof(__pyx_k__next), 0, 0, 1, 1},
-  {&__pyx_n_s__now, __pyx_k__now, sizeof(__pyx_k__now), 0, 0, 1, 1},
-  {&__pyx_n_s__nums, __pyx_k__nums, sizeof(__pyx_k__nums), 0, 0, 1, 1},
-  {&__pyx_n_s__other, __pyx_k__other, sizeof(__pyx_k__other), 0, 0, 1, 1},
-  {&__pyx_n_s__out, __pyx_k__out, sizeof(__pyx_k__out), 0, 0, 1, 1},
-  {&__pyx_n_s__pa_update, __pyx_k__pa_update, sizeof(__pyx_k__pa_update), 0, 0, 1, 1},
-  {&__pyx_n_s__params, __pyx_k__params, sizeof(__pyx_k__params), 0, 0, 1, 1},
-  {&__pyx_n_s__predict, __pyx_k__predict, sizeof(__pyx_k__predict), 0, 0, 1, 1},
-  {&__pyx_n_s__predict_r, __pyx_k__predict_r, sizeof(__pyx_k__predict_r), 0, 0, 1, 1},
-  {&__pyx_n_s__probs_output, __pyx_k__probs_output, sizeof(__pyx_k__probs_output), 0, 0, 1, 1},
-  {&__pyx_n_s__range, __pyx_k__range, sizeof(__pyx_k__range), 0, 0, 1, 1},
-  {&__pyx_n_s__scalar_multiply, __pyx_k__scalar_multiply, sizeof(__pyx_k__scalar_multiply), 0, 0, 1, 1},
-  {&__pyx_n_s__scores, __pyx_k__scores, sizeof(__pyx_k__scores), 0, 0, 1, 1},
-  {&__pyx_n_s__set, __pyx_k__set, sizeof(__pyx_k__set), 0, 0, 1, 1},
-  {&__pyx_n_s__split, __pyx_k__split, sizeof(__pyx_k__split), 0, 0, 1, 1},
-  {&__pyx_n_s__stderr, __pyx_k__stderr, sizeof(__pyx_k__stderr), 0, 0, 1, 1},
-  {&__pyx_n_s__stdout, __pyx_k__stdout, sizeof(__pyx_k__stdout), 0, 0, 1, 1},
-  {&__pyx_n_s__strip, __pyx_k__strip, sizeof(__pyx_k__strip), 0, 0, 1, 1},
-  {&__pyx_n_s__sys, __pyx_k__sys, sizeof(__pyx_k__sys), 0, 0, 1, 1},
-  {&__pyx_n_s__tick, __pyx_k__tick, sizeof(__pyx_k__tick), 0, 0, 1, 1},
-  {&__pyx_n_s__updateFeatures, __pyx_k__updateFeatures, sizeof(__pyx_k__updateFeatures), 0, 0, 1, 1},
-  {&__pyx_n_s__val, __pyx_k__val, sizeof(__pyx_k__val), 0, 0, 1, 1},
-  {&__pyx_n_s__vals, __pyx_k__vals, sizeof(__pyx_k__vals), 0, 0, 1, 1},
-  {&__pyx_n_s__values, __pyx_k__values, sizeof(__pyx_k__values), 0, 0, 1, 1},
-  {&__pyx_n_s__w, __pyx_k__w, sizeof(__pyx_k__w), 0, 0, 1, 1},
-  {&__pyx_n_s__write, __pyx_k__write, sizeof(__pyx_k__write), 0, 0, 1, 1},
-  {&__pyx_n_s__xrange, __pyx_k__xrange, sizeof(__pyx_k__xrange), 0, 0, 1, 1},
-  {0, 0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_builtin_xrange = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_xrange) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #else
-  __pyx_builtin_xrange = __Pyx_GetName(__pyx_b, __pyx_n_s__xrange); if (!__pyx_builtin_xrange) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  __pyx_builtin_KeyError = __Pyx_GetName(__pyx_b, __pyx_n_s__KeyError); if (!__pyx_builtin_KeyError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_range = __Pyx_GetName(__pyx_b, __pyx_n_s__range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_max = __Pyx_GetName(__pyx_b, __pyx_n_s__max); if (!__pyx_builtin_max) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 402; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC initml(void); /*proto*/
-PyMODINIT_FUNC initml(void)
-#else
-PyMODINIT_FUNC PyInit_ml(void); /*proto*/
-PyMODINIT_FUNC PyInit_ml(void)
-#endif
-{
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  #if CYTHON_REFNANNY
-  void* __pyx_refnanny = NULL;
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-      PyErr_Clear();
-      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-      if (!__Pyx_RefNanny)
-          Py_FatalError("failed to import 'refnanny' module");
-  }
-  __pyx_refnanny = __Pyx_RefNanny->SetupContext("PyMODINIT_FUNC PyInit_ml(void)", __LINE__, __FILE__);
-  #endif
-  __pyx_init_filenames();
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #if PY_MAJOR_VERSION < 3
-  __pyx_empty_bytes = PyString_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #else
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
-  PyEval_InitThreads();
-  #endif
-  #endif
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4(__Pyx_NAMESTR("ml"), __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_NAMESTR(__Pyx_BUILTIN_MODULE_NAME));
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__pyx_module_is_main_ml) {
-    if (__Pyx_SetAttrString(__pyx_m, "__name__", __pyx_n_s____main__) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  }
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Global init code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_2ml_DoublesArr) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "DoublesArr", (PyObject *)&__pyx_type_2ml_DoublesArr) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_DoublesArr = &__pyx_type_2ml_DoublesArr;
-  __pyx_vtabptr_2ml_MulticlassModel = &__pyx_vtable_2ml_MulticlassModel;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_2ml_MulticlassModel.load = (PyObject *(*)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *))__pyx_f_2ml_15MulticlassModel_load;
-  __pyx_vtable_2ml_MulticlassModel.predict = (PyObject *(*)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_15MulticlassModel_predict;
-  __pyx_vtable_2ml_MulticlassModel.predict_r = (PyObject *(*)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_15MulticlassModel_predict_r;
-  __pyx_vtable_2ml_MulticlassModel.get_scores = (PyObject *(*)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_15MulticlassModel_get_scores;
-  __pyx_vtable_2ml_MulticlassModel.get_scores_r = (PyObject *(*)(struct __pyx_obj_2ml_MulticlassModel *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_15MulticlassModel_get_scores_r;
-  #else
-  *(void(**)(void))&__pyx_vtable_2ml_MulticlassModel.load = (void(*)(void))__pyx_f_2ml_15MulticlassModel_load;
-  *(void(**)(void))&__pyx_vtable_2ml_MulticlassModel.predict = (void(*)(void))__pyx_f_2ml_15MulticlassModel_predict;
-  *(void(**)(void))&__pyx_vtable_2ml_MulticlassModel.predict_r = (void(*)(void))__pyx_f_2ml_15MulticlassModel_predict_r;
-  *(void(**)(void))&__pyx_vtable_2ml_MulticlassModel.get_scores = (void(*)(void))__pyx_f_2ml_15MulticlassModel_get_scores;
-  *(void(**)(void))&__pyx_vtable_2ml_MulticlassModel.get_scores_r = (void(*)(void))__pyx_f_2ml_15MulticlassModel_get_scores_r;
-  #endif
-  if (PyType_Ready(&__pyx_type_2ml_MulticlassModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_2ml_MulticlassModel.tp_dict, __pyx_vtabptr_2ml_MulticlassModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "MulticlassModel", (PyObject *)&__pyx_type_2ml_MulticlassModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_MulticlassModel = &__pyx_type_2ml_MulticlassModel;
-  if (PyType_Ready(&__pyx_type_2ml_MulticlassParamData) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "MulticlassParamData", (PyObject *)&__pyx_type_2ml_MulticlassParamData) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_MulticlassParamData = &__pyx_type_2ml_MulticlassParamData;
-  __pyx_vtabptr_2ml_MultitronParameters = &__pyx_vtable_2ml_MultitronParameters;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_2ml_MultitronParameters.getW = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_getW;
-  __pyx_vtable_2ml_MultitronParameters._tick = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *))__pyx_f_2ml_19MultitronParameters__tick;
-  __pyx_vtable_2ml_MultitronParameters.scalar_multiply = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, double, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_scalar_multiply;
-  __pyx_vtable_2ml_MultitronParameters.add = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, double, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_add;
-  __pyx_vtable_2ml_MultitronParameters.add_r = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, double, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_add_r;
-  __pyx_vtable_2ml_MultitronParameters.set = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, double, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_set;
-  __pyx_vtable_2ml_MultitronParameters.add_params = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, struct __pyx_obj_2ml_MultitronParameters *, double, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_add_params;
-  __pyx_vtable_2ml_MultitronParameters.do_pa_update = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int, int __pyx_skip_dispatch, struct __pyx_opt_args_2ml_19MultitronParameters_do_pa_update *__pyx_optional_args))__pyx_f_2ml_19MultitronParameters_do_pa_update;
-  __pyx_vtable_2ml_MultitronParameters.pa_update = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, PyObject *, int, int, int __pyx_skip_dispatch, struct __pyx_opt_args_2ml_19MultitronParameters_pa_update *__pyx_optional_args))__pyx_f_2ml_19MultitronParameters_pa_update;
-  __pyx_vtable_2ml_MultitronParameters.get_scores = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_get_scores;
-  __pyx_vtable_2ml_MultitronParameters.get_scores_r = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_get_scores_r;
-  __pyx_vtable_2ml_MultitronParameters.predict_best_class_r = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_19MultitronParameters_predict_best_class_r;
-  __pyx_vtable_2ml_MultitronParameters._predict_best_class = (int (*)(struct __pyx_obj_2ml_MultitronParameters *, PyObject *))__pyx_f_2ml_19MultitronParameters__predict_best_class;
-  __pyx_vtable_2ml_MultitronParameters._update = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, int, int, PyObject *))__pyx_f_2ml_19MultitronParameters__update;
-  __pyx_vtable_2ml_MultitronParameters._update_r = (PyObject *(*)(struct __pyx_obj_2ml_MultitronParameters *, int, int, PyObject *))__pyx_f_2ml_19MultitronParameters__update_r;
-  #else
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.getW = (void(*)(void))__pyx_f_2ml_19MultitronParameters_getW;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters._tick = (void(*)(void))__pyx_f_2ml_19MultitronParameters__tick;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.scalar_multiply = (void(*)(void))__pyx_f_2ml_19MultitronParameters_scalar_multiply;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.add = (void(*)(void))__pyx_f_2ml_19MultitronParameters_add;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.add_r = (void(*)(void))__pyx_f_2ml_19MultitronParameters_add_r;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.set = (void(*)(void))__pyx_f_2ml_19MultitronParameters_set;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.add_params = (void(*)(void))__pyx_f_2ml_19MultitronParameters_add_params;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.do_pa_update = (void(*)(void))__pyx_f_2ml_19MultitronParameters_do_pa_update;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.pa_update = (void(*)(void))__pyx_f_2ml_19MultitronParameters_pa_update;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.get_scores = (void(*)(void))__pyx_f_2ml_19MultitronParameters_get_scores;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.get_scores_r = (void(*)(void))__pyx_f_2ml_19MultitronParameters_get_scores_r;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters.predict_best_class_r = (void(*)(void))__pyx_f_2ml_19MultitronParameters_predict_best_class_r;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters._predict_best_class = (void(*)(void))__pyx_f_2ml_19MultitronParameters__predict_best_class;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters._update = (void(*)(void))__pyx_f_2ml_19MultitronParameters__update;
-  *(void(**)(void))&__pyx_vtable_2ml_MultitronParameters._update_r = (void(*)(void))__pyx_f_2ml_19MultitronParameters__update_r;
-  #endif
-  if (PyType_Ready(&__pyx_type_2ml_MultitronParameters) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_2ml_MultitronParameters.tp_dict, __pyx_vtabptr_2ml_MultitronParameters) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "MultitronParameters", (PyObject *)&__pyx_type_2ml_MultitronParameters) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_MultitronParameters = &__pyx_type_2ml_MultitronParameters;
-  if (PyType_Ready(&__pyx_type_2ml_ParamData) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "ParamData", (PyObject *)&__pyx_type_2ml_ParamData) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 496; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_ParamData = &__pyx_type_2ml_ParamData;
-  __pyx_vtabptr_2ml_PerceptronParameters = &__pyx_vtable_2ml_PerceptronParameters;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_2ml_PerceptronParameters._score = (PyObject *(*)(struct __pyx_obj_2ml_PerceptronParameters *, PyObject *))__pyx_f_2ml_20PerceptronParameters__score;
-  __pyx_vtable_2ml_PerceptronParameters.updateFeatures = (PyObject *(*)(struct __pyx_obj_2ml_PerceptronParameters *, PyObject *, double, int __pyx_skip_dispatch))__pyx_f_2ml_20PerceptronParameters_updateFeatures;
-  #else
-  *(void(**)(void))&__pyx_vtable_2ml_PerceptronParameters._score = (void(*)(void))__pyx_f_2ml_20PerceptronParameters__score;
-  *(void(**)(void))&__pyx_vtable_2ml_PerceptronParameters.updateFeatures = (void(*)(void))__pyx_f_2ml_20PerceptronParameters_updateFeatures;
-  #endif
-  if (PyType_Ready(&__pyx_type_2ml_PerceptronParameters) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_2ml_PerceptronParameters.tp_dict, __pyx_vtabptr_2ml_PerceptronParameters) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "PerceptronParameters", (PyObject *)&__pyx_type_2ml_PerceptronParameters) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 506; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_PerceptronParameters = &__pyx_type_2ml_PerceptronParameters;
-  if (PyType_Ready(&__pyx_type_2ml__float) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "_float", (PyObject *)&__pyx_type_2ml__float) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 567; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml__float = &__pyx_type_2ml__float;
-  __pyx_vtabptr_2ml_LinearModel = &__pyx_vtable_2ml_LinearModel;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_2ml_LinearModel._load = (PyObject *(*)(struct __pyx_obj_2ml_LinearModel *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_11LinearModel__load;
-  __pyx_vtable_2ml_LinearModel._score = (double (*)(struct __pyx_obj_2ml_LinearModel *, PyObject *))__pyx_f_2ml_11LinearModel__score;
-  #else
-  *(void(**)(void))&__pyx_vtable_2ml_LinearModel._load = (void(*)(void))__pyx_f_2ml_11LinearModel__load;
-  *(void(**)(void))&__pyx_vtable_2ml_LinearModel._score = (void(*)(void))__pyx_f_2ml_11LinearModel__score;
-  #endif
-  if (PyType_Ready(&__pyx_type_2ml_LinearModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_2ml_LinearModel.tp_dict, __pyx_vtabptr_2ml_LinearModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "LinearModel", (PyObject *)&__pyx_type_2ml_LinearModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 576; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_LinearModel = &__pyx_type_2ml_LinearModel;
-  if (PyType_Ready(&__pyx_type_2ml_MultipleVectorsMulticlassModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 628; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "MultipleVectorsMulticlassModel", (PyObject *)&__pyx_type_2ml_MultipleVectorsMulticlassModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 628; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_MultipleVectorsMulticlassModel = &__pyx_type_2ml_MultipleVectorsMulticlassModel;
-  __pyx_vtabptr_2ml_MultipleVectorsMulticlassParams = &__pyx_vtable_2ml_MultipleVectorsMulticlassParams;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_2ml_MultipleVectorsMulticlassParams.add = (PyObject *(*)(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *, PyObject *, int, double, int __pyx_skip_dispatch))__pyx_f_2ml_31MultipleVectorsMulticlassParams_add;
-  __pyx_vtable_2ml_MultipleVectorsMulticlassParams.tick = (PyObject *(*)(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *, int __pyx_skip_dispatch))__pyx_f_2ml_31MultipleVectorsMulticlassParams_tick;
-  __pyx_vtable_2ml_MultipleVectorsMulticlassParams.get_scores = (PyObject *(*)(struct __pyx_obj_2ml_MultipleVectorsMulticlassParams *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_31MultipleVectorsMulticlassParams_get_scores;
-  #else
-  *(void(**)(void))&__pyx_vtable_2ml_MultipleVectorsMulticlassParams.add = (void(*)(void))__pyx_f_2ml_31MultipleVectorsMulticlassParams_add;
-  *(void(**)(void))&__pyx_vtable_2ml_MultipleVectorsMulticlassParams.tick = (void(*)(void))__pyx_f_2ml_31MultipleVectorsMulticlassParams_tick;
-  *(void(**)(void))&__pyx_vtable_2ml_MultipleVectorsMulticlassParams.get_scores = (void(*)(void))__pyx_f_2ml_31MultipleVectorsMulticlassParams_get_scores;
-  #endif
-  __pyx_type_2ml_MultipleVectorsMulticlassParams.tp_base = __pyx_ptype_2ml_MultipleVectorsMulticlassModel;
-  if (PyType_Ready(&__pyx_type_2ml_MultipleVectorsMulticlassParams) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_2ml_MultipleVectorsMulticlassParams.tp_dict, __pyx_vtabptr_2ml_MultipleVectorsMulticlassParams) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "MultipleVectorsMulticlassParams", (PyObject *)&__pyx_type_2ml_MultipleVectorsMulticlassParams) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 639; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_MultipleVectorsMulticlassParams = &__pyx_type_2ml_MultipleVectorsMulticlassParams;
-  __pyx_vtabptr_2ml_MulticlassLinearModel = &__pyx_vtable_2ml_MulticlassLinearModel;
-  #if PY_MAJOR_VERSION >= 3
-  __pyx_vtable_2ml_MulticlassLinearModel.nclasses = (int (*)(struct __pyx_obj_2ml_MulticlassLinearModel *, int __pyx_skip_dispatch))__pyx_f_2ml_21MulticlassLinearModel_nclasses;
-  __pyx_vtable_2ml_MulticlassLinearModel.get_scores = (PyObject *(*)(struct __pyx_obj_2ml_MulticlassLinearModel *, PyObject *, int __pyx_skip_dispatch))__pyx_f_2ml_21MulticlassLinearModel_get_scores;
-  #else
-  *(void(**)(void))&__pyx_vtable_2ml_MulticlassLinearModel.nclasses = (void(*)(void))__pyx_f_2ml_21MulticlassLinearModel_nclasses;
-  *(void(**)(void))&__pyx_vtable_2ml_MulticlassLinearModel.get_scores = (void(*)(void))__pyx_f_2ml_21MulticlassLinearModel_get_scores;
-  #endif
-  __pyx_type_2ml_MulticlassLinearModel.tp_base = __pyx_ptype_2ml_MultipleVectorsMulticlassModel;
-  if (PyType_Ready(&__pyx_type_2ml_MulticlassLinearModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 684; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetVtable(__pyx_type_2ml_MulticlassLinearModel.tp_dict, __pyx_vtabptr_2ml_MulticlassLinearModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 684; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (__Pyx_SetAttrString(__pyx_m, "MulticlassLinearModel", (PyObject *)&__pyx_type_2ml_MulticlassLinearModel) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 684; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_2ml_MulticlassLinearModel = &__pyx_type_2ml_MulticlassLinearModel;
-  /*--- Type import code ---*/
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":18
- * ##    along with easyfirst.  If not, see <http://www.gnu.org/licenses/>.
- * 
- * import sys             # <<<<<<<<<<<<<<
- * import math
- * 
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__sys), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 18; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__sys, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 18; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":19
- * 
- * import sys
- * import math             # <<<<<<<<<<<<<<
- * 
- * from stdlib cimport *
- */
-  __pyx_t_1 = __Pyx_Import(((PyObject *)__pyx_n_s__math), 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s__math, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":62
- *       self.scores=<double *>malloc(sizeof(double)*self.nclas)
- * 
- *    def __init__(self, fname, probs_output=False):             # <<<<<<<<<<<<<<
- *       self.W = {}
- *       self.probs_output=probs_output
- */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_k_3 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":476
- *             p.w[c] = p.acc[c] / self.now
- * 
- *    def dump(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       for f in self.W.keys():
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__stdout); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 476; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_k_7 = __pyx_t_2;
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":485
- *          out.write("\n")
- * 
- *    def dump_fin(self,out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef MulticlassParamData p
- *       # write the average
- */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 485; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__stdout); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 485; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_k_11 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":553
- *          p.w = p.acc / self.now
- * 
- *    def dump(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__stdout); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 553; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_k_13 = __pyx_t_2;
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":560
- *          out.write("\n")
- * 
- *    def dump_fin(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       cdef ParamData p
- *       for f,p in self.W.iteritems():
- */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__stdout); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 560; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_k_14 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":595
- * 
- *    @classmethod
- *    def from_file(cls, fname):             # <<<<<<<<<<<<<<
- *       sys.stderr.write("loading model %s" % fname)
- *       o=cls()
- */
-  __pyx_t_1 = __Pyx_GetName((PyObject *)__pyx_ptype_2ml_LinearModel, __pyx_n_s__from_file); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_Method_ClassMethod(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 594; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_2ml_LinearModel->tp_dict, __pyx_n_s__from_file, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 595; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_2ml_LinearModel);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":603
- * 
- *    @classmethod
- *    def from_fh(cls, fh):             # <<<<<<<<<<<<<<
- *       o=cls()
- *       o._load(fh)
- */
-  __pyx_t_2 = __Pyx_GetName((PyObject *)__pyx_ptype_2ml_LinearModel, __pyx_n_s__from_fh); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 603; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_Method_ClassMethod(__pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 602; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_2ml_LinearModel->tp_dict, __pyx_n_s__from_fh, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 603; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  PyType_Modified(__pyx_ptype_2ml_LinearModel);
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":670
- *       return scores
- * 
- *    def dump(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       out.write("%s\n" % self.nclasses)
- *       cdef PerceptronParameters p
- */
-  __pyx_t_1 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 670; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_GetAttr(__pyx_t_1, __pyx_n_s__stdout); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 670; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_k_16 = __pyx_t_2;
-  __Pyx_GIVEREF(__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":677
- *          out.write("\n")
- * 
- *    def dump_fin(self, out=sys.stdout):             # <<<<<<<<<<<<<<
- *       out.write("%s\n" % self.nclasses)
- *       cdef PerceptronParameters p
- */
-  __pyx_t_2 = __Pyx_GetName(__pyx_m, __pyx_n_s__sys); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 677; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_GetAttr(__pyx_t_2, __pyx_n_s__stdout); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 677; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_k_18 = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "/home/yoavg/Vork/Research/software/easyfirst/ml/ml.pyx":700
- * 
- *    @classmethod
- *    def from_file(cls, fname):             # <<<<<<<<<<<<<<
- *       o=cls()
- *       fh=file(fname)
- */
-  __pyx_t_1 = __Pyx_GetName((PyObject *)__pyx_ptype_2ml_MulticlassLinearModel, __pyx_n_s__from_file); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 700; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_Method_ClassMethod(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 699; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_2ml_MulticlassLinearModel->tp_dict, __pyx_n_s__from_file, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 700; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_2ml_MulticlassLinearModel);
-
-  /* "/usr/local/lib/python2.6/dist-packages/Cython-0.12.1-py2.6-linux-x86_64.egg/Cython/Includes/stdlib.pxd":2
- * 
- * cdef extern from "stdlib.h" nogil:             # <<<<<<<<<<<<<<
- *     void free(void *ptr)
- *     void *malloc(size_t size)
- */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  if (__pyx_m) {
-    __Pyx_AddTraceback("init ml");
-    Py_DECREF(__pyx_m); __pyx_m = 0;
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init ml");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-}
-
-static const char *__pyx_filenames[] = {
-  "ml.pyx",
-};
-
-/* Runtime support code */
-
-static void __pyx_init_filenames(void) {
-  __pyx_f = __pyx_filenames;
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AS_STRING(kw_name));
-        #endif
-}
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *number, *more_or_less;
-
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    number = (num_expected == 1) ? "" : "s";
-    PyErr_Format(PyExc_TypeError,
-        #if PY_VERSION_HEX < 0x02050000
-            "%s() takes %s %d positional argument%s (%d given)",
-        #else
-            "%s() takes %s %zd positional argument%s (%zd given)",
-        #endif
-        func_name, more_or_less, num_expected, number, num_found);
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-        } else {
-            #if PY_MAJOR_VERSION < 3
-            if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
-            #else
-            if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
-            #endif
-                goto invalid_keyword_type;
-            } else {
-                for (name = first_kw_arg; *name; name++) {
-                    #if PY_MAJOR_VERSION >= 3
-                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                        PyUnicode_Compare(**name, key) == 0) break;
-                    #else
-                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                        _PyString_Eq(**name, key)) break;
-                    #endif
-                }
-                if (*name) {
-                    values[name-argnames] = value;
-                } else {
-                    /* unexpected keyword found */
-                    for (name=argnames; name != first_kw_arg; name++) {
-                        if (**name == key) goto arg_passed_twice;
-                        #if PY_MAJOR_VERSION >= 3
-                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
-                        #else
-                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                            _PyString_Eq(**name, key)) goto arg_passed_twice;
-                        #endif
-                    }
-                    if (kwds2) {
-                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-                    } else {
-                        goto invalid_keyword;
-                    }
-                }
-            }
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-static double __Pyx__PyObject_AsDouble(PyObject* obj) {
-    PyObject* float_value;
-    if (Py_TYPE(obj)->tp_as_number && Py_TYPE(obj)->tp_as_number->nb_float) {
-        return PyFloat_AsDouble(obj);
-    } else if (PyUnicode_CheckExact(obj) || PyBytes_CheckExact(obj)) {
-#if PY_MAJOR_VERSION >= 3
-        float_value = PyFloat_FromString(obj);
-#else
-        float_value = PyFloat_FromString(obj, 0);
-#endif
-    } else {
-        PyObject* args = PyTuple_New(1);
-        if (unlikely(!args)) goto bad;
-        PyTuple_SET_ITEM(args, 0, obj);
-        float_value = PyObject_Call((PyObject*)&PyFloat_Type, args, 0);
-        PyTuple_SET_ITEM(args, 0, 0);
-        Py_DECREF(args);
-    }
-    if (likely(float_value)) {
-        double value = PyFloat_AS_DOUBLE(float_value);
-        Py_DECREF(float_value);
-        return value;
-    }
-bad:
-    return (double)-1;
-}
-
-
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-        #if PY_VERSION_HEX < 0x02050000
-                 "need more than %d value%s to unpack", (int)index,
-        #else
-                 "need more than %zd value%s to unpack", index,
-        #endif
-                 (index == 1) ? "" : "s");
-}
-
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(void) {
-    PyErr_SetString(PyExc_ValueError, "too many values to unpack");
-}
-
-static PyObject *__Pyx_UnpackItem(PyObject *iter, Py_ssize_t index) {
-    PyObject *item;
-    if (!(item = PyIter_Next(iter))) {
-        if (!PyErr_Occurred()) {
-            __Pyx_RaiseNeedMoreValuesError(index);
-        }
-    }
-    return item;
-}
-
-static int __Pyx_EndUnpack(PyObject *iter) {
-    PyObject *item;
-    if ((item = PyIter_Next(iter))) {
-        Py_DECREF(item);
-        __Pyx_RaiseTooManyValuesError();
-        return -1;
-    }
-    else if (!PyErr_Occurred())
-        return 0;
-    else
-        return -1;
-}
-
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (unlikely(!type)) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (likely(PyObject_TypeCheck(obj, type)))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
-                 Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
-    PyObject *local_type, *local_value, *local_tb;
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    local_type = tstate->curexc_type;
-    local_value = tstate->curexc_value;
-    local_tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
-    if (unlikely(tstate->curexc_type))
-        goto bad;
-    #if PY_MAJOR_VERSION >= 3
-    if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
-        goto bad;
-    #endif
-    *type = local_type;
-    *value = local_value;
-    *tb = local_tb;
-    Py_INCREF(local_type);
-    Py_INCREF(local_value);
-    Py_INCREF(local_tb);
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = local_type;
-    tstate->exc_value = local_value;
-    tstate->exc_traceback = local_tb;
-    /* Make sure tstate is in a consistent state when we XDECREF
-       these objects (XDECREF may run arbitrary code). */
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-    return 0;
-bad:
-    *type = 0;
-    *value = 0;
-    *tb = 0;
-    Py_XDECREF(local_type);
-    Py_XDECREF(local_value);
-    Py_XDECREF(local_tb);
-    return -1;
-}
-
-
-
-static CYTHON_INLINE int __Pyx_CheckKeywordStrings(
-    PyObject *kwdict,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-    while (PyDict_Next(kwdict, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key)))
-        #else
-        if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key)))
-        #endif
-            goto invalid_keyword_type;
-    }
-    if ((!kw_allowed) && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    return 0;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-    return 0;
-}
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (!type) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (Py_TYPE(obj) == type) return 1;
-    }
-    else {
-        if (PyObject_TypeCheck(obj, type)) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%s' has incorrect type (expected %s, got %s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-static CYTHON_INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-}
-
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
-    PyObject *__import__ = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    __import__ = __Pyx_GetAttrString(__pyx_b, "__import__");
-    if (!__import__)
-        goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    module = PyObject_CallFunctionObjArgs(__import__,
-        name, global_dict, empty_dict, list, NULL);
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(__import__);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
-
-static PyObject* __Pyx_Method_ClassMethod(PyObject *method) {
-    /* It appears that PyMethodDescr_Type is not anywhere exposed in the Python/C API */
-    static PyTypeObject *methoddescr_type = NULL;
-    if (methoddescr_type == NULL) {
-       PyObject *meth = __Pyx_GetAttrString((PyObject*)&PyList_Type, "append");
-       if (!meth) return NULL;
-       methoddescr_type = Py_TYPE(meth);
-       Py_DECREF(meth);
-    }
-    if (PyObject_TypeCheck(method, methoddescr_type)) { /* cdef classes */
-        PyMethodDescrObject *descr = (PyMethodDescrObject *)method;
-        #if PY_VERSION_HEX < 0x03020000
-        PyTypeObject *d_type = descr->d_type;
-        #else
-        PyTypeObject *d_type = descr->d_common.d_type;
-        #endif
-        return PyDescr_NewClassMethod(d_type, descr->d_method);
-    }
-    else if (PyMethod_Check(method)) { /* python classes */
-        return PyClassMethod_New(PyMethod_GET_FUNCTION(method));
-    }
-    else if (PyCFunction_Check(method)) {
-        return PyClassMethod_New(method);
-    }
-    PyErr_Format(PyExc_TypeError,
-                 "Class-level classmethod() can only be called on"
-                 "a method_descriptor or instance method.");
-    return NULL;
-}
-
-static CYTHON_INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static CYTHON_INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-#else /* Python 3+ */
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (!PyExceptionClass_Check(type)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
-    }
-
-    PyErr_SetObject(type, value);
-
-    if (tb) {
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-    }
-
-bad:
-    return;
-}
-#endif
-
-static CYTHON_INLINE unsigned char __Pyx_PyInt_AsUnsignedChar(PyObject* x) {
-    const unsigned char neg_one = (unsigned char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned char" :
-                    "value too large to convert to unsigned char");
-            }
-            return (unsigned char)-1;
-        }
-        return (unsigned char)val;
-    }
-    return (unsigned char)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned short __Pyx_PyInt_AsUnsignedShort(PyObject* x) {
-    const unsigned short neg_one = (unsigned short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned short" :
-                    "value too large to convert to unsigned short");
-            }
-            return (unsigned short)-1;
-        }
-        return (unsigned short)val;
-    }
-    return (unsigned short)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE unsigned int __Pyx_PyInt_AsUnsignedInt(PyObject* x) {
-    const unsigned int neg_one = (unsigned int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(unsigned int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(unsigned int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to unsigned int" :
-                    "value too large to convert to unsigned int");
-            }
-            return (unsigned int)-1;
-        }
-        return (unsigned int)val;
-    }
-    return (unsigned int)__Pyx_PyInt_AsUnsignedLong(x);
-}
-
-static CYTHON_INLINE char __Pyx_PyInt_AsChar(PyObject* x) {
-    const char neg_one = (char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to char" :
-                    "value too large to convert to char");
-            }
-            return (char)-1;
-        }
-        return (char)val;
-    }
-    return (char)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE short __Pyx_PyInt_AsShort(PyObject* x) {
-    const short neg_one = (short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to short" :
-                    "value too large to convert to short");
-            }
-            return (short)-1;
-        }
-        return (short)val;
-    }
-    return (short)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE int __Pyx_PyInt_AsInt(PyObject* x) {
-    const int neg_one = (int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to int" :
-                    "value too large to convert to int");
-            }
-            return (int)-1;
-        }
-        return (int)val;
-    }
-    return (int)__Pyx_PyInt_AsLong(x);
-}
-
-static CYTHON_INLINE signed char __Pyx_PyInt_AsSignedChar(PyObject* x) {
-    const signed char neg_one = (signed char)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed char) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed char)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed char" :
-                    "value too large to convert to signed char");
-            }
-            return (signed char)-1;
-        }
-        return (signed char)val;
-    }
-    return (signed char)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed short __Pyx_PyInt_AsSignedShort(PyObject* x) {
-    const signed short neg_one = (signed short)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed short) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed short)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed short" :
-                    "value too large to convert to signed short");
-            }
-            return (signed short)-1;
-        }
-        return (signed short)val;
-    }
-    return (signed short)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE signed int __Pyx_PyInt_AsSignedInt(PyObject* x) {
-    const signed int neg_one = (signed int)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (sizeof(signed int) < sizeof(long)) {
-        long val = __Pyx_PyInt_AsLong(x);
-        if (unlikely(val != (long)(signed int)val)) {
-            if (!unlikely(val == -1 && PyErr_Occurred())) {
-                PyErr_SetString(PyExc_OverflowError,
-                    (is_unsigned && unlikely(val < 0)) ?
-                    "can't convert negative value to signed int" :
-                    "value too large to convert to signed int");
-            }
-            return (signed int)-1;
-        }
-        return (signed int)val;
-    }
-    return (signed int)__Pyx_PyInt_AsSignedLong(x);
-}
-
-static CYTHON_INLINE unsigned long __Pyx_PyInt_AsUnsignedLong(PyObject* x) {
-    const unsigned long neg_one = (unsigned long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned long");
-            return (unsigned long)-1;
-        }
-        return (unsigned long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned long");
-                return (unsigned long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        unsigned long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned long)-1;
-        val = __Pyx_PyInt_AsUnsignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to unsigned PY_LONG_LONG");
-            return (unsigned PY_LONG_LONG)-1;
-        }
-        return (unsigned PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to unsigned PY_LONG_LONG");
-                return (unsigned PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        unsigned PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (unsigned PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsUnsignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE long __Pyx_PyInt_AsLong(PyObject* x) {
-    const long neg_one = (long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to long");
-            return (long)-1;
-        }
-        return (long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to long");
-                return (long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (long)-1;
-        val = __Pyx_PyInt_AsLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_AsLongLong(PyObject* x) {
-    const PY_LONG_LONG neg_one = (PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to PY_LONG_LONG");
-            return (PY_LONG_LONG)-1;
-        }
-        return (PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to PY_LONG_LONG");
-                return (PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed long __Pyx_PyInt_AsSignedLong(PyObject* x) {
-    const signed long neg_one = (signed long)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed long");
-            return (signed long)-1;
-        }
-        return (signed long)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed long");
-                return (signed long)-1;
-            }
-            return PyLong_AsUnsignedLong(x);
-        } else {
-            return PyLong_AsLong(x);
-        }
-    } else {
-        signed long val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed long)-1;
-        val = __Pyx_PyInt_AsSignedLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static CYTHON_INLINE signed PY_LONG_LONG __Pyx_PyInt_AsSignedLongLong(PyObject* x) {
-    const signed PY_LONG_LONG neg_one = (signed PY_LONG_LONG)-1, const_zero = 0;
-    const int is_unsigned = neg_one > const_zero;
-#if PY_VERSION_HEX < 0x03000000
-    if (likely(PyInt_Check(x))) {
-        long val = PyInt_AS_LONG(x);
-        if (is_unsigned && unlikely(val < 0)) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "can't convert negative value to signed PY_LONG_LONG");
-            return (signed PY_LONG_LONG)-1;
-        }
-        return (signed PY_LONG_LONG)val;
-    } else
-#endif
-    if (likely(PyLong_Check(x))) {
-        if (is_unsigned) {
-            if (unlikely(Py_SIZE(x) < 0)) {
-                PyErr_SetString(PyExc_OverflowError,
-                                "can't convert negative value to signed PY_LONG_LONG");
-                return (signed PY_LONG_LONG)-1;
-            }
-            return PyLong_AsUnsignedLongLong(x);
-        } else {
-            return PyLong_AsLongLong(x);
-        }
-    } else {
-        signed PY_LONG_LONG val;
-        PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (signed PY_LONG_LONG)-1;
-        val = __Pyx_PyInt_AsSignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static void __Pyx_WriteUnraisable(const char *name) {
-    PyObject *old_exc, *old_val, *old_tb;
-    PyObject *ctx;
-    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
-    #if PY_MAJOR_VERSION < 3
-    ctx = PyString_FromString(name);
-    #else
-    ctx = PyUnicode_FromString(name);
-    #endif
-    __Pyx_ErrRestore(old_exc, old_val, old_tb);
-    if (!ctx) {
-        PyErr_WriteUnraisable(Py_None);
-    } else {
-        PyErr_WriteUnraisable(ctx);
-        Py_DECREF(ctx);
-    }
-}
-
-static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
-#if PY_VERSION_HEX < 0x03010000
-    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
-#else
-    PyObject *ob = PyCapsule_New(vtable, 0, 0);
-#endif
-    if (!ob)
-        goto bad;
-    if (PyDict_SetItemString(dict, "__pyx_vtable__", ob) < 0)
-        goto bad;
-    Py_DECREF(ob);
-    return 0;
-bad:
-    Py_XDECREF(ob);
-    return -1;
-}
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(const char *funcname) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(__pyx_filename);
-    #else
-    py_srcfile = PyUnicode_FromString(__pyx_filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (__pyx_clineno) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        #if PY_MAJOR_VERSION >= 3
-        0,            /*int kwonlyargcount,*/
-        #endif
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple,  /*PyObject *consts,*/
-        __pyx_empty_tuple,  /*PyObject *names,*/
-        __pyx_empty_tuple,  /*PyObject *varnames,*/
-        __pyx_empty_tuple,  /*PyObject *freevars,*/
-        __pyx_empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else  /* Python 3+ has unicode identifiers */
-        if (t->is_unicode | t->is_str) {
-            if (t->intern) {
-                *t->p = PyUnicode_InternFromString(t->s);
-            } else if (t->encoding) {
-                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
-            } else {
-                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-            }
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-/* Type Conversion Functions */
-
-static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   if (x == Py_True) return 1;
-   else if ((x == Py_False) | (x == Py_None)) return 0;
-   else return PyObject_IsTrue(x);
-}
-
-static CYTHON_INLINE PyObject* __Pyx_PyNumber_Int(PyObject* x) {
-  PyNumberMethods *m;
-  const char *name = NULL;
-  PyObject *res = NULL;
-#if PY_VERSION_HEX < 0x03000000
-  if (PyInt_Check(x) || PyLong_Check(x))
-#else
-  if (PyLong_Check(x))
-#endif
-    return Py_INCREF(x), x;
-  m = Py_TYPE(x)->tp_as_number;
-#if PY_VERSION_HEX < 0x03000000
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Int(x);
-  }
-  else if (m && m->nb_long) {
-    name = "long";
-    res = PyNumber_Long(x);
-  }
-#else
-  if (m && m->nb_int) {
-    name = "int";
-    res = PyNumber_Long(x);
-  }
-#endif
-  if (res) {
-#if PY_VERSION_HEX < 0x03000000
-    if (!PyInt_Check(res) && !PyLong_Check(res)) {
-#else
-    if (!PyLong_Check(res)) {
-#endif
-      PyErr_Format(PyExc_TypeError,
-                   "__%s__ returned non-%s (type %.200s)",
-                   name, name, Py_TYPE(res)->tp_name);
-      Py_DECREF(res);
-      return NULL;
-    }
-  }
-  else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_TypeError,
-                    "an integer is required");
-  }
-  return res;
-}
-
-static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-
-static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
-#if PY_VERSION_HEX < 0x02050000
-   if (ival <= LONG_MAX)
-       return PyInt_FromLong((long)ival);
-   else {
-       unsigned char *bytes = (unsigned char *) &ival;
-       int one = 1; int little = (int)*(unsigned char*)&one;
-       return _PyLong_FromByteArray(bytes, sizeof(size_t), little, 0);
-   }
-#else
-   return PyInt_FromSize_t(ival);
-#endif
-}
-
-static CYTHON_INLINE size_t __Pyx_PyInt_AsSize_t(PyObject* x) {
-   unsigned PY_LONG_LONG val = __Pyx_PyInt_AsUnsignedLongLong(x);
-   if (unlikely(val == (unsigned PY_LONG_LONG)-1 && PyErr_Occurred())) {
-       return (size_t)-1;
-   } else if (unlikely(val != (unsigned PY_LONG_LONG)(size_t)val)) {
-       PyErr_SetString(PyExc_OverflowError,
-                       "value too large to convert to size_t");
-       return (size_t)-1;
-   }
-   return (size_t)val;
-}
-
-
-#endif /* Py_PYTHON_H */
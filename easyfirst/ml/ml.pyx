@@ -15,11 +15,25 @@
 ##    You should have received a copy of the GNU General Public License
 ##    along with easyfirst.  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import sys
 import math
+import struct
+import itertools
+from array import array
 
 from stdlib cimport *
 
+cdef extern from "string.h":
+   int memcmp(void *s1, void *s2, size_t n)
+
+cdef extern from "sys/mman.h":
+   void *mmap(void *addr, size_t length, int prot, int flags, int fd, long offset)
+   int munmap(void *addr, size_t length)
+   int PROT_READ
+   int MAP_SHARED
+   void *MAP_FAILED
+
 
 cdef class DoublesArr:
    cdef double* vals
@@ -147,6 +161,15 @@ cdef class MulticlassModel:
          res.append(self.scores[i])
       return res
 
+   cpdef list get_scores_batch(self,list batch):
+      """
+      get_scores of each features list in batch
+      """
+      cdef list res=[]
+      for features in batch:
+         res.append(self.get_scores(features))
+      return res
+
    cpdef list get_scores_r(self,list features): #@@TODO FIX
       """
       like get_scores but with real values features
@@ -170,6 +193,406 @@ cdef class MulticlassModel:
       return res
    #}}}
 
+### Hashed feature space {{{
+# features are hashed into a fixed number of buckets, and weights are kept in
+# a contiguous (nbuckets x nclasses) matrix.
+# a feature is either a string, or a tuple of atoms (strings, ints, None,
+# bools). a tuple is hashed as the string "_".join(map(str,atoms)) would be,
+# without building that string: ("f1t","NN") and "f1t_NN" share a bucket, so
+# string-keyed models can be hashed and used with tuple features.
+
+cdef unsigned int FNV_OFFSET = 2166136261U
+cdef unsigned int FNV_PRIME = 16777619U
+
+cdef unsigned int _hash_str(char *s, Py_ssize_t n, unsigned int h):
+   cdef Py_ssize_t i
+   for i in range(n):
+      h = (h ^ <unsigned char>s[i]) * FNV_PRIME
+   return h
+
+cdef unsigned int _hash_int(long v, unsigned int h):
+   # hash the decimal representation of v
+   cdef char digits[24]
+   cdef int n = 0
+   cdef unsigned long u
+   if v < 0:
+      h = (h ^ <unsigned char>'-') * FNV_PRIME
+      u = -v
+   else:
+      u = v
+   while True:
+      digits[n] = <char>(48 + u % 10)
+      n += 1
+      u = u / 10
+      if u == 0: break
+   while n > 0:
+      n -= 1
+      h = (h ^ <unsigned char>digits[n]) * FNV_PRIME
+   return h
+
+cdef unsigned int _hash_feature(object f):
+   cdef unsigned int h = FNV_OFFSET
+   cdef char *s
+   cdef bint first = True
+   if isinstance(f, str):
+      s = f
+      return _hash_str(s, len(f), h)
+   for x in f:
+      if not first: h = (h ^ <unsigned char>'_') * FNV_PRIME
+      first = False
+      if isinstance(x, str):
+         s = x
+         h = _hash_str(s, len(x), h)
+      elif x is None or x is True or x is False or not isinstance(x, int):
+         x = str(x)
+         s = x
+         h = _hash_str(s, len(x), h)
+      else:
+         h = _hash_int(x, h)
+   return h
+
+cpdef int hash_feature(object f, int nbuckets):
+   """
+   bucket of a single feature (string or tuple), stable across runs and
+   platforms.
+   """
+   return _hash_feature(f) % nbuckets
+
+cpdef list hash_features(list features, int nbuckets):
+   cdef list res = []
+   for f in features:
+      res.append(_hash_feature(f) % nbuckets)
+   return res
+
+cdef class HashedMulticlassModel:
+   """
+   like MulticlassModel, with integer features (buckets) instead of strings.
+
+   loads either a file written by HashedMultitronParameters.dump_fin
+   (first line: "#hashed nbuckets"), or a string-keyed weights file, whose
+   features are then hashed into nbuckets buckets (colliding weights are
+   summed).
+   """
+   cdef double* W
+   cdef double* biases
+   cdef public int nbuckets
+   cdef int nclas
+   cdef double* scores
+
+   def __init__(self, fname, nbuckets=None):
+      cdef int i, b
+      cdef double* row
+      sys.stderr.write("loading model %s" % fname)
+      fh = file(fname)
+      first = fh.readline()
+      hashed = first.startswith("#hashed")
+      if hashed:
+         nbuckets = int(first.split()[1])
+         lines = fh
+      elif nbuckets is None:
+         raise ValueError("nbuckets is required to hash a string-keyed model")
+      else:
+         lines = itertools.chain([first], fh)
+      self.nbuckets = nbuckets
+      self.nclas = 0
+      for line in lines:
+         f,ws = line.strip().split(None,1)
+         ws = [float(w) for w in ws.split()]
+         if self.nclas == 0:
+            self.nclas = len(ws)
+            self.W = <double *>malloc(sizeof(double)*self.nbuckets*self.nclas)
+            self.biases = <double *>malloc(sizeof(double)*self.nclas)
+            self.scores = <double *>malloc(sizeof(double)*self.nclas)
+            for i in range(self.nbuckets*self.nclas): self.W[i] = 0
+            for i in range(self.nclas): self.biases[i] = 0
+         if f == '**BIAS**':
+            row = self.biases
+         else:
+            if hashed: b = int(f)
+            else: b = hash_feature(f, self.nbuckets)
+            row = self.W + b*self.nclas
+         for i in range(self.nclas):
+            row[i] += ws[i]
+      fh.close()
+      sys.stderr.write(" done\n")
+
+   def __dealloc__(self):
+      free(self.W)
+      free(self.biases)
+      free(self.scores)
+
+   cdef _score(self, list features):
+      cdef int i, b
+      cdef double* row
+      for i in range(self.nclas):
+         self.scores[i]=self.biases[i]
+      for f in features:
+         b = f
+         if b < 0 or b >= self.nbuckets: continue
+         row = self.W + b*self.nclas
+         for i in range(self.nclas):
+            self.scores[i]+=row[i]
+
+   cpdef object get_scores(self, list features):
+      cdef int i
+      cdef list res=[]
+      self._score(features)
+      for i in range(self.nclas):
+         res.append(self.scores[i])
+      return res
+
+   cpdef list get_scores_batch(self, list batch):
+      cdef list res=[]
+      for features in batch:
+         res.append(self.get_scores(features))
+      return res
+
+   cpdef object predict(self, list features):
+      cdef int i
+      cdef int besti=0
+      cdef list res=[]
+      self._score(features)
+      for i in range(self.nclas):
+         if self.scores[i] > self.scores[besti]: besti = i
+         res.append(self.scores[i])
+      return besti,res
+#}}}
+
+### Binary (memory mapped) models {{{
+# a binary model is mapped read-only in memory: loading it costs nothing, and
+# all the processes using the same file share its pages.
+#
+# layout (native byte order):
+#   header, padded to BINARY_HEADER_SIZE bytes:
+#      magic, nclasses, hashed, nrows, nslots, size of the keys
+#   biases:  nclasses doubles
+#   weights: nrows x nclasses doubles
+#   string-keyed models only:
+#      slots:   nslots ints, open addressing table (linear probing) over the
+#               hash of the keys (see _hash_feature), holding row numbers
+#               or -1
+#      offsets: nrows+1 unsigned ints, key r is keys[offsets[r]:offsets[r+1]]
+#      keys:    the concatenated keys
+# in a hashed model, the row of a feature is its bucket (nrows==nbuckets).
+
+BINARY_MAGIC = "EFBIN001"
+BINARY_HEADER = struct.Struct("=8siiqqq")
+BINARY_HEADER_SIZE = 64
+
+def _write_binary_header(out, nclasses, hashed, nrows, nslots, keysize):
+   header = BINARY_HEADER.pack(BINARY_MAGIC, nclasses, hashed, nrows, nslots, keysize)
+   out.write(header + "\0"*(BINARY_HEADER_SIZE-len(header)))
+
+def write_binary_model(out, rows, nbuckets=None):
+   """
+   write a binary model from (feature, weights) pairs. "**BIAS**" holds the
+   biases. the features are strings, or buckets if nbuckets is given.
+   """
+   cdef int nclasses, h, mask
+   cdef long nslots
+   rows = iter(rows)
+   try:
+      first = rows.next()
+   except StopIteration:
+      raise ValueError("empty model")
+   rows = itertools.chain([first], rows)
+   nclasses = len(first[1])
+   biases = array('d', [0.0]*nclasses)
+   if nbuckets:
+      W = array('d', [0.0])*(nbuckets*nclasses)
+      for f,ws in rows:
+         if f == '**BIAS**':
+            biases = array('d', ws)
+            continue
+         k = int(f)*nclasses
+         W[k:k+nclasses] = array('d', ws)
+      nrows = nbuckets
+      nslots = 0
+      tables = []
+   else:
+      W = array('d')
+      keys = []
+      for f,ws in rows:
+         if f == '**BIAS**':
+            biases = array('d', ws)
+            continue
+         keys.append(f)
+         W.extend(ws)
+      nrows = len(keys)
+      nslots = 1
+      while nslots < 2*nrows: nslots *= 2
+      mask = nslots-1
+      slots = array('i', [-1])*nslots
+      offsets = array('I', [0])
+      pos = 0
+      for r,f in enumerate(keys):
+         h = _hash_feature(f) & mask
+         while slots[h] != -1: h = (h+1) & mask
+         slots[h] = r
+         pos += len(f)
+         offsets.append(pos)
+      if pos >= 2**32: raise ValueError("keys too large for a binary model")
+      tables = [slots.tostring(), offsets.tostring(), "".join(keys)]
+   if len(biases) != nclasses or len(W) != nrows*nclasses:
+      raise ValueError("inconsistent number of classes")
+   _write_binary_header(out, nclasses, bool(nbuckets), nrows, nslots, len(tables[2]) if tables else 0)
+   out.write(biases.tostring())
+   out.write(W.tostring())
+   for t in tables: out.write(t)
+
+def is_binary_model(fname):
+   fh = file(fname, "rb")
+   magic = fh.read(len(BINARY_MAGIC))
+   fh.close()
+   return magic == BINARY_MAGIC
+
+def convert_model(fname, out):
+   """
+   write the text weights file fname (string-keyed or hashed) as a binary
+   model.
+   """
+   fh = file(fname)
+   first = fh.readline()
+   nbuckets = None
+   if first.startswith("#hashed"):
+      nbuckets = int(first.split()[1])
+      lines = fh
+   else:
+      lines = itertools.chain([first], fh)
+   def rows():
+      for line in lines:
+         f,ws = line.strip().split(None,1)
+         yield f, [float(w) for w in ws.split()]
+   write_binary_model(out, rows(), nbuckets)
+   fh.close()
+
+def load_model(fname, nbuckets=None):
+   """
+   the scorer for a weights file, whatever its format: MappedMulticlassModel
+   for binary models, else HashedMulticlassModel if nbuckets is given, else
+   MulticlassModel.
+   """
+   if is_binary_model(fname):
+      m = MappedMulticlassModel(fname)
+      if nbuckets and m.nbuckets != nbuckets:
+         raise ValueError("%s is not hashed into %s buckets, convert its text weights instead" % (fname, nbuckets))
+      return m
+   if nbuckets:
+      return HashedMulticlassModel(fname, nbuckets)
+   return MulticlassModel(fname)
+
+cdef class MappedMulticlassModel:
+   """
+   MulticlassModel (or HashedMulticlassModel) over a memory mapped binary
+   model, see write_binary_model.
+   """
+   cdef char* base
+   cdef size_t size
+   cdef double* W
+   cdef double* biases
+   cdef int* slots
+   cdef unsigned int* offsets
+   cdef char* keys
+   cdef unsigned int mask
+   cdef public int nclas
+   cdef public long nrows
+   cdef public bint hashed
+   cdef double* scores
+
+   def __init__(self, fname):
+      cdef long nslots, keysize, expected
+      sys.stderr.write("mapping model %s" % fname)
+      fh = file(fname, "rb")
+      header = fh.read(BINARY_HEADER_SIZE)
+      if len(header) < BINARY_HEADER_SIZE:
+         raise ValueError("%s is not a binary model" % fname)
+      magic,self.nclas,self.hashed,self.nrows,nslots,keysize = BINARY_HEADER.unpack(header[:BINARY_HEADER.size])
+      if magic != BINARY_MAGIC:
+         raise ValueError("%s is not a binary model" % fname)
+      expected = BINARY_HEADER_SIZE + sizeof(double)*self.nclas*(self.nrows+1)
+      if not self.hashed:
+         expected += sizeof(int)*nslots + sizeof(unsigned int)*(self.nrows+1) + keysize
+      self.size = os.fstat(fh.fileno()).st_size
+      if self.size < expected:
+         raise ValueError("%s is truncated" % fname)
+      self.base = <char*>mmap(NULL, self.size, PROT_READ, MAP_SHARED, fh.fileno(), 0)
+      fh.close()
+      if self.base == <char*>MAP_FAILED:
+         self.base = NULL
+         raise OSError("cannot map %s" % fname)
+      self.biases = <double*>(self.base + <long>BINARY_HEADER_SIZE)
+      self.W = self.biases + self.nclas
+      if not self.hashed:
+         self.slots = <int*>(self.W + self.nrows*self.nclas)
+         self.offsets = <unsigned int*>(self.slots + nslots)
+         self.keys = <char*>(self.offsets + self.nrows + 1)
+         self.mask = nslots-1
+      self.scores = <double *>malloc(sizeof(double)*self.nclas)
+      sys.stderr.write(" done\n")
+
+   def __dealloc__(self):
+      if self.base != NULL: munmap(self.base, self.size)
+      free(self.scores)
+
+   property nbuckets:
+      def __get__(self): return self.nrows if self.hashed else None
+
+   cdef long _row(self, object f) except -2:
+      cdef char* s
+      cdef unsigned int n, h
+      cdef long r
+      if self.hashed:
+         r = f
+         if r < 0 or r >= self.nrows: return -1
+         return r
+      s = f
+      n = len(f)
+      h = _hash_str(s, n, FNV_OFFSET) & self.mask
+      while True:
+         r = self.slots[h]
+         if r < 0: return -1
+         if self.offsets[r+1]-self.offsets[r] == n and memcmp(self.keys+self.offsets[r], s, n) == 0:
+            return r
+         h = (h+1) & self.mask
+
+   cdef _score(self, list features):
+      cdef int i
+      cdef long r
+      cdef double* row
+      for i in range(self.nclas):
+         self.scores[i]=self.biases[i]
+      for f in features:
+         r = self._row(f)
+         if r < 0: continue
+         row = self.W + r*self.nclas
+         for i in range(self.nclas):
+            self.scores[i]+=row[i]
+
+   cpdef object get_scores(self, list features):
+      cdef int i
+      cdef list res=[]
+      self._score(features)
+      for i in range(self.nclas):
+         res.append(self.scores[i])
+      return res
+
+   cpdef list get_scores_batch(self, list batch):
+      cdef list res=[]
+      for features in batch:
+         res.append(self.get_scores(features))
+      return res
+
+   cpdef object predict(self, list features):
+      cdef int i
+      cdef int besti=0
+      cdef list res=[]
+      self._score(features)
+      for i in range(self.nclas):
+         if self.scores[i] > self.scores[besti]: besti = i
+         res.append(self.scores[i])
+      return besti,res
+#}}}
+
 ### Model trainers {{{
 
 cdef class MulticlassParamData:
@@ -195,7 +618,7 @@ cdef class MulticlassParamData:
 cdef class MultitronParameters:
    cdef:
       int nclasses
-      int now
+      public int now
       dict W
 
       double* scores # (re)used in calculating prediction
@@ -306,6 +729,67 @@ cdef class MultitronParameters:
             p.w[clas]+=(op.w[clas]*factor)
             p.lastUpd[clas]=self.now
 
+   cpdef list changes(self, int since):
+      """
+      the features updated after time "since", as (feature, weights, sums)
+      triplets. sums are the averaging sums (see dump_fin) as of now.
+      used with mix().
+      """
+      cdef MulticlassParamData p
+      cdef int c
+      cdef list res=[]
+      for f,p in self.W.iteritems():
+         for c in xrange(self.nclasses):
+            if p.lastUpd[c] > since: break
+         else:
+            continue
+         res.append((f,[p.w[c] for c in xrange(self.nclasses)],
+                       [p.acc[c]+(self.now-p.lastUpd[c])*p.w[c] for c in xrange(self.nclasses)]))
+      return res
+
+   cpdef mix(self, list results):
+      """
+      iterative parameter mixing: results is a list of (nticks, changes)
+      pairs, one per copy of these parameters trained in parallel for
+      nticks ticks from the current time, changes being copy.changes(now).
+
+      the weights become the average of the copies weights, and the
+      averaging sums account for every tick of every copy, so that
+      dump_fin averages over all the intermediate weights.
+      """
+      cdef MulticlassParamData p
+      cdef int c, now0, touched, ticks
+      cdef double base
+      cdef dict merged={}
+      now0 = self.now
+      total = 0
+      for nticks,changes in results:
+         total += nticks
+         for f,ws,sums in changes:
+            try:
+               m = merged[f]
+            except KeyError:
+               m = merged[f] = [0, [0.0]*self.nclasses, [0.0]*self.nclasses, 0]
+            m[0] += 1
+            m[3] += nticks
+            for c in xrange(self.nclasses):
+               m[1][c] += ws[c]
+               m[2][c] += sums[c]
+      self.now = now0 + total
+      for f,(touched,ws,sums,ticks) in merged.iteritems():
+         try:
+            p = self.W[f]
+         except KeyError:
+            p = MulticlassParamData(self.nclasses)
+            self.W[f] = p
+         for c in xrange(self.nclasses):
+            # the sums of the copies which updated f include the sum up
+            # to now0, the others grew by w for each of their ticks
+            base = p.acc[c]+(now0-p.lastUpd[c])*p.w[c]
+            p.acc[c] = base*(1-touched) + sums[c] + (total-ticks)*p.w[c]
+            p.w[c] += (ws[c]-touched*p.w[c])/len(results)
+            p.lastUpd[c] = self.now
+
    cpdef do_pa_update(self, list feats, int gold_cls, double C=1.0):
       cdef double go_scr
       cdef double gu_scr
@@ -492,6 +976,180 @@ cdef class MultitronParameters:
             out.write(" %s " % ((p.acc[c]+((self.now-p.lastUpd[c])*p.w[c])) / self.now))
          out.write("\n")
 
+   def dump_bin(self,out):
+      """
+      like dump_fin, in the binary format (see write_binary_model)
+      """
+      cdef MulticlassParamData p
+      rows=[]
+      for f,p in self.W.iteritems():
+         rows.append((f,[(p.acc[c]+((self.now-p.lastUpd[c])*p.w[c])) / self.now for c in xrange(self.nclasses)]))
+      write_binary_model(out, rows)
+
+cdef class HashedMultitronParameters:
+   """
+   like MultitronParameters (averaged perceptron), with integer features
+   (buckets, see hash_features) and contiguous (nbuckets x nclasses) arrays.
+   """
+   cdef:
+      public int nclasses
+      public int nbuckets
+      public int now
+      double* w
+      double* acc
+      int* lastUpd
+      double* scores
+
+   def __cinit__(self, int nclasses, int nbuckets):
+      cdef long i
+      self.nclasses = nclasses
+      self.nbuckets = nbuckets
+      self.now = 0
+      self.w       = <double *>malloc(nbuckets*nclasses*sizeof(double))
+      self.acc     = <double *>malloc(nbuckets*nclasses*sizeof(double))
+      self.lastUpd = <int *>malloc(nbuckets*nclasses*sizeof(int))
+      self.scores  = <double *>malloc(nclasses*sizeof(double))
+      if self.w is NULL or self.acc is NULL or self.lastUpd is NULL:
+         raise MemoryError()
+      for i in range(nbuckets*nclasses):
+         self.w[i]=0
+         self.acc[i]=0
+         self.lastUpd[i]=0
+
+   def __dealloc__(self):
+      free(self.w)
+      free(self.acc)
+      free(self.lastUpd)
+      free(self.scores)
+
+   def tick(self): self.now=self.now+1
+
+   cpdef get_scores(self, list features):
+      cdef int i, c
+      cdef double* row
+      for c in range(self.nclasses):
+         self.scores[c]=0
+      for f in features:
+         i = f
+         row = self.w + i*self.nclasses
+         for c in range(self.nclasses):
+            self.scores[c] += row[c]
+      res={}
+      for c in range(self.nclasses):
+         res[c] = self.scores[c]
+      return res
+
+   cpdef add(self, list features, int clas, double amount):
+      cdef int i
+      cdef long k
+      for f in features:
+         i = f
+         k = i*self.nclasses+clas
+         self.acc[k]+=(self.now-self.lastUpd[k])*self.w[k]
+         self.w[k]+=amount
+         self.lastUpd[k]=self.now
+
+   cpdef scalar_multiply(self, double scalar):
+      """
+      note: DOES NOT support averaging
+      """
+      cdef long k
+      for k in range(self.nbuckets*self.nclasses):
+         self.w[k]*=scalar
+
+   cpdef add_params(self, HashedMultitronParameters other, double factor):
+      """
+      like MultitronParameters.add_params
+      """
+      cdef long k
+      assert(self.nclasses==other.nclasses and self.nbuckets==other.nbuckets),"incompatible parameters in add_params"
+      for k in range(self.nbuckets*self.nclasses):
+         if other.w[k]<0.0000001: continue
+         self.acc[k]+=(self.now-self.lastUpd[k])*self.w[k]
+         self.w[k]+=other.w[k]*factor
+         self.lastUpd[k]=self.now
+
+   cpdef list changes(self, int since):
+      """
+      like MultitronParameters.changes, with buckets as features
+      """
+      cdef int i, c
+      cdef long k
+      cdef list res=[]
+      for i in range(self.nbuckets):
+         k = i*self.nclasses
+         for c in range(self.nclasses):
+            if self.lastUpd[k+c] > since: break
+         else:
+            continue
+         res.append((i,[self.w[k+c] for c in range(self.nclasses)],
+                       [self.acc[k+c]+(self.now-self.lastUpd[k+c])*self.w[k+c] for c in range(self.nclasses)]))
+      return res
+
+   cpdef mix(self, list results):
+      """
+      like MultitronParameters.mix
+      """
+      cdef int i, c, now0, touched, ticks
+      cdef long k
+      cdef double base
+      cdef dict merged={}
+      now0 = self.now
+      total = 0
+      for nticks,changes in results:
+         total += nticks
+         for i,ws,sums in changes:
+            try:
+               m = merged[i]
+            except KeyError:
+               m = merged[i] = [0, [0.0]*self.nclasses, [0.0]*self.nclasses, 0]
+            m[0] += 1
+            m[3] += nticks
+            for c in range(self.nclasses):
+               m[1][c] += ws[c]
+               m[2][c] += sums[c]
+      self.now = now0 + total
+      for i,(touched,ws,sums,ticks) in merged.iteritems():
+         for c in range(self.nclasses):
+            k = i*self.nclasses+c
+            base = self.acc[k]+(now0-self.lastUpd[k])*self.w[k]
+            self.acc[k] = base*(1-touched) + sums[c] + (total-ticks)*self.w[k]
+            self.w[k] += (ws[c]-touched*self.w[k])/len(results)
+            self.lastUpd[k] = self.now
+
+   def dump_fin(self,out=sys.stdout):
+      """
+      write the average weights of the used buckets, in the format read by
+      HashedMulticlassModel.
+      """
+      cdef int i, c
+      cdef long k
+      cdef bint used
+      out.write("#hashed %d\n" % self.nbuckets)
+      for i in range(self.nbuckets):
+         used = False
+         for c in range(self.nclasses):
+            k = i*self.nclasses+c
+            if self.w[k] != 0 or self.acc[k] != 0: used = True
+         if not used: continue
+         out.write("%d" % i)
+         for c in range(self.nclasses):
+            k = i*self.nclasses+c
+            out.write(" %s " % ((self.acc[k]+((self.now-self.lastUpd[k])*self.w[k])) / self.now))
+         out.write("\n")
+
+   def dump_bin(self,out):
+      """
+      like dump_fin, in the binary format (see write_binary_model)
+      """
+      cdef long k
+      W = array('d', [0.0])*(self.nbuckets*self.nclasses)
+      for k in range(self.nbuckets*self.nclasses):
+         W[k] = (self.acc[k]+((self.now-self.lastUpd[k])*self.w[k])) / self.now
+      _write_binary_header(out, self.nclasses, True, self.nbuckets, 0, 0)
+      out.write(array('d', [0.0]*self.nclasses).tostring())
+      out.write(W.tostring())
+
 ##################
 cdef class ParamData:
    cdef:
@@ -19,7 +19,7 @@
 
 import sys
 from pio import io
-from easyfirst import test,parse,Model
+from easyfirst import test,parse,parse_batch,Model
 
 from optparse import OptionParser
 
@@ -30,6 +30,11 @@ parser.add_option("-m","--model",dest="model_file")
 parser.add_option("--iter",dest="iter",default="FINAL")
 parser.add_option("-e","--eval",action="store_true",dest="eval",default=False)
 parser.add_option("--nopunct",action="store_true",dest="ignore_punc",default=False)
+parser.add_option("-j","--jobs",dest="jobs",action="store",type="int",default=1,help="number of parsing processes (0: one per cpu)")
+parser.add_option("--decoder",dest="decoder",default="list",help="list or tree (same output, tree is faster, more so on long sentences)")
+parser.add_option("--beam",dest="beam",action="store",type="int",default=1,help="beam size (1: greedy)")
+parser.add_option("--hash-bits",dest="hash_bits",action="store",type="int",default=0,help="hash the features of a string-keyed model into 2^N integer ids")
+parser.add_option("--chunk",dest="chunk_size",action="store",type="int",default=200,help="sentences sent at once to a parsing process")
 
 opts, args = parser.parse_args()
 
@@ -39,13 +44,22 @@ if (not opts.model_file) or (len(args)!=1):
 
 TEST_FILE = args[0]
 
-model = Model.load("%s" % opts.model_file, opts.iter)
+NBUCKETS = 1 << opts.hash_bits if opts.hash_bits else None
+
+try:
+   model = Model.load("%s" % opts.model_file, opts.iter, NBUCKETS)
+except ValueError, e:
+   parser.error(str(e))
+
+if opts.jobs!=1 and not opts.eval:
+   parse_batch(io.conll_to_sents(file(TEST_FILE)),model,opts.iter,sys.stdout,opts.jobs,opts.chunk_size,opts.decoder,opts.beam)
+   sys.exit()
 
 test_sents = [s for s in io.conll_to_sents(file(TEST_FILE))]
 
 if opts.eval:
-   test(test_sents,model,opts.iter,quiet=False,ignore_punc=opts.ignore_punc)
+   test(test_sents,model,opts.iter,quiet=False,ignore_punc=opts.ignore_punc,decoder=opts.decoder,beam=opts.beam)
 else:
-   parse(test_sents,model,opts.iter)
+   parse(test_sents,model,opts.iter,opts.decoder,opts.beam)
 
 
@@ -32,6 +32,9 @@ parser.add_option("-o","--model",dest="model_file")
 parser.add_option("-f","--features",dest="features_file",default="None")
 parser.add_option("--iters",dest="iters",action="store",type="int",default=20)
 parser.add_option("--every",dest="save_every",action="store",type="int",default=1)
+parser.add_option("-j","--jobs",dest="jobs",action="store",type="int",default=1,help="train on N shards in parallel, mixing the weights after each iteration")
+parser.add_option("--binary",action="store_true",dest="binary",default=False,help="write the weights in the binary (memory mapped) format")
+parser.add_option("--hash-bits",dest="hash_bits",action="store",type="int",default=0,help="hash the features into 2^N integer ids")
 
 opts, args = parser.parse_args()
 
@@ -43,9 +46,10 @@ TRAIN_FILE = args[0]
 DEV_FILE   = args[1] if len(args)>1 else None
 FEATURES   = opts.features_file
 MODEL      = opts.model_file
+NBUCKETS   = 1 << opts.hash_bits if opts.hash_bits else None
 
 
-model = Model(FEATURES, "%s.weights" % MODEL)
+model = Model(FEATURES, "%s.weights" % MODEL, nbuckets=NBUCKETS)
 model.save("%s.model" % MODEL)
 
 
@@ -56,5 +60,5 @@ print len(train_sents)
 train_sents = [s for s in train_sents if isprojective.is_projective(s)]
 print len(train_sents)
 
-train(train_sents, model, dev, opts.iters,save_every=opts.save_every)
+train(train_sents, model, dev, opts.iters,save_every=opts.save_every,binary=opts.binary,jobs=opts.jobs)
 
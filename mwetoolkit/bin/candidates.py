@@ -45,6 +45,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import absolute_import
 
+import bisect
 import collections
 import re
 import os
@@ -56,7 +57,7 @@ from libs.base.ngram import Ngram
 from libs.util import read_options, treat_options_simplest, error, verbose,\
     interpret_ngram, warn
 from libs.filetype.patternlib import build_generic_pattern
-#from libs.filetype.indexlib import Index
+from libs.filetype.indexlib import NGRAM_LIMIT
 from libs.base.meta import Meta
 from libs import filetype
 
@@ -85,6 +86,12 @@ You must choose either the -p option or the -n option
 
 The <corpus> input file must be in one of the filetype
 formats accepted by the `--from` switch.
+
+When <corpus> is a BinaryIndex (see index.py) and the patterns only give
+attribute values (no wildcards, repetitions, alternatives, negations, back
+references or dependencies), as do those of -n, the matches are found by
+searching the index instead of every sentence, which is much faster for
+selective patterns. This is not done with --non-overlapping or --id-order.
     
 
 OPTIONS may be:
@@ -179,8 +186,7 @@ class CandidatesGeneratorHandler(filetype.ChainedInputHandler):
         
         @param sentence A `Sentence` that is being read from the XML file.    
         """
-        global patterns, ignore_pos, surface_instead_lemmas, \
-               longest_pattern, shortest_pattern
+        global patterns
 
         already_matched = set()
 
@@ -188,35 +194,125 @@ class CandidatesGeneratorHandler(filetype.ChainedInputHandler):
             for (match_ngram, wordnums) in pattern.matches(sentence,
                     match_distance=match_distance, id_order=id_order,
                     overlapping=not non_overlapping):
-                wordnums_string = ",".join(unicode(wn+1) for wn in wordnums)
-                if wordnums_string in already_matched:
-                    continue
-                already_matched.add( wordnums_string )
-
-                if ignore_pos :    
-                    match_ngram.set_all( pos=WILDCARD )
-                ngram_real = unicode(match_ngram.to_string())
-
-                if( surface_instead_lemmas ) :
-                    match_ngram.set_all( lemma=WILDCARD )
-                else :
-                    for word in match_ngram:
-                        # (Still uses surface if lemma is unavailable)
-                        if word.lemma != WILDCARD:
-                            word.surface = WILDCARD
-
-                ngram_basestring = unicode(match_ngram.to_string())
-                info_for_ngram_basestring = self.all_entities.setdefault(ngram_basestring, {})
-                (surfaces_dict, total_freq) = info_for_ngram_basestring \
-                        .get(self.current_corpus_name, ({}, 0))
-                freq_surface = surfaces_dict.setdefault(ngram_real, [])
-
-                # Append the id of the source sentence. The number of items in
-                # surfaces_dict[form] is the number of occurrences of that form.
-                source_sent_id = str( sentence.id_number ) + ":" + wordnums_string
-                surfaces_dict[ ngram_real ].append( source_sent_id )
-                info_for_ngram_basestring[self.current_corpus_name] \
-                        = (surfaces_dict, total_freq + 1)
+                self.add_match(sentence.id_number, match_ngram, wordnums,
+                               already_matched)
+
+
+    def handle_index(self, index, info={}):
+        """When the corpus is an index and the patterns only give attribute
+        values for a bounded number of words (e.g. with the -n option), finds
+        their matches by searching the suffix arrays of the index (see
+        `Index.iterate_matches`) instead of matching the patterns against
+        every sentence. The matches are then handled in the same order as
+        by `handle_sentence`, so the output is the same.
+
+        @param index The `Index` of the corpus, with its attributes loaded.
+
+        @return Whether the candidates were extracted from the index.
+        """
+        global patterns
+        if not self.index_searchable(index):
+            return False
+        verbose("Searching the patterns in the index...")
+
+        sentence_ends = index.sentence_ends()
+        matches = []
+        for pattern_num, pattern in enumerate(patterns):
+            occurrences = index.iterate_matches(pattern.word_constraints,
+                                                *pattern.length_range)
+            if match_distance != "All":
+                if match_distance == "Longest":
+                    select = max
+                elif match_distance == "Shortest":
+                    select = min
+                else:
+                    raise Exception("Bad match_distance: " + match_distance)
+                lengths = {}  # Start position -> length of the match
+                for (position, length) in occurrences:
+                    lengths[position] = select(length,
+                                               lengths.get(position, length))
+                occurrences = lengths.iteritems()
+            for (position, length) in occurrences:
+                sentence_num = bisect.bisect_left(sentence_ends, position)
+                matches.append((sentence_num, pattern_num, position, -length))
+        matches.sort()
+
+        already_matched = set()
+        previous_sentence_num = None
+        for (sentence_num, pattern_num, position, minus_length) in matches:
+            if sentence_num != previous_sentence_num:
+                already_matched = set()
+                previous_sentence_num = sentence_num
+            sentence_start = sentence_ends[sentence_num-1] + 1 \
+                    if sentence_num > 0 else 0
+            positions = range(position, position - minus_length)
+            match_ngram = Ngram([index.word_at(p) for p in positions])
+            wordnums = [p - sentence_start for p in positions]
+            self.add_match(sentence_num + 1, match_ngram, wordnums,
+                           already_matched)
+        return True
+
+
+    def index_searchable(self, index):
+        """Returns whether `handle_index` can search the patterns in `index`.
+        """
+        if non_overlapping or id_order != ["*"]:
+            return False
+        for pattern in patterns:
+            if pattern.word_constraints is None \
+                    or pattern.length_range[1] > NGRAM_LIMIT + 1:
+                return False
+            for constraints in pattern.word_constraints:
+                for attr in constraints:
+                    if attr not in index.used_word_attributes:
+                        return False
+        return True
+
+
+    def add_match(self, sentence_id, match_ngram, wordnums, already_matched):
+        """Adds a match of a pattern to the candidates, unless its words were
+        already matched (by another pattern) in the same sentence.
+
+        @param sentence_id The `id_number` of the sentence of the match.
+
+        @param match_ngram The matched `Ngram`, which is modified.
+
+        @param wordnums The positions of the matched words in the sentence.
+
+        @param already_matched The set of the matched word positions in the
+        sentence, as strings.
+        """
+        global ignore_pos, surface_instead_lemmas
+
+        wordnums_string = ",".join(unicode(wn+1) for wn in wordnums)
+        if wordnums_string in already_matched:
+            return
+        already_matched.add( wordnums_string )
+
+        if ignore_pos :    
+            match_ngram.set_all( pos=WILDCARD )
+        ngram_real = unicode(match_ngram.to_string())
+
+        if( surface_instead_lemmas ) :
+            match_ngram.set_all( lemma=WILDCARD )
+        else :
+            for word in match_ngram:
+                # (Still uses surface if lemma is unavailable)
+                if word.lemma != WILDCARD:
+                    word.surface = WILDCARD
+
+        ngram_basestring = unicode(match_ngram.to_string())
+        info_for_ngram_basestring = self.all_entities.setdefault(ngram_basestring, {})
+        (surfaces_dict, total_freq) = info_for_ngram_basestring \
+                .get(self.current_corpus_name, ({}, 0))
+        freq_surface = surfaces_dict.setdefault(ngram_real, [])
+
+        # Append the id of the source sentence. The number of items in
+        # surfaces_dict[form] is the number of occurrences of that form.
+        source_sent_id = str( sentence_id ) + ":" + wordnums_string
+        surfaces_dict[ ngram_real ].append( source_sent_id )
+        info_for_ngram_basestring[self.current_corpus_name] \
+                = (surfaces_dict, total_freq + 1)
 
 
     def finish(self):
@@ -335,6 +431,9 @@ def treat_options( opts, arg, n_arg, usage_string ) :
         else:
             raise Exception("Bad flag")
 
+    if match_distance not in ("All", "Longest", "Shortest"):
+        error("Unknown match distance: " + match_distance)
+
     if non_overlapping and match_distance == "All":
         # If we are taking all matches, we need to be able to overlap...
         error("Conflicting options: --match-distance=All and --non-overlapping")
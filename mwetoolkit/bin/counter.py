@@ -39,6 +39,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from __future__ import absolute_import
 
+import gc
 import sys
 import re
 import subprocess
@@ -167,17 +168,49 @@ filetype_corpus_ext = "BinaryIndex"
 filetype_candidates_ext = None
 output_filetype_ext = "XML"
 
+# Number of candidates counted at once in the index (see `append_counters_index`)
+BATCH_SIZE = 500
+
 
 ################################################################################
 
 class CounterPrinter(filetype.ChainedInputHandler):
-    r"""Adds info and outputs the result."""
+    r"""Adds info and outputs the result.
+    With an index, candidates are counted by batches of `BATCH_SIZE`,
+    and are only output once their batch is counted. The garbage collector
+    is disabled while a batch is pending: the parsed candidates it holds
+    would only make it run over and over for nothing."""
+    def __init__(self):
+        self.pending = []
+
     def before_file(self, fileobj, info={}):
         if not self.chain:
             self.chain = self.make_printer(info, output_filetype_ext)
         self.chain.before_file(fileobj, info)
         self.entity_counter = 0
 
+    def after_file(self, fileobj, info={}):
+        self.count_pending()
+        self.chain.after_file(fileobj, info)
+
+    def finish(self):
+        self.count_pending()
+        self.chain.finish()
+
+    def _fallback(self, entity, info={}):
+        self.count_pending()
+        self.chain.handle(entity, info)
+
+    def count_pending(self):
+        """Counts the pending candidates and outputs them."""
+        if self.pending:
+            append_counters_index([ngram for candidate, ngrams, info
+                                   in self.pending for ngram in ngrams])
+            for candidate, ngrams, info in self.pending:
+                self.chain.handle_candidate(candidate, info)
+            self.pending = []
+            gc.enable()
+
     def handle_meta(self, meta, info={}):
         """Adds a `CorpusSize` meta-information to the header and prints the 
         header. The corpus size is important to allow the calculation of 
@@ -200,15 +233,24 @@ class CounterPrinter(filetype.ChainedInputHandler):
         """
         global low_limit, up_limit
         global count_vars
+        ngrams = []
         if ( self.entity_counter >= low_limit or low_limit < 0 ) and \
                 ( self.entity_counter <= up_limit or up_limit < 0 ):
             if count_vars:
-                for var in candidate.vars:
-                    append_counters(var)
+                ngrams = candidate.vars
             else:
-                append_counters(candidate)
-        self.chain.handle_candidate(candidate, info)
+                ngrams = [candidate]
         self.entity_counter += 1
+        if get_freq_function == get_freq_index:
+            if not self.pending:
+                gc.disable()
+            self.pending.append((candidate, ngrams, dict(info)))
+            if len(self.pending) >= BATCH_SIZE:
+                self.count_pending()
+        else:
+            for ngram in ngrams:
+                append_counters(ngram)
+            self.chain.handle_candidate(candidate, info)
 
 
 ################################################################################
@@ -248,6 +290,58 @@ def append_counters(ngram):
             ngram.add_bigram(Frequency(freq_name, freq_value))
 
 
+################################################################################
+
+def append_counters_index(ngrams):
+    """
+        Same as `append_counters` for a list of n-grams at once, with the
+        index: all the n-grams, words and bigrams to count are gathered and
+        searched together by `SuffixArray.count_ngrams`.
+
+        @param ngrams The list of `Ngram`s being counted.
+    """
+    global freq_name, count_joint_frequency, count_bigrams, suffix_array
+    ngrams_ids = []
+    queries = []
+    for ngram in ngrams:
+        ids = [get_word_id(w.surface, w.lemma, w.pos) for w in ngram]
+        ngrams_ids.append(ids)
+        queries.extend((i,) for i in ids if i)
+        if count_joint_frequency and all(ids):
+            queries.append(tuple(ids))
+        if count_bigrams:
+            queries.extend(tuple(ids[i:i + 2]) for i in range(len(ids) - 1)
+                           if ids[i] and ids[i + 1])
+    counts = suffix_array.count_ngrams(queries)
+
+    def count(ids):
+        if all(ids):
+            return counts[tuple(ids)]
+        else:
+            return 0
+
+    for ngram, ids in zip(ngrams, ngrams_ids):
+        for w, i in zip(ngram, ids):
+            w.add_frequency(Frequency(freq_name, count([i])))
+        if count_joint_frequency:
+            ngram.add_frequency(Frequency(freq_name, count(ids)))
+        if count_bigrams:
+            for i in range(len(ids) - 1):
+                ngram.add_bigram(Frequency(freq_name, count(ids[i:i + 2])))
+
+
+################################################################################
+
+def get_word_id(surface, lemma, pos):
+    """
+        Returns the number of a word in the index, or `None` if it is not
+        there.
+    """
+    global build_entry, suffix_array
+    word = build_entry(surface, lemma, pos)
+    return suffix_array.symbols.symbol_to_number.get(word, None) or None
+
+
 ################################################################################
 
 def get_freq_index(surfaces, lemmas, pos):
@@ -275,12 +369,7 @@ def get_freq_index(surfaces, lemmas, pos):
 
     #i_last = binary_search(ng_ids, ngrams_file,corpus_file,lambda a, b:a > b)
     #i_first = binary_search(ng_ids, ngrams_file,corpus_file,lambda a, b:a >= b)
-    indexrange = suffix_array.find_ngram_range(ngram_ids)
-    if indexrange is not None:
-        first, last = indexrange
-        return last - first + 1
-    else:
-        return 0
+    return suffix_array.count_ngram(ngram_ids)
 
 
 ################################################################################
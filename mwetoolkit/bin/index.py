@@ -59,7 +59,33 @@ OPTIONS may be:
     colon-separated list of attributes (e.g. lemma:pos:lemma+pos).
 
 -o OR --old
-    Use the old (slower) Python indexer, even when the C indexer is available.
+    Use the Python indexer, even when the C indexer is available.
+
+-b OR --bigrams
+    Also generate a table of bigram frequencies for each attribute, from
+    which `counter.py` gets bigram counts without searching the index.
+    (A table of word frequencies is always generated.)
+
+-j <n> OR --jobs <n>
+    Build the suffix arrays of the different attributes in <n> processes at
+    the same time (0 for one per CPU). The fused attributes (e.g. lemma+pos)
+    are then built in parallel too. Needs about <n> times as much memory.
+    Default 1.
+
+--append
+    Add <corpus> to the existing index <index> instead of creating a new one.
+    Only <corpus> is indexed, as a new segment of each attribute of the index
+    (whatever -a says), and the counts are then summed over the segments. The
+    fused attributes (e.g. lemma+pos) are made again. Queries get slower as
+    segments pile up; see --compact. Concurrent appends to the same index wait
+    for each other. This can run while the index is used: the processes which
+    have already loaded it are not affected, and those loading it see the new
+    segment only once it is complete.
+
+--compact
+    Merge the segments of the index <index> into its main files, after
+    indexing <corpus> if any. This can run while the index is used, like
+    --append.
 
 --from <input-filetype-ext>
     Force reading of corpus with given filetype extension.
@@ -96,6 +122,10 @@ OPTIONS may be:
 use_text_format = None
 input_filetype_ext = None
 basename = None
+bigram_tables = False
+jobs = 1
+append = False
+compact = False
 
 
 ################################################################################
@@ -115,6 +145,10 @@ def treat_options( opts, arg, n_arg, usage_string ) :
     global build_entry
     global use_text_format
     global input_filetype_ext
+    global bigram_tables
+    global jobs
+    global append
+    global compact
 
     treat_options_simplest( opts, arg, n_arg, usage_string )
 
@@ -132,6 +166,19 @@ def treat_options( opts, arg, n_arg, usage_string ) :
             use_text_format = "conll"            
         elif o in ("-o", "--old"):
             indexlib.Index.use_c_indexer(False)
+        elif o in ("-b", "--bigrams"):
+            bigram_tables = True
+        elif o in ("-j", "--jobs"):
+            try:
+                jobs = int(a)
+                if jobs < 0:
+                    raise ValueError
+            except ValueError:
+                error("Argument of " + o + " must be a non-negative integer")
+        elif o == "--append":
+            append = True
+        elif o == "--compact":
+            compact = True
             
     if basename is None:     
         error("You must provide a filename for the index.\n"
@@ -141,8 +188,9 @@ def treat_options( opts, arg, n_arg, usage_string ) :
 ################################################################################
 # MAIN SCRIPT
 
-longopts = ["from=", "index=", "attributes=", "old", "moses", "conll" ]
-arg = read_options( "i:a:omc", longopts, treat_options, -1, usage_string )
+longopts = ["from=", "index=", "attributes=", "old", "moses", "conll",
+            "bigrams", "jobs=", "append", "compact" ]
+arg = read_options( "i:a:omcbj:", longopts, treat_options, -1, usage_string )
 
 simple_attrs = [a for a in used_attributes if '+' not in a]
 composite_attrs = [a for a in used_attributes if '+' in a]
@@ -154,8 +202,15 @@ for attrs in [attr.split('+') for attr in composite_attrs]:
 
 
 index = indexlib.Index(basename, simple_attrs)
-indexlib.populate_index(index, arg, input_filetype_ext)
-for attr in composite_attrs:
-    index.make_fused_array(attr.split('+'))
+index.bigram_tables = bigram_tables
+index.jobs = jobs
+if append:
+    indexlib.append_to_index(index, arg, input_filetype_ext)
+elif arg or not compact:
+    indexlib.populate_index(index, arg, input_filetype_ext)
+if append or arg or not compact:
+    index.make_fused_arrays([attr.split('+') for attr in composite_attrs])
+if compact:
+    index.compact()
 #index.build_suffix_arrays()
 #index.save_main()
@@ -177,6 +177,9 @@ class FirstInputHandler(ChainedInputHandler):
         self._meta_handled = True
         self.chain.handle_meta(meta,info)
 
+    def handle_index(self, index, info={}):
+        return self.chain.handle_index(index, info)
+
     def handle_meta_if_absent(self):
         if not self._meta_handled:
             from ..base.meta import Meta
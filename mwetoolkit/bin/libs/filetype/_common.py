@@ -517,6 +517,13 @@ class InputHandler(object):
         info["kind"] = "sentence"
         return self._fallback_entity(sentence, info)
 
+    def handle_index(self, index, info={}):
+        r"""Called with the `indexlib.Index` of a BinaryIndex file (with
+        its main attributes loaded), before reading its sentences.
+        Returns True if it treated the whole corpus from the index, in
+        which case the sentences are not read. By default, returns False."""
+        return False
+
     def handle_candidate(self, candidate, info={}):
         r"""Called to treat a Candidate object."""
         info["kind"] = "candidate"
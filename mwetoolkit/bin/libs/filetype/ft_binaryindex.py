@@ -74,6 +74,8 @@ class BinaryIndexParser(common.AbstractParser):
             assert fileobj.name.endswith(".info")
             index = Index(fileobj.name[:-len(".info")])
             index.load_main()
+            if self.handler.handle_index(index, info):
+                return
             for sentence, progress in index.iterate_sentences_and_progress():
                 info["progress"] = progress
                 self.handler.handle_sentence(sentence, info)
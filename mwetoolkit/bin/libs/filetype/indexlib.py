@@ -51,10 +51,28 @@ from __future__ import absolute_import
 import sys
 import os
 import array
+import bisect
+import collections
+import ctypes
+import itertools
+import mmap
+import multiprocessing
+import operator
 import xml.sax
 import tempfile
 import subprocess
 import struct
+import glob
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 from ..base.sentence import SentenceFactory
 from ..util import verbose, warn, error
@@ -64,6 +82,9 @@ from .. import filetype
 
 
 NGRAM_LIMIT = 16
+UNIGRAM_CACHE_SIZE = 100000
+# Files of a segment (see `Index.segment_paths`)
+SEGMENT_FILES = ("corpus", "suffix", "unigrams", "bigrams")
 
 ################################################################################
 
@@ -102,11 +123,14 @@ def load_array_from_file(an_array, a_filename):
 
 def save_array_to_file(array, path):
     """
-        Dumps an array to a file.
+        Dumps an array to a file. The file is written under another name and
+        then renamed, so that the processes which have mapped the old file
+        (see `map_file`) keep seeing it whole.
     """
-    file = open(path, "w")
+    file = open(path + ".tmp", "w")
     array.tofile(file)
     file.close()
+    os.rename(path + ".tmp", path)
 
 
 ################################################################################
@@ -125,6 +149,7 @@ def load_symbols_from_file(symbols, path):
         symbols.symbol_to_number[sym] = id
         symbols.number_to_symbol.append(sym)
         id += 1
+    symbols.last_number = id - 1
 
     file.close()
 
@@ -133,12 +158,107 @@ def load_symbols_from_file(symbols, path):
 
 def save_symbols_to_file(symbols, path):
     """
-        Dumps a symbol table to a file.
+        Dumps a symbol table to a file (renamed into place, like in
+        `save_array_to_file`).
     """
-    file = open(path, "wb")
+    file = open(path + ".tmp", "wb")
     for sym in symbols.number_to_symbol:
         file.write(sym.encode("utf-8") + '\n')
     file.close()
+    os.rename(path + ".tmp", path)
+
+
+################################################################################
+
+def make_lexicon(encoded_symbols):
+    """
+        Returns the lexicon of a symbol table, given its symbols encoded in
+        UTF-8, in order: an array with the number of symbols, the offset of
+        each symbol in the `.symbols` file (plus the size of the file), and
+        the symbol numbers sorted by symbol. It allows one to look symbols up
+        in both directions without reading the `.symbols` file.
+    """
+    lexicon = make_array([len(encoded_symbols)])
+    offset = 0
+    for sym in encoded_symbols:
+        lexicon.append(offset)
+        offset += len(sym) + 1
+    lexicon.append(offset)
+    lexicon.extend(sorted(xrange(len(encoded_symbols)),
+                          key=encoded_symbols.__getitem__))
+    return lexicon
+
+
+################################################################################
+
+def save_lexicon_to_file(symbols, path):
+    """
+        Dumps the lexicon of a symbol table to a file (see `make_lexicon`).
+    """
+    save_array_to_file(make_lexicon([sym.encode("utf-8")
+                                     for sym in symbols.number_to_symbol]),
+                       path)
+
+
+################################################################################
+
+def lock_file(path, shared=False):
+    """
+        Opens the file at `path` (created if needed) and takes a lock on it,
+        shared or exclusive, waiting for the processes which hold conflicting
+        locks. Returns the open file, to give to `unlock_file`, or None if
+        `fcntl` is not available or the file cannot be created (e.g. an index
+        in a read-only directory), in which case nothing is locked.
+    """
+    if fcntl is None:
+        return None
+    try:
+        file = open(path, "a")
+    except IOError:
+        return None
+    fcntl.flock(file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    return file
+
+
+def unlock_file(file):
+    """
+        Releases the lock taken by `lock_file`.
+    """
+    if file is not None:
+        fcntl.flock(file, fcntl.LOCK_UN)
+        file.close()
+
+
+################################################################################
+
+def map_file(path, access=mmap.ACCESS_READ):
+    """
+        Returns the contents of the file at `path` mapped in memory,
+        read-only by default.
+    """
+    file = open(path, "rb")
+    try:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ""  # Empty files cannot be mapped
+        return mmap.mmap(file.fileno(), 0, access=access)
+    finally:
+        file.close()
+
+
+################################################################################
+
+def map_array_file(path):
+    """
+        Returns the array saved by `save_array_to_file` at `path`, mapped in
+        memory instead of read: a `ctypes` array over the file, whose pages
+        are shared with the other processes mapping it. Indexing it returns
+        an int, slicing it a list. Changes to it are not saved.
+    """
+    data = map_file(path, mmap.ACCESS_COPY)
+    length = len(data) // ctypes.sizeof(ctypes.c_int)
+    if length == 0:
+        return (ctypes.c_int * 0)()
+    return (ctypes.c_int * length).from_buffer(data)
 
 
 ################################################################################
@@ -209,6 +329,190 @@ def compare_ngrams(ngram1, pos1, ngram2, pos2, ngram1_exhausted=-1,
         return int(ngram1[pos1] - ngram2[pos2])
 
 
+################################################################################
+
+def _refine_ranks(rank, width, other, length):
+    """
+        One prefix doubling step in pure Python. `rank` ranks the first
+        `length` words of every suffix, `other` ranks the first k words
+        (values below `width`). Returns `(order, rank, nranks)` for the
+        first `length`+k words, where `order` lists the positions sorted by
+        the new rank (ties in corpus order).
+    """
+    n = len(rank)
+    keys = [r * width + o + 1 for r, o in
+            itertools.izip(rank, itertools.islice(other, length, None))]
+    # Suffixes ending within `length` words sort first (see compare_ngrams)
+    keys.extend(r * width for r in itertools.islice(rank, n - length, None))
+    order = sorted(xrange(n), key=keys.__getitem__)
+    rank = [0] * n
+    r = -1
+    prev = None
+    for i in order:
+        if keys[i] != prev:
+            prev = keys[i]
+            r += 1
+        rank[i] = r
+    return order, rank, r + 1
+
+################################################################################
+
+def _refine_ranks_numpy(rank, width, other, length):
+    """
+        Same as `_refine_ranks`, over NumPy arrays.
+    """
+    n = len(rank)
+    keys = rank.astype(numpy.int64) * width
+    keys[:n - length] += other[length:] + 1
+    order = numpy.argsort(keys, kind="mergesort")
+    sorted_keys = keys[order]
+    sorted_rank = numpy.zeros(n, dtype=numpy.int64)
+    numpy.cumsum(sorted_keys[1:] != sorted_keys[:-1], out=sorted_rank[1:])
+    rank = numpy.empty(n, dtype=numpy.int64)
+    rank[order] = sorted_rank
+    return order, rank, int(sorted_rank[-1]) + 1
+
+################################################################################
+
+def build_suffix_positions(corpus, limit=NGRAM_LIMIT):
+    """
+        Returns an array with the positions of `corpus` sorted the way
+        `compare_ngrams` sorts them: by their first `limit`+1 words, a suffix
+        that ends sooner coming first, ties kept in corpus order.
+
+        Uses prefix doubling: the rank of the first 2h words at position `i`
+        is given by the ranks of the first h words at `i` and at `i`+h, so
+        the suffixes are sorted with O(log limit) integer sorts instead of a
+        Python comparison for every pair. Stops as soon as all the ranks are
+        distinct. Uses NumPy when it is installed.
+
+        @param corpus An array of non-negative word numbers.
+    """
+    n = len(corpus)
+    if n == 0:
+        return make_array()
+    if numpy is not None:
+        rank = numpy.frombuffer(corpus, dtype=numpy.intc).astype(numpy.int64)
+        nranks = int(rank.max()) + 1
+        refine = _refine_ranks_numpy
+    else:
+        rank = list(corpus)
+        nranks = max(rank) + 1
+        refine = _refine_ranks
+    target = limit + 1
+    length = 1
+    ranks = {1: (rank, nranks)}  # prefix length -> (ranks, upper bound)
+    order = None
+    while length < target and (order is None or nranks < n):
+        step = max(l for l in ranks if l <= target - length)
+        other, other_nranks = ranks[step]
+        order, rank, nranks = refine(rank, other_nranks + 1, other, length)
+        length += step
+        ranks[length] = (rank, nranks)
+        for l in ranks.keys():
+            if l > target - length:
+                del ranks[l]
+
+    if numpy is not None:
+        if order is None:
+            order = numpy.argsort(rank, kind="mergesort")
+        return make_array(order.astype(numpy.intc).tostring())
+    if order is None:
+        order = sorted(xrange(n), key=rank.__getitem__)
+    return make_array(order)
+
+
+################################################################################
+
+def count_unigrams(corpus, nsymbols):
+    """
+        Returns an array with the number of occurrences in `corpus` of each
+        of the `nsymbols` word numbers.
+    """
+    if numpy is not None:
+        words = numpy.frombuffer(corpus, dtype=numpy.intc)
+        counts = numpy.bincount(words, minlength=nsymbols)
+        return make_array(counts.astype(numpy.intc).tostring())
+    counts = make_array([0]) * nsymbols
+    for word in corpus:
+        counts[word] += 1
+    return counts
+
+
+################################################################################
+
+def count_bigrams(corpus, suffix):
+    """
+        Returns the bigram table of a corpus: an array with, for every
+        bigram of the corpus not containing the end of sentence (0), its two
+        word numbers and its number of occurrences, sorted by bigram. Reads
+        the bigrams in `suffix` order, in which they are already sorted.
+    """
+    size = len(corpus)
+    if numpy is not None:
+        words = numpy.frombuffer(corpus, dtype=numpy.intc)
+        positions = numpy.frombuffer(suffix, dtype=numpy.intc)
+        positions = positions[positions < size - 1]
+        first = words[positions]
+        second = words[positions + 1]
+        inside = (first != 0) & (second != 0)
+        first = first[inside]
+        second = second[inside]
+        if len(first) == 0:
+            return make_array()
+        starts = numpy.flatnonzero((first[1:] != first[:-1]) |
+                                   (second[1:] != second[:-1])) + 1
+        starts = numpy.concatenate(([0], starts))
+        counts = numpy.diff(numpy.concatenate((starts, [len(first)])))
+        table = numpy.column_stack((first[starts], second[starts], counts))
+        return make_array(table.astype(numpy.intc).tostring())
+    table = make_array()
+    for pos in suffix:
+        if pos < size - 1 and corpus[pos] != 0 and corpus[pos + 1] != 0:
+            if table and table[-3] == corpus[pos] and \
+                    table[-2] == corpus[pos + 1]:
+                table[-1] += 1
+            else:
+                table.extend((corpus[pos], corpus[pos + 1], 1))
+    return table
+
+
+################################################################################
+
+def build_suffix_array_file(basepath):
+    """
+        Builds the `.suffix` file of the suffix array at `basepath` from its
+        `.corpus` file. Run by `Index.build_suffix_arrays` in a subprocess.
+    """
+    corpus = make_array()
+    load_array_from_file(corpus, basepath + ".corpus")
+    save_array_to_file(build_suffix_positions(corpus), basepath + ".suffix")
+
+
+################################################################################
+
+def run_c_indexer(basepath, wordlist_path):
+    """
+        Builds the suffix array files at `basepath` with the C indexer, from
+        a file with one word per line.
+    """
+    wordlist_file = open(wordlist_path, "rb")
+    subprocess.call([C_INDEXER_PROGRAM, basepath], stdin=wordlist_file)
+    wordlist_file.close()
+
+
+################################################################################
+
+def make_fused_array_file(basepath, attrs, bigram_tables=False):
+    """
+        Makes the files of the fused array for `attrs` in the index at
+        `basepath`. Run by `Index.make_fused_arrays` in a subprocess.
+    """
+    index = Index(basepath, attrs)
+    index.bigram_tables = bigram_tables
+    index.make_fused_array(attrs)
+
+
 ################################################################################
 
 def fuse_suffix_arrays(array1, array2):
@@ -252,6 +556,38 @@ class SymbolTable(object):
         return self.symbol_to_number[symbol]
 
 
+################################################################################
+################################################################################
+
+class LRUCache(object):
+    """
+        Dict-like cache keeping at most `size` entries, dropping the least
+        recently used one when full.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = collections.OrderedDict()
+
+    def get(self, key, default=None):
+        """
+            Returns the value of `key` (making it the most recently used),
+            or `default`.
+        """
+        try:
+            value = self.entries.pop(key)
+        except KeyError:
+            return default
+        self.entries[key] = value
+        return value
+
+    def put(self, key, value):
+        self.entries.pop(key, None)
+        if len(self.entries) >= self.size:
+            self.entries.popitem(last=False)
+        self.entries[key] = value
+
+
 ################################################################################
 ################################################################################
 
@@ -261,23 +597,37 @@ class SuffixArray(object):
         for one attribute of a corpus.
     """
 
+    # Type of the slices of `corpus`, to compare ngrams with
+    make_ngram = staticmethod(make_array)
+
 ################################################################################
 
     def __init__(self):
         self.corpus = make_array()  # List of word numbers
         self.suffix = make_array()  # List of word positions
         self.symbols = SymbolTable()  # word<->number conversion table
+        # Ranges of the most frequently searched words (see `ngram_range`)
+        self.unigram_ranges = LRUCache(UNIGRAM_CACHE_SIZE)
+        self.unigrams = None  # Frequency of each word number
+        self.bigrams = None  # Bigram table (see `count_bigrams`)
 
 ################################################################################
 
-    def set_basepath(self, basepath):
+    def set_basepath(self, basepath, symbols_basepath=None):
         """
-            Sets the base path for the suffix array files.
+            Sets the base path for the suffix array files. The symbol table
+            files are at `symbols_basepath` if given (for the segments of an
+            index, which share the symbol table of the main files).
         """
+        if symbols_basepath is None:
+            symbols_basepath = basepath
         self.basepath = basepath
         self.corpus_path = basepath + ".corpus"
         self.suffix_path = basepath + ".suffix"
-        self.symbols_path = basepath + ".symbols"
+        self.symbols_path = symbols_basepath + ".symbols"
+        self.lexicon_path = symbols_basepath + ".lexicon"
+        self.unigrams_path = basepath + ".unigrams"
+        self.bigrams_path = basepath + ".bigrams"
 
 ################################################################################
 
@@ -285,9 +635,44 @@ class SuffixArray(object):
         """
             Loads the suffix array from the files at `self.basepath`.
         """
+        self.load_arrays()
+        load_symbols_from_file(self.symbols, self.symbols_path)
+
+################################################################################
+
+    def load_arrays(self):
+        """
+            Loads the corpus and suffix arrays and the frequency tables, but
+            not the symbol table.
+        """
         load_array_from_file(self.corpus, self.corpus_path)
         load_array_from_file(self.suffix, self.suffix_path)
-        load_symbols_from_file(self.symbols, self.symbols_path)
+        self.load_tables()
+
+################################################################################
+
+    def load_tables(self):
+        """
+            Maps the frequency tables at `self.basepath`, those that exist.
+        """
+        if os.path.isfile(self.unigrams_path):
+            self.unigrams = map_array_file(self.unigrams_path)
+        if os.path.isfile(self.bigrams_path):
+            self.bigrams = map_array_file(self.bigrams_path)
+
+################################################################################
+
+    def save_tables(self, bigrams=False):
+        """
+            Saves the table of word frequencies, and the bigram table if
+            `bigrams`, to the files at `self.basepath`.
+        """
+        self.unigrams = count_unigrams(self.corpus,
+                                       len(self.symbols.number_to_symbol))
+        save_array_to_file(self.unigrams, self.unigrams_path)
+        if bigrams:
+            self.bigrams = count_bigrams(self.corpus, self.suffix)
+            save_array_to_file(self.bigrams, self.bigrams_path)
 
 ################################################################################
 
@@ -298,6 +683,7 @@ class SuffixArray(object):
         save_array_to_file(self.corpus, self.corpus_path)
         save_array_to_file(self.suffix, self.suffix_path)
         save_symbols_to_file(self.symbols, self.symbols_path)
+        save_lexicon_to_file(self.symbols, self.lexicon_path)
 
 ################################################################################
 
@@ -321,10 +707,29 @@ class SuffixArray(object):
         """
             Builds the sorted suffix array from the corpus array.
         """
-        tmpseq = range(0, len(self.corpus))
-        tmpseq.sort(cmp=(lambda a, b: compare_ngrams(self.corpus, a,
-                                                     self.corpus, b)))
-        self.suffix = make_array(tmpseq)
+        self.suffix = build_suffix_positions(self.corpus)
+
+################################################################################
+
+    def start_build(self, pool):
+        """
+            Starts building the suffix array in a process of the
+            `multiprocessing` `pool`. Saves the corpus array, which the
+            process reads. Returns the result to give to `end_build`.
+        """
+        save_array_to_file(self.corpus, self.corpus_path)
+        return pool.apply_async(build_suffix_array_file, (self.basepath,))
+
+################################################################################
+
+    def end_build(self, result):
+        """
+            Waits for the build started by `start_build` and loads the
+            suffix array it made.
+        """
+        result.get()
+        self.suffix = make_array()
+        load_array_from_file(self.suffix, self.suffix_path)
 
 ################################################################################
 
@@ -339,8 +744,8 @@ class SuffixArray(object):
         if max is None:
             max = len(self.suffix) - 1
 
-        first = self.binary_search_ngram(ngram, min, max, array.array.__ge__)
-        last = self.binary_search_ngram(ngram, min, max, array.array.__gt__)
+        first = self.binary_search_ngram(ngram, min, max, operator.ge)
+        last = self.binary_search_ngram(ngram, min, max, operator.gt)
 
         if first is None:
             return None
@@ -354,6 +759,173 @@ class SuffixArray(object):
         else:
             return None
 
+################################################################################
+
+    def narrow_range(self, first, last, depth, word):
+        """
+            Returns the part `(first, last)` of the range `first..last` of
+            the suffix array whose suffixes have `word` as their word number
+            `depth` (from 0), or `None`. The suffixes in the range must share
+            their first `depth` words, so that they are sorted by that word.
+        """
+        corpus = self.corpus
+        suffix = self.suffix
+        size = len(corpus)
+        # Suffixes ending before `depth` come first, as if with a word -1
+        mini = first
+        maxi = last + 1
+        while mini < maxi:
+            mid = (mini + maxi) // 2
+            pos = suffix[mid] + depth
+            if pos < size and corpus[pos] >= word:
+                maxi = mid
+            else:
+                mini = mid + 1
+        start = mini
+        maxi = last + 1
+        while mini < maxi:
+            mid = (mini + maxi) // 2
+            pos = suffix[mid] + depth
+            if pos < size and corpus[pos] > word:
+                maxi = mid
+            else:
+                mini = mid + 1
+        if start < mini:
+            return (start, mini - 1)
+        else:
+            return None
+
+################################################################################
+
+    def iterate_matches(self, numbers, min_length, max_length):
+        """
+            Yields `(position, length)` for the occurrences of the ngrams of
+            `min_length` to `max_length` words, within a sentence, whose word
+            i is `numbers[i]`, or any word where `numbers[i]` is None. The
+            ranges of the suffix array are narrowed word by word, and split
+            by the next word where it is None, so that the time taken depends
+            on the number of matches rather than on the size of the corpus.
+            `max_length` must not exceed `NGRAM_LIMIT + 1`.
+        """
+        corpus = self.corpus
+        suffix = self.suffix
+        stack = [(0, len(suffix) - 1, 0)]
+        while stack:
+            first, last, depth = stack.pop()
+            if depth >= min_length:
+                for i in xrange(first, last + 1):
+                    yield suffix[i], depth
+            if depth == max_length:
+                continue
+            number = numbers[depth]
+            if number is not None:
+                found = self.narrow_range(first, last, depth, number)
+                if found is not None:
+                    stack.append((found[0], found[1], depth + 1))
+                continue
+            while first <= last:
+                word = corpus[suffix[first] + depth]
+                found = self.narrow_range(first, last, depth, word)
+                if word != 0:  # End of sentence
+                    stack.append((first, found[1], depth + 1))
+                first = found[1] + 1
+
+################################################################################
+
+    def ngram_range(self, ngram, ranges):
+        """
+            Same as `find_ngram_range`, for a tuple `ngram`, searching within
+            the range of `ngram[:-1]`. The range of every prefix is looked up
+            in (and added to) the dict `ranges`; those of unigrams also in
+            `self.unigram_ranges`.
+        """
+        if ngram in ranges:
+            return ranges[ngram]
+        if not ngram:
+            found = self.find_ngram_range([])
+        elif len(ngram) > NGRAM_LIMIT + 1:
+            # Suffixes are only sorted up to that length
+            found = self.find_ngram_range(list(ngram))
+        elif len(ngram) == 1:
+            found = self.unigram_ranges.get(ngram, False)
+            if found is False:
+                found = self.narrow_range(0, len(self.suffix) - 1, 0, ngram[0])
+                self.unigram_ranges.put(ngram, found)
+        else:
+            found = self.ngram_range(ngram[:-1], ranges)
+            if found is not None:
+                found = self.narrow_range(found[0], found[1],
+                                          len(ngram) - 1, ngram[-1])
+        ranges[ngram] = found
+        return found
+
+################################################################################
+
+    def table_count(self, ngram):
+        """
+            Returns the number of occurrences of the unigram or bigram
+            `ngram` (a tuple of word numbers) from the frequency tables, or
+            `None` if they cannot tell.
+        """
+        if 0 in ngram:
+            return None  # Not in the bigram table
+        if len(ngram) == 1 and self.unigrams is not None:
+            if ngram[0] < len(self.unigrams):
+                return self.unigrams[ngram[0]]
+            return 0
+        if len(ngram) == 2 and self.bigrams is not None:
+            table = self.bigrams
+            mini = 0
+            maxi = len(table) // 3
+            while mini < maxi:
+                mid = (mini + maxi) // 2
+                if (table[3 * mid], table[3 * mid + 1]) < ngram:
+                    mini = mid + 1
+                else:
+                    maxi = mid
+            if mini < len(table) // 3 and \
+                    (table[3 * mini], table[3 * mini + 1]) == ngram:
+                return table[3 * mini + 2]
+            return 0
+        return None
+
+################################################################################
+
+    def count_ngrams(self, ngrams):
+        """
+            Returns a dict with the number of occurrences of each ngram in
+            `ngrams` (tuples of word numbers). The ngrams are searched
+            together, in sorted order, each one within the range of its
+            prefix, so that ngrams sharing their first words share searches.
+            Unigrams and bigrams are counted from the frequency tables, when
+            the index has them (see `save_tables`).
+        """
+        counts = {}
+        ranges = {}
+        for ngram in sorted(set(ngrams)):
+            count = self.table_count(ngram)
+            if count is not None:
+                counts[ngram] = count
+                continue
+            found = self.ngram_range(ngram, ranges)
+            if found is None:
+                counts[ngram] = 0
+            else:
+                counts[ngram] = found[1] - found[0] + 1
+        return counts
+
+################################################################################
+
+    def count_ngram(self, ngram):
+        """
+            Returns the number of occurrences of `ngram` (a list of word
+            numbers).
+        """
+        found = self.find_ngram_range(ngram)
+        if found is None:
+            return 0
+        return found[1] - found[0] + 1
+
 ################################################################################
 
     def binary_search_ngram(self, ngram, first, last, cmp):
@@ -366,7 +938,7 @@ class SuffixArray(object):
         # satisfies the comparison.
         maxi = last + 1
         mini = first
-        ngram_array = make_array(ngram)
+        ngram_array = self.make_ngram(ngram)
         length = len(ngram)
         mid = -1
         while mini < maxi:
@@ -413,6 +985,250 @@ class SuffixArray(object):
             print("")
 
 
+################################################################################
+################################################################################
+
+class MappedSymbolTable(object):
+    """
+        Read-only symbol table over the `.symbols` file and its lexicon (see
+        `make_lexicon`), both through `mmap`. Has the `number_to_symbol` and
+        `symbol_to_number` of `SymbolTable`, without loading any symbol
+        before it is looked up.
+    """
+
+    def __init__(self, symbols_path, lexicon_path):
+        self.data = map_file(symbols_path)
+        if os.path.isfile(lexicon_path):
+            self.lexicon = map_array_file(lexicon_path)
+        else:
+            self.lexicon = self.make_lexicon(lexicon_path)
+        self.size = self.lexicon[0]
+        self.numbers = {}  # Symbols already looked up
+        self.number_to_symbol = _NumberToSymbol(self)
+        self.symbol_to_number = _SymbolToNumber(self)
+
+    def make_lexicon(self, lexicon_path):
+        """
+            Builds the lexicon of an index that lacks it (e.g. made by the C
+            indexer), and saves it for the next time if possible.
+        """
+        verbose("Building lexicon %s" % lexicon_path)
+        lexicon = make_lexicon(self.data[:].split("\n")[:-1])
+        try:
+            save_array_to_file(lexicon, lexicon_path)
+        except IOError:
+            pass
+        return lexicon
+
+    def encoded_symbol(self, number):
+        return self.data[self.lexicon[number + 1]:
+                         self.lexicon[number + 2] - 1]
+
+    def symbol(self, number):
+        """
+            Returns the symbol with number `number`.
+        """
+        if not 0 <= number < self.size:
+            raise IndexError("symbol number out of range")
+        return self.encoded_symbol(number).decode("utf-8")
+
+    def number(self, symbol, default=None):
+        """
+            Returns the number of `symbol`, or `default` if it is not in the
+            table. Binary search in the sorted part of the lexicon.
+        """
+        if symbol in self.numbers:
+            return self.numbers[symbol]
+        sym = symbol.encode("utf-8")
+        sorted_base = self.size + 2
+        first = 0
+        last = self.size
+        while first < last:
+            mid = (first + last) // 2
+            if self.encoded_symbol(self.lexicon[sorted_base + mid]) < sym:
+                first = mid + 1
+            else:
+                last = mid
+        if first < self.size:
+            number = self.lexicon[sorted_base + first]
+            if self.encoded_symbol(number) == sym:
+                self.numbers[symbol] = number
+                return number
+        return default
+
+    def intern(self, symbol):
+        number = self.number(symbol)
+        if number is None:
+            raise ValueError("Cannot add symbols to a mapped symbol table")
+        return number
+
+
+class _NumberToSymbol(dict):
+    """
+        Decoded symbols, by number. Each symbol is decoded the first time it
+        is looked up, then read from the dict itself.
+    """
+    def __init__(self, table):
+        dict.__init__(self)
+        self.table = table
+
+    def __missing__(self, number):
+        symbol = self[number] = self.table.symbol(number)
+        return symbol
+
+    def __len__(self):
+        return self.table.size
+
+    def __iter__(self):
+        for number in xrange(self.table.size):
+            yield self[number]
+
+
+class _SymbolToNumber(object):
+    def __init__(self, table):
+        self.table = table
+
+    def __getitem__(self, symbol):
+        number = self.table.number(symbol)
+        if number is None:
+            raise KeyError(symbol)
+        return number
+
+    def get(self, symbol, default=None):
+        return self.table.number(symbol, default)
+
+    def __contains__(self, symbol):
+        return self.table.number(symbol) is not None
+
+    has_key = __contains__
+
+    def __len__(self):
+        return self.table.size
+
+
+################################################################################
+################################################################################
+
+class MappedSuffixArray(SuffixArray):
+    """
+        A `SuffixArray` whose files are mapped in memory instead of read.
+        Opening it takes constant time and memory whatever the size of the
+        corpus, and the processes using the same index share its pages.
+        It is read-only.
+    """
+
+    make_ngram = list
+
+################################################################################
+
+    def load(self):
+        """
+            Maps the suffix array files at `self.basepath`.
+        """
+        self.load_arrays()
+        self.symbols = MappedSymbolTable(self.symbols_path, self.lexicon_path)
+
+################################################################################
+
+    def load_arrays(self):
+        self.corpus = map_array_file(self.corpus_path)
+        self.suffix = map_array_file(self.suffix_path)
+        self.load_tables()
+
+################################################################################
+
+    def save(self):
+        error("Cannot save a mapped suffix array")
+
+
+################################################################################
+################################################################################
+
+class ConcatenatedArray(object):
+    """
+        Read-only view of a list of arrays as a single array.
+    """
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self.offsets = [0]  # Position of the first item of each array
+        for an_array in arrays:
+            self.offsets.append(self.offsets[-1] + len(an_array))
+
+    def __len__(self):
+        return self.offsets[-1]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in xrange(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("array index out of range")
+        k = bisect.bisect_right(self.offsets, i) - 1
+        return self.arrays[k][i - self.offsets[k]]
+
+    def __iter__(self):
+        return itertools.chain(*self.arrays)
+
+
+################################################################################
+################################################################################
+
+class SegmentedSuffixArray(SuffixArray):
+    """
+        The suffix arrays of an attribute of an index to which corpora were
+        appended (see `append_to_index`): the main one and one per segment,
+        sharing their symbol table. Its corpus is the concatenation of theirs
+        and the counts are summed over them (ngrams spanning the end of a
+        segment, thus the end of a sentence, are not found). There is no
+        suffix array for the whole corpus, so ngram ranges cannot be
+        searched. It is read-only; `Index.compact` merges the segments.
+    """
+
+################################################################################
+
+    def __init__(self, segments):
+        SuffixArray.__init__(self)
+        self.segments = segments
+        self.symbols = segments[0].symbols
+        self.corpus = ConcatenatedArray([s.corpus for s in segments])
+        self.suffix = None
+
+################################################################################
+
+    def find_ngram_range(self, ngram, min=0, max=None):
+        error("Cannot search ngram ranges in a segmented suffix array")
+
+################################################################################
+
+    def iterate_matches(self, numbers, min_length, max_length):
+        for segment, offset in zip(self.segments, self.corpus.offsets):
+            for position, length in segment.iterate_matches(
+                    numbers, min_length, max_length):
+                yield position + offset, length
+
+################################################################################
+
+    def count_ngram(self, ngram):
+        return sum(segment.count_ngram(ngram) for segment in self.segments)
+
+################################################################################
+
+    def count_ngrams(self, ngrams):
+        ngrams = set(ngrams)
+        counts = dict.fromkeys(ngrams, 0)
+        for segment in self.segments:
+            for ngram, count in segment.count_ngrams(ngrams).iteritems():
+                counts[ngram] += count
+        return counts
+
+################################################################################
+
+    def save(self):
+        error("Cannot save a segmented suffix array")
+
+
 ################################################################################
 ################################################################################
 
@@ -447,10 +1263,22 @@ class CSuffixArray(SuffixArray):
                   "with C indexer")
             sys.exit(2)
 
-        self.wordlist_file.seek(0)
+        self.wordlist_file.flush()
+        verbose("Using C indexer to build suffix array %s" % self.basepath)
+        run_c_indexer(self.basepath, self.wordlist_path)
+
+################################################################################
+
+    def start_build(self, pool):
+        self.wordlist_file.flush()
         verbose("Using C indexer to build suffix array %s" % self.basepath)
-        subprocess.call([C_INDEXER_PROGRAM, self.basepath],
-                        stdin=self.wordlist_file)
+        return pool.apply_async(run_c_indexer,
+                                (self.basepath, self.wordlist_path))
+
+################################################################################
+
+    def end_build(self, result):
+        result.get()
 
 ################################################################################
 
@@ -470,6 +1298,10 @@ class Index(object):
 
     make_suffix_array = None
     c_indexer_program = None
+    # Whether to save a bigram table along with each attribute
+    bigram_tables = False
+    # Number of processes building suffix arrays (0: one per CPU)
+    jobs = 1
 
 ################################################################################
 
@@ -501,8 +1333,7 @@ class Index(object):
             Index.make_suffix_array = CSuffixArray
         else:
             if wants_to_use:
-                warn(
-                    "C indexer not found; using (slower) Python indexer instead.")
+                verbose("C indexer not found; using Python indexer instead.")
             Index.make_suffix_array = SuffixArray
 
     use_c_indexer = staticmethod(use_c_indexer)
@@ -510,8 +1341,13 @@ class Index(object):
 ################################################################################
 
     def __init__(self, basepath=None, used_word_attributes=None,
-                 use_c_indexer=None):
+                 use_c_indexer=None, mapped=True):
         self.arrays = {}
+        self.mapped = mapped
+        self.new_segments = {}  # Attribute -> number of the segment built
+        self.lock_file = None  # Open while the index is locked (see `lock`)
+        self.files_lock = None  # Open while `lock_files` is in effect
+        self.files_lock_depth = 0
         self.metadata = {"corpus_size": 0}
         self.sentence_factory = SentenceFactory()
 
@@ -548,6 +1384,127 @@ class Index(object):
     def array_file_exists(self, attr):
         return os.path.isfile(self.basepath + "." + attr + ".corpus")
 
+################################################################################
+
+    def segment_paths(self, attr):
+        """
+            Returns the base paths of the segments appended to the files of
+            `attr` (see `append_to_index`), in order. The files of segment k
+            are `<basepath>.<attr>.seg<k>.{corpus,suffix,unigrams,bigrams}`.
+        """
+        paths = []
+        while True:
+            path = "%s.%s.seg%d" % (self.basepath, attr, len(paths) + 1)
+            if not os.path.isfile(path + ".corpus"):
+                return paths
+            paths.append(path)
+
+################################################################################
+
+    def array_path(self, attr):
+        """
+            Returns the base path of the files to which the suffix array being
+            built for `attr` is saved: the main files, or a new segment. The
+            files of a new segment are saved under a `.new` name until they
+            are all complete (see `publish_segment`).
+        """
+        if attr in self.new_segments:
+            return "%s.%s.seg%d.new" % (self.basepath, attr,
+                                        self.new_segments[attr])
+        return self.basepath + "." + attr
+
+################################################################################
+
+    def symbols_basepath(self, attr):
+        """
+            Returns the base path of the symbol table files of the suffix
+            array being built for `attr`. A new segment extends the symbol
+            table of the index, saved under a `.new` name like its files.
+        """
+        if attr in self.new_segments:
+            return "%s.%s.new" % (self.basepath, attr)
+        return self.basepath + "." + attr
+
+################################################################################
+
+    def fresh_segment(self):
+        """
+            Creates empty suffix arrays for all the attributes present in the
+            index, whatever `used_word_attributes` says, to be saved as new
+            segments: every attribute must cover the same words. They extend
+            the symbol tables of the index, so they are always built by the
+            Python indexer. Bigram tables are made if the index has them.
+            Call it with the index locked (see `lock`).
+        """
+        self.used_word_attributes = self.stored_attributes()
+        if not self.used_word_attributes:
+            error("No index files at %s" % self.basepath)
+        for attr in self.used_word_attributes:
+            path = self.basepath + "." + attr
+            array = SuffixArray()
+            load_symbols_from_file(array.symbols, path + ".symbols")
+            self.arrays[attr] = array
+            self.new_segments[attr] = len(self.segment_paths(attr)) + 1
+            if os.path.isfile(path + ".bigrams"):
+                self.bigram_tables = True
+
+################################################################################
+
+    def stored_attributes(self):
+        """
+            Returns the simple attributes which have files in the index.
+        """
+        return [attr for attr in WORD_ATTRIBUTES
+                if self.array_file_exists(attr)]
+
+################################################################################
+
+    def lock(self):
+        """
+            Takes an exclusive lock on the index, waiting for the process which
+            holds it, so that appends and compactions are made one at a time.
+            The lock is released by `unlock`, or when the process ends.
+            Does nothing where `fcntl` is not available.
+        """
+        if self.lock_file is None:
+            self.lock_file = lock_file(self.basepath + ".lock")
+
+################################################################################
+
+    def unlock(self):
+        """
+            Releases the lock taken by `lock`.
+        """
+        unlock_file(self.lock_file)
+        self.lock_file = None
+
+################################################################################
+
+    def lock_files(self, shared=True):
+        """
+            Locks the files of the index: shared while they are loaded, and
+            exclusive while an append or a compaction renames its new files
+            into place and removes the old ones (see `publish_segment` and
+            `compact`), so that a process never loads part of them. Calls can
+            be nested, the lock is released by the last `unlock_files`.
+            Attributes loaded apart (e.g. a fused attribute loaded after
+            `load_main`) may see a later state of the index.
+        """
+        if self.files_lock_depth == 0:
+            self.files_lock = lock_file(self.basepath + ".files.lock", shared)
+        self.files_lock_depth += 1
+
+################################################################################
+
+    def unlock_files(self):
+        """
+            Releases the lock taken by `lock_files`.
+        """
+        self.files_lock_depth -= 1
+        if self.files_lock_depth == 0:
+            unlock_file(self.files_lock)
+            self.files_lock = None
+
 ################################################################################
 
     def load(self, attribute):
@@ -556,61 +1513,117 @@ class Index(object):
             If the attribute is of the form `a1+a2` and the corresponding
             file does not exist, creates a new suffix array fusing the 
             arrays for attributes `a1` and `a2`.
+            The files are mapped in memory (see `MappedSuffixArray`) unless
+            the index was created with `mapped=False`. They are loaded under
+            a shared lock (see `lock_files`).
         """
         #pdb.set_trace()
         if self.arrays.has_key(attribute):
             return self.arrays[attribute]
 
-        if not self.array_file_exists(attribute):
-            if '+' in attribute:
-                self.make_fused_array(attribute.split('+'))
-            else:
-                warn("Cannot load attribute %s; index files not present."
-                     % attribute)
-                return None
-
-        verbose("Loading corpus files for attribute \"%s\"." % attribute)
-        array = SuffixArray()
-        path = self.basepath + "." + attribute
-        array.set_basepath(path)
-        array.load()
+        self.lock_files()
+        try:
+            if not self.array_file_exists(attribute):
+                if '+' in attribute:
+                    self.make_fused_array(attribute.split('+'))
+                else:
+                    warn("Cannot load attribute %s; index files not present."
+                         % attribute)
+                    return None
 
-        self.arrays[attribute] = array
-        return array
+            verbose("Loading corpus files for attribute \"%s\"." % attribute)
+            if self.mapped:
+                array = MappedSuffixArray()
+            else:
+                array = SuffixArray()
+            path = self.basepath + "." + attribute
+            array.set_basepath(path)
+            array.load()
+
+            segment_paths = self.segment_paths(attribute)
+            if segment_paths:
+                segments = [array]
+                for segment_path in segment_paths:
+                    if self.mapped:
+                        segment = MappedSuffixArray()
+                    else:
+                        segment = SuffixArray()
+                    segment.set_basepath(segment_path, path)
+                    segment.load_arrays()
+                    segment.symbols = array.symbols
+                    segments.append(segment)
+                array = SegmentedSuffixArray(segments)
+
+            self.arrays[attribute] = array
+            return array
+        finally:
+            self.unlock_files()
 
 ################################################################################
 
     def make_fused_array(self, attrs):
         """
             Make an array combining the attributes `attrs`. This array must be
-            loaded after creation.
+            loaded after creation. A bigram table is made if the index has
+            them, as readers make fused arrays lazily (see `load`).
         """
 
         verbose("Making fused array for " + '+'.join(attrs) + "...")
-        generators = [read_attribute_from_index(attr, self.basepath) \
-                      for attr in attrs]
+        corpora = []
+        symbols = []
+        for attr in attrs:
+            corpus = make_array()
+            path = self.basepath + "." + attr
+            if os.path.isfile(path + ".bigrams"):
+                self.bigram_tables = True
+            for corpus_path in [path] + self.segment_paths(attr):
+                load_array_from_file(corpus, corpus_path + ".corpus")
+            corpora.append(corpus)
+            table = SymbolTable()
+            load_symbols_from_file(table,
+                                   self.basepath + "." + attr + ".symbols")
+            symbols.append(table.number_to_symbol)
 
         sufarray = Index.make_suffix_array()
         sufarray.set_basepath(self.basepath + "." + '+'.join(attrs))
-        while True:
-            try:
-                g = ""
-                next_words = [g.next() for g in generators]
-                if g == "":
-                    sufarray.append_word("")
-                else:
-                    sufarray.append_word(ATTRIBUTE_SEPARATOR.join(next_words))
-
-            except StopIteration:
-                break
+        fused_words = {}  # Tuple of word numbers -> fused word
+        for numbers in itertools.izip(*corpora):
+            word = fused_words.get(numbers)
+            if word is None:
+                word = ATTRIBUTE_SEPARATOR.join(
+                    [syms[number] for syms, number in zip(symbols, numbers)])
+                fused_words[numbers] = word
+            sufarray.append_word(word)
 
         sufarray.build_suffix_array()
         sufarray.save()
+        self.save_tables('+'.join(attrs))
 
         # Is this any good? (May be with the old indexer; must test)
         sufarray = None
         #print("objects collected by gc.collect()", file=sys.stderr)
 
+################################################################################
+
+    def make_fused_arrays(self, attrs_list):
+        """
+            Same as `make_fused_array` for each list of attributes in
+            `attrs_list`, with `self.jobs` processes.
+        """
+        if self.jobs == 1:
+            for attrs in attrs_list:
+                self.make_fused_array(attrs)
+            return
+
+        pool = multiprocessing.Pool(self.jobs or None)
+        results = [pool.apply_async(make_fused_array_file,
+                                    (self.basepath, attrs, self.bigram_tables))
+                   for attrs in attrs_list]
+        pool.close()
+        for result in results:
+            result.get()
+        pool.join()
+
 ################################################################################
 
     def save(self, attribute):
@@ -618,8 +1631,26 @@ class Index(object):
             Saves the suffix array for `attribute` to the corresponding files.
         """
         array = self.arrays[attribute]
-        array.set_basepath(self.basepath + "." + attribute)
+        array.set_basepath(self.array_path(attribute),
+                           self.symbols_basepath(attribute))
         array.save()
+        self.save_tables(attribute)
+
+################################################################################
+
+    def save_tables(self, attribute):
+        """
+            Saves the frequency tables for `attribute`, from its saved files
+            (so that it works with both indexers). The bigram table is only
+            made if `self.bigram_tables` is set.
+        """
+        verbose("Counting unigrams%s for %s..." %
+                (" and bigrams" if self.bigram_tables else "", attribute))
+        array = MappedSuffixArray()
+        array.set_basepath(self.array_path(attribute),
+                           self.symbols_basepath(attribute))
+        array.load()
+        array.save_tables(self.bigram_tables)
 
 ################################################################################
 
@@ -640,9 +1671,10 @@ class Index(object):
 
     def save_metadata(self):
         """
-            Saves the index metadata to the corresponding file.
+            Saves the index metadata to the corresponding file (renamed into
+            place, like in `save_array_to_file`).
         """
-        metafile = open(self.metadata_path, "w")
+        metafile = open(self.metadata_path + ".tmp", "w")
         for key, value in self.metadata.items():
             if isinstance(value, int):
                 type = "int"
@@ -652,17 +1684,22 @@ class Index(object):
             metafile.write("%s %s %s\n" % (key, type, value))
 
         metafile.close()
+        os.rename(self.metadata_path + ".tmp", self.metadata_path)
 
 ################################################################################
 
     # Load/save main (non-composite) attributes and metadata
     def load_main(self):
-        self.load_metadata()
-        present_attributes = []
-        for attr in self.used_word_attributes:
-            present = self.load(attr)
-            if present:
-                present_attributes.append(attr)
+        self.lock_files()
+        try:
+            self.load_metadata()
+            present_attributes = []
+            for attr in self.used_word_attributes:
+                present = self.load(attr)
+                if present:
+                    present_attributes.append(attr)
+        finally:
+            self.unlock_files()
         self.used_word_attributes = present_attributes
 
     ################################################################################
@@ -672,6 +1709,104 @@ class Index(object):
         for attr in self.used_word_attributes:
             self.save(attr)
 
+################################################################################
+
+    def remove_fused_arrays(self):
+        """
+            Removes the files of the fused arrays (e.g. `lemma+pos`), which
+            are made again from the main attributes when loaded.
+        """
+        for path in glob.glob(self.basepath + ".*+*.*"):
+            os.remove(path)
+
+################################################################################
+
+    def publish_segment(self):
+        """
+            Renames the files of the new segments (see `fresh_segment`) into
+            place, with the extended symbol tables and the new metadata, and
+            removes the fused arrays, all under the exclusive lock of the
+            files (see `lock_files`). The `.corpus` file of a segment, which
+            makes it part of the index (see `segment_paths`), is renamed last.
+        """
+        self.lock_files(shared=False)
+        try:
+            for attr in self.used_word_attributes:
+                path = self.basepath + "." + attr
+                new_symbols_path = self.symbols_basepath(attr)
+                for ext in ("symbols", "lexicon"):
+                    os.rename(new_symbols_path + "." + ext, path + "." + ext)
+                new_segment_path = self.array_path(attr)
+                segment_path = "%s.seg%d" % (path, self.new_segments[attr])
+                for ext in reversed(SEGMENT_FILES):
+                    if os.path.isfile(new_segment_path + "." + ext):
+                        os.rename(new_segment_path + "." + ext,
+                                  segment_path + "." + ext)
+            self.new_segments = {}
+            self.save_metadata()
+            self.remove_fused_arrays()
+        finally:
+            self.unlock_files()
+
+################################################################################
+
+    def compact(self):
+        """
+            Merges the segments of each attribute into its main files,
+            rebuilding the suffix array and the frequency tables of the whole
+            corpus. All the attributes of the index are compacted, under its
+            lock. The new files are built under a `.compact` name, then
+            renamed into place, and the segments removed, under the exclusive
+            lock of the files (see `lock_files`): the processes which have
+            already loaded the index keep their view of it, and those loading
+            it meanwhile wait.
+        """
+        self.lock()
+        try:
+            compacted = {}  # Attribute -> its segments merged
+            for attr in self.stored_attributes():
+                segment_paths = self.segment_paths(attr)
+                if segment_paths:
+                    self.compact_attribute(attr, segment_paths)
+                    compacted[attr] = segment_paths
+            self.lock_files(shared=False)
+            try:
+                for attr, segment_paths in compacted.iteritems():
+                    path = self.basepath + "." + attr
+                    for ext in SEGMENT_FILES:
+                        if os.path.isfile(path + ".compact." + ext):
+                            os.rename(path + ".compact." + ext,
+                                      path + "." + ext)
+                    for segment_path in reversed(segment_paths):
+                        for ext in SEGMENT_FILES:
+                            if os.path.isfile(segment_path + "." + ext):
+                                os.remove(segment_path + "." + ext)
+            finally:
+                self.unlock_files()
+        finally:
+            self.unlock()
+
+################################################################################
+
+    def compact_attribute(self, attr, segment_paths):
+        """
+            Builds the files of `attr` merged with its segments at
+            `segment_paths`, under a `.compact` name (see `compact`).
+        """
+        verbose("Compacting %d segment(s) for %s..." %
+                (len(segment_paths), attr))
+        path = self.basepath + "." + attr
+        array = SuffixArray()
+        for corpus_path in [path] + segment_paths:
+            load_array_from_file(array.corpus, corpus_path + ".corpus")
+        load_symbols_from_file(array.symbols, path + ".symbols")
+        array.build_suffix_array()
+        array.set_basepath(path + ".compact", path)
+        save_array_to_file(array.corpus, array.corpus_path)
+        save_array_to_file(array.suffix, array.suffix_path)
+        array.save_tables(self.bigram_tables or
+                          os.path.isfile(path + ".bigrams"))
+
 ################################################################################
 
 
@@ -698,13 +1833,96 @@ class Index(object):
 
     def build_suffix_arrays(self):
         """
-            Build suffix arrays for all attributes in the index.
+            Build suffix arrays for all attributes in the index, with
+            `self.jobs` processes.
         """
+        if self.jobs == 1:
+            for attr in self.arrays.keys():
+                verbose("Building suffix array for %s..." % attr)
+                ## REFACTOR FIXME
+                self.arrays[attr].set_basepath(self.array_path(attr),
+                                               self.symbols_basepath(attr))
+                self.arrays[attr].build_suffix_array()
+            return
+
+        pool = multiprocessing.Pool(self.jobs or None)
+        results = {}
         for attr in self.arrays.keys():
             verbose("Building suffix array for %s..." % attr)
-            ## REFACTOR FIXME
-            self.arrays[attr].set_basepath(self.basepath + "." + attr)
-            self.arrays[attr].build_suffix_array()
+            self.arrays[attr].set_basepath(self.array_path(attr),
+                                           self.symbols_basepath(attr))
+            results[attr] = self.arrays[attr].start_build(pool)
+        pool.close()
+        for attr in self.arrays.keys():
+            self.arrays[attr].end_build(results[attr])
+        pool.join()
+
+################################################################################
+
+    def iterate_matches(self, word_constraints, min_length, max_length):
+        """
+            Yields `(position, length)` for the occurrences of the ngrams of
+            `min_length` to `max_length` words whose word i has the attribute
+            values in the dict `word_constraints[i]` (empty for any word).
+            The suffix array of the attribute given for the most leading words
+            is searched (see `SuffixArray.iterate_matches`), and the other
+            attributes are checked at each occurrence. The attributes must be
+            loaded.
+        """
+        def leading_words(attr):
+            n = 0
+            while n < max_length and attr in word_constraints[n]:
+                n += 1
+            return (n, sum(attr in c for c in word_constraints))
+        guide = max(self.used_word_attributes, key=leading_words)
+
+        numbers = [None] * max_length
+        checks = []  # (word index, corpus, word number) of the other attrs
+        for i, constraints in enumerate(word_constraints):
+            for attr, value in constraints.iteritems():
+                array = self.arrays[attr]
+                number = array.symbols.symbol_to_number.get(value, None)
+                if number is None:
+                    return  # Not in the corpus
+                if attr == guide:
+                    numbers[i] = number
+                else:
+                    checks.append((i, array.corpus, number))
+
+        for position, length in self.arrays[guide].iterate_matches(
+                numbers, min_length, max_length):
+            for i, corpus, number in checks:
+                if i < length and corpus[position + i] != number:
+                    break
+            else:
+                yield position, length
+
+################################################################################
+
+    def sentence_ends(self):
+        """
+            Returns the sorted positions of the ends of sentences in the
+            corpus, from the suffix array.
+        """
+        array = self.arrays[self.used_word_attributes[0]]
+        return sorted(position for position, length
+                      in array.iterate_matches([0], 1, 1))
+
+################################################################################
+
+    def word_at(self, position):
+        """Returns the `Word` at `position` in the corpus."""
+        args_dict = {}
+        args = []
+        for poss_attr in WORD_ATTRIBUTES:
+            args_dict[poss_attr] = WILDCARD
+        for attr in self.used_word_attributes:
+            number = self.arrays[attr].corpus[position]
+            symbol = self.arrays[attr].symbols.number_to_symbol[number]
+            args_dict[attr] = symbol
+        for poss_attr in WORD_ATTRIBUTES:
+            args.append(args_dict[poss_attr])
+        return Word(*args)
 
 ################################################################################
 
@@ -717,25 +1935,24 @@ class Index(object):
     def iterate_sentences_and_progress(self):
         """Returns an iterator over all (sentence, progress) pairs in the corpus."""
         guide = self.used_word_attributes[0]  # guide?
-        length = len(self.arrays[guide].corpus)
+        guide_corpus = self.arrays[guide].corpus
+        length = len(guide_corpus)
+        # Same as `word_at`, with the lookups made once for all words
+        columns = [(WORD_ATTRIBUTES.index(attr), self.arrays[attr].corpus,
+                    self.arrays[attr].symbols.number_to_symbol)
+                   for attr in self.used_word_attributes]
+        wildcards = [WILDCARD] * len(WORD_ATTRIBUTES)
         words = []
-        for i in range(0, length):
-            if self.arrays[guide].corpus[i] == 0:
+        for i in xrange(length):
+            if guide_corpus[i] == 0:
                 # We have already a whole sentence.
                 yield self.sentence_factory.make(words), (i, length)
                 words = []
 
             else:
-                args_dict = {}
-                args = []
-                for poss_attr in WORD_ATTRIBUTES:
-                    args_dict[poss_attr] = WILDCARD
-                for attr in self.used_word_attributes:
-                    number = self.arrays[attr].corpus[i]
-                    symbol = self.arrays[attr].symbols.number_to_symbol[number]
-                    args_dict[attr] = symbol
-                for poss_attr in WORD_ATTRIBUTES:
-                    args.append(args_dict[poss_attr])
+                args = wildcards[:]
+                for attr_index, corpus, number_to_symbol in columns:
+                    args[attr_index] = number_to_symbol[corpus[i]]
                 words.append(Word(*args))
 
 ################################################################################
@@ -772,6 +1989,41 @@ class IndexPopulatorHandler(filetype.InputHandler):
         self.index.save_main()
 
 
+################################################################################
+
+def append_to_index(index, corpus_fileobjs, filetype_hint=None):
+    """
+        Adds the sentences of a corpus to an existing `Index`, as a new
+        segment of each attribute: only the new sentences are indexed, and
+        queries sum the counts over the segments (see `SegmentedSuffixArray`).
+        All the attributes of the index get a segment, whatever the attributes
+        of `index`. The fused arrays are removed, to be made again when loaded.
+        The index is locked meanwhile, so concurrent appends wait in turn, and
+        the new files only become visible once complete (see
+        `Index.publish_segment`), so the index can be read meanwhile.
+    """
+    index.lock()
+    try:
+        handler = IndexAppenderHandler(index)
+        filetype.parse(corpus_fileobjs, handler, filetype_hint)
+    finally:
+        index.unlock()
+
+################################################################################
+
+class IndexAppenderHandler(IndexPopulatorHandler):
+    def __init__(self, index):
+        self.index = index
+        self.index.load_metadata()
+        self.index.fresh_segment()
+
+    def finish(self):
+        self.index.build_suffix_arrays()
+        for attr in self.index.used_word_attributes:
+            self.index.save(attr)
+        self.index.publish_segment()
+
+
 ################################################################################
 #t = fuse_suffix_arrays(h.arrays["surface"], h.arrays["pos"])
 
@@ -71,6 +71,8 @@ def build_generic_pattern(min, max):
     p.pattern = p.WORD_SEPARATOR + "(?:[^%s]*" % p.WORD_SEPARATOR + \
               p.WORD_SEPARATOR + ")" + "{%d,%d}" % (min, max)
     p._post_parsing()
+    p.word_constraints = [{}] * max
+    p.length_range = (min, max)
     return p
 
 
@@ -88,12 +90,20 @@ class ParsedPattern(object):
         self.defined_w_ids = []
         self.forepattern_ids = {}
         self.WORD_SEPARATOR = WORD_SEPARATOR
+        # For the patterns matching ngrams whose words have given attribute
+        # values, one {attr: value} dict per word (see `Index.iterate_matches`)
+        # and the (min, max) ngram length; None for other patterns
+        self.word_constraints = []
+        self.length_range = None
 
     def _parse(self, node):
         self.node = node
         self.pattern = self.WORD_SEPARATOR
         self._do_parse(node, None)
         self._post_parsing()
+        if self.word_constraints is not None:
+            self.length_range = (len(self.word_constraints),
+                                 len(self.word_constraints))
         return self
 
     def _post_parsing(self):
@@ -115,6 +125,7 @@ class ParsedPattern(object):
         elif node.tag == "backpat": 
             id = node.get("id", "")
             self.pattern += "(?P=id_%s)" % id
+            self.word_constraints = None
 
         elif node.tag == "w":
             self._parse_w(node, scope_repeat)
@@ -140,6 +151,8 @@ class ParsedPattern(object):
         ignore = node.get("ignore", "")
         anchor_start = node.get("anchor_start", "")
         anchor_end = node.get("anchor_end", "")
+        if repeat or ignore or anchor_start or anchor_end:
+            self.word_constraints = None
 
         if anchor_start:
             if self.pattern == self.WORD_SEPARATOR:
@@ -186,6 +199,7 @@ class ParsedPattern(object):
     def _parse_either(self, node, scope_repeat):
         id = node.get("id", "")
         repeat = node.get("repeat", "")
+        self.word_constraints = None
 
         if id:
             self.check_scope_repeat(scope_repeat, node)
@@ -233,8 +247,14 @@ class ParsedPattern(object):
         negated = set(node.get("neg", "").split(":"))
         attrs = { "wordnum": self.ATTRIBUTE_WILDCARD }
         id = node.get("id", "")
+        literal_attrs = {}
         for attr in WORD_ATTRIBUTES:
             val = node.get(attr, "")
+            if val.startswith("back:") or "*" in val or attr in negated \
+                    or (val and attr == "syn"):
+                self.word_constraints = None
+            elif val:
+                literal_attrs[attr] = val
             if val.startswith("back:"):
                 (refid, refattr) = val.split(":")[1].split(".")
                 val = "(?P=id_%s_%s)" % (refid, refattr)
@@ -267,6 +287,12 @@ class ParsedPattern(object):
             self.defined_w_ids.append(id)
 
         syndep = node.get("syndep", "")
+        if syndep or any(subnode.tag != ElementTree.Comment
+                         for subnode in node):
+            self.word_constraints = None
+        if self.word_constraints is not None:
+            self.word_constraints.append(literal_attrs)
+
         if syndep:
             (deptype, depref) = syndep.split(":")
             if depref in self.defined_w_ids:
@@ -19,12 +19,28 @@ find_candidates() {
     local args="$1"
     local out_fname="$2"
 
-    mkdir -p "$t_OUTDIR/$datadir/txt"
-    local txt_out="$t_OUTDIR/$datadir/${out_fname}.txt"
+    # With corpus=index, runs on the index made by `index_corpus` and
+    # compares against the same reference as the XML corpus
+    local input="$t_LOCAL_INPUT/$datadir/corpus.xml"
+    local outdir="$t_OUTDIR/$datadir"
+    if test "$corpus" = index; then
+        input="$t_OUTDIR/$datadir/index/corpus.info"
+        outdir="$t_OUTDIR/$datadir/index"
+    fi
+
+    mkdir -p "$outdir"
+    local txt_out="$outdir/${out_fname}.txt"
+
+    t_run "$t_BIN/candidates.py -s -v $args --to=PlainCandidates $input \
+| tail -n +2 | sort >$txt_out"
+    t_compare "$t_REFDIR/$datadir/${out_fname}.txt" "$txt_out" \
+        "Comparing \"$datadir/${out_fname}.txt\" ($corpus) vs reference"
+}
 
-    t_run "$t_BIN/candidates.py -s -v $args -p $t_LOCAL_INPUT/$datadir/patterns.xml \
---to=PlainCandidates $t_LOCAL_INPUT/$datadir/corpus.xml | tail -n +2 | sort >$txt_out"
-    t_compare_with_ref "$datadir/${out_fname}.txt"
+index_corpus() {
+    mkdir -p "$t_OUTDIR/$datadir/index"
+    t_run "$t_BIN/index.py -i $t_OUTDIR/$datadir/index/corpus \
+$t_LOCAL_INPUT/$datadir/corpus.xml"
 }
 
 
@@ -35,19 +51,45 @@ ln -sf "$t_INPUT/ted500.xml" "$t_LOCAL_INPUT/VerbParticle/corpus.xml"
 
 for datadir in NounCompound VerbParticle; do
     mkdir -p "$t_OUTDIR/$datadir"
+    patterns="$t_LOCAL_INPUT/$datadir/patterns.xml"
+    literal="$t_LOCAL_INPUT/$datadir/literal-patterns.xml"
+
+    t_testname "Index the corpus"
+    index_corpus
+
+    for corpus in xml index; do
+        t_testname "Find all matches ($corpus)"
+        find_candidates "-p $patterns -d All" "all-candidates"
+
+        t_testname "Find longest matches ($corpus)"
+        find_candidates "-p $patterns -d Longest" "longest-candidates"
 
-    t_testname "Find all matches"
-    find_candidates '-d All' "all-candidates"
+        t_testname "Find longest matches (non-overlapping) ($corpus)"
+        find_candidates "-p $patterns -N -d Longest" \
+            "longest-nonoverlap-candidates"
+
+        t_testname "Find shortest matches ($corpus)"
+        find_candidates "-p $patterns -d Shortest" "shortest-candidates"
+
+        t_testname "Find shortest matches (non-overlapping) ($corpus)"
+        find_candidates "-p $patterns -N -d Shortest" \
+            "shortest-nonoverlap-candidates"
+
+        # Literal patterns are searched in the suffix arrays of the index
+        t_testname "Find matches of literal patterns ($corpus)"
+        find_candidates "-p $literal -d All" "literal-candidates"
+    done
+done
 
-    t_testname "Find longest matches"
-    find_candidates '-d Longest' "longest-candidates"
 
-    t_testname "Find longest matches (non-overlapping)"
-    find_candidates '-N -d Longest' "longest-nonoverlap-candidates"
+datadir=NounCompound
+for corpus in xml index; do
+    t_testname "Find all n-grams ($corpus)"
+    find_candidates "-n 1:3 -d All" "ngram-all-candidates"
 
-    t_testname "Find shortest matches"
-    find_candidates '-d Shortest' "shortest-candidates"
+    t_testname "Find longest n-grams ($corpus)"
+    find_candidates "-n 2:3 -d Longest" "ngram-longest-candidates"
 
-    t_testname "Find shortest matches (non-overlapping)"
-    find_candidates '-N -d Shortest' "shortest-nonoverlap-candidates"
+    t_testname "Find shortest n-grams ($corpus)"
+    find_candidates "-n 1:3 -d Shortest" "ngram-shortest-candidates"
 done
@@ -0,0 +1,98 @@
+#! /bin/bash
+HERE="$(cd "$(dirname "$0")" && pwd)"
+
+source "$HERE/../testlib.sh"
+
+usage_exit() { {
+    echo "Usage: $(basename "$0") [-h]"
+    echo "Test appending to an index while it is read"
+    exit 1
+} 1>&2;
+}
+
+test "$#" -ne 0  && usage_exit
+
+########################################
+
+
+# count_bigrams <index_dir> <out_fname>
+# Counts the bigrams of the index at <index_dir>/corpus.info, sorted.
+count_bigrams() {
+    "$t_BIN/candidates.py" -n 2:2 -f "$1/corpus.info" \
+        | sed 's/ candid="[0-9]*"//' | sort >"$2"
+}
+
+# count_some <index_dir> <out_fname>
+# Counts some of the bigrams in the index at <index_dir>/corpus.info.
+# This is quick, so it can run many times while the index changes.
+count_some() {
+    "$t_BIN/counter.py" -i "$1/corpus.info" "$t_OUTDIR/some.xml" >"$2"
+}
+
+
+
+cd "$HERE"
+
+t_testname "Split the corpus"
+# The first 300 sentences are indexed, the other 200 appended in 4 parts.
+t_run "$t_BIN/head.py -n 300 $t_INPUT/ted500.xml >$t_OUTDIR/first300.xml"
+for n in 350 400 450 500; do
+    t_run "$t_BIN/head.py -n $n $t_INPUT/ted500.xml >$t_OUTDIR/first$n.xml"
+    t_run "$t_BIN/tail.py -n 50 $t_OUTDIR/first$n.xml >$t_OUTDIR/part$n.xml"
+done
+
+t_run "$t_BIN/candidates.py -n 2:2 $t_INPUT/ted500.xml >$t_OUTDIR/bigrams.xml"
+t_run "$t_BIN/head.py -n 100 $t_OUTDIR/bigrams.xml >$t_OUTDIR/some.xml"
+
+t_testname "Index every prefix of the corpus"
+for n in 300 350 400 450 500; do
+    mkdir -p "$t_OUTDIR/first$n"
+    t_run "$t_BIN/index.py -i $t_OUTDIR/first$n/corpus $t_OUTDIR/first$n.xml"
+    t_run "count_some $t_OUTDIR/first$n $t_OUTDIR/first$n.txt"
+done
+t_run "count_bigrams $t_OUTDIR/first500 $t_OUTDIR/whole.txt"
+mkdir -p "$t_OUTDIR/race"
+t_run "$t_BIN/index.py -i $t_OUTDIR/race/corpus $t_OUTDIR/first300.xml"
+
+t_testname "Append and compact while the index is read"
+# Readers count some bigrams over and over until the appends and the
+# compaction are done: each must see the index as it was before or after
+# an append, never a broken or half-appended one.
+rm -rf "$t_OUTDIR/reads" "$t_OUTDIR/done"
+mkdir -p "$t_OUTDIR/reads"
+(
+    i=0
+    until test -f "$t_OUTDIR/done"; do
+        i="$((i+1))"
+        count_some "$t_OUTDIR/race" "$t_OUTDIR/reads/$i.txt" \
+            2>"$t_OUTDIR/reads/$i.err" || echo "$i" >>"$t_OUTDIR/reads/failed"
+    done
+) &
+readers="$!"
+for n in 350 400 450 500; do
+    t_run "$t_BIN/index.py --append -j 2 -i $t_OUTDIR/race/corpus $t_OUTDIR/part$n.xml"
+done
+t_run "$t_BIN/index.py --compact -i $t_OUTDIR/race/corpus"
+touch "$t_OUTDIR/done"
+wait "$readers"
+
+echo -n "$(t_echo_rgb 0 "Checking the reads... ")"
+if test -f "$t_OUTDIR/reads/failed"; then
+    read="$(head -n 1 "$t_OUTDIR/reads/failed")"
+    t_error "Read $read failed: $(tail -n 1 "$t_OUTDIR/reads/$read.err")"
+fi
+nb_reads=0
+for read in "$t_OUTDIR"/reads/*.txt; do
+    nb_reads="$((nb_reads+1))"
+    seen=""
+    for n in 300 350 400 450 500; do
+        cmp -s "$read" "$t_OUTDIR/first$n.txt" && seen="$n"
+    done
+    test -z "$seen" && t_error "Read $(basename "$read" .txt) saw a broken index"
+done
+t_echo_bold_rgb 2 "OK ($nb_reads reads)."
+
+t_testname "Count after the append and the compaction"
+t_run "count_bigrams $t_OUTDIR/race $t_OUTDIR/race.txt"
+t_compare "$t_OUTDIR/whole.txt" "$t_OUTDIR/race.txt" \
+    "Comparing appended index vs whole index"